@@ -23,17 +23,20 @@ from marshmallow import fields
 from ..config.injection_context import InjectionContext
 from ..core.event_bus import Event, EventBus
 from ..core.plugin_registry import PluginRegistry
-from ..core.profile import Profile
+from ..core.profile import Profile, SessionScope
+from ..core.workers import WorkerCoordinator
 from ..ledger.error import LedgerConfigError, LedgerTransactionError
 from ..messaging.models.openapi import OpenAPISchema
 from ..messaging.responder import BaseResponder
 from ..multitenant.base import BaseMultitenantManager, MultitenantManagerError
 from ..storage.error import StorageNotFoundError
+from ..transport.inbound.admission import AdmissionController
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.queue.basic import BasicMessageQueue
+from ..utils import json_codec
 from ..utils.stats import Collector
-from ..utils.task_queue import TaskQueue
+from ..utils.task_queue import TaskPriority, TaskQueue
 from ..version import __version__
 from ..messaging.valid import UUIDFour
 from .base_server import BaseAdminServer
@@ -78,6 +81,19 @@ class AdminStatusSchema(OpenAPISchema):
     label = fields.Str(description="Default label", allow_none=True)
     timing = fields.Dict(description="Timing results", required=False)
     conductor = fields.Dict(description="Conductor statistics", required=False)
+    admission = fields.Dict(
+        description="Inbound admission control load state", required=False
+    )
+    workers = fields.Dict(
+        description="Worker processes and their combined statistics", required=False
+    )
+    sessions = fields.Dict(
+        description=(
+            "Storage sessions requested and created, and connections acquired, "
+            "totalled over admin requests and inbound messages"
+        ),
+        required=False,
+    )
 
 
 class AdminResetSchema(OpenAPISchema):
@@ -416,10 +432,20 @@ class AdminServer(BaseAdminServer):
 
             if collector:
                 handler = collector.wrap_coro(handler, [handler.__qualname__])
+
+            async def handle_scoped():
+                # share one storage session among the operations of the request
+                async with SessionScope("admin"):
+                    return await handler(request)
+
             if self.task_queue:
-                task = await self.task_queue.put(handler(request))
+                # handlers of background jobs are marked with a lower priority
+                priority = getattr(
+                    request.match_info.handler, "task_priority", TaskPriority.NORMAL
+                )
+                task = await self.task_queue.put(handle_scoped(), priority=priority)
                 return await task
-            return await handler(request)
+            return await handle_scoped()
 
         middlewares.append(setup_context)
 
@@ -537,7 +563,13 @@ class AdminServer(BaseAdminServer):
         # order definitions alphabetically by dict key
         swagger_dict["definitions"] = sort_dict(swagger_dict["definitions"])
 
-        self.site = web.TCPSite(runner, host=self.host, port=self.port)
+        self.site = web.TCPSite(
+            runner,
+            host=self.host,
+            port=self.port,
+            # share the port with the other workers, if any
+            reuse_port=(self.context.settings.get("workers.count") or 1) > 1,
+        )
 
         try:
             await self.site.start()
@@ -664,6 +696,13 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
+        admission = self.context.inject_or(AdmissionController)
+        if admission:
+            status["admission"] = admission.status
+        coordinator = self.context.inject_or(WorkerCoordinator)
+        if coordinator:
+            status["workers"] = await coordinator.status()
+        status["sessions"] = SessionScope.totals()
         return web.json_response(status)
 
     @docs(tags=["server"], summary="Reset statistics")
@@ -682,6 +721,7 @@ class AdminServer(BaseAdminServer):
         collector = self.context.inject_or(Collector)
         if collector:
             collector.reset()
+        SessionScope.reset_totals()
         return web.json_response({})
 
     async def redirect_handler(self, request: web.BaseRequest):
@@ -834,7 +874,7 @@ class AdminServer(BaseAdminServer):
                             }
                         if not closed:
                             if msg:
-                                await ws.send_json(msg)
+                                await ws.send_json(msg, dumps=json_codec.dumps)
                             send = loop.create_task(queue.dequeue(timeout=5.0))
 
                 except asyncio.CancelledError:
@@ -313,6 +313,14 @@ class TestAdminServer(IsolatedAsyncioTestCase):
         ) as response:
             assert response.status == 200
 
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            assert response.status == 200
+            # totals include the reset request, but not this one yet
+            sessions = (await response.json())["sessions"]
+            assert sessions["admin"]["scopes"] == 1
+
         async with self.client_session.ws_connect(
             f"http://127.0.0.1:{self.port}/ws"
         ) as ws:
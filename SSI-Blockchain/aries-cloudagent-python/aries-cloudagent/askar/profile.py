@@ -15,7 +15,7 @@ from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..config.provider import ClassProvider
 from ..core.error import ProfileError
-from ..core.profile import Profile, ProfileManager, ProfileSession
+from ..core.profile import Profile, ProfileManager, ProfileSession, SessionScope
 from ..indy.holder import IndyHolder
 from ..indy.issuer import IndyIssuer
 from ..indy.verifier import IndyVerifier
@@ -136,7 +136,9 @@ class AskarProfile(Profile):
 
     def session(self, context: InjectionContext = None) -> ProfileSession:
         """Start a new interactive session with no transaction support requested."""
-        return AskarProfileSession(self, False, context=context)
+        return SessionScope.get_session(
+            self, context, lambda: AskarProfileSession(self, False, context=context)
+        )
 
     def transaction(self, context: InjectionContext = None) -> ProfileSession:
         """
@@ -167,14 +169,18 @@ class AskarProfileSession(ProfileSession):
     ):
         """Create a new IndySdkProfileSession instance."""
         super().__init__(profile=profile, context=context, settings=settings)
-        if is_txn:
-            self._opener = self.profile.store.transaction(profile.profile_id)
-        else:
-            self._opener = self.profile.store.session(profile.profile_id)
+        self._is_txn = is_txn
+        self._opener = self._open()
         self._handle: Session = None
         self._acquire_start: float = None
         self._acquire_end: float = None
 
+    def _open(self):
+        """Create the opener for the store session or transaction."""
+        if self._is_txn:
+            return self.profile.store.transaction(self.profile.profile_id)
+        return self.profile.store.session(self.profile.profile_id)
+
     @property
     def handle(self) -> Session:
         """Accessor for the Session instance."""
@@ -190,11 +196,16 @@ class AskarProfileSession(ProfileSession):
         """Check if the session supports commit and rollback operations."""
         if self._handle:
             return self._handle.is_transaction
-        return self._opener.is_transaction
+        if self._opener:
+            return self._opener.is_transaction
+        return self._is_txn
 
     async def _setup(self):
         """Create the session or transaction connection, if needed."""
         self._acquire_start = time.perf_counter()
+        if not self._opener:
+            # a shared session may be reopened after being released
+            self._opener = self._open()
         try:
             self._handle = await asyncio.wait_for(self._opener, 10)
         except AskarError as err:
@@ -2,10 +2,13 @@ import asyncio
 import logging
 import pytest
 
+from aries_askar import Store
 from asynctest import mock
 
 from ...askar.profile import AskarProfile
+from ...askar.store import AskarOpenStore, AskarStoreConfig
 from ...config.injection_context import InjectionContext
+from ...core.profile import SessionScope
 
 from .. import profile as test_module
 
@@ -86,3 +89,35 @@ async def test_profile_manager_store():
 
         assert sessionProfile._opener == askar_profile_session
         askar_profile.store.session.assert_called_once_with(profile)
+
+
+@pytest.mark.asyncio
+async def test_session_scope_releases_connection(tmp_path):
+    store = await Store.provision(
+        f"sqlite://{tmp_path}/test.db?max_connections=1", "none", None, recreate=True
+    )
+    opened = AskarOpenStore(
+        AskarStoreConfig({"name": "test", "key_derivation_method": "RAW", "key": "x"}),
+        True,
+        store,
+    )
+    profile = AskarProfile(opened, InjectionContext())
+
+    async def run():
+        async with SessionScope():
+            async with profile.session() as session:
+                await session.handle.count("test")
+                async with profile.session() as nested:
+                    assert nested is session
+                    await nested.handle.count("test")
+            # the only connection is released for the transaction
+            async with profile.transaction() as txn:
+                await txn.handle.count("test")
+            async with profile.session() as again:
+                assert again is session
+                await again.handle.count("test")
+
+    try:
+        await asyncio.wait_for(run(), 5)
+    finally:
+        await store.close()
@@ -1,11 +1,45 @@
 """Abstract base classes for cache."""
 
 import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Sequence, Text, Union
+from uuid import uuid4
+from typing import Any, Awaitable, Callable, Optional, Sequence, Text, Union
 
 from ..core.error import BaseError
 
+LOGGER = logging.getLogger(__name__)
+
+REFRESH_AHEAD_PREFIX = "refresh_ahead::"
+NAMESPACE_PREFIX = "cache_namespace::"
+
+# stored in place of a value to record that a lookup found nothing
+NEGATIVE_CACHE_VALUE = {"negative_cache_entry": True}
+
+
+def is_negative_entry(value: Any) -> bool:
+    """Check whether a cached value records a failed lookup."""
+    return value == NEGATIVE_CACHE_VALUE
+
+
+def key_family(key: Text) -> Text:
+    """Get the family of a cache key, such as `connection_target`."""
+    return key.split("::", 1)[0]
+
+
+def wallet_namespace(wallet_id: Optional[Text], family: Text = None) -> Text:
+    """
+    Get the cache namespace for a wallet, or for a key family within it.
+
+    Args:
+        wallet_id: the wallet id, or `None` for the base wallet
+        family: the key family, if only that family should be covered
+
+    """
+    namespace = f"wallet::{wallet_id or 'base'}"
+    return f"{namespace}::{family}" if family else namespace
+
 
 class CacheError(BaseError):
     """Base class for cache-related errors."""
@@ -14,9 +48,17 @@ class CacheError(BaseError):
 class BaseCache(ABC):
     """Abstract cache interface."""
 
+    # seconds for which a namespace token read from the cache is reused
+    NAMESPACE_TOKEN_TTL = 1.0
+    NAMESPACE_TOKEN_MEMO_SIZE = 1024
+
     def __init__(self):
         """Initialize the cache instance."""
         self._key_locks = {}
+        self._namespace_tokens = {}
+        self._refresh_policies = {}
+        self._refresh_tasks = {}
+        self.negative_ttl: Optional[float] = None
 
     @abstractmethod
     async def get(self, key: Text):
@@ -43,6 +85,38 @@ class BaseCache(ABC):
 
         """
 
+    async def get_many(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """
+        Get several items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            The records found, or `None` for each key that is not cached
+
+        """
+        return [await self.get(key) for key in keys]
+
+    async def add(self, key: Text, value: Any, ttl: int = None) -> Any:
+        """
+        Add an item to the cache unless the key is already present.
+
+        Args:
+            key: the key for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        Returns:
+            The value now stored under the key
+
+        """
+        found = await self.get(key)
+        if found is None:
+            await self.set(key, value, ttl)
+            found = value
+        return found
+
     @abstractmethod
     async def clear(self, key: Text):
         """
@@ -57,6 +131,211 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    def _remember_token(self, namespace: Text, token: Text, now: float):
+        """Keep a namespace token for reuse within this process."""
+        if len(self._namespace_tokens) >= self.NAMESPACE_TOKEN_MEMO_SIZE:
+            self._namespace_tokens = {
+                ns: entry
+                for ns, entry in self._namespace_tokens.items()
+                if entry[1] > now
+            }
+            if len(self._namespace_tokens) >= self.NAMESPACE_TOKEN_MEMO_SIZE:
+                self._namespace_tokens.clear()
+        self._namespace_tokens[namespace] = (token, now + self.NAMESPACE_TOKEN_TTL)
+
+    async def _namespace_tokens_for(
+        self, namespaces: Sequence[Text], fresh: Sequence[Text] = ()
+    ) -> Sequence[Text]:
+        """Get the current tokens for several namespaces, creating any missing."""
+        now = time.monotonic()
+        tokens = {}
+        missing = []
+        for namespace in namespaces:
+            entry = (
+                None if namespace in fresh else self._namespace_tokens.get(namespace)
+            )
+            if entry and entry[1] > now:
+                tokens[namespace] = entry[0]
+            elif namespace not in missing:
+                missing.append(namespace)
+        if missing:
+            found = await self.get_many([NAMESPACE_PREFIX + ns for ns in missing])
+            for namespace, token in zip(missing, found):
+                if not token:
+                    token = await self.add(NAMESPACE_PREFIX + namespace, uuid4().hex)
+                tokens[namespace] = token
+                if namespace not in fresh and self.NAMESPACE_TOKEN_TTL:
+                    self._remember_token(namespace, token, now)
+        return [tokens[namespace] for namespace in namespaces]
+
+    async def namespaced_key(
+        self, key: Text, *namespaces: Text, fresh: Sequence[Text] = ()
+    ) -> Text:
+        """
+        Get the key under which a value is stored within the given namespaces.
+
+        The result includes the current token of each namespace, so entries
+        stored before a namespace was invalidated are no longer found and are
+        left to expire. Tokens are read in one call and reused for up to
+        `NAMESPACE_TOKEN_TTL` seconds, so an invalidation made by another
+        process may take that long to be seen here.
+
+        Args:
+            key: the key to scope
+            namespaces: the namespaces covering the key
+            fresh: namespaces whose tokens are always read from the cache
+
+        """
+        tokens = await self._namespace_tokens_for(namespaces, fresh)
+        return "{}@{}".format(key, ".".join(tokens)) if tokens else key
+
+    async def scoped_key(self, key: Text, wallet_id: Text = None) -> Text:
+        """
+        Get the key for a wallet-specific value.
+
+        The key is covered by its family, the wallet, and the family within
+        the wallet, and is invalidated along with any of them.
+
+        Args:
+            key: the key to scope
+            wallet_id: the wallet id, or `None` for the base wallet
+
+        """
+        family = key_family(key)
+        return await self.namespaced_key(
+            key,
+            family,
+            wallet_namespace(wallet_id),
+            wallet_namespace(wallet_id, family),
+        )
+
+    async def invalidate_namespace(self, namespace: Text):
+        """
+        Invalidate all entries stored within a namespace.
+
+        Args:
+            namespace: the namespace to invalidate
+
+        """
+        token = uuid4().hex
+        await self.set(NAMESPACE_PREFIX + namespace, token)
+        self._namespace_tokens.pop(namespace, None)
+
+    async def set_negative(self, keys: Union[Text, Sequence[Text]], ttl: int = None):
+        """
+        Record that a lookup found nothing for the given keys.
+
+        Negative entries are only stored when a ttl is given or the cache has
+        a default `negative_ttl`. Use `is_negative_entry` to recognize them.
+
+        Args:
+            keys: the key or keys for which to record a miss
+            ttl: number of seconds that the record should persist
+
+        """
+        ttl = ttl or self.negative_ttl
+        if ttl:
+            await self.set(keys, NEGATIVE_CACHE_VALUE, ttl)
+
+    def set_refresh_policy(self, prefix: Text, grace: float):
+        """
+        Enable refresh-ahead for keys starting with a given prefix.
+
+        Values stored through `set_refreshable` for matching keys become stale
+        once their ttl has passed, but are kept for a further `grace` seconds
+        during which they are still returned while being refreshed.
+
+        Args:
+            prefix: the key prefix, such as `schema::`
+            grace: number of seconds to keep a stale value
+
+        """
+        self._refresh_policies[prefix] = grace
+
+    def refresh_grace(self, key: Text) -> Optional[float]:
+        """Get the refresh-ahead grace period for a key, if any."""
+        grace = None
+        matched = ""
+        for prefix, prefix_grace in self._refresh_policies.items():
+            if key.startswith(prefix) and len(prefix) >= len(matched):
+                grace = prefix_grace
+                matched = prefix
+        return grace
+
+    async def set_refreshable(
+        self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None
+    ):
+        """
+        Add an item to the cache, applying any refresh-ahead policy.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds after which the record should be refreshed
+
+        """
+        keys = [keys] if isinstance(keys, Text) else list(keys)
+        plain = []
+        for key in keys:
+            grace = self.refresh_grace(key) if ttl else None
+            if grace is None:
+                plain.append(key)
+            else:
+                await self.set(key, value, ttl + grace)
+                await self.set(REFRESH_AHEAD_PREFIX + key, True, ttl)
+        if plain:
+            await self.set(plain, value, ttl)
+
+    async def is_stale(self, key: Text) -> bool:
+        """Check whether a refresh-ahead value is past its ttl."""
+        if self.refresh_grace(key) is None:
+            return False
+        return not await self.get(REFRESH_AHEAD_PREFIX + key)
+
+    def refresh(
+        self,
+        key: Text,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: int = None,
+        store: bool = True,
+    ) -> asyncio.Task:
+        """
+        Refresh a stale value in the background.
+
+        Only one refresh task is run per key at a time. The value returned
+        by the producer is stored unless it is empty.
+
+        Args:
+            key: the key to refresh
+            producer: coroutine function returning the new value
+            ttl: number of seconds after which the record should be refreshed
+            store: whether to store the produced value, `False` when the
+                producer already stores it
+
+        """
+        task = self._refresh_tasks.get(key)
+        if not task:
+            task = asyncio.ensure_future(self._run_refresh(key, producer, ttl, store))
+            self._refresh_tasks[key] = task
+        return task
+
+    async def _run_refresh(
+        self,
+        key: Text,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: int = None,
+        store: bool = True,
+    ):
+        """Produce and store a refreshed value."""
+        try:
+            value = await producer()
+            if value and store:
+                await self.set_refreshable(key, value, ttl)
+        except Exception:
+            LOGGER.exception("Error refreshing cache key: %s", key)
+        finally:
+            self._refresh_tasks.pop(key, None)
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
@@ -89,6 +368,8 @@ class CacheKeyLock:
         self.exception: BaseException = None
         self.key = key
         self.released = False
+        self.negative = False
+        self.stale = False
         self._future: asyncio.Future = asyncio.get_event_loop().create_future()
         self._parent: "CacheKeyLock" = None
 
@@ -125,13 +406,30 @@ class CacheKeyLock:
         if result:
             self._future.set_result(fut.result())
 
-    async def set_result(self, value: Any, ttl: int = None):
-        """Set the result, updating the cache and any waiters."""
+    async def set_result(self, value: Any, ttl: int = None, store: bool = True):
+        """
+        Set the result, updating the cache and any waiters.
+
+        Args:
+            value: the value found for the key
+            ttl: number of seconds after which the record should be refreshed
+            store: whether to store the value, `False` when the code producing
+                it already stores it
+
+        """
         if self.done and value:
             raise CacheError("Result already set")
         self._future.set_result(value)
+        if store and (not self._parent or self._parent.done):
+            await self.cache.set_refreshable(self.key, value, ttl)
+
+    async def set_negative(self, ttl: int = None):
+        """Record that no result was found, updating the cache and any waiters."""
+        if not self.done:
+            self._future.set_result(None)
+        self.negative = True
         if not self._parent or self._parent.done:
-            await self.cache.set(self.key, value, ttl)
+            await self.cache.set_negative(self.key, ttl)
 
     def __await__(self):
         """Wait for a result to be produced."""
@@ -146,10 +444,24 @@ class CacheKeyLock:
                 await self  # wait for parent's done handler to complete
         if not result:
             found = await self.cache.get(self.key)
-            if found:
+            if is_negative_entry(found):
+                self.negative = True
+                self._future.set_result(None)
+            elif found:
                 self._future.set_result(found)
+                self.stale = await self.cache.is_stale(self.key)
         return self
 
+    def refresh(
+        self,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: int = None,
+        store: bool = True,
+    ):
+        """Refresh the cached value in the background if it is stale."""
+        if self.stale:
+            self.cache.refresh(self.key, producer, ttl, store=store)
+
     def release(self):
         """Release the cache lock."""
         if not self.parent and not self.released:
@@ -1,29 +1,71 @@
 """Basic in-memory cache implementation."""
 
+import heapq
 import time
+from collections import OrderedDict
 from typing import Any, Sequence, Text, Union
 
 from .base import BaseCache
 
 
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """
+    Basic in-memory cache class.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    Entries are kept in least-recently-used order and evicted once the
+    optional capacity is exceeded. Expiry times are tracked in a min-heap so
+    that expired entries can be reclaimed lazily without scanning the cache.
+    """
+
+    def __init__(self, max_entries: int = None):
+        """
+        Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_entries: the maximum number of entries to hold, or `None`
+                for an unbounded cache
+
+        """
         super().__init__()
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self._cache: OrderedDict = OrderedDict()
+        # heap of (<epoch timestamp>, <key>) for entries with an expiry
+        self._expiry_heap = []
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def _remove_expired_cache_items(self):
-        """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
+        """Remove expired items from the head of the expiry heap."""
+        now = time.perf_counter()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # skip heap records left behind by entries which were overwritten
+            if entry and entry["expires"] == expires:
                 del self._cache[key]
+                self.expirations += 1
+
+    def _compact_expiry_heap(self):
+        """Drop heap records which no longer refer to a cached entry."""
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (expires, key)
+                for (expires, key) in self._expiry_heap
+                if key in self._cache and self._cache[key]["expires"] == expires
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict_lru_items(self):
+        """Evict least recently used items until the capacity is respected."""
+        if self.max_entries is None:
+            return
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
 
     async def get(self, key: Text):
         """
@@ -37,7 +79,13 @@ class InMemoryCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        entry = self._cache.get(key)
+        if not entry:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
@@ -55,6 +103,11 @@ class InMemoryCache(BaseCache):
         expires_ts = time.perf_counter() + ttl if ttl else None
         for key in [keys] if isinstance(keys, Text) else keys:
             self._cache[key] = {"expires": expires_ts, "value": value}
+            self._cache.move_to_end(key)
+            if expires_ts is not None:
+                heapq.heappush(self._expiry_heap, (expires_ts, key))
+        self._evict_lru_items()
+        self._compact_expiry_heap()
 
     async def clear(self, key: Text):
         """
@@ -70,4 +123,17 @@ class InMemoryCache(BaseCache):
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry_heap = []
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache hit, miss and eviction counters."""
+        return {
+            "entries": len(self._cache),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
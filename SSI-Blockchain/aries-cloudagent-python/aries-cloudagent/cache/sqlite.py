@@ -0,0 +1,361 @@
+"""SQLite-backed cache implementation shared between local processes."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, Text, Union
+
+from .base import BaseCache, CacheError, CacheKeyLock, is_negative_entry
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SqliteCache(BaseCache):
+    """
+    Cache stored in a SQLite database in WAL mode.
+
+    Several agent processes on the same host may point at the same database
+    file to share cached values. Expiry uses wall-clock time so that every
+    process agrees on it, and values must be JSON serializable. Key locks
+    additionally take a lease row in the database so that a missing value is
+    produced by only one process at a time.
+
+    Statements run on a dedicated thread so that a database locked by another
+    process never blocks the event loop.
+    """
+
+    PURGE_INTERVAL = 256
+    BUSY_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        path: str,
+        lease_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Initialize a `SqliteCache` instance.
+
+        Args:
+            path: the path to the database file
+            lease_timeout: number of seconds after which a lease held by
+                another process is considered abandoned
+            poll_interval: number of seconds to wait between checks while
+                another process holds the lease on a key
+
+        """
+        super().__init__()
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        self._set_count = 0
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="acapy-cache")
+        try:
+            self._conn = sqlite3.connect(
+                path,
+                timeout=self.BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_items "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_items_expires "
+                "ON cache_items (expires)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_leases "
+                "(key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+        except sqlite3.Error as err:
+            raise CacheError(f"Error opening cache database: {path}") from err
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        """Run a blocking database operation on the cache thread."""
+        return await asyncio.get_event_loop().run_in_executor(self._executor, fn, *args)
+
+    def _purge_expired_cache_items(self, now: float):
+        """Remove expired items, using the expiry index."""
+        self._conn.execute(
+            "DELETE FROM cache_items WHERE expires IS NOT NULL AND expires <= ?",
+            (now,),
+        )
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        value = await self._run(self._get, key)
+        return None if value is None else json.loads(value)
+
+    def _get(self, key: Text):
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value, expires FROM cache_items WHERE key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return None
+        value, expires = row
+        if expires is not None and expires <= now:
+            self._conn.execute(
+                "DELETE FROM cache_items WHERE key = ? AND expires <= ?", (key, now)
+            )
+            return None
+        return value
+
+    async def get_many(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """
+        Get several items from the cache in a single statement.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            The records found, or `None` for each key that is not cached
+
+        """
+        values = await self._run(self._get_many, list(keys))
+        return [None if value is None else json.loads(value) for value in values]
+
+    def _get_many(self, keys: Sequence[Text]) -> Sequence[Text]:
+        now = time.time()
+        found = {}
+        if keys:
+            for key, value, expires in self._conn.execute(
+                "SELECT key, value, expires FROM cache_items WHERE key IN ({})".format(
+                    ", ".join("?" * len(keys))
+                ),
+                keys,
+            ):
+                if expires is None or expires > now:
+                    found[key] = value
+        return [found.get(key) for key in keys]
+
+    async def add(self, key: Text, value: Any, ttl: int = None) -> Any:
+        """
+        Add an item to the cache unless the key is already present.
+
+        The insert is ignored when the key is already present, so concurrent
+        processes adding the same key all get back the first value stored.
+
+        Args:
+            key: the key for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        Returns:
+            The value now stored under the key
+
+        """
+        now = time.time()
+        try:
+            value_json = json.dumps(value)
+        except TypeError as err:
+            raise CacheError("Cache value is not JSON serializable") from err
+        stored = await self._run(
+            self._add, key, value_json, now + ttl if ttl else None, now
+        )
+        return json.loads(stored)
+
+    def _add(self, key: Text, value_json: Text, expires: float, now: float) -> Text:
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM cache_items WHERE key = ? AND expires <= ?", (key, now)
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO cache_items (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, value_json, expires),
+            )
+            row = self._conn.execute(
+                "SELECT value FROM cache_items WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0]
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        now = time.time()
+        expires_ts = now + ttl if ttl else None
+        try:
+            value_json = json.dumps(value)
+        except TypeError as err:
+            raise CacheError("Cache value is not JSON serializable") from err
+        rows = [
+            (key, value_json, expires_ts)
+            for key in ([keys] if isinstance(keys, Text) else keys)
+        ]
+        self._set_count += 1
+        purge = self._set_count % self.PURGE_INTERVAL == 0
+        await self._run(self._set, rows, now if purge else None)
+
+    def _set(self, rows: Sequence[tuple], purge_time: float = None):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache_items (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+        if purge_time:
+            self._purge_expired_cache_items(purge_time)
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self._run(
+            self._conn.execute, "DELETE FROM cache_items WHERE key = ?", (key,)
+        )
+
+    async def flush(self):
+        """Remove all items from the cache."""
+
+        await self._run(self._conn.execute, "DELETE FROM cache_items")
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key."""
+        result = SqliteCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def claim_lease(self, key: Text, owner: Text = None) -> bool:
+        """
+        Attempt to claim the cross-process lease on a cache key.
+
+        Args:
+            key: the key to lease
+            owner: the identifier of the claiming key lock, by default
+                this instance
+
+        Returns:
+            `True` if the owner now holds the lease
+
+        """
+        return await self._run(self._claim_lease, key, owner or self.owner)
+
+    def _claim_lease(self, key: Text, owner: Text) -> bool:
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM cache_leases WHERE key = ? AND expires <= ?", (key, now)
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO cache_leases (key, owner, expires) "
+                "VALUES (?, ?, ?)",
+                (key, owner, now + self.lease_timeout),
+            )
+            row = self._conn.execute(
+                "SELECT owner FROM cache_leases WHERE key = ?", (key,)
+            ).fetchone()
+        return bool(row and row[0] == owner)
+
+    async def release_lease(self, key: Text, owner: Text = None):
+        """Release the cross-process lease on a cache key, if held by the owner."""
+        await self._run(
+            self._conn.execute,
+            "DELETE FROM cache_leases WHERE key = ? AND owner = ?",
+            (key, owner or self.owner),
+        )
+
+    def close(self):
+        """Close the database connection."""
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(path={})>".format(self.__class__.__name__, self.path)
+
+
+class SqliteCacheKeyLock(CacheKeyLock):
+    """
+    A lock on a cache key which is also honoured by other processes.
+
+    When the value is not cached, the lock waits until it either claims the
+    database lease for the key or another process stores the value. Each lock
+    claims the lease under its own owner id, so that a lock waiting on another
+    in the same process cannot take over or release its lease.
+    """
+
+    def __init__(self, cache: SqliteCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self.lease_held = False
+        self.owner = f"{cache.owner}:{uuid.uuid4().hex}"
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        while not self.done:
+            if await self.cache.claim_lease(self.key, self.owner):
+                self.lease_held = True
+                # the value may have been stored before the previous lease ended
+                self._set_found(await self.cache.get(self.key))
+                break
+            await asyncio.sleep(self.cache.poll_interval)
+            self._set_found(await self.cache.get(self.key))
+        return self
+
+    def _set_found(self, found: Any):
+        """Resolve the lock with a value stored by another process, if any."""
+        if is_negative_entry(found):
+            self.negative = True
+            self._future.set_result(None)
+        elif found:
+            self._future.set_result(found)
+
+    async def _release_lease(self):
+        """Release the database lease, if held."""
+        if self.lease_held:
+            self.lease_held = False
+            try:
+                await self.cache.release_lease(self.key, self.owner)
+            except sqlite3.Error:
+                LOGGER.warning("Error releasing cache lease for key: %s", self.key)
+
+    async def set_result(self, value: Any, ttl: int = None, store: bool = True):
+        """Set the result, updating the cache and any waiters."""
+        await super().set_result(value, ttl, store)
+        await self._release_lease()
+
+    async def set_negative(self, ttl: int = None):
+        """Record that no result was found, updating the cache and any waiters."""
+        await super().set_negative(ttl)
+        await self._release_lease()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        await self._release_lease()
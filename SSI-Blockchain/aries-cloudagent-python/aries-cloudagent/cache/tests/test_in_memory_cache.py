@@ -2,7 +2,7 @@ import pytest
 
 from asyncio import ensure_future, sleep, wait_for
 
-from ..base import CacheError
+from ..base import CacheError, is_negative_entry, key_family, wallet_namespace
 from ..in_memory import InMemoryCache
 
 
@@ -67,6 +67,49 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_expired_reclaimed_without_access(self, cache):
+        await cache.set("key", "value", 0.05)
+        await cache.set("key2", "value", 0.05)
+        await sleep(0.05)
+        await cache.set("other", "value")
+        assert "key" not in cache._cache
+        assert "key2" not in cache._cache
+        assert cache.expirations == 2
+
+    @pytest.mark.asyncio
+    async def test_overwrite_keeps_new_expiry(self, cache):
+        await cache.set("key", "value", 0.05)
+        await cache.set("key", "newval")
+        await sleep(0.05)
+        assert await cache.get("key") == "newval"
+        assert cache.expirations == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        assert await cache.get("key1") == "value1"
+        await cache.set("key3", "value3")
+        assert await cache.get("key2") is None
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key3") == "value3"
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache):
+        assert await cache.get("valid key") == "value"
+        assert await cache.get("doesn't exist") is None
+        assert cache.stats == {
+            "entries": 1,
+            "max_entries": None,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
@@ -166,3 +209,163 @@ class TestBasicCache:
     @pytest.mark.asyncio
     async def test_repr(self, cache):
         assert isinstance(repr(cache), str)
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead(self, cache):
+        cache.set_refresh_policy("schema::", 10)
+        assert cache.refresh_grace("schema::abc") == 10
+        assert cache.refresh_grace("other::abc") is None
+
+        await cache.set_refreshable("schema::abc", "value", 0.05)
+        assert not await cache.is_stale("schema::abc")
+        await sleep(0.05)
+        assert await cache.get("schema::abc") == "value"
+        assert await cache.is_stale("schema::abc")
+
+        calls = []
+
+        async def produce():
+            calls.append(True)
+            return "new value"
+
+        lock = cache.acquire("schema::abc")
+        async with lock as entry:
+            assert entry.result == "value"
+            assert entry.stale
+            entry.refresh(produce, 10)
+            task = cache.refresh("schema::abc", produce, 10)
+        await wait_for(task, 1)
+        assert calls == [True]
+        assert await cache.get("schema::abc") == "new value"
+        assert not await cache.is_stale("schema::abc")
+        assert not cache._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_no_store(self, cache):
+        cache.set_refresh_policy("schema::", 10)
+        await cache.set("schema::abc", "value", 10)
+
+        async def produce():
+            await cache.set_refreshable("schema::abc", "stored", 10)
+            return "new value"
+
+        await wait_for(cache.refresh("schema::abc", produce, 10, store=False), 1)
+        assert await cache.get("schema::abc") == "stored"
+        assert not await cache.is_stale("schema::abc")
+
+    @pytest.mark.asyncio
+    async def test_acquire_set_result_no_store(self, cache):
+        lock = cache.acquire("key")
+        waiter = cache.acquire("key")
+        async with lock as entry:
+            await entry.set_result("value", store=False)
+        async with waiter as entry:
+            assert entry.result == "value"
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_error(self, cache):
+        cache.set_refresh_policy("schema::", 10)
+        await cache.set_refreshable("schema::abc", "value", 10)
+
+        async def produce():
+            raise ValueError()
+
+        await wait_for(cache.refresh("schema::abc", produce, 10), 1)
+        assert await cache.get("schema::abc") == "value"
+        assert not cache._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_set_negative(self, cache):
+        await cache.set_negative("key")
+        assert await cache.get("key") is None
+
+        cache.negative_ttl = 10
+        await cache.set_negative("key")
+        assert is_negative_entry(await cache.get("key"))
+
+        await cache.set_negative("key2", 0.05)
+        assert is_negative_entry(await cache.get("key2"))
+        await sleep(0.05)
+        assert await cache.get("key2") is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_negative(self, cache):
+        cache.negative_ttl = 10
+        test_key = "test_key"
+        async with cache.acquire(test_key) as entry:
+            assert not entry.done
+            await entry.set_negative()
+        assert entry.negative
+        assert entry.result is None
+
+        lock = cache.acquire(test_key)
+        lock2 = cache.acquire(test_key)
+        async with lock as entry:
+            async with lock2 as entry2:
+                assert entry2.negative
+                assert entry2.result is None
+            assert entry.negative
+            assert entry.done
+            assert entry.result is None
+        assert test_key not in cache._key_locks
+
+    @pytest.mark.asyncio
+    async def test_namespaced_key(self, cache):
+        assert await cache.namespaced_key("key") == "key"
+        key = await cache.namespaced_key("key", "ns1", "ns2")
+        assert key.startswith("key@")
+        assert await cache.namespaced_key("key", "ns1", "ns2") == key
+        await cache.set(key, "value")
+
+        await cache.invalidate_namespace("ns2")
+        key2 = await cache.namespaced_key("key", "ns1", "ns2")
+        assert key2 != key
+        assert await cache.get(key2) is None
+
+    @pytest.mark.asyncio
+    async def test_namespace_tokens_memoized(self, cache):
+        key = await cache.namespaced_key("key", "ns1", "ns2")
+        await cache.set("cache_namespace::ns1", "external")
+        await cache.set("cache_namespace::ns2", "external")
+        assert await cache.namespaced_key("key", "ns1", "ns2") == key
+        assert await cache.namespaced_key("key", "ns1", "ns2", fresh=["ns2"]) == (
+            key.rsplit(".", 1)[0] + ".external"
+        )
+
+        cache._namespace_tokens = {"ns1": ("old", 0)}
+        assert await cache.namespaced_key("key", "ns1") == "key@external"
+
+        cache.NAMESPACE_TOKEN_MEMO_SIZE = 2
+        await cache.namespaced_key("key", "ns3", "ns4", "ns5")
+        assert len(cache._namespace_tokens) <= 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_add(self, cache):
+        assert await cache.get_many(["valid key", "missing"]) == ["value", None]
+        assert await cache.add("valid key", "other") == "value"
+        assert await cache.add("key", "other") == "other"
+
+    @pytest.mark.asyncio
+    async def test_scoped_key(self, cache):
+        key = await cache.scoped_key("connection_target::abc", "wallet1")
+        other = await cache.scoped_key("connection_target::abc", "wallet2")
+        base = await cache.scoped_key("connection_target::abc")
+        assert len({key, other, base}) == 3
+
+        await cache.invalidate_namespace(wallet_namespace("wallet1"))
+        assert await cache.scoped_key("connection_target::abc", "wallet1") != key
+        assert await cache.scoped_key("connection_target::abc", "wallet2") == other
+
+        key = await cache.scoped_key("connection_target::abc", "wallet1")
+        verkey_key = await cache.scoped_key("connection_by_verkey::abc", "wallet1")
+        await cache.invalidate_namespace(
+            wallet_namespace("wallet1", "connection_target")
+        )
+        assert await cache.scoped_key("connection_target::abc", "wallet1") != key
+        assert (
+            await cache.scoped_key("connection_by_verkey::abc", "wallet1") == verkey_key
+        )
+
+        await cache.invalidate_namespace(key_family("connection_target::abc"))
+        assert await cache.scoped_key("connection_target::abc", "wallet2") != other
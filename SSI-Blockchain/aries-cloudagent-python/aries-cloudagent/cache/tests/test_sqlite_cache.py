@@ -0,0 +1,191 @@
+import os
+import pytest
+import threading
+
+from asyncio import gather, sleep, wait_for
+from tempfile import TemporaryDirectory
+
+from ..base import CacheError
+from ..sqlite import SqliteCache
+
+
+@pytest.fixture()
+def db_path():
+    with TemporaryDirectory() as tmp_dir:
+        yield os.path.join(tmp_dir, "cache.db")
+
+
+@pytest.fixture()
+async def cache(db_path):
+    cache = SqliteCache(db_path, poll_interval=0.01)
+    await cache.set("valid key", "value")
+    yield cache
+    cache.close()
+
+
+class TestSqliteCache:
+    @pytest.mark.asyncio
+    async def test_get_none(self, cache):
+        item = await cache.get("doesn't exist")
+        assert item is None
+
+    @pytest.mark.asyncio
+    async def test_get_valid(self, cache):
+        item = await cache.get("valid key")
+        assert item == "value"
+
+    @pytest.mark.asyncio
+    async def test_set_multi(self, cache):
+        await cache.set([f"key{i}" for i in range(4)], {"dictkey": "dval"})
+        for key in [f"key{i}" for i in range(4)]:
+            assert await cache.get(key) == {"dictkey": "dval"}
+
+    @pytest.mark.asyncio
+    async def test_set_not_serializable(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", object())
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", {"dictkey": "dval"}, 0.05)
+        assert await cache.get("key") == {"dictkey": "dval"}
+        await sleep(0.05)
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_flush(self, cache):
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.flush()
+        assert await cache.get("valid key") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, cache, db_path):
+        other = SqliteCache(db_path)
+        assert await other.get("valid key") == "value"
+        await other.set("key", "other value")
+        assert await cache.get("key") == "other value"
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_single_flight_across_instances(self, cache, db_path):
+        other = SqliteCache(db_path, poll_interval=0.01)
+        test_key = "test_key"
+        calls = []
+
+        async def fetch(instance):
+            async with instance.acquire(test_key) as entry:
+                if entry.result:
+                    return entry.result
+                calls.append(instance)
+                await sleep(0.05)
+                await entry.set_result("test_result", 10)
+                return "test_result"
+
+        results = await wait_for(gather(fetch(cache), fetch(other)), 2)
+        assert results == ["test_result", "test_result"]
+        assert len(calls) == 1
+        assert test_key not in cache._key_locks
+        assert test_key not in other._key_locks
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_released_on_exception(self, cache, db_path):
+        other = SqliteCache(db_path, poll_interval=0.01)
+        test_key = "test_key"
+        with pytest.raises(ValueError):
+            async with cache.acquire(test_key):
+                raise ValueError
+        lock = other.acquire(test_key)
+        await wait_for(lock.__aenter__(), 1)
+        assert lock.lease_held
+        await lock.__aexit__(None, None, None)
+        assert not lock.lease_held
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_per_lock(self, cache):
+        test_key = "test_key"
+        lock = cache.acquire(test_key)
+        await wait_for(lock.__aenter__(), 1)
+        assert lock.lease_held
+        waiter = cache.acquire(test_key)
+        assert waiter.parent is lock
+        # a lock in the same instance does not share the lease
+        assert not await cache.claim_lease(test_key, waiter.owner)
+        await cache.release_lease(test_key, waiter.owner)
+        assert not await cache.claim_lease(test_key)
+
+        # the waiter claims the lease once the first lock ends without a result
+        await lock.__aexit__(None, None, None)
+        await wait_for(waiter.__aenter__(), 1)
+        assert waiter.lease_held
+        await waiter.__aexit__(None, None, None)
+        assert not waiter.lease_held
+        assert await cache.claim_lease(test_key)
+
+    @pytest.mark.asyncio
+    async def test_abandoned_lease_expires(self, cache, db_path):
+        other = SqliteCache(db_path, lease_timeout=0.05, poll_interval=0.01)
+        assert await other.claim_lease("test_key")
+        assert not await cache.claim_lease("test_key")
+        await sleep(0.05)
+        assert await cache.claim_lease("test_key")
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_statements_off_loop(self, cache):
+        threads = set()
+        cache._conn.set_trace_callback(
+            lambda _: threads.add(threading.current_thread().name)
+        )
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+        await cache.clear("key")
+        assert threads and threading.current_thread().name not in threads
+        assert all(name.startswith("acapy-cache") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_get_many_add(self, cache, db_path):
+        await cache.set("expired", "value", 0.01)
+        await sleep(0.02)
+        assert await cache.get_many(["valid key", "missing", "expired"]) == [
+            "value",
+            None,
+            None,
+        ]
+        assert await cache.get_many([]) == []
+
+        other = SqliteCache(db_path)
+        assert await cache.add("key", "first") == "first"
+        assert await other.add("key", "second") == "first"
+        assert await other.add("expired", "second") == "second"
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_namespace_tokens_across_instances(self, cache, db_path):
+        other = SqliteCache(db_path)
+        key = await cache.namespaced_key("key", "ns1", "ns2", fresh=("ns2",))
+        assert await other.namespaced_key("key", "ns1", "ns2") == key
+
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        assert await cache.namespaced_key("key", "ns1", "ns2", fresh=("ns2",)) == key
+        assert len(statements) == 1
+
+        await other.invalidate_namespace("ns2")
+        assert await cache.namespaced_key("key", "ns1", "ns2", fresh=("ns2",)) != key
+        await other.invalidate_namespace("ns1")
+        assert await cache.namespaced_key("key", "ns1") != await other.namespaced_key(
+            "key", "ns1"
+        )
+        cache._namespace_tokens.clear()
+        assert await cache.namespaced_key("key", "ns1") == await other.namespaced_key(
+            "key", "ns1"
+        )
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_repr(self, cache):
+        assert isinstance(repr(cache), str)
@@ -3,8 +3,10 @@
 import asyncio
 import functools
 import logging
+import shutil
 import signal
 import sys
+import tempfile
 from configargparse import ArgumentParser
 from typing import Coroutine, Sequence
 
@@ -14,8 +16,15 @@ except ImportError:
     uvloop = None
 
 from ..core.conductor import Conductor
+from ..core.workers import (
+    prepare_run_dir,
+    run_workers,
+    worker_started,
+    workers_supported,
+)
 from ..config import argparse as arg
 from ..config.default_context import DefaultContextBuilder
+from ..config.error import ArgsParseError
 from ..config.util import common_config
 
 from . import PROG
@@ -52,6 +61,17 @@ def execute(argv: Sequence[str] = None):
     # set ledger to read only if explicitely specified
     settings["ledger.read_only"] = settings.get("read_only_ledger", False)
 
+    workers = settings.get("workers.count") or 1
+    if workers > 1:
+        exit_code = execute_workers(settings, workers)
+        if exit_code:
+            sys.exit(exit_code)
+    else:
+        run_app(settings)
+
+
+def run_app(settings: dict):
+    """Run the agent in the current process."""
     # Create the Conductor instance
     context_builder = DefaultContextBuilder(settings)
     conductor = Conductor(context_builder)
@@ -63,6 +83,40 @@ def execute(argv: Sequence[str] = None):
     run_loop(start_app(conductor), shutdown_app(conductor))
 
 
+def execute_workers(settings: dict, workers: int) -> int:
+    """Run the agent in several worker processes, returning the exit code."""
+    if not workers_supported():
+        raise ArgsParseError("--workers is not supported on this platform")
+    if settings.get("wallet.type", "basic") == "basic":
+        raise ArgsParseError("--workers requires a persistent wallet type")
+    if settings.get("wallet.storage_type") != "postgres_storage":
+        LOGGER.warning(
+            "Workers sharing a wallet without postgres_storage may contend for it"
+        )
+    if not settings.get("cache.path"):
+        # Each worker would keep its own copy of cached records, such as
+        # connection records, and serve it after another worker updates it
+        raise ArgsParseError("--workers requires a shared --cache-path")
+
+    run_dir = settings.get("workers.run_dir")
+    temp_dir = None
+    if not run_dir:
+        run_dir = temp_dir = tempfile.mkdtemp(prefix="acapy-workers-")
+        settings["workers.run_dir"] = run_dir
+    prepare_run_dir(run_dir)
+
+    def run_worker(index: int):
+        run_app({**settings, "workers.index": index})
+
+    try:
+        return run_workers(
+            workers, run_worker, ready=functools.partial(worker_started, run_dir)
+        )
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def run_loop(startup: Coroutine, shutdown: Coroutine):
     """Execute the application, handling signals and ctrl-c."""
 
@@ -1,3 +1,4 @@
+import os
 import sys
 
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
@@ -55,6 +56,62 @@ class TestStart(AsyncTestCase):
             assert isinstance(shutdown_app.call_args[0][0], test_module.Conductor)
             run_loop.assert_called_once()
 
+    def test_exec_start_workers(self):
+        args = [
+            "-it",
+            "http",
+            "0.0.0.0",
+            "80",
+            "-ot",
+            "http",
+            "--endpoint",
+            "0.0.0.0",
+            "80",
+            "--no-ledger",
+            "--workers",
+            "2",
+        ]
+        with self.assertRaises(ArgsParseError):
+            test_module.execute(args)
+
+        args.extend(["--wallet-type", "askar", "--wallet-key", "key"])
+        with async_mock.patch.object(
+            test_module, "run_workers", return_value=0
+        ) as run_workers:
+            # workers with the in-memory default would each cache records
+            with self.assertRaises(ArgsParseError):
+                test_module.execute(args)
+            run_workers.assert_not_called()
+
+        cache_path = os.path.join(test_module.tempfile.gettempdir(), "cache.db")
+        args.extend(["--cache-path", cache_path])
+        with async_mock.patch.object(
+            test_module, "workers_supported", return_value=False
+        ):
+            with self.assertRaises(ArgsParseError):
+                test_module.execute(args)
+
+        with async_mock.patch.object(
+            test_module, "run_workers", return_value=0
+        ) as run_workers, async_mock.patch.object(test_module, "run_app") as run_app:
+            test_module.execute(args)
+            run_workers.assert_called_once()
+            count, run_worker = run_workers.call_args[0]
+            assert count == 2
+            run_worker(1)
+            settings = run_app.call_args[0][0]
+            assert settings["workers.count"] == 2
+            assert settings["workers.index"] == 1
+            run_dir = settings["workers.run_dir"]
+            assert run_dir.startswith(test_module.tempfile.gettempdir())
+            assert not os.path.exists(run_dir)
+
+            run_workers.return_value = 1
+            with self.assertRaises(SystemExit):
+                test_module.execute(args + ["--workers-run-dir", run_dir])
+            assert os.path.isdir(run_dir)
+            test_module.shutil.rmtree(run_dir)
+
     async def test_run_loop(self):
         startup = async_mock.CoroutineMock()
         startup_call = startup()
@@ -5,6 +5,7 @@ from asynctest import mock as async_mock, TestCase as AsyncTestCase
 from ...core.in_memory import InMemoryProfile
 from ...config.error import ArgsParseError
 from ...connections.models.conn_record import ConnRecord
+from ...protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
 from ...storage.base import BaseStorage
 from ...storage.record import StorageRecord
 from ...version import __version__
@@ -335,6 +336,38 @@ class TestUpgrade(AsyncTestCase):
                 )
             assert "No upgrade configuration found for" in str(ctx.exception)
 
+    async def test_upgrade_backfills_record_tags(self):
+        cred_ex = V20CredExRecord(
+            connection_id="dummy-conn-id",
+            thread_id="dummy-thid",
+            role=V20CredExRecord.ROLE_ISSUER,
+            state=V20CredExRecord.STATE_OFFER_SENT,
+        )
+        await cred_ex.save(self.session_storage)
+        stored = cred_ex.storage_record
+        await self.storage.update_record(
+            stored, stored.value, {"thread_id": "dummy-thid"}
+        )
+        assert not await V20CredExRecord.tags_backfilled(self.session_storage)
+
+        with async_mock.patch.object(
+            test_module,
+            "wallet_config",
+            async_mock.CoroutineMock(
+                return_value=(
+                    self.profile_storage,
+                    async_mock.CoroutineMock(did="public DID", verkey="verkey"),
+                )
+            ),
+        ):
+            await test_module.upgrade({"upgrade.from_version": "v0.7.2"})
+
+        assert await V20CredExRecord.tags_backfilled(self.session_storage)
+        stored = await self.storage.get_record(
+            V20CredExRecord.RECORD_TYPE, cred_ex.cred_ex_id
+        )
+        assert stored.tags["state"] == V20CredExRecord.STATE_OFFER_SENT
+
     def test_main(self):
         with async_mock.patch.object(
             test_module, "__name__", "__main__"
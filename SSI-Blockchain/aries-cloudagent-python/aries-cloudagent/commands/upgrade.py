@@ -13,6 +13,7 @@ from ..config.default_context import DefaultContextBuilder
 from ..config.base import BaseError
 from ..config.util import common_config
 from ..config.wallet import wallet_config
+from ..messaging.models.backfill import backfill_pending_record_tags
 from ..messaging.models.base_record import BaseRecord
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
@@ -197,6 +198,10 @@ async def upgrade(settings: dict):
                         f"specified for {config_from_version}"
                     )
                 await update_existing_recs_callable(root_profile)
+        # Backfill record tags now, rather than in the background on startup
+        print("Backfilling record tags")
+        count = await backfill_pending_record_tags(root_profile)
+        print(f"Backfilled tags on {count} records")
         # Update storage version
         async with root_profile.session() as session:
             storage = session.inject(BaseStorage)
@@ -13,6 +13,7 @@ import yaml
 
 from configargparse import ArgumentParser, Namespace, YAMLConfigFileParser
 
+from ..utils import executors
 from ..utils.tracing import trace_event
 
 from .error import ArgsParseError
@@ -221,6 +222,87 @@ class AdminGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class CacheGroup(ArgumentGroup):
+    """Cache settings."""
+
+    GROUP_NAME = "Cache"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add cache-specific command line arguments to the parser."""
+        parser.add_argument(
+            "--cache-max-entries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help=(
+                "Set the maximum number of entries held by the in-memory cache. "
+                "Least recently used entries are evicted once this is exceeded. "
+                "Default: unbounded."
+            ),
+        )
+        parser.add_argument(
+            "--cache-path",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_CACHE_PATH",
+            help=(
+                "Store the cache in a SQLite database at <path> instead of in "
+                "memory. Agent processes on the same host which use the same path "
+                "share cached values and only fetch a missing value once."
+            ),
+        )
+        parser.add_argument(
+            "--cache-negative-ttl",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_CACHE_NEGATIVE_TTL",
+            help=(
+                "Remember failed schema, credential definition and DID lookups "
+                "for <seconds>, so that repeated lookups of missing objects do "
+                "not reach the ledger or resolver. Default: disabled."
+            ),
+        )
+        parser.add_argument(
+            "--cache-refresh-ahead",
+            type=str,
+            nargs="+",
+            metavar="<prefix>=<grace>",
+            env_var="ACAPY_CACHE_REFRESH_AHEAD",
+            help=(
+                "Enable refresh-ahead for cache keys starting with <prefix>, "
+                "for example 'schema::=300'. Once such an entry expires it is "
+                "still served for <grace> seconds while it is refreshed in the "
+                "background. Supported prefixes include 'schema::', "
+                "'credential_definition::' and 'did_ledger_id_resolver::'."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract cache settings."""
+        settings = {}
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_path:
+            settings["cache.path"] = args.cache_path
+        if args.cache_negative_ttl:
+            settings["cache.negative_ttl"] = args.cache_negative_ttl
+        if args.cache_refresh_ahead:
+            refresh_ahead = {}
+            for value_str in args.cache_refresh_ahead:
+                prefix, _, grace = value_str.rpartition("=")
+                try:
+                    if not prefix:
+                        raise ValueError()
+                    refresh_ahead[prefix] = float(grace)
+                except ValueError:
+                    raise ArgsParseError(
+                        f"Invalid --cache-refresh-ahead value: '{value_str}'"
+                    )
+            settings["cache.refresh_ahead"] = refresh_ahead
+        return settings
+
+
 @group(CAT_START)
 class DebugGroup(ArgumentGroup):
     """Debug settings."""
@@ -507,6 +589,68 @@ class DiscoverFeaturesGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class ExecutorGroup(ArgumentGroup):
+    """Crypto executor settings."""
+
+    GROUP_NAME = "Executors"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add crypto executor command line arguments to the parser."""
+        parser.add_argument(
+            "--crypto-executor",
+            type=str,
+            nargs="+",
+            metavar="<name>:<options>",
+            env_var="ACAPY_CRYPTO_EXECUTOR",
+            help=(
+                "Configure the executor running a class of blocking crypto "
+                "operations with comma separated <options>, for example "
+                "'anoncreds-verify:workers=4,max_queued=100,backend=process'. "
+                "Options are 'workers' (default: the number of CPUs, or 1 for "
+                "'anoncreds-registry'), 'max_queued' operations waiting for a "
+                "worker before new operations are refused (default: no limit) "
+                "and 'backend', either 'thread' (default) or 'process'. "
+                "Executors are 'pack', 'anoncreds-issue', 'anoncreds-holder', "
+                "'anoncreds-verify' and 'anoncreds-registry'; only the last two "
+                "support the 'process' backend."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract crypto executor settings."""
+        settings = {}
+        if args.crypto_executor:
+            config = {}
+            for value_str in args.crypto_executor:
+                name, _, options_str = value_str.partition(":")
+                options = {}
+                try:
+                    if name not in executors.EXECUTOR_DEFAULTS or not options_str:
+                        raise ValueError()
+                    for option in options_str.split(","):
+                        key, _, value = option.partition("=")
+                        if key == "workers" and int(value) > 0:
+                            options["workers"] = int(value)
+                        elif key == "max_queued" and int(value) >= 0:
+                            options["max_queued"] = int(value)
+                        elif key == "backend" and (
+                            value == executors.BACKEND_THREAD
+                            or value == executors.BACKEND_PROCESS
+                            and name in executors.PROCESS_EXECUTORS
+                        ):
+                            options["backend"] = value
+                        else:
+                            raise ValueError()
+                except ValueError:
+                    raise ArgsParseError(
+                        f"Invalid --crypto-executor value: '{value_str}'"
+                    )
+                config[name] = options
+            settings["executors"] = config
+        return settings
+
+
 @group(CAT_PROVISION, CAT_START)
 class GeneralGroup(ArgumentGroup):
     """General settings."""
@@ -643,6 +787,43 @@ class GeneralGroup(ArgumentGroup):
                 "resolver instance."
             ),
         )
+        parser.add_argument(
+            "--json-codec",
+            type=str,
+            choices=("stdlib", "orjson", "ujson", "auto"),
+            metavar="<codec>",
+            env_var="ACAPY_JSON_CODEC",
+            help=(
+                "Specifies the JSON library used to parse and encode wire messages, "
+                "storage record values and webhooks: 'stdlib', 'orjson', 'ujson', "
+                "or 'auto' for the fastest one installed. Admin responses always "
+                "use the default encoder. Default: stdlib."
+            ),
+        )
+        parser.add_argument(
+            "--event-bus-mode",
+            type=str,
+            choices=("sequential", "concurrent", "background"),
+            metavar="<mode>",
+            env_var="ACAPY_EVENT_BUS_MODE",
+            help=(
+                "Specifies how event subscribers, such as webhook and websocket "
+                "emitters, are run: 'sequential' awaits each subscriber in turn, "
+                "'concurrent' awaits all subscribers together, and 'background' "
+                "runs them as tasks on the dispatcher queue without blocking the "
+                "code emitting the event. Default: sequential."
+            ),
+        )
+        parser.add_argument(
+            "--event-subscriber-timeout",
+            type=BoundedInt(min=1),
+            metavar="<milliseconds>",
+            env_var="ACAPY_EVENT_SUBSCRIBER_TIMEOUT",
+            help=(
+                "Cancel event subscribers which do not complete within the given "
+                "number of milliseconds. Default: no timeout."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -694,6 +875,107 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_regex:
             settings["resolver.universal.supported"] = args.universal_resolver_regex
 
+        if args.json_codec:
+            settings["json_codec"] = args.json_codec
+
+        if args.event_bus_mode:
+            settings["event_bus.mode"] = args.event_bus_mode
+        if args.event_subscriber_timeout:
+            settings["event_bus.subscriber_timeout"] = (
+                args.event_subscriber_timeout / 1000
+            )
+
+        return settings
+
+
+@group(CAT_START)
+class RetentionGroup(ArgumentGroup):
+    """Record retention settings."""
+
+    GROUP_NAME = "Retention"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add record retention command line arguments to the parser."""
+        parser.add_argument(
+            "--retention-policy",
+            type=str,
+            nargs="+",
+            metavar="<record_type>:<limits>",
+            env_var="ACAPY_RETENTION_POLICY",
+            help=(
+                "Periodically remove records of <record_type> which exceed the "
+                "comma separated <limits>, for example "
+                "'cred_ex_v20:max_age=604800,max_count=10000'. Limits are "
+                "'max_age' in seconds since the last update, 'max_count' of the "
+                "most recently updated records to keep, and 'terminal_only' "
+                "(default: true) to only remove records in a terminal state. "
+                "Supported record types are 'credential_exchange_v10', "
+                "'cred_ex_v20', 'presentation_exchange_v10', 'pres_ex_v20', "
+                "'oob_record' and 'transaction'. Only the base wallet is swept; "
+                "the sub-wallets of a multitenant agent are not."
+            ),
+        )
+        parser.add_argument(
+            "--retention-interval",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_RETENTION_INTERVAL",
+            help="Set the number of seconds between retention sweeps. Default: 3600.",
+        )
+        parser.add_argument(
+            "--retention-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_RETENTION_BATCH_SIZE",
+            help=(
+                "Set the number of records removed in each retention transaction. "
+                "Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--retention-concurrency",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_RETENTION_CONCURRENCY",
+            help=(
+                "Set the maximum number of retention batches removed concurrently. "
+                "Default: 2."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract record retention settings."""
+        settings = {}
+        if args.retention_policy:
+            policies = {}
+            for value_str in args.retention_policy:
+                record_type, _, limits_str = value_str.partition(":")
+                policy = {}
+                try:
+                    if not record_type or not limits_str:
+                        raise ValueError()
+                    for limit in limits_str.split(","):
+                        key, _, value = limit.partition("=")
+                        if key == "max_age":
+                            policy["max_age"] = float(value)
+                        elif key == "max_count":
+                            policy["max_count"] = int(value)
+                        elif key == "terminal_only" and value in ("true", "false"):
+                            policy["terminal_only"] = value == "true"
+                        else:
+                            raise ValueError()
+                except ValueError:
+                    raise ArgsParseError(
+                        f"Invalid --retention-policy value: '{value_str}'"
+                    )
+                policies[record_type] = policy
+            settings["retention.policies"] = policies
+        if args.retention_interval:
+            settings["retention.interval"] = args.retention_interval
+        if args.retention_batch_size:
+            settings["retention.batch_size"] = args.retention_batch_size
+        if args.retention_concurrency:
+            settings["retention.concurrency"] = args.retention_concurrency
         return settings
 
 
@@ -1109,6 +1391,17 @@ class ProtocolGroup(ArgumentGroup):
                 "instead of 'application/ssi-agent-wire'."
             ),
         )
+        parser.add_argument(
+            "--fast-message-codecs",
+            action="store_true",
+            env_var="ACAPY_FAST_MESSAGE_CODECS",
+            help=(
+                "Serialize and deserialize high-volume message types (forward, "
+                "trust ping, basic message, credential issue and presentation) "
+                "with codecs compiled from their schemas at startup, falling "
+                "back to full schema validation whenever the fast path declines."
+            ),
+        )
         parser.add_argument(
             "--exch-use-unencrypted-tags",
             action="store_true",
@@ -1174,6 +1467,8 @@ class ProtocolGroup(ArgumentGroup):
             settings["emit_new_didcomm_prefix"] = True
         if args.emit_new_didcomm_mime_type:
             settings["emit_new_didcomm_mime_type"] = True
+        if args.fast_message_codecs:
+            settings["fast_message_codecs"] = True
         if args.exch_use_unencrypted_tags:
             settings["exch_use_unencrypted_tags"] = True
             environ["EXCH_UNENCRYPTED_TAGS"] = "True"
@@ -1197,12 +1492,39 @@ class StartupGroup(ArgumentGroup):
                 "the given parameters."
             ),
         )
+        parser.add_argument(
+            "--workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WORKERS",
+            help=(
+                "Run the agent in <count> worker processes sharing the inbound "
+                "and admin ports and the wallet, which must be persistent. "
+                "Requires --cache-path so the workers share one cache. "
+                "Default: 1."
+            ),
+        )
+        parser.add_argument(
+            "--workers-run-dir",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_WORKERS_RUN_DIR",
+            help=(
+                "Directory used by the worker processes to elect a leader for "
+                "background jobs and to share statistics. Default: a temporary "
+                "directory."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract startup settings."""
         settings = {}
         if args.auto_provision:
             settings["auto_provision"] = True
+        if args.workers:
+            settings["workers.count"] = args.workers
+        if args.workers_run_dir:
+            settings["workers.run_dir"] = args.workers_run_dir
         return settings
 
 
@@ -1296,6 +1618,78 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--dispatch-shards",
+            type=BoundedInt(min=0),
+            metavar="<shards>",
+            env_var="ACAPY_DISPATCH_SHARDS",
+            help=(
+                "Dispatch inbound messages through <shards> task queues, running "
+                "the messages of each thread in order and different threads in "
+                "parallel. Default: 0, a single shared queue without ordering."
+            ),
+        )
+        parser.add_argument(
+            "--dispatch-order",
+            type=str,
+            choices=("thread", "connection"),
+            env_var="ACAPY_DISPATCH_ORDER",
+            help=(
+                "With sharded dispatch, run inbound messages in order per 'thread' "
+                "or per 'connection' (sending key). Default: thread."
+            ),
+        )
+        parser.add_argument(
+            "--dispatch-max-pending",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_DISPATCH_MAX_PENDING",
+            help=(
+                "With sharded dispatch, reject inbound messages when <count> "
+                "messages are already waiting for the same thread or connection. "
+                "Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--inbound-max-pending",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_INBOUND_MAX_PENDING",
+            help=(
+                "Refuse inbound messages while more than <count> tasks are "
+                "waiting in the dispatcher. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--inbound-max-outbound",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_INBOUND_MAX_OUTBOUND",
+            help=(
+                "Refuse inbound messages while more than <count> outbound "
+                "messages are waiting to be encoded or delivered. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--inbound-max-loop-lag",
+            type=BoundedInt(min=1),
+            metavar="<milliseconds>",
+            env_var="ACAPY_INBOUND_MAX_LOOP_LAG",
+            help=(
+                "Refuse inbound messages while the event loop lags by more than "
+                "<milliseconds>. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--inbound-retry-after",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_INBOUND_RETRY_AFTER",
+            help=(
+                "Ask clients to retry refused inbound messages after <seconds>, "
+                "using the Retry-After header of HTTP 503 responses. Default: 5."
+            ),
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1340,6 +1734,22 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.dispatch_shards:
+            settings["dispatch.shards"] = args.dispatch_shards
+        if args.dispatch_order:
+            settings["dispatch.order"] = args.dispatch_order
+        if args.dispatch_max_pending:
+            settings["dispatch.max_pending_per_key"] = args.dispatch_max_pending
+        if args.inbound_max_pending:
+            settings["transport.admission.max_pending"] = args.inbound_max_pending
+        if args.inbound_max_outbound:
+            settings["transport.admission.max_outbound"] = args.inbound_max_outbound
+        if args.inbound_max_loop_lag:
+            settings["transport.admission.max_loop_lag"] = (
+                args.inbound_max_loop_lag / 1000
+            )
+        if args.inbound_retry_after:
+            settings["transport.admission.retry_after"] = args.inbound_retry_after
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
@@ -2,6 +2,7 @@
 
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.sqlite import SqliteCache
 from ..core.event_bus import EventBus
 from ..core.goal_code_registry import GoalCodeRegistry
 from ..core.plugin_registry import PluginRegistry
@@ -37,8 +38,15 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache, in-memory unless a database path is configured
+        if context.settings.get("cache.path"):
+            cache = SqliteCache(context.settings["cache.path"])
+        else:
+            cache = InMemoryCache(max_entries=context.settings.get("cache.max_entries"))
+        cache.negative_ttl = context.settings.get("cache.negative_ttl")
+        for prefix, grace in context.settings.get("cache.refresh_ahead", {}).items():
+            cache.set_refresh_policy(prefix, grace)
+        context.injector.bind_instance(BaseCache, cache)
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -47,7 +55,13 @@ class DefaultContextBuilder(ContextBuilder):
         context.injector.bind_instance(GoalCodeRegistry, GoalCodeRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                mode=context.settings.get("event_bus.mode"),
+                subscriber_timeout=context.settings.get("event_bus.subscriber_timeout"),
+            ),
+        )
 
         # Global did resolver
         context.injector.bind_instance(DIDResolver, DIDResolver([]))
@@ -126,6 +140,7 @@ class DefaultContextBuilder(ContextBuilder):
         plugin_registry.register_plugin("aries_cloudagent.messaging.jsonld")
         plugin_registry.register_plugin("aries_cloudagent.revocation")
         plugin_registry.register_plugin("aries_cloudagent.resolver")
+        plugin_registry.register_plugin("aries_cloudagent.retention")
         plugin_registry.register_plugin("aries_cloudagent.wallet")
 
         if context.settings.get("multitenant.admin_enabled"):
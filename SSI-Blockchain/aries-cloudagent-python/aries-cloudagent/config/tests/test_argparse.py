@@ -52,6 +52,231 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
+        assert "dispatch.shards" not in settings
+
+        result = parser.parse_args(
+            [
+                "--inbound-transport",
+                "http",
+                "0.0.0.0",
+                "80",
+                "--outbound-transport",
+                "http",
+                "--dispatch-shards",
+                "4",
+                "--dispatch-order",
+                "connection",
+                "--dispatch-max-pending",
+                "10",
+                "--inbound-max-pending",
+                "500",
+                "--inbound-max-outbound",
+                "1000",
+                "--inbound-max-loop-lag",
+                "250",
+                "--inbound-retry-after",
+                "2",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["dispatch.shards"] == 4
+        assert settings["dispatch.order"] == "connection"
+        assert settings["dispatch.max_pending_per_key"] == 10
+        assert settings["transport.admission.max_pending"] == 500
+        assert settings["transport.admission.max_outbound"] == 1000
+        assert settings["transport.admission.max_loop_lag"] == 0.25
+        assert settings["transport.admission.retry_after"] == 2
+
+    async def test_cache_settings(self):
+        """Test cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.CacheGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        assert group.get_settings(result) == {}
+
+        result = parser.parse_args(["--cache-max-entries", "1000"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_entries") == 1000
+
+        result = parser.parse_args(["--cache-path", "/tmp/cache.db"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.path") == "/tmp/cache.db"
+
+        result = parser.parse_args(["--cache-negative-ttl", "30"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.negative_ttl") == 30
+
+        result = parser.parse_args(
+            ["--cache-refresh-ahead", "schema::=300", "credential_definition::=60"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.refresh_ahead") == {
+            "schema::": 300.0,
+            "credential_definition::": 60.0,
+        }
+
+        result = parser.parse_args(["--cache-refresh-ahead", "schema::"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_workers_settings(self):
+        """Test worker process argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.StartupGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        assert group.get_settings(result) == {}
+
+        result = parser.parse_args(
+            ["--workers", "4", "--workers-run-dir", "/run/acapy"]
+        )
+        settings = group.get_settings(result)
+        assert settings["workers.count"] == 4
+        assert settings["workers.run_dir"] == "/run/acapy"
+
+    async def test_retention_settings(self):
+        """Test record retention argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.RetentionGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        assert group.get_settings(result) == {}
+
+        result = parser.parse_args(
+            [
+                "--retention-policy",
+                "cred_ex_v20:max_age=86400,max_count=100",
+                "oob_record:max_age=60,terminal_only=false",
+                "--retention-interval",
+                "600",
+                "--retention-batch-size",
+                "50",
+                "--retention-concurrency",
+                "4",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings == {
+            "retention.policies": {
+                "cred_ex_v20": {"max_age": 86400.0, "max_count": 100},
+                "oob_record": {"max_age": 60.0, "terminal_only": False},
+            },
+            "retention.interval": 600,
+            "retention.batch_size": 50,
+            "retention.concurrency": 4,
+        }
+
+        for value in ("cred_ex_v20", "cred_ex_v20:max_age", "cred_ex_v20:size=1"):
+            result = parser.parse_args(["--retention-policy", value])
+            with self.assertRaises(argparse.ArgsParseError):
+                group.get_settings(result)
+
+    async def test_executor_settings(self):
+        """Test crypto executor argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ExecutorGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        assert group.get_settings(result) == {}
+
+        result = parser.parse_args(
+            [
+                "--crypto-executor",
+                "pack:workers=2",
+                "anoncreds-verify:workers=4,max_queued=100,backend=process",
+            ]
+        )
+        assert group.get_settings(result) == {
+            "executors": {
+                "pack": {"workers": 2},
+                "anoncreds-verify": {
+                    "workers": 4,
+                    "max_queued": 100,
+                    "backend": "process",
+                },
+            }
+        }
+
+        for value in (
+            "pack",
+            "unknown:workers=1",
+            "pack:workers=0",
+            "pack:max_queued=x",
+            "pack:backend=process",
+        ):
+            result = parser.parse_args(["--crypto-executor", value])
+            with self.assertRaises(argparse.ArgsParseError):
+                group.get_settings(result)
+
+    async def test_fast_message_codecs(self):
+        """Test fast message codec argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+        argparse.TransportGroup().add_arguments(parser)
+
+        result = parser.parse_args([])
+        assert not group.get_settings(result).get("fast_message_codecs")
+
+        result = parser.parse_args(["--fast-message-codecs"])
+        assert group.get_settings(result).get("fast_message_codecs") is True
+
+    async def test_json_codec(self):
+        """Test JSON codec argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["-e", "test"])
+        assert "json_codec" not in group.get_settings(result)
+
+        result = parser.parse_args(["-e", "test", "--json-codec", "auto"])
+        assert group.get_settings(result)["json_codec"] == "auto"
+
+        with async_mock.patch.object(parser, "exit") as exit_parser:
+            parser.parse_args(["-e", "test", "--json-codec", "bogus"])
+            exit_parser.assert_called()
+
+    async def test_event_bus_settings(self):
+        """Test event bus argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["-e", "test"])
+        settings = group.get_settings(result)
+        assert "event_bus.mode" not in settings
+        assert "event_bus.subscriber_timeout" not in settings
+
+        result = parser.parse_args(
+            [
+                "-e",
+                "test",
+                "--event-bus-mode",
+                "background",
+                "--event-subscriber-timeout",
+                "2500",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["event_bus.mode"] == "background"
+        assert settings["event_bus.subscriber_timeout"] == 2.5
+
+        with async_mock.patch.object(parser, "exit") as exit_parser:
+            parser.parse_args(["-e", "test", "--event-bus-mode", "bogus"])
+            exit_parser.assert_called()
 
     async def test_get_genesis_transactions_list_with_ledger_selection(self):
         """Test multiple ledger support related argument parsing."""
@@ -48,6 +48,12 @@ class TestWalletConfig(AsyncTestCase):
         self.context = InjectionContext()
         self.context.injector.bind_instance(ProfileManager, MockManager(self.profile))
 
+        patcher = async_mock.patch.object(
+            test_module, "mark_record_tags_backfilled", async_mock.CoroutineMock()
+        )
+        self.mock_mark_backfilled = patcher.start()
+        self.addCleanup(patcher.stop)
+
     async def test_wallet_config_existing_replace(self):
         self.context.update_settings(
             {
@@ -75,6 +81,7 @@ class TestWalletConfig(AsyncTestCase):
             mock_seed_to_did.return_value = "XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
 
             await test_module.wallet_config(self.context, provision=True)
+        self.mock_mark_backfilled.assert_awaited_once_with(self.session)
 
     async def test_wallet_config_existing_open(self):
         self.profile = async_mock.MagicMock(
@@ -114,6 +121,7 @@ class TestWalletConfig(AsyncTestCase):
             mock_seed_to_did.return_value = "XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
 
             await test_module.wallet_config(self.context, provision=True)
+        self.mock_mark_backfilled.assert_not_awaited()
 
     async def test_wallet_config_auto_provision(self):
         self.context.update_settings(
@@ -5,6 +5,7 @@ from typing import Tuple
 
 from ..core.error import ProfileNotFoundError
 from ..core.profile import Profile, ProfileManager, ProfileSession
+from ..messaging.models.backfill import mark_record_tags_backfilled
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
@@ -71,6 +72,10 @@ async def wallet_config(
     txn = await profile.transaction()
     wallet = txn.inject(BaseWallet)
 
+    if profile.created:
+        # a new wallet holds no records stored without their current tags
+        await mark_record_tags_backfilled(txn)
+
     public_did_info = await wallet.get_public_did()
     public_did = None
 
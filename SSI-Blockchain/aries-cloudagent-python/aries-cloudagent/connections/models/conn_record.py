@@ -1,13 +1,12 @@
 """Handle connection information interface with non-secrets storage."""
 
-import json
-
 from enum import Enum
 from typing import Any, Optional, Union
 
 from marshmallow import fields, validate
 
-from ...core.profile import ProfileSession
+from ...cache.base import BaseCache, key_family, wallet_namespace
+from ...core.profile import Profile, ProfileSession
 from ...messaging.models.base_record import BaseRecord, BaseRecordSchema
 from ...messaging.valid import INDY_DID, INDY_RAW_PUBLIC_KEY, UUIDFour
 
@@ -29,6 +28,7 @@ from ...protocols.out_of_band.v1_0.messages.invitation import (
 from ...storage.base import BaseStorage
 from ...storage.record import StorageRecord
 from ...storage.error import StorageNotFoundError
+from ...utils import json_codec
 
 
 class ConnRecord(BaseRecord):
@@ -166,6 +166,7 @@ class ConnRecord(BaseRecord):
 
     RECORD_ID_NAME = "connection_id"
     RECORD_TOPIC = "connections"
+    RECORD_CACHE_TTL = 3600
     LOG_STATE_FLAG = "debug.connections"
     TAG_NAMES = {
         "my_did",
@@ -366,11 +367,9 @@ class ConnRecord(BaseRecord):
         conn_records = await cls.query(
             session,
             tag_filter=tag_filter,
+            post_filter_positive={"state": cls.State.COMPLETED.rfc160},
         )
-        for conn_record in conn_records:
-            if conn_record.state == ConnRecord.State.COMPLETED:
-                return conn_record
-        return None
+        return conn_records[0] if conn_records else None
 
     @classmethod
     async def retrieve_by_request_id(
@@ -434,7 +433,7 @@ class ConnRecord(BaseRecord):
             self.RECORD_TYPE_INVITATION,
             {"connection_id": self.connection_id},
         )
-        ser = json.loads(result.value)
+        ser = json_codec.loads(result.value)
         return (
             ConnectionInvitation
             if DIDCommPrefix.unqualify(ser["@type"]) == CONNECTION_INVITATION
@@ -475,7 +474,7 @@ class ConnRecord(BaseRecord):
         result = await storage.find_record(
             self.RECORD_TYPE_REQUEST, {"connection_id": self.connection_id}
         )
-        ser = json.loads(result.value)
+        ser = json_codec.loads(result.value)
         return (
             ConnectionRequest
             if DIDCommPrefix.unqualify(ser["@type"]) == CONNECTION_REQUEST
@@ -495,6 +494,80 @@ class ConnRecord(BaseRecord):
         """Accessor for multi use invitation mode."""
         return self.invitation_mode == self.INVITATION_MODE_MULTI
 
+    @classmethod
+    async def _record_cache_key(
+        cls, cache: BaseCache, wallet_id: Optional[str], connection_id: str
+    ) -> str:
+        """
+        Get the versioned cache key for a connection record.
+
+        Besides the usual family and wallet namespaces, the key is covered by
+        a namespace of its own which is invalidated on every write, so a value
+        read from storage before a concurrent write is never found again. The
+        token of that namespace is always read from the cache.
+        """
+        key = f"conn_record::{connection_id}"
+        record_namespace = wallet_namespace(wallet_id, key)
+        return await cache.namespaced_key(
+            key,
+            key_family(key),
+            wallet_namespace(wallet_id),
+            wallet_namespace(wallet_id, key_family(key)),
+            record_namespace,
+            fresh=(record_namespace,),
+        )
+
+    @classmethod
+    async def retrieve_by_id_cached(
+        cls, profile: Profile, connection_id: str
+    ) -> "ConnRecord":
+        """Retrieve a connection record by ID, reading through the profile cache.
+
+        Args:
+            profile: The profile holding the connection
+            connection_id: The ID of the connection record
+        """
+        cache = profile.inject_or(BaseCache)
+        if not cache:
+            async with profile.session() as session:
+                return await cls.retrieve_by_id(session, connection_id)
+
+        cache_key = await cls._record_cache_key(
+            cache, profile.settings.get("wallet.id"), connection_id
+        )
+        value = await cache.get(cache_key)
+        if value:
+            return cls.from_storage(connection_id, value)
+
+        async with profile.session() as session:
+            record = await cls.retrieve_by_id(session, connection_id)
+        await cache.set(cache_key, record.value, cls.RECORD_CACHE_TTL)
+        return record
+
+    async def _write_through_cache(self, session: ProfileSession, deleted: bool):
+        """
+        Replace the cached copy of this record after a write.
+
+        Within a transaction the cached copy is only invalidated, as the
+        write may still be rolled back. It is invalidated again once the
+        transaction is committed, in case a concurrent reader cached the
+        previous value in the meantime.
+        """
+        cache = session.inject_or(BaseCache)
+        if not cache or not self._id:
+            return
+        namespace = wallet_namespace(
+            session.settings.get("wallet.id"), f"conn_record::{self._id}"
+        )
+        await cache.invalidate_namespace(namespace)
+        if session.is_transaction:
+            session.on_commit(lambda: cache.invalidate_namespace(namespace))
+        elif not deleted:
+            cache_key = await self._record_cache_key(
+                cache, session.settings.get("wallet.id"), self._id
+            )
+            await cache.set(cache_key, self.value, self.RECORD_CACHE_TTL)
+
     async def post_save(self, session: ProfileSession, *args, **kwargs):
         """Perform post-save actions.
 
@@ -502,6 +575,7 @@ class ConnRecord(BaseRecord):
             session: The active profile session
         """
         await super().post_save(session, *args, **kwargs)
+        await self._write_through_cache(session, deleted=False)
 
         # clear cache key set by connection manager
         cache_key = f"connection_target::{self.connection_id}"
@@ -515,6 +589,7 @@ class ConnRecord(BaseRecord):
 
         """
         await super().delete_record(session)
+        await self._write_through_cache(session, deleted=True)
 
         # Delete metadata
         if self.connection_id:
@@ -546,7 +621,7 @@ class ConnRecord(BaseRecord):
                 self.RECORD_TYPE_METADATA,
                 {"key": key, "connection_id": self.connection_id},
             )
-            return json.loads(record.value)
+            return json_codec.loads(record.value)
         except StorageNotFoundError:
             return default
 
@@ -559,7 +634,7 @@ class ConnRecord(BaseRecord):
             value (Any): value to set
         """
         assert self.connection_id
-        value = json.dumps(value)
+        value = json_codec.dumps(value)
         storage: BaseStorage = session.inject(BaseStorage)
         try:
             record = await storage.find_record(
@@ -609,7 +684,9 @@ class ConnRecord(BaseRecord):
             self.RECORD_TYPE_METADATA,
             {"connection_id": self.connection_id},
         )
-        return {record.tags["key"]: json.loads(record.value) for record in records}
+        return {
+            record.tags["key"]: json_codec.loads(record.value) for record in records
+        }
 
     def __eq__(self, other: Any) -> bool:
         """Comparison between records."""
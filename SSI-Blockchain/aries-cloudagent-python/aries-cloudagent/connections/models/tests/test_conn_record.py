@@ -1,5 +1,7 @@
-from asynctest import TestCase as AsyncTestCase
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
+from ....cache.base import BaseCache
+from ....cache.in_memory import InMemoryCache
 from ....core.in_memory import InMemoryProfile
 from ....protocols.connections.v1_0.messages.connection_invitation import (
     ConnectionInvitation,
@@ -478,3 +480,110 @@ class TestConnRecord(AsyncTestCase):
             )
             == []
         )
+
+    async def test_retrieve_by_id_cached(self):
+        profile = InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
+        async with profile.session() as session:
+            record = ConnRecord(my_did=self.test_did, state=ConnRecord.State.INIT)
+            await record.save(session)
+
+        # write-through on save: no storage read is needed
+        with async_mock.patch.object(
+            ConnRecord, "retrieve_by_id", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            cached = await ConnRecord.retrieve_by_id_cached(
+                profile, record.connection_id
+            )
+            mock_retrieve.assert_not_called()
+        assert cached == record
+        assert cached is not record
+
+        async with profile.session() as session:
+            record.state = ConnRecord.State.COMPLETED.rfc160
+            await record.save(session)
+        cached = await ConnRecord.retrieve_by_id_cached(profile, record.connection_id)
+        assert cached.state == ConnRecord.State.COMPLETED.rfc160
+
+        async with profile.session() as session:
+            await record.delete_record(session)
+        with self.assertRaises(StorageNotFoundError):
+            await ConnRecord.retrieve_by_id_cached(profile, record.connection_id)
+
+    async def test_retrieve_by_id_cached_concurrent_write(self):
+        profile = InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
+        async with profile.session() as session:
+            record = ConnRecord(my_did=self.test_did, state=ConnRecord.State.INIT)
+            await record.save(session)
+        await profile.inject(BaseCache).flush()
+
+        retrieve_by_id = ConnRecord.retrieve_by_id
+
+        async def retrieve_then_update(session, record_id):
+            # a write lands after the reader fetched the old value from storage
+            stale = await retrieve_by_id(session, record_id)
+            record.state = ConnRecord.State.COMPLETED.rfc160
+            await record.save(session)
+            return stale
+
+        with async_mock.patch.object(
+            ConnRecord, "retrieve_by_id", side_effect=retrieve_then_update
+        ):
+            stale = await ConnRecord.retrieve_by_id_cached(
+                profile, record.connection_id
+            )
+        assert stale.state == ConnRecord.State.INIT.rfc160
+
+        cached = await ConnRecord.retrieve_by_id_cached(profile, record.connection_id)
+        assert cached.state == ConnRecord.State.COMPLETED.rfc160
+
+    async def test_retrieve_by_id_cached_transaction(self):
+        profile = InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
+        async with profile.session() as session:
+            record = ConnRecord(my_did=self.test_did, state=ConnRecord.State.INIT)
+            await record.save(session)
+        stale = ConnRecord.deserialize(record.serialize())
+
+        txn = await profile.transaction()
+        with async_mock.patch.object(
+            type(txn),
+            "is_transaction",
+            async_mock.PropertyMock(return_value=True),
+        ):
+            record.state = ConnRecord.State.COMPLETED.rfc160
+            await record.save(txn)
+            # a concurrent reader still sees the committed value
+            with async_mock.patch.object(
+                ConnRecord,
+                "retrieve_by_id",
+                async_mock.CoroutineMock(return_value=stale),
+            ):
+                cached = await ConnRecord.retrieve_by_id_cached(
+                    profile, record.connection_id
+                )
+            assert cached.state == ConnRecord.State.INIT.rfc160
+            await txn.commit()
+
+        cached = await ConnRecord.retrieve_by_id_cached(profile, record.connection_id)
+        assert cached.state == ConnRecord.State.COMPLETED.rfc160
+
+    async def test_retrieve_by_id_cached_scoped_per_wallet(self):
+        cache = InMemoryCache()
+        profile = InMemoryProfile.test_profile(bind={BaseCache: cache})
+        other = InMemoryProfile.test_profile(
+            settings={"wallet.id": "other"}, bind={BaseCache: cache}
+        )
+        async with profile.session() as session:
+            record = ConnRecord(my_did=self.test_did)
+            await record.save(session)
+
+        assert await ConnRecord.retrieve_by_id_cached(profile, record.connection_id)
+        with self.assertRaises(StorageNotFoundError):
+            await ConnRecord.retrieve_by_id_cached(other, record.connection_id)
+
+    async def test_retrieve_by_id_cached_no_cache(self):
+        record = ConnRecord(my_did=self.test_did)
+        await record.save(self.session)
+        cached = await ConnRecord.retrieve_by_id_cached(
+            self.session.profile, record.connection_id
+        )
+        assert cached == record
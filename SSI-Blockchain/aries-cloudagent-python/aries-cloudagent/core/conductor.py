@@ -36,6 +36,8 @@ from ..ledger.multiple_ledger.base_manager import (
 )
 from ..ledger.multiple_ledger.ledger_requests_executor import IndyLedgerRequestsExecutor
 from ..ledger.multiple_ledger.manager_provider import MultiIndyLedgerManagerProvider
+from ..messaging.fast_codec import enable_fast_codecs
+from ..messaging.models.backfill import TagBackfillService
 from ..messaging.responder import BaseResponder
 from ..multitenant.base import BaseMultitenantManager
 from ..multitenant.manager_provider import MultitenantManagerProvider
@@ -54,8 +56,10 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..retention.service import RetentionService
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
+from ..transport.inbound.admission import AdmissionController
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.base import OutboundDeliveryError
@@ -63,14 +67,18 @@ from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboun
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
+from ..utils.executors import configure_executors, executor_stats, shutdown_executors
+from ..utils.json_codec import set_json_codec
 from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
+from .event_bus import EventBus
 from .oob_processor import OobMessageProcessor
 from .util import SHUTDOWN_EVENT_TOPIC, STARTUP_EVENT_TOPIC
+from .workers import WorkerCoordinator
 
 LOGGER = logging.getLogger(__name__)
 
@@ -200,6 +208,20 @@ class Conductor:
         if wire_format and hasattr(wire_format, "task_queue"):
             wire_format.task_queue = self.dispatcher.task_queue
 
+        # Run background event subscribers on the dispatcher queue
+        event_bus = context.inject_or(EventBus)
+        if event_bus:
+            event_bus.task_queue = self.dispatcher.task_queue
+
+        # Bind admission control for inbound transports, if any limits are set
+        admission = AdmissionController.from_settings(
+            context.settings,
+            pending=lambda: self.dispatcher.current_pending,
+            outbound=self._outbound_load,
+        )
+        if admission:
+            context.injector.bind_instance(AdmissionController, admission)
+
         # Bind manager for multitenancy related tasks
         if context.settings.get("multitenant.enabled"):
             context.injector.bind_provider(
@@ -223,6 +245,31 @@ class Conductor:
             DocumentLoader, DocumentLoader(self.root_profile)
         )
 
+        # Select the JSON codec for wire messages, storage and webhooks
+        set_json_codec(context.settings.get("json_codec"))
+
+        # Compile fast-path codecs for hot message types, if enabled
+        if context.settings.get("fast_message_codecs"):
+            enable_fast_codecs()
+
+        # Coordinate with the other worker processes, if any
+        coordinator = WorkerCoordinator.from_settings(
+            context.settings, snapshot=self.get_worker_snapshot
+        )
+        if coordinator:
+            context.injector.bind_instance(WorkerCoordinator, coordinator)
+
+        # Size the executors running blocking crypto operations
+        configure_executors(context.settings.get("executors"))
+
+        # Bind record retention service, if any policies are configured
+        retention_service = RetentionService.from_settings(context.settings)
+        if retention_service:
+            context.injector.bind_instance(RetentionService, retention_service)
+
+        # Bind the service backfilling record tags in the background
+        context.injector.bind_instance(TagBackfillService, TagBackfillService())
+
         # Admin API
         if context.settings.get("admin.enabled"):
             try:
@@ -271,6 +318,11 @@ class Conductor:
 
         context = self.root_profile.context
 
+        # Start monitoring the load before accepting inbound messages
+        admission = context.inject_or(AdmissionController)
+        if admission:
+            admission.start()
+
         # Start up transports
         try:
             await self.inbound_transport_manager.start()
@@ -473,9 +525,42 @@ class Conductor:
             except Exception:
                 LOGGER.exception("Error accepting mediation invitation")
 
+        # Start removing completed exchange records
+        retention_service = context.inject_or(RetentionService)
+        coordinator = context.inject_or(WorkerCoordinator)
+        if retention_service:
+            retention_service.task_queue = self.dispatcher.task_queue
+            if coordinator:
+                # only the leader among the workers removes records
+                coordinator.add_singleton(
+                    "retention",
+                    lambda: retention_service.start(self.root_profile),
+                    retention_service.stop,
+                )
+            else:
+                retention_service.start(self.root_profile)
+
+        # Backfill record tags introduced since the wallet was last used;
+        # queries only rely on the tags of a record type once it is complete
+        tag_backfill = context.inject_or(TagBackfillService)
+        if tag_backfill:
+            if coordinator:
+                # only the leader among the workers rewrites records
+                coordinator.add_singleton(
+                    "tag_backfill",
+                    lambda: tag_backfill.start(self.root_profile),
+                    tag_backfill.stop,
+                )
+            else:
+                tag_backfill.start(self.root_profile)
+
         # notify protcols of startup status
         await self.root_profile.notify(STARTUP_EVENT_TOPIC, {})
 
+        # Report this worker as started and take part in leader elections
+        if coordinator:
+            coordinator.start()
+
     async def stop(self, timeout=1.0):
         """Stop the agent."""
         # notify protcols that we are shutting down
@@ -493,6 +578,22 @@ class Conductor:
             shutdown.run(self.outbound_transport_manager.stop())
 
         if self.root_profile:
+            coordinator = self.context.inject_or(WorkerCoordinator)
+            if coordinator:
+                shutdown.run(coordinator.stop())
+
+            admission = self.context.inject_or(AdmissionController)
+            if admission:
+                shutdown.run(admission.stop())
+
+            retention_service = self.context.inject_or(RetentionService)
+            if retention_service:
+                shutdown.run(retention_service.stop())
+
+            tag_backfill = self.context.inject_or(TagBackfillService)
+            if tag_backfill:
+                shutdown.run(tag_backfill.stop())
+
             # close multitenant profiles
             multitenant_mgr = self.context.inject_or(BaseMultitenantManager)
             if multitenant_mgr:
@@ -502,6 +603,7 @@ class Conductor:
             shutdown.run(self.root_profile.close())
 
         await shutdown.complete(timeout)
+        shutdown_executors()
 
     def inbound_message_router(
         self,
@@ -565,22 +667,59 @@ class Conductor:
                 )
         self.inbound_transport_manager.dispatch_complete(message, completed)
 
+    async def get_worker_snapshot(self) -> dict:
+        """Get the stats of this worker to be combined with the other workers."""
+        stats = await self.get_stats()
+        # executor averages and maximums cannot be added up across workers
+        stats.pop("executors", None)
+        snapshot = {"conductor": stats}
+        collector = self.context.inject_or(Collector)
+        if collector:
+            snapshot["timing"] = collector.results
+        return snapshot
+
+    def _outbound_load(self) -> int:
+        """
+        Count the outbound messages being encoded or delivered, or waiting to be.
+
+        Messages waiting for a retry are excluded, so that an unreachable
+        endpoint does not cause inbound traffic to be refused.
+        """
+        outbound_stats = self.outbound_transport_manager.outbound_stats
+        return sum(
+            outbound_stats[state]
+            for state in (
+                QueuedOutboundMessage.STATE_PENDING,
+                QueuedOutboundMessage.STATE_ENCODE,
+                QueuedOutboundMessage.STATE_DELIVER,
+            )
+        )
+
     async def get_stats(self) -> dict:
         """Get the current stats tracked by the conductor."""
+        outbound_stats = self.outbound_transport_manager.outbound_stats
         stats = {
             "in_sessions": len(self.inbound_transport_manager.sessions),
-            "out_encode": 0,
-            "out_deliver": 0,
+            "out_encode": outbound_stats[QueuedOutboundMessage.STATE_ENCODE],
+            "out_deliver": outbound_stats[QueuedOutboundMessage.STATE_DELIVER],
+            "out_retry": outbound_stats[QueuedOutboundMessage.STATE_RETRY],
             "task_active": self.dispatcher.task_queue.current_active,
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
+            "task_priorities": self.dispatcher.task_queue.priority_stats,
+            "executors": executor_stats(),
         }
-        for m in self.outbound_transport_manager.outbound_buffer:
-            if m.state == QueuedOutboundMessage.STATE_ENCODE:
-                stats["out_encode"] += 1
-            if m.state == QueuedOutboundMessage.STATE_DELIVER:
-                stats["out_deliver"] += 1
+        if self.dispatcher.message_queue:
+            message_queue = self.dispatcher.message_queue
+            stats["task_active"] += message_queue.current_active
+            stats["task_done"] += message_queue.total_done
+            stats["task_failed"] += message_queue.total_failed
+            stats["task_pending"] += message_queue.current_pending
+            for priority, counts in message_queue.priority_stats.items():
+                totals = stats["task_priorities"][priority]
+                for name, count in counts.items():
+                    totals[name] += count
         return stats
 
     async def outbound_message_router(
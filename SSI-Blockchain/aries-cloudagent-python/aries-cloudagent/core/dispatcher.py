@@ -10,14 +10,14 @@ import logging
 import os
 import warnings
 
-from typing import Callable, Coroutine, Optional, Union, Tuple
+from typing import Callable, Coroutine, Hashable, Optional, Union, Tuple
 import weakref
 
 from aiohttp.web import HTTPException
 
 
 from ..connections.models.conn_record import ConnRecord
-from ..core.profile import Profile
+from ..core.profile import Profile, SessionScope
 from ..messaging.agent_message import AgentMessage
 from ..messaging.base_message import BaseMessage
 from ..messaging.error import MessageParseError
@@ -31,7 +31,13 @@ from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..utils.stats import Collector
-from ..utils.task_queue import CompletedTask, PendingTask, TaskQueue
+from ..utils.task_queue import (
+    CompletedTask,
+    PendingTask,
+    ShardedTaskQueue,
+    TaskPriority,
+    TaskQueue,
+)
 from ..utils.tracing import get_timer, trace_event
 
 from .error import ProtocolMinorVersionNotSupported
@@ -64,6 +70,8 @@ class Dispatcher:
         self.collector: Collector = None
         self.profile = profile
         self.task_queue: TaskQueue = None
+        self.message_queue: ShardedTaskQueue = None
+        self.order_by_connection = False
 
     async def setup(self):
         """Perform async instance setup."""
@@ -73,17 +81,48 @@ class Dispatcher:
             max_active=max_active, timed=bool(self.collector), trace_fn=self.log_task
         )
 
+        # Sharded dispatch: inbound messages run in order per thread or connection
+        settings = self.profile.settings
+        shards = settings.get_int("dispatch.shards")
+        if shards:
+            self.message_queue = ShardedTaskQueue(
+                shards,
+                max_active=max_active,
+                max_pending_per_key=settings.get_int(
+                    "dispatch.max_pending_per_key", default=100
+                ),
+                timed=bool(self.collector),
+                trace_fn=self.log_task,
+            )
+            self.order_by_connection = settings.get("dispatch.order") == "connection"
+
+    @property
+    def current_pending(self) -> int:
+        """Accessor for the number of tasks waiting to be started."""
+        pending = self.task_queue.current_pending
+        if self.message_queue:
+            pending += self.message_queue.current_pending
+        return pending
+
     def put_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ) -> PendingTask:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.put(coro, complete, ident)
+        return self.task_queue.put(coro, complete, ident, priority)
 
     def run_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ) -> asyncio.Task:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.run(coro, complete, ident)
+        return self.task_queue.run(coro, complete, ident, priority=priority)
 
     def log_task(self, task: CompletedTask):
         """Log a completed task using the stats collector."""
@@ -120,17 +159,62 @@ class Dispatcher:
         Returns:
             A pending task instance resolving to the handler task
 
+        Raises:
+            TaskQueueFullError: If too many messages are queued for the same
+                thread or connection, with sharded dispatch
+
         """
-        return self.put_task(
-            self.handle_message(profile, inbound_message, send_outbound),
-            complete,
-        )
+        coro = self.handle_message(profile, inbound_message, send_outbound)
+        if self.message_queue:
+            return self.message_queue.put(
+                coro,
+                complete,
+                key=self.dispatch_key(inbound_message),
+                priority=TaskPriority.HIGH,
+            )
+        return self.put_task(coro, complete, priority=TaskPriority.HIGH)
+
+    def dispatch_key(self, inbound_message: InboundMessage) -> Optional[Hashable]:
+        """
+        Determine the key ordering the dispatch of an inbound message.
+
+        Messages from the same sender on the same thread, or from the same sender
+        at all when ordering by connection, are handled one at a time.
+        """
+        receipt = inbound_message.receipt
+        sender = receipt.sender_verkey
+        if self.order_by_connection and sender:
+            return sender
+        if receipt.thread_id:
+            return (sender, receipt.thread_id)
+        return None
 
     async def handle_message(
         self,
         profile: Profile,
         inbound_message: InboundMessage,
         send_outbound: Coroutine,
+    ):
+        """
+        Handle an inbound message, sharing one storage session among its operations.
+
+        Args:
+            profile: The profile associated with the inbound message
+            inbound_message: The inbound message instance
+            send_outbound: Async function to send outbound messages
+
+        Returns:
+            The response from the handler
+
+        """
+        async with SessionScope("inbound"):
+            return await self._handle_message(profile, inbound_message, send_outbound)
+
+    async def _handle_message(
+        self,
+        profile: Profile,
+        inbound_message: InboundMessage,
+        send_outbound: Coroutine,
     ):
         """
         Configure responder and message context and invoke the message handler.
@@ -233,10 +317,9 @@ class Dispatcher:
         # When processing oob attach message we supply the connection id
         # associated with the inbound message
         if inbound_message.connection_id:
-            async with self.profile.session() as session:
-                connection = await ConnRecord.retrieve_by_id(
-                    session, inbound_message.connection_id
-                )
+            connection = await ConnRecord.retrieve_by_id_cached(
+                self.profile, inbound_message.connection_id
+            )
         else:
             connection_mgr = ConnectionManager(profile)
             connection = await connection_mgr.find_inbound_connection(
@@ -323,6 +406,8 @@ class Dispatcher:
 
     async def complete(self, timeout: float = 0.1):
         """Wait for pending tasks to complete."""
+        if self.message_queue:
+            await self.message_queue.complete(timeout=timeout)
         await self.task_queue.complete(timeout=timeout)
 
 
@@ -3,6 +3,7 @@
 import asyncio
 from contextlib import contextmanager
 import logging
+import re
 from typing import (
     Any,
     Awaitable,
@@ -14,16 +15,21 @@ from typing import (
     NamedTuple,
     Optional,
     Pattern,
+    Set,
     TYPE_CHECKING,
     Tuple,
 )
 from functools import partial
 
+from ..utils.task_queue import TaskPriority, TaskQueue
+
 if TYPE_CHECKING:  # To avoid circular import error
     from .profile import Profile
 
 LOGGER = logging.getLogger(__name__)
 
+REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
 
 class Event:
     """A simple event object."""
@@ -79,12 +85,170 @@ class EventWithMetadata(Event):
         return self._metadata
 
 
+def literal_prefix(pattern: Pattern) -> str:
+    """
+    Find the literal text which every topic matching a pattern starts with.
+
+    Patterns are matched at the start of the topic. An empty prefix is returned
+    for patterns which cannot be analyzed, such as alternations or patterns
+    compiled with flags affecting literal matches.
+    """
+    source = pattern.pattern
+    if (
+        not isinstance(source, str)
+        or pattern.flags & (re.IGNORECASE | re.VERBOSE)
+        or "|" in source
+    ):
+        return ""
+    prefix = []
+    pos = 1 if source.startswith("^") else 0
+    while pos < len(source):
+        char = source[pos]
+        if char == "\\":
+            # escaped punctuation is literal, other escapes are character classes
+            if pos + 1 == len(source) or source[pos + 1].isalnum():
+                break
+            char = source[pos + 1]
+            size = 2
+        elif char in REGEX_SPECIAL_CHARS:
+            break
+        else:
+            size = 1
+        following = pos + size
+        quantifier = source[following] if following < len(source) else ""
+        if quantifier and quantifier in "?*{":
+            break
+        prefix.append(char)
+        if quantifier == "+":
+            break
+        pos += size
+    return "".join(prefix)
+
+
+class _TopicNode:
+    """A node of the topic index, for one literal prefix."""
+
+    __slots__ = ("children", "patterns")
+
+    def __init__(self):
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.patterns: List[Pattern] = []
+
+
+class TopicIndex:
+    """
+    An index of subscribed patterns by the literal prefix of their topics.
+
+    Patterns are stored in a trie, so that finding the patterns which may match
+    a topic only visits the characters of the topic. Patterns without a literal
+    prefix are stored at the root and tested against every topic.
+    """
+
+    def __init__(self):
+        """Initialize the index."""
+        self._root = _TopicNode()
+        self._order: Dict[Pattern, int] = {}
+        self._added = 0
+
+    def __len__(self) -> int:
+        """Accessor for the number of indexed patterns."""
+        return len(self._order)
+
+    def _node(self, prefix: str, create: bool = False) -> Optional[_TopicNode]:
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if not child:
+                if not create:
+                    return None
+                child = node.children[char] = _TopicNode()
+            node = child
+        return node
+
+    def add(self, pattern: Pattern):
+        """Add a pattern to the index."""
+        if pattern not in self._order:
+            self._node(literal_prefix(pattern), create=True).patterns.append(pattern)
+            self._order[pattern] = self._added
+            self._added += 1
+
+    def remove(self, pattern: Pattern):
+        """Remove a pattern from the index."""
+        if self._order.pop(pattern, None) is not None:
+            self._node(literal_prefix(pattern)).patterns.remove(pattern)
+
+    def candidates(self, topic: str) -> List[Pattern]:
+        """Find the patterns which may match a topic, in the order added."""
+        node = self._root
+        found = list(node.patterns)
+        for char in topic:
+            node = node.children.get(char)
+            if not node:
+                break
+            found.extend(node.patterns)
+        if len(found) > 1:
+            found.sort(key=self._order.__getitem__)
+        return found
+
+
 class EventBus:
     """A simple event bus implementation."""
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    MODE_SEQUENTIAL = "sequential"
+    MODE_CONCURRENT = "concurrent"
+    MODE_BACKGROUND = "background"
+
+    def __init__(self, mode: str = None, subscriber_timeout: float = None):
+        """
+        Initialize Event Bus.
+
+        Args:
+            mode: how subscribers are run: "sequential" to await each in turn
+                (the default), "concurrent" to await them together, or
+                "background" to run them as tasks without blocking the notifier
+            subscriber_timeout: the number of seconds after which a subscriber
+                is cancelled, if any
+
+        """
+        mode = mode or self.MODE_SEQUENTIAL
+        if mode not in (
+            self.MODE_SEQUENTIAL,
+            self.MODE_CONCURRENT,
+            self.MODE_BACKGROUND,
+        ):
+            raise ValueError(f"Unknown event bus mode: {mode}")
+        self.mode = mode
+        self.subscriber_timeout = subscriber_timeout
+        self.task_queue: TaskQueue = None
         self.topic_patterns_to_subscribers: Dict[Pattern, List[Callable]] = {}
+        self._topic_index = TopicIndex()
+        self._background: Set[asyncio.Task] = set()
+
+    async def _run_processor(self, processor: Callable[[], Awaitable]):
+        """Run a subscriber, logging any error."""
+        try:
+            if self.subscriber_timeout:
+                await asyncio.wait_for(processor(), self.subscriber_timeout)
+            else:
+                await processor()
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "Event subscriber timed out after %s seconds: %s",
+                self.subscriber_timeout,
+                processor.func,
+            )
+        except Exception:
+            LOGGER.exception("Error occurred while processing event")
+
+    def _run_background(self, processor: Callable[[], Awaitable]):
+        """Run a subscriber as a task, on the dispatcher queue if available."""
+        coro = self._run_processor(processor)
+        if self.task_queue:
+            self.task_queue.put(coro, priority=TaskPriority.LOW)
+        else:
+            task = asyncio.get_event_loop().create_task(coro)
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
@@ -94,20 +258,16 @@ class EventBus:
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
 
         partials = []
-        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
+        for pattern in self._topic_index.candidates(event.topic):
             match = pattern.match(event.topic)
 
             if not match:
                 continue
 
-            for subscriber in subscribers:
+            for subscriber in self.topic_patterns_to_subscribers[pattern]:
                 partials.append(
                     partial(
                         subscriber,
@@ -116,11 +276,16 @@ class EventBus:
                     )
                 )
 
-        for processor in partials:
-            try:
-                await processor()
-            except Exception:
-                LOGGER.exception("Error occurred while processing event")
+        if self.mode == self.MODE_BACKGROUND:
+            for processor in partials:
+                self._run_background(processor)
+        elif self.mode == self.MODE_CONCURRENT and len(partials) > 1:
+            await asyncio.gather(
+                *(self._run_processor(processor) for processor in partials)
+            )
+        else:
+            for processor in partials:
+                await self._run_processor(processor)
 
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
@@ -133,6 +298,7 @@ class EventBus:
         LOGGER.debug("Subscribed: topic %s, processor %s", pattern, processor)
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
+            self._topic_index.add(pattern)
         self.topic_patterns_to_subscribers[pattern].append(processor)
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
@@ -154,6 +320,7 @@ class EventBus:
             del self.topic_patterns_to_subscribers[pattern][index]
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+                self._topic_index.remove(pattern)
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
     @contextmanager
@@ -6,12 +6,12 @@ from weakref import ref
 
 from ...config.injection_context import InjectionContext
 from ...config.provider import ClassProvider
-from ...storage.base import BaseStorage
+from ...storage.base import BaseStorage, BaseStorageSearch
 from ...storage.vc_holder.base import VCHolder
 from ...utils.classloader import DeferLoad
 from ...wallet.base import BaseWallet
 
-from ..profile import Profile, ProfileManager, ProfileSession
+from ..profile import Profile, ProfileManager, ProfileSession, SessionScope
 
 STORAGE_CLASS = DeferLoad("aries_cloudagent.storage.in_memory.InMemoryStorage")
 WALLET_CLASS = DeferLoad("aries_cloudagent.wallet.in_memory.InMemoryWallet")
@@ -35,6 +35,7 @@ class InMemoryProfile(Profile):
         self.local_dids = {}
         self.pair_dids = {}
         self.records = OrderedDict()
+        self.record_index = None  # created on first use by InMemoryStorage
         self.bind_providers()
 
     def bind_providers(self):
@@ -51,7 +52,9 @@ class InMemoryProfile(Profile):
 
     def session(self, context: InjectionContext = None) -> "ProfileSession":
         """Start a new interactive session with no transaction support requested."""
-        return InMemoryProfileSession(self, context=context)
+        return SessionScope.get_session(
+            self, context, lambda: InMemoryProfileSession(self, context=context)
+        )
 
     def transaction(self, context: InjectionContext = None) -> "ProfileSession":
         """
@@ -116,7 +119,9 @@ class InMemoryProfileSession(ProfileSession):
 
     def _init_context(self):
         """Initialize the session context."""
-        self._context.injector.bind_instance(BaseStorage, STORAGE_CLASS(self.profile))
+        storage = STORAGE_CLASS(self.profile)
+        self._context.injector.bind_instance(BaseStorage, storage)
+        self._context.injector.bind_instance(BaseStorageSearch, storage)
         self._context.injector.bind_instance(BaseWallet, WALLET_CLASS(self.profile))
 
     @property
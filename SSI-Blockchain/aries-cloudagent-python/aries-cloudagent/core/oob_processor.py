@@ -19,6 +19,7 @@ from ..storage.error import StorageNotFoundError
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.wire_format import JsonWireFormat
+from ..utils.task_queue import TaskQueueFullError
 from .error import BaseError
 from .profile import Profile
 
@@ -354,7 +355,18 @@ class OobMessageProcessor:
 
                 await oob_record.save(session)
 
-        self._inbound_message_router(profile, inbound_message, False)
+        try:
+            self._inbound_message_router(profile, inbound_message, False)
+        except TaskQueueFullError as err:
+            LOGGER.warning(
+                "Attached message not accepted for oob record %s: %s",
+                oob_record.oob_id,
+                err,
+            )
+            raise OobMessageProcessorError(
+                "Too many messages are queued to process the attached message, "
+                "try again later"
+            ) from err
 
     def get_thread_id(self, message: Dict[str, Any]) -> str:
         """Extract thread id from agent message dict."""
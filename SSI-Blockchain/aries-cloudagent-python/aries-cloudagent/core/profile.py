@@ -1,9 +1,21 @@
 """Classes for managing profile information within a request context."""
 
+import asyncio
 import logging
 
 from abc import ABC, abstractmethod
-from typing import Any, Mapping, Optional, Type
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from .event_bus import EventBus, Event
 from ..config.base import InjectionError
@@ -166,6 +178,7 @@ class ProfileSession(ABC):
         self._entered = 0
         self._context = (context or profile.context).start_scope("session", settings)
         self._profile = profile
+        self._commit_callbacks: List[Callable[[], Awaitable[None]]] = []
 
     async def _setup(self):
         """Create the underlying session or transaction."""
@@ -173,6 +186,14 @@ class ProfileSession(ABC):
     async def _teardown(self, commit: bool = None):
         """Dispose of the underlying session or transaction."""
 
+    async def _activate(self):
+        """Set up the session, counting it against the active session scope."""
+        await self._setup()
+        self._active = True
+        scope = SessionScope.current()
+        if scope:
+            scope.acquired += 1
+
     def __await__(self):
         """
         Coroutine magic method.
@@ -182,8 +203,7 @@ class ProfileSession(ABC):
 
         async def _init():
             if not self._active:
-                await self._setup()
-                self._active = True
+                await self._activate()
             self._awaited = True
             return self
 
@@ -192,8 +212,7 @@ class ProfileSession(ABC):
     async def __aenter__(self):
         """Async context manager entry."""
         if not self._active:
-            await self._setup()
-            self._active = True
+            await self._activate()
         self._entered += 1
         return self
 
@@ -201,6 +220,7 @@ class ProfileSession(ABC):
         """Async context manager exit."""
         self._entered -= 1
         if not self._awaited and not self._entered:
+            # a shared session is reopened on its next use
             await self._teardown()
             self._active = False
 
@@ -239,6 +259,17 @@ class ProfileSession(ABC):
             raise ProfileSessionInactiveError()
         await self._teardown(commit=True)
         self._active = False
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for callback in callbacks:
+            await callback()
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]):
+        """
+        Register a coroutine function to run once the transaction is committed.
+
+        Callbacks are discarded if the transaction is rolled back.
+        """
+        self._commit_callbacks.append(callback)
 
     async def rollback(self):
         """
@@ -250,6 +281,7 @@ class ProfileSession(ABC):
             raise ProfileSessionInactiveError()
         await self._teardown(commit=False)
         self._active = False
+        self._commit_callbacks = []
 
     def inject(
         self,
@@ -300,6 +332,159 @@ class ProfileSession(ABC):
         )
 
 
+class SessionScope:
+    """
+    Share interactive profile sessions among the operations of a single request.
+
+    While a scope is active, `Profile.session` hands out one session per profile
+    and injection context instead of opening a new one on every call, so nested
+    uses share a single connection. The underlying connection is acquired when
+    the session is entered and released when the outermost `async with` block
+    exits, rather than being held across other awaits of the request. Only the
+    task which entered the scope participates; transactions and tasks spawned
+    by the request always receive their own sessions.
+
+    Each scope counts the sessions requested, the shared sessions created and
+    the backend connections acquired by its task, including those of
+    transactions. The counters are added to per-name totals when the scope
+    exits, which the admin server reports in its status.
+    """
+
+    _current: ContextVar[Optional["SessionScope"]] = ContextVar(
+        "session_scope", default=None
+    )
+
+    _totals: Dict[str, dict] = {}
+
+    def __init__(self, name: str = "default"):
+        """
+        Initialize the session scope.
+
+        Args:
+            name: The name under which the counters of the scope are totalled
+
+        """
+        self._sessions: Dict[Tuple[Profile, InjectionContext], ProfileSession] = {}
+        self._task: asyncio.Task = None
+        self._token = None
+        self.name = name
+        self.requested = 0
+        self.created = 0
+        self.acquired = 0
+
+    @classmethod
+    def current(cls) -> Optional["SessionScope"]:
+        """Fetch the session scope active for the running task, if any."""
+        scope = cls._current.get()
+        if scope and scope._task is asyncio.current_task():
+            return scope
+        return None
+
+    @classmethod
+    def get_session(
+        cls,
+        profile: Profile,
+        context: Optional[InjectionContext],
+        factory: Callable[[], ProfileSession],
+    ) -> ProfileSession:
+        """
+        Fetch the shared session for a profile, or create a standalone one.
+
+        Args:
+            profile: The profile the session is requested for
+            context: The injection context passed to `Profile.session`
+            factory: Callable creating a new session when none can be shared
+
+        """
+        scope = cls.current()
+        if not scope:
+            return factory()
+        return scope.session(profile, context, factory)
+
+    def session(
+        self,
+        profile: Profile,
+        context: Optional[InjectionContext],
+        factory: Callable[[], ProfileSession],
+    ) -> ProfileSession:
+        """Fetch or create the session shared within this scope."""
+        self.requested += 1
+        key = (profile, context)
+        session = self._sessions.get(key)
+        if not session:
+            session = factory()
+            self._sessions[key] = session
+            self.created += 1
+        return session
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the session counters of this scope."""
+        return {
+            "requested": self.requested,
+            "created": self.created,
+            "acquired": self.acquired,
+        }
+
+    @classmethod
+    def totals(cls) -> dict:
+        """Fetch the session counters totalled over the exited scopes, by name."""
+        return {name: dict(totals) for name, totals in cls._totals.items()}
+
+    @classmethod
+    def reset_totals(cls):
+        """Reset the session counters totalled over the exited scopes."""
+        cls._totals.clear()
+
+    def _add_to_totals(self):
+        """Add the counters of this scope to the totals for its name."""
+        totals = self._totals.setdefault(
+            self.name,
+            {
+                "scopes": 0,
+                "requested": 0,
+                "created": 0,
+                "acquired": 0,
+                "max_acquired": 0,
+            },
+        )
+        totals["scopes"] += 1
+        for key, value in self.stats.items():
+            totals[key] += value
+        totals["max_acquired"] = max(totals["max_acquired"], self.acquired)
+
+    async def close(self):
+        """Release the sessions held by this scope."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if session.active and not session._entered:
+                await session._teardown()
+                session._active = False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self._task = asyncio.current_task()
+        self._token = self._current.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self._current.reset(self._token)
+        self._token = None
+        try:
+            await self.close()
+        finally:
+            self._add_to_totals()
+            LOGGER.debug(
+                "Shared %d profile session(s) among %d session request(s), "
+                "acquiring %d connection(s)",
+                self.created,
+                self.requested,
+                self.acquired,
+            )
+
+
 class ProfileManagerProvider(BaseProvider):
     """The standard profile manager provider which keys off the selected wallet type."""
 
@@ -3,7 +3,7 @@
 import logging
 import re
 
-from typing import Mapping, Sequence
+from typing import Dict, Mapping, Sequence, Tuple
 
 from ..config.injection_context import InjectionContext
 from ..utils.classloader import ClassLoader
@@ -12,6 +12,9 @@ from .error import ProtocolMinorVersionNotSupported, ProtocolDefinitionValidatio
 
 LOGGER = logging.getLogger(__name__)
 
+# Bound on resolved classes cached for message types outside the typemap
+MAX_VERSIONED_CLASSES = 1024
+
 
 class ProtocolRegistry:
     """Protocol registry for indexing message families."""
@@ -21,6 +24,11 @@ class ProtocolRegistry:
         self._controllers = {}
         self._typemap = {}
         self._versionmap = {}
+        # (major version, protocol name, message name) -> version map entry
+        self._versionindex: Dict[Tuple[int, str, str], dict] = {}
+        # message type -> resolved message class
+        self._classmap: Dict[str, type] = {}
+        self._versioned_classes = 0
 
     @property
     def protocols(self) -> Sequence[str]:
@@ -140,12 +148,21 @@ class ProtocolRegistry:
         if version_definition["major_version"] not in self._versionmap:
             self._versionmap[version_definition["major_version"]] = []
 
-        self._versionmap[version_definition["major_version"]].append(
-            {
-                "parsed_type_string": parsed_type_string,
-                "version_definition": version_definition,
-                "message_module": module_path,
-            }
+        proto = {
+            "parsed_type_string": parsed_type_string,
+            "version_definition": version_definition,
+            "message_module": module_path,
+        }
+        self._versionmap[version_definition["major_version"]].append(proto)
+
+        # the first registration for a message takes precedence
+        self._versionindex.setdefault(
+            (
+                version_definition["major_version"],
+                parsed_type_string["protocol_name"],
+                parsed_type_string["message_name"],
+            ),
+            proto,
         )
 
     def register_message_types(self, *typesets, version_definition=None):
@@ -158,6 +175,10 @@ class ProtocolRegistry:
 
         """
 
+        # Resolved classes may be superseded by the new registrations
+        self._classmap.clear()
+        self._versioned_classes = 0
+
         # Maintain support for versionless protocol modules
         updated_typesets = None
         minor_versions_supported = self._message_type_check_for_minor_verssion(
@@ -199,6 +220,7 @@ class ProtocolRegistry:
 
         Given a message type identifier, this method
         returns the corresponding registered message class.
+        Classes are loaded on first use and cached by message type.
 
         Args:
             message_type: Message type to resolve
@@ -208,47 +230,50 @@ class ProtocolRegistry:
 
         """
 
-        # Try and retrieve from direct mapping
-        msg_cls = self._typemap.get(message_type)
-        if isinstance(msg_cls, str):
-            return ClassLoader.load_class(msg_cls)
-
-        # Support registered modules (not path as string)
-        elif msg_cls:
+        msg_cls = self._classmap.get(message_type)
+        if msg_cls:
             return msg_cls
 
-        # Try and route via min/maj version matching
-        if not msg_cls:
-            parsed_type_string = self.parse_type_string(message_type)
-            major_version = parsed_type_string["major_version"]
-
-            version_supported_protos = self._versionmap.get(major_version)
-            if not version_supported_protos:
+        # Try and retrieve from direct mapping
+        msg_cls = self._typemap.get(message_type)
+        versioned = not msg_cls
+        if versioned:
+            # Try and route via min/maj version matching
+            msg_cls = self._resolve_versioned(message_type)
+            if not msg_cls:
                 return None
 
-            for proto in version_supported_protos:
-                if (
-                    proto["parsed_type_string"]["protocol_name"]
-                    == parsed_type_string["protocol_name"]
-                    and proto["parsed_type_string"]["message_name"]
-                    == parsed_type_string["message_name"]
-                ):
-                    if (
-                        parsed_type_string["minor_version"]
-                        < proto["version_definition"]["minimum_minor_version"]
-                    ):
-                        raise ProtocolMinorVersionNotSupported(
-                            "Minimum supported minor version is "
-                            + f"{proto['version_definition']['minimum_minor_version']}."
-                            + f" Received {parsed_type_string['minor_version']}."
-                        )
-
-                    if isinstance(proto["message_module"], str):
-                        return ClassLoader.load_class(msg_cls)
-                    elif proto["message_module"]:
-                        return proto["message_module"]
-
-        return None
+        # Load class paths, registered modules are used as is
+        if isinstance(msg_cls, str):
+            msg_cls = ClassLoader.load_class(msg_cls)
+
+        if not versioned:
+            self._classmap[message_type] = msg_cls
+        elif self._versioned_classes < MAX_VERSIONED_CLASSES:
+            self._classmap[message_type] = msg_cls
+            self._versioned_classes += 1
+        return msg_cls
+
+    def _resolve_versioned(self, message_type: str):
+        """Find the registered message class or path for another minor version."""
+        parsed_type_string = self.parse_type_string(message_type)
+        proto = self._versionindex.get(
+            (
+                parsed_type_string["major_version"],
+                parsed_type_string["protocol_name"],
+                parsed_type_string["message_name"],
+            )
+        )
+        if not proto:
+            return None
+
+        min_minor_version = proto["version_definition"]["minimum_minor_version"]
+        if parsed_type_string["minor_version"] < min_minor_version:
+            raise ProtocolMinorVersionNotSupported(
+                f"Minimum supported minor version is {min_minor_version}."
+                + f" Received {parsed_type_string['minor_version']}."
+            )
+        return proto["message_module"]
 
     async def prepare_disclosed(
         self, context: InjectionContext, protocols: Sequence[str]
@@ -1,3 +1,4 @@
+import tempfile
 from io import StringIO
 
 import mock as async_mock
@@ -223,10 +224,11 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
         ) as mock_logger:
 
             mock_inbound_mgr.return_value.sessions = ["dummy"]
-            mock_outbound_mgr.return_value.outbound_buffer = [
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
-            ]
+            mock_outbound_mgr.return_value.outbound_stats = {
+                **dict.fromkeys(QueuedOutboundMessage.STATES, 0),
+                QueuedOutboundMessage.STATE_ENCODE: 1,
+                QueuedOutboundMessage.STATE_DELIVER: 1,
+            }
             mock_outbound_mgr.return_value.registered_transports = {
                 "test": async_mock.MagicMock(schemes=["http"])
             }
@@ -240,12 +242,98 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                     "in_sessions",
                     "out_encode",
                     "out_deliver",
+                    "out_retry",
                     "task_active",
                     "task_done",
                     "task_failed",
                     "task_pending",
                 ]
             )
+            assert (stats["out_encode"], stats["out_deliver"]) == (1, 1)
+
+    async def test_admission(self):
+        builder: ContextBuilder = StubContextBuilder(
+            {**self.test_settings, "transport.admission.max_pending": 10}
+        )
+        conductor = test_module.Conductor(builder)
+
+        with async_mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, async_mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr, async_mock.patch.object(
+            test_module, "LoggingConfigurator", autospec=True
+        ):
+            mock_outbound_mgr.return_value.outbound_stats = {
+                QueuedOutboundMessage.STATE_NEW: 0,
+                QueuedOutboundMessage.STATE_PENDING: 1,
+                QueuedOutboundMessage.STATE_ENCODE: 1,
+                QueuedOutboundMessage.STATE_DELIVER: 1,
+                QueuedOutboundMessage.STATE_RETRY: 5,
+                QueuedOutboundMessage.STATE_DONE: 2,
+            }
+            mock_outbound_mgr.return_value.registered_transports = {}
+            mock_inbound_mgr.return_value.registered_transports = {}
+
+            await conductor.setup()
+            admission = conductor.context.inject(test_module.AdmissionController)
+            assert admission.load() == {"pending": 0, "outbound": 3, "loop_lag": 0.0}
+
+            with async_mock.patch.object(
+                admission, "start", async_mock.MagicMock()
+            ) as mock_start, async_mock.patch.object(
+                admission, "stop", async_mock.AsyncMock()
+            ) as mock_stop:
+                await conductor.start()
+                mock_start.assert_called_once_with()
+                await conductor.stop()
+                mock_stop.assert_awaited_once_with()
+
+    async def test_workers(self):
+        with tempfile.TemporaryDirectory() as run_dir:
+            builder: ContextBuilder = StubContextBuilder(
+                {
+                    **self.test_settings,
+                    "workers.count": 2,
+                    "workers.run_dir": run_dir,
+                    "retention.policies": {"cred_ex_v20": {"max_count": 10}},
+                }
+            )
+            conductor = test_module.Conductor(builder)
+
+            with async_mock.patch.object(
+                test_module, "InboundTransportManager", autospec=True
+            ) as mock_inbound_mgr, async_mock.patch.object(
+                test_module, "OutboundTransportManager", autospec=True
+            ) as mock_outbound_mgr, async_mock.patch.object(
+                test_module, "LoggingConfigurator", autospec=True
+            ):
+                mock_outbound_mgr.return_value.outbound_stats = dict.fromkeys(
+                    QueuedOutboundMessage.STATES, 0
+                )
+                mock_outbound_mgr.return_value.registered_transports = {}
+                mock_inbound_mgr.return_value.registered_transports = {}
+                mock_inbound_mgr.return_value.sessions = []
+
+                await conductor.setup()
+                coordinator = conductor.context.inject(test_module.WorkerCoordinator)
+                retention = conductor.context.inject(test_module.RetentionService)
+
+                with async_mock.patch.object(
+                    retention, "start", async_mock.MagicMock()
+                ) as mock_retention_start, async_mock.patch.object(
+                    coordinator, "start", async_mock.MagicMock()
+                ) as mock_start:
+                    await conductor.start()
+                    mock_start.assert_called_once_with()
+                    mock_retention_start.assert_not_called()
+                    coordinator.elect()
+                    mock_retention_start.assert_called_once_with(conductor.root_profile)
+
+                snapshot = await conductor.get_worker_snapshot()
+                assert "task_done" in snapshot["conductor"]
+                await conductor.stop()
+                assert not coordinator.is_leader
 
     async def test_inbound_message_handler(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from async_case import IsolatedAsyncioTestCase
@@ -6,10 +7,13 @@ import pytest
 
 from marshmallow import EXCLUDE
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.injection_context import InjectionContext
+from ...connections.models.conn_record import ConnRecord
 from ...core.event_bus import EventBus
 from ...core.in_memory import InMemoryProfile
-from ...core.profile import Profile
+from ...core.profile import Profile, SessionScope
 from ...core.protocol_registry import ProtocolRegistry
 from ...messaging.agent_message import AgentMessage, AgentMessageSchema
 from ...messaging.request_context import RequestContext
@@ -24,6 +28,7 @@ from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.message import OutboundMessage
 from ...utils.stats import Collector
+from ...utils.task_queue import TaskQueueFullError
 
 from .. import dispatcher as test_module
 
@@ -135,6 +140,161 @@ class TestDispatcher(IsolatedAsyncioTestCase):
                 handler_mock.call_args[0][2], test_module.DispatcherResponder
             )
 
+    async def test_dispatch_cached_connection(self):
+        profile = make_profile()
+        profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {
+                DIDCommPrefix.qualify_current(
+                    StubAgentMessage.Meta.message_type
+                ): StubAgentMessage
+            }
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        rcv = Receiver()
+        message = {
+            "@type": DIDCommPrefix.qualify_current(StubAgentMessage.Meta.message_type)
+        }
+        async with profile.session() as session:
+            conn_record = ConnRecord(state=ConnRecord.State.COMPLETED)
+            await conn_record.save(session)
+        inbound = make_inbound(message)
+        inbound.connection_id = conn_record.connection_id
+
+        with async_mock.patch.object(
+            StubAgentMessageHandler, "handle", autospec=True
+        ) as handler_mock, async_mock.patch.object(
+            ConnRecord, "retrieve_by_id", async_mock.AsyncMock()
+        ) as mock_retrieve, async_mock.patch.object(
+            test_module,
+            "validate_get_response_version",
+            async_mock.AsyncMock(return_value=("1.1", None)),
+        ):
+            await dispatcher.queue_message(dispatcher.profile, inbound, rcv.send)
+            await dispatcher.task_queue
+            mock_retrieve.assert_not_called()
+            handler_mock.assert_awaited_once()
+            context = handler_mock.call_args[0][1]
+            assert context.connection_record == conn_record
+            assert context.connection_ready
+
+    async def test_dispatch_shared_session(self):
+        profile = make_profile()
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {
+                DIDCommPrefix.qualify_current(
+                    StubAgentMessage.Meta.message_type
+                ): StubAgentMessage
+            }
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        rcv = Receiver()
+        message = {
+            "@type": DIDCommPrefix.qualify_current(StubAgentMessage.Meta.message_type)
+        }
+        sessions = []
+
+        async def handle(_, context, responder):
+            for _ in range(3):
+                async with context.session() as session:
+                    sessions.append(session)
+            sessions.append(SessionScope.current())
+
+        with async_mock.patch.object(
+            StubAgentMessageHandler, "handle", handle
+        ), async_mock.patch.object(
+            test_module, "ConnectionManager", autospec=True
+        ) as conn_mgr_mock, async_mock.patch.object(
+            test_module,
+            "validate_get_response_version",
+            async_mock.AsyncMock(return_value=("1.1", None)),
+        ):
+            conn_mgr_mock.return_value = async_mock.MagicMock(
+                find_inbound_connection=async_mock.AsyncMock(return_value=None)
+            )
+            await dispatcher.queue_message(
+                dispatcher.profile, make_inbound(message), rcv.send
+            )
+            await dispatcher.task_queue
+
+        *handler_sessions, scope = sessions
+        assert all(session is handler_sessions[0] for session in handler_sessions)
+        assert not handler_sessions[0].active
+        # one shared session, whose connection is acquired for each use
+        assert scope.stats == {"requested": 3, "created": 1, "acquired": 3}
+        assert scope.name == "inbound"
+
+    async def test_dispatch_sharded(self):
+        profile = make_profile()
+        profile.settings["dispatch.shards"] = 2
+        profile.settings["dispatch.max_pending_per_key"] = 2
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {
+                DIDCommPrefix.qualify_current(
+                    StubAgentMessage.Meta.message_type
+                ): StubAgentMessage
+            }
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        assert len(dispatcher.message_queue.shards) == 2
+        rcv = Receiver()
+        message = {
+            "@type": DIDCommPrefix.qualify_current(StubAgentMessage.Meta.message_type)
+        }
+        events = []
+
+        async def handle(_, context, responder):
+            thread_id = context.message_receipt.thread_id
+            events.append(("start", thread_id))
+            await asyncio.sleep(0.01)
+            events.append(("end", thread_id))
+
+        def inbound(thread_id):
+            return InboundMessage(
+                message, MessageReceipt(thread_id=thread_id, sender_verkey="verkey")
+            )
+
+        with async_mock.patch.object(
+            StubAgentMessageHandler, "handle", handle
+        ), async_mock.patch.object(
+            test_module, "ConnectionManager", autospec=True
+        ) as conn_mgr_mock, async_mock.patch.object(
+            test_module,
+            "validate_get_response_version",
+            async_mock.AsyncMock(return_value=("1.1", None)),
+        ):
+            conn_mgr_mock.return_value = async_mock.MagicMock(
+                find_inbound_connection=async_mock.AsyncMock(return_value=None)
+            )
+            for thread_id in ("thread-a", "thread-a", "thread-b", "thread-a"):
+                dispatcher.queue_message(
+                    dispatcher.profile, inbound(thread_id), rcv.send
+                )
+            with self.assertRaises(TaskQueueFullError):
+                dispatcher.queue_message(
+                    dispatcher.profile, inbound("thread-a"), rcv.send
+                )
+            await dispatcher.message_queue.flush()
+
+        thread_a = [event for event in events if event[1] == "thread-a"]
+        assert thread_a == [("start", "thread-a"), ("end", "thread-a")] * 3
+        assert events.index(("start", "thread-b")) < events.index(("end", "thread-a"))
+        assert not dispatcher.task_queue.total_started
+
+        dispatcher.order_by_connection = True
+        assert dispatcher.dispatch_key(inbound("thread-b")) == "verkey"
+        assert dispatcher.dispatch_key(make_inbound(message)) == (None, "dummy-thread")
+        assert (
+            dispatcher.dispatch_key(InboundMessage(message, MessageReceipt())) is None
+        )
+        await dispatcher.complete()
+
     async def test_dispatch_versioned_message(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
@@ -1,11 +1,13 @@
 """Test Event Bus."""
 
+import asyncio
 import pytest
 import re
 
 from asynctest import mock as async_mock
 
 from .. import event_bus as test_module
+from ...utils.task_queue import TaskQueue
 from ..event_bus import EventBus, Event
 
 # pylint: disable=redefined-outer-name
@@ -205,3 +207,108 @@ async def test_wait_for_event_condition(event_bus: EventBus, profile, event):
         await event_bus.notify(profile, event)
         assert returned_event.done()
         assert await returned_event == event
+
+
+@pytest.mark.parametrize(
+    "pattern, prefix",
+    [
+        ("^acapy::webhook::(.*)$", "acapy::webhook::"),
+        ("^acapy::record::([^:]*)(?:::.*)?$", "acapy::record::"),
+        ("^acapy::core::startup?$", "acapy::core::startu"),
+        ("topic::with::namespace", "topic::with::namespace"),
+        (re.escape("acapy::record::oob-invitation"), "acapy::record::oob-invitation"),
+        ("ab+c", "ab"),
+        (r"acapy\d", "acapy"),
+        ("ab{2}", "a"),
+        (".*", ""),
+        ("a|b", ""),
+        ("(?i)acapy", ""),
+    ],
+)
+def test_literal_prefix(pattern, prefix):
+    assert test_module.literal_prefix(re.compile(pattern)) == prefix
+
+
+def test_literal_prefix_flags():
+    assert test_module.literal_prefix(re.compile("acapy", re.IGNORECASE)) == ""
+    assert test_module.literal_prefix(re.compile(b"acapy")) == ""
+
+
+def test_topic_index():
+    index = test_module.TopicIndex()
+    patterns = [
+        re.compile("^acapy::record::.*"),
+        re.compile(".*"),
+        re.compile("^acapy::webhook::(.*)$"),
+        re.compile("^acapy::record::connections::.*"),
+    ]
+    for pattern in patterns:
+        index.add(pattern)
+    index.add(patterns[0])
+    assert len(index) == 4
+
+    assert index.candidates("acapy::record::connections::active") == [
+        patterns[0],
+        patterns[1],
+        patterns[3],
+    ]
+    assert index.candidates("acapy::webhook::topic") == patterns[1:3]
+    assert index.candidates("other") == [patterns[1]]
+
+    index.remove(patterns[1])
+    index.remove(patterns[1])
+    assert index.candidates("other") == []
+    assert len(index) == 3
+
+
+class SlowProcessor(MockProcessor):
+    def __init__(self, delay: float, calls: list):
+        super().__init__()
+        self.delay = delay
+        self.calls = calls
+
+    async def __call__(self, profile, event):
+        await asyncio.sleep(self.delay)
+        self.calls.append(self.delay)
+        await super().__call__(profile, event)
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent(profile, event):
+    event_bus = EventBus(mode=EventBus.MODE_CONCURRENT, subscriber_timeout=0.05)
+    calls = []
+    processors = [SlowProcessor(delay, calls) for delay in (0.02, 0.01, 1.0)]
+    for processor in processors:
+        event_bus.subscribe(re.compile(".*"), processor)
+    with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+        await event_bus.notify(profile, event)
+    assert calls == [0.01, 0.02]
+    assert processors[0].event == event
+    assert processors[2].event is None
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_notify_background(profile, event):
+    event_bus = EventBus(mode=EventBus.MODE_BACKGROUND)
+    calls = []
+    processor = SlowProcessor(0.01, calls)
+    event_bus.subscribe(re.compile(".*"), processor)
+    with event_bus.wait_for_event(profile, re.compile(".*")) as returned_event:
+        await event_bus.notify(profile, event)
+        assert not calls
+        assert await returned_event == event
+    await asyncio.sleep(0.02)
+    assert calls == [0.01]
+
+    event_bus.task_queue = TaskQueue()
+    await event_bus.notify(profile, event)
+    assert event_bus.task_queue.current_active == 1
+    await event_bus.task_queue.complete()
+    assert calls == [0.01, 0.01]
+    assert event_bus.task_queue.priority_stats["low"]["done"] == 1
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        EventBus(mode="bogus")
@@ -17,6 +17,7 @@ from ...storage.error import StorageNotFoundError
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.message import OutboundMessage
 from ..in_memory.profile import InMemoryProfile
+from ...utils.task_queue import TaskQueueFullError
 from ..oob_processor import OobMessageProcessor, OobMessageProcessorError
 
 
@@ -750,6 +751,30 @@ class TestOobProcessor(AsyncTestCase):
 
         self.inbound_message_router.assert_called_once_with(self.profile, ANY, False)
 
+    async def test_handle_message_queue_full(self):
+        oob_record = async_mock.MagicMock(
+            connection_id="the-conn-id",
+            save=async_mock.CoroutineMock(),
+        )
+        oob_processor = OobMessageProcessor(
+            inbound_message_router=async_mock.MagicMock(
+                side_effect=TaskQueueFullError("full")
+            )
+        )
+
+        with self.assertRaises(OobMessageProcessorError) as err:
+            await oob_processor.handle_message(
+                self.profile,
+                [
+                    {
+                        "@type": "issue-credential/1.0/offer-credential",
+                        "@id": "4a580490-a9d8-44f5-a3f6-14e0b8a219b0",
+                    }
+                ],
+                oob_record,
+            )
+        assert "try again later" in err.exception.message
+
     async def test_handle_message_unsupported_message_type(self):
 
         with self.assertRaises(OobMessageProcessorError) as err:
@@ -1,10 +1,13 @@
+import asyncio
+
 from asynctest import TestCase as AsyncTestCase
 
 from ...config.base import InjectionError
 from ...config.injection_context import InjectionContext
 
 from ..error import ProfileSessionInactiveError
-from ..profile import Profile, ProfileManagerProvider, ProfileSession
+from ..in_memory import InMemoryProfile
+from ..profile import Profile, ProfileManagerProvider, ProfileSession, SessionScope
 
 
 class MockProfile(Profile):
@@ -54,6 +57,132 @@ class TestProfileSession(AsyncTestCase):
 
         await session2.rollback()
 
+    async def test_on_commit(self):
+        profile = MockProfile()
+        calls = []
+
+        async def callback():
+            calls.append(True)
+
+        session = await ProfileSession(profile)
+        session.on_commit(callback)
+        await session.rollback()
+        session = await ProfileSession(profile)
+        await session.commit()
+        assert not calls
+
+        session = await ProfileSession(profile)
+        session.on_commit(callback)
+        await session.commit()
+        assert calls == [True]
+
+
+class TestSessionScope(AsyncTestCase):
+    async def test_shared_session(self):
+        profile = InMemoryProfile.test_profile()
+        assert profile.session() is not profile.session()
+
+        async with SessionScope() as scope:
+            assert SessionScope.current() is scope
+            first = profile.session()
+            assert not first.active
+            async with first as session:
+                assert session.active
+                async with profile.session() as nested:
+                    assert nested is session
+            # released after the outermost block, and reopened on the next use
+            assert not first.active
+            async with profile.session() as session:
+                assert session is first
+                assert session.active
+            async with profile.transaction() as txn:
+                assert txn is not first
+            # the transaction acquires a connection of its own
+            assert scope.stats == {"requested": 3, "created": 1, "acquired": 3}
+
+        assert SessionScope.current() is None
+        assert not first.active
+        assert profile.session() is not first
+
+    async def test_totals(self):
+        profile = InMemoryProfile.test_profile()
+        SessionScope.reset_totals()
+
+        for count in (1, 3):
+            async with SessionScope("admin"):
+                for _ in range(count):
+                    async with profile.session():
+                        pass
+        async with SessionScope("inbound"):
+            await profile.session()
+
+        assert SessionScope.totals() == {
+            "admin": {
+                "scopes": 2,
+                "requested": 4,
+                "created": 2,
+                "acquired": 4,
+                "max_acquired": 3,
+            },
+            "inbound": {
+                "scopes": 1,
+                "requested": 1,
+                "created": 1,
+                "acquired": 1,
+                "max_acquired": 1,
+            },
+        }
+        SessionScope.reset_totals()
+        assert SessionScope.totals() == {}
+
+    async def test_awaited_session_held(self):
+        profile = InMemoryProfile.test_profile()
+
+        async with SessionScope():
+            session = await profile.session()
+            async with profile.session() as nested:
+                assert nested is session
+            # an awaited session is held until the scope exits
+            assert session.active
+        assert not session.active
+
+    async def test_context_and_profile_keys(self):
+        profile = InMemoryProfile.test_profile()
+        other = InMemoryProfile.test_profile()
+        context = InjectionContext()
+
+        async with SessionScope() as scope:
+            assert profile.session() is profile.session()
+            assert profile.session(context) is profile.session(context)
+            assert profile.session(context) is not profile.session()
+            assert other.session() is not profile.session()
+            assert scope.created == 3
+
+    async def test_spawned_task(self):
+        profile = InMemoryProfile.test_profile()
+
+        async def spawn():
+            assert SessionScope.current() is None
+            return profile.session()
+
+        async with SessionScope():
+            shared = profile.session()
+            # tasks created within the scope do not share its sessions
+            spawned = await asyncio.ensure_future(spawn())
+            assert spawned is not shared
+
+    async def test_close_entered_session(self):
+        profile = InMemoryProfile.test_profile()
+
+        scope = SessionScope()
+        async with scope:
+            session = await profile.session().__aenter__()
+        await scope.close()
+        # a session still entered is released by its own context manager
+        assert session.active
+        await session.__aexit__(None, None, None)
+        assert not session.active
+
 
 class TestProfileManagerProvider(AsyncTestCase):
     async def test_basic_wallet_type(self):
@@ -3,6 +3,8 @@ from asynctest import TestCase as AsyncTestCase, mock as async_mock
 from ...config.injection_context import InjectionContext
 from ...utils.classloader import ClassLoader
 
+from .. import protocol_registry as test_module
+from ..error import ProtocolMinorVersionNotSupported
 from ..protocol_registry import ProtocolRegistry
 
 
@@ -295,5 +297,52 @@ class TestProtocolRegistry(AsyncTestCase):
             result = self.registry.resolve_message_class("proto/1.2/bbb")
             assert result is None
 
+    def test_resolve_message_class_cached(self):
+        message_type_a = "proto/1.2/aaa"
+        self.registry.register_message_types(
+            {message_type_a: self.test_message_handler},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 1,
+                "current_minor_version": 2,
+                "path": "v1_2",
+            },
+        )
+        mock_class = async_mock.MagicMock()
+        with async_mock.patch.object(
+            ClassLoader, "load_class", async_mock.MagicMock()
+        ) as load_class:
+            load_class.return_value = mock_class
+            for message_type in (message_type_a, "proto/1.1/aaa", "proto/1.5/aaa"):
+                assert self.registry.resolve_message_class(message_type) is mock_class
+                assert self.registry.resolve_message_class(message_type) is mock_class
+            assert load_class.call_count == 3
+            load_class.assert_called_with(self.test_message_handler)
+
+            with self.assertRaises(ProtocolMinorVersionNotSupported):
+                self.registry.resolve_message_class("proto/1.0/aaa")
+            assert self.registry.resolve_message_class("proto/1.2/bbb") is None
+            assert self.registry.resolve_message_class("proto/2.0/aaa") is None
+
+            # new registrations discard resolved classes
+            self.registry.register_message_types({"proto/1.2/bbb": "other"})
+            assert self.registry.resolve_message_class(message_type_a) is mock_class
+            assert load_class.call_count == 4
+
+    def test_resolve_message_class_cache_bound(self):
+        self.registry.register_message_types(
+            {"proto/1.0/aaa": async_mock.MagicMock()},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 0,
+                "current_minor_version": 0,
+                "path": "v1_0",
+            },
+        )
+        with async_mock.patch.object(test_module, "MAX_VERSIONED_CLASSES", 2):
+            for minor in range(5):
+                assert self.registry.resolve_message_class(f"proto/1.{minor}/aaa")
+        assert len(self.registry._classmap) == 3
+
     def test_repr(self):
         assert type(repr(self.registry)) is str
@@ -0,0 +1,228 @@
+import os
+import sys
+import time
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+from tempfile import TemporaryDirectory
+
+from .. import workers as test_module
+from ..workers import LeaderLock, WorkerCoordinator, aggregate_stats
+
+
+class TestLeaderLock(AsyncTestCase):
+    def test_acquire_release(self):
+        with TemporaryDirectory() as run_dir:
+            path = os.path.join(run_dir, "leader.lock")
+            first = LeaderLock(path)
+            second = LeaderLock(path)
+            assert first.try_acquire()
+            assert first.try_acquire()
+            assert not second.try_acquire()
+            assert first.held and not second.held
+            first.release()
+            first.release()
+            assert second.try_acquire()
+            second.release()
+
+
+class TestAggregateStats(AsyncTestCase):
+    def test_aggregate(self):
+        snapshots = [
+            {
+                "conductor": {
+                    "task_done": 3,
+                    "task_priorities": {"high": {"done": 2}},
+                    "label": "ignored",
+                },
+                "timing": {
+                    "count": {"handle": 2},
+                    "total": {"handle": 1.0},
+                    "max": {"handle": 0.75},
+                    "min": {"handle": 0.25},
+                },
+            },
+            {
+                "conductor": {"task_done": 1, "task_priorities": {"high": {"done": 1}}},
+                "timing": {
+                    "count": {"handle": 2},
+                    "total": {"handle": 3.0},
+                    "max": {"handle": 2.0},
+                    "min": {"handle": 1.0},
+                },
+            },
+            {},
+        ]
+        result = aggregate_stats(snapshots)
+        assert result["conductor"] == {
+            "task_done": 4,
+            "task_priorities": {"high": {"done": 3}},
+        }
+        assert result["timing"] == {
+            "avg": {"handle": 1.0},
+            "count": {"handle": 4},
+            "total": {"handle": 4.0},
+            "max": {"handle": 2.0},
+            "min": {"handle": 0.25},
+        }
+
+
+class TestWorkerCoordinator(AsyncTestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.run_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_from_settings(self):
+        assert WorkerCoordinator.from_settings({}) is None
+        assert WorkerCoordinator.from_settings({"workers.count": 1}) is None
+        coordinator = WorkerCoordinator.from_settings(
+            {
+                "workers.count": 4,
+                "workers.index": 2,
+                "workers.run_dir": self.run_dir,
+            },
+            interval=1.0,
+        )
+        assert coordinator.count == 4
+        assert coordinator.index == 2
+        assert coordinator.interval == 1.0
+
+    async def test_leader_singletons(self):
+        first = WorkerCoordinator(self.run_dir, 0, 2)
+        second = WorkerCoordinator(self.run_dir, 1, 2)
+        jobs = {0: async_mock.MagicMock(), 1: async_mock.MagicMock()}
+        stops = {0: async_mock.CoroutineMock(), 1: async_mock.CoroutineMock()}
+        first.add_singleton("job", jobs[0], stops[0])
+        second.add_singleton("job", jobs[1], stops[1])
+
+        assert first.elect()
+        assert not second.elect()
+        jobs[0].assert_called_once_with()
+        jobs[1].assert_not_called()
+        first.add_singleton("other", jobs[0], stops[0])
+        assert jobs[0].call_count == 2
+
+        # leadership is handed over when the leader stops
+        await first.stop()
+        assert stops[0].await_count == 2
+        assert not first.is_leader
+        assert second.elect()
+        jobs[1].assert_called_once_with()
+        await second.stop()
+        stops[1].assert_awaited_once_with()
+
+    async def test_status(self):
+        snapshot = async_mock.CoroutineMock(
+            return_value={"conductor": {"task_done": 2}}
+        )
+        first = WorkerCoordinator(self.run_dir, 0, 2, snapshot=snapshot)
+        second = WorkerCoordinator(self.run_dir, 1, 2, snapshot=snapshot)
+        first.elect()
+        assert not test_module.worker_started(self.run_dir, 1)
+        await second.publish()
+        assert test_module.worker_started(self.run_dir, 1)
+
+        with open(os.path.join(self.run_dir, "worker-7.json"), "w") as stale:
+            stale.write('{"updated": 0}')
+        with open(os.path.join(self.run_dir, "worker-8.json"), "w") as broken:
+            broken.write("{")
+
+        status = await first.status()
+        assert status["count"] == 2
+        assert status["leader"]
+        assert [worker["index"] for worker in status["workers"]] == [0, 1]
+        assert [worker["leader"] for worker in status["workers"]] == [True, False]
+        assert status["conductor"] == {"task_done": 4}
+
+        await second.stop()
+        assert not test_module.worker_started(self.run_dir, 1)
+        await first.stop()
+
+        test_module.prepare_run_dir(self.run_dir)
+        assert os.listdir(self.run_dir) == ["leader.lock"]
+
+    async def test_start_stop(self):
+        coordinator = WorkerCoordinator(self.run_dir, 0, 2, interval=0.01)
+        coordinator.start()
+        coordinator.start()
+        for _ in range(50):
+            if test_module.worker_started(self.run_dir, 0):
+                break
+            await test_module.asyncio.sleep(0.01)
+        assert coordinator.is_leader
+        await coordinator.stop()
+        await coordinator.stop()
+        assert not test_module.worker_started(self.run_dir, 0)
+
+    async def test_run_error(self):
+        coordinator = WorkerCoordinator(
+            self.run_dir,
+            0,
+            2,
+            snapshot=async_mock.CoroutineMock(side_effect=ValueError()),
+            interval=0.01,
+        )
+        with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+            coordinator.start()
+            await test_module.asyncio.sleep(0.05)
+            await coordinator.stop()
+        mock_logger.exception.assert_called()
+
+
+class TestRunWorkers(AsyncTestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.run_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def started(self, index: int):
+        with open(os.path.join(self.run_dir, f"worker-{index}.json"), "w") as out:
+            out.write(str(os.getpid()))
+
+    def test_run_workers(self):
+        def run_worker(index: int):
+            self.started(index)
+
+        assert (
+            test_module.run_workers(
+                3,
+                run_worker,
+                ready=lambda index: test_module.worker_started(self.run_dir, index),
+            )
+            == 0
+        )
+        assert sorted(os.listdir(self.run_dir)) == [
+            "worker-0.json",
+            "worker-1.json",
+            "worker-2.json",
+        ]
+
+    def test_run_workers_failure(self):
+        def run_worker(index: int):
+            self.started(index)
+            if index == 1:
+                sys.exit(3)
+            time.sleep(10)
+
+        started = time.monotonic()
+        assert test_module.run_workers(2, run_worker) == 3
+        assert time.monotonic() - started < 5
+
+    def test_run_workers_startup_failure(self):
+        def run_worker(index: int):
+            raise ValueError()
+
+        with async_mock.patch.object(test_module, "LOGGER"):
+            assert (
+                test_module.run_workers(2, run_worker, ready=lambda index: False) == 1
+            )
+        assert not os.listdir(self.run_dir)
+
+        with self.assertRaises(test_module.WorkerError):
+            test_module.run_workers(
+                2, lambda index: time.sleep(10), ready_timeout=0, ready=lambda i: False
+            )
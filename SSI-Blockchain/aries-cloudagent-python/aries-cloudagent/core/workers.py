@@ -0,0 +1,403 @@
+"""
+Support for running the agent in several worker processes.
+
+The worker processes are forked by a supervisor before any event loop is
+started. Each worker runs a complete conductor, listening on the shared
+inbound and admin ports with SO_REUSEPORT and opening the same wallet.
+
+Workers coordinate through files in a shared run directory: a lock file
+elects the leader which runs singleton background jobs, and each worker
+periodically publishes a snapshot of its statistics for aggregation.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import time
+
+from typing import Awaitable, Callable, Mapping, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # worker mode is not supported on this platform
+
+from .error import BaseError
+
+LOGGER = logging.getLogger(__name__)
+
+LEADER_LOCK_FILE = "leader.lock"
+STATS_FILE_PREFIX = "worker-"
+
+
+class WorkerError(BaseError):
+    """Worker coordination error."""
+
+
+def workers_supported() -> bool:
+    """Check whether the platform supports running several worker processes."""
+    return bool(fcntl and hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT"))
+
+
+class LeaderLock:
+    """
+    An inter-process lock electing a single leader among the workers.
+
+    The lock is an exclusive `flock` on a file in the run directory, so it is
+    released by the operating system if the leader exits for any reason.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the lock instance."""
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        """Check whether this process holds the lock."""
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Try to take the lock without blocking."""
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        """Release the lock, if held."""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _merge_counts(total: dict, counts: Mapping):
+    """Add the numeric values of a nested dict to a running total."""
+    for name, value in counts.items():
+        if isinstance(value, Mapping):
+            _merge_counts(total.setdefault(name, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[name] = total.get(name, 0) + value
+
+
+def aggregate_stats(snapshots: Sequence[Mapping]) -> dict:
+    """
+    Combine the statistics published by several workers.
+
+    Conductor counts are added up. Timing results are combined per timer:
+    counts and totals are added up, minimums and maximums are kept and the
+    averages are recomputed.
+    """
+    conductor = {}
+    timing = {"avg": {}, "count": {}, "max": {}, "min": {}, "total": {}}
+    for snapshot in snapshots:
+        _merge_counts(conductor, snapshot.get("conductor") or {})
+        results = snapshot.get("timing") or {}
+        for name, count in results.get("count", {}).items():
+            timing["count"][name] = timing["count"].get(name, 0) + count
+            timing["total"][name] = (
+                timing["total"].get(name, 0) + results["total"][name]
+            )
+            timing["max"][name] = max(
+                timing["max"].get(name, results["max"][name]), results["max"][name]
+            )
+            timing["min"][name] = min(
+                timing["min"].get(name, results["min"][name]), results["min"][name]
+            )
+    for name, count in timing["count"].items():
+        timing["avg"][name] = timing["total"][name] / count
+    return {"conductor": conductor, "timing": timing}
+
+
+class WorkerCoordinator:
+    """Coordinate a worker process with the other workers of the agent."""
+
+    def __init__(
+        self,
+        run_dir: str,
+        index: int,
+        count: int,
+        *,
+        snapshot: Callable[[], Awaitable[dict]] = None,
+        interval: float = 5.0,
+    ):
+        """
+        Initialize a `WorkerCoordinator` instance.
+
+        Args:
+            run_dir: the directory shared by the workers
+            index: the index of this worker
+            count: the number of workers
+            snapshot: coroutine function returning the statistics of this worker
+            interval: number of seconds between leader election attempts and
+                statistics updates
+
+        """
+        self.run_dir = run_dir
+        self.index = index
+        self.count = count
+        self.snapshot = snapshot
+        self.interval = interval
+        self.lock = LeaderLock(os.path.join(run_dir, LEADER_LOCK_FILE))
+        self._singletons = {}
+        self._task: asyncio.Task = None
+
+    @classmethod
+    def from_settings(
+        cls, settings: Mapping, **kwargs
+    ) -> Optional["WorkerCoordinator"]:
+        """Create the coordinator from settings, when running several workers."""
+        count = settings.get("workers.count") or 1
+        if count < 2:
+            return None
+        return cls(
+            settings["workers.run_dir"],
+            settings.get("workers.index", 0),
+            count,
+            **kwargs,
+        )
+
+    @property
+    def is_leader(self) -> bool:
+        """Check whether this worker is the leader."""
+        return self.lock.held
+
+    @property
+    def stats_path(self) -> str:
+        """Accessor for the path of the statistics file of this worker."""
+        return os.path.join(self.run_dir, f"{STATS_FILE_PREFIX}{self.index}.json")
+
+    def add_singleton(
+        self, name: str, start: Callable[[], None], stop: Callable[[], Awaitable]
+    ):
+        """
+        Register a background job to be run by the leader only.
+
+        Args:
+            name: the job name
+            start: function starting the job
+            stop: coroutine function stopping the job
+
+        """
+        self._singletons[name] = (start, stop)
+        if self.is_leader:
+            start()
+
+    def elect(self) -> bool:
+        """Try to become the leader, starting the singleton jobs if elected."""
+        if self.is_leader or not self.lock.try_acquire():
+            return self.is_leader
+        LOGGER.info("Worker %s elected leader", self.index)
+        for name, (start, _stop) in self._singletons.items():
+            LOGGER.debug("Starting singleton job: %s", name)
+            start()
+        return True
+
+    async def publish(self):
+        """Write the statistics of this worker for the other workers."""
+        snapshot = {
+            "index": self.index,
+            "pid": os.getpid(),
+            "leader": self.is_leader,
+            "updated": time.time(),
+        }
+        if self.snapshot:
+            snapshot.update(await self.snapshot())
+        temp_path = f"{self.stats_path}.tmp"
+        with open(temp_path, "w") as stats_file:
+            json.dump(snapshot, stats_file)
+        os.replace(temp_path, self.stats_path)
+
+    def read_snapshots(self) -> Sequence[dict]:
+        """Read the current statistics published by each worker."""
+        snapshots = []
+        expired = time.time() - self.interval * 3
+        for name in sorted(os.listdir(self.run_dir)):
+            if not (name.startswith(STATS_FILE_PREFIX) and name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(self.run_dir, name)) as stats_file:
+                    snapshot = json.load(stats_file)
+            except (OSError, ValueError):
+                continue
+            if snapshot.get("updated", 0) >= expired:
+                snapshots.append(snapshot)
+        return snapshots
+
+    async def status(self) -> dict:
+        """Report the workers and their combined statistics."""
+        await self.publish()
+        snapshots = self.read_snapshots()
+        return {
+            "count": self.count,
+            "index": self.index,
+            "leader": self.is_leader,
+            "workers": [
+                {
+                    "index": snapshot["index"],
+                    "pid": snapshot["pid"],
+                    "leader": snapshot["leader"],
+                    "updated": snapshot["updated"],
+                }
+                for snapshot in snapshots
+            ],
+            **aggregate_stats(snapshots),
+        }
+
+    async def _run(self):
+        """Hold elections and publish statistics until cancelled."""
+        while True:
+            try:
+                self.elect()
+                await self.publish()
+            except Exception:
+                LOGGER.exception("Error coordinating worker %s", self.index)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start coordinating with the other workers."""
+        if not self._task or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop coordinating, handing over leadership to another worker."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self.is_leader:
+            for name, (_start, stop) in self._singletons.items():
+                LOGGER.debug("Stopping singleton job: %s", name)
+                await stop()
+            self.lock.release()
+        try:
+            os.remove(self.stats_path)
+        except OSError:
+            pass
+
+
+def prepare_run_dir(run_dir: str):
+    """Create the run directory, removing statistics left by earlier runs."""
+    os.makedirs(run_dir, mode=0o700, exist_ok=True)
+    for name in os.listdir(run_dir):
+        if name.startswith(STATS_FILE_PREFIX):
+            os.remove(os.path.join(run_dir, name))
+
+
+def worker_started(run_dir: str, index: int) -> bool:
+    """Check whether a worker has published its statistics, once started."""
+    return os.path.exists(os.path.join(run_dir, f"{STATS_FILE_PREFIX}{index}.json"))
+
+
+def _exit_code(status: int) -> int:
+    """Convert a process status returned by `os.wait` to an exit code."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _fork_worker(run_worker: Callable[[int], None], index: int) -> int:
+    """Fork a worker process, returning its pid in the supervisor."""
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 0
+    try:
+        run_worker(index)
+    except SystemExit as err:
+        code = err.code if isinstance(err.code, int) else 1
+    except BaseException:
+        LOGGER.exception("Worker %s failed", index)
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def run_workers(
+    count: int,
+    run_worker: Callable[[int], None],
+    ready: Callable[[int], bool] = None,
+    ready_timeout: float = 300.0,
+) -> int:
+    """
+    Fork worker processes and wait for them to exit.
+
+    The first worker is started alone, so that the wallet is provisioned and
+    upgraded once, and the other workers are forked when `ready` reports it
+    has started. SIGTERM is forwarded to the workers; on SIGINT the workers
+    are expected to be interrupted by the terminal. If any worker exits with
+    an error the others are stopped.
+
+    Args:
+        count: the number of workers
+        run_worker: function running a worker, given its index
+        ready: function reporting whether the worker with an index has started
+        ready_timeout: number of seconds to wait for the first worker to start
+
+    Returns:
+        The exit code of the first worker to fail, or 0
+
+    """
+    workers = {_fork_worker(run_worker, 0): 0}
+    if ready:
+        deadline = time.monotonic() + ready_timeout
+        while not ready(0):
+            pid, status = os.waitpid(next(iter(workers)), os.WNOHANG)
+            if pid:
+                LOGGER.error("Worker 0 exited during startup")
+                return _exit_code(status) or 1
+            if time.monotonic() > deadline:
+                for pid in workers:
+                    os.kill(pid, signal.SIGTERM)
+                    os.waitpid(pid, 0)
+                raise WorkerError("Timed out waiting for worker 0 to start")
+            time.sleep(0.1)
+    for index in range(1, count):
+        workers[_fork_worker(run_worker, index)] = index
+
+    stopping = False
+
+    def stop_workers(signum=signal.SIGTERM, frame=None):
+        nonlocal stopping
+        stopping = True
+        if signum == signal.SIGTERM:
+            for pid in workers:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    handlers = {
+        signum: signal.signal(signum, stop_workers)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    exit_code = 0
+    try:
+        while workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index = workers.pop(pid, None)
+            code = _exit_code(status)
+            if code and not stopping:
+                LOGGER.error("Worker %s exited with code %s, stopping", index, code)
+                exit_code = code
+                stop_workers()
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    return exit_code
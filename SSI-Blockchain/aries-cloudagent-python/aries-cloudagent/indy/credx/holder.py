@@ -1,6 +1,5 @@
 """Indy holder implementation."""
 
-import asyncio
 import json
 import logging
 import re
@@ -21,6 +20,7 @@ from indy_credx import (
 
 from ...askar.profile import AskarProfile
 from ...ledger.base import BaseLedger
+from ...utils import executors
 from ...wallet.error import WalletNotFoundError
 
 from ..holder import IndyHolder, IndyHolderError
@@ -124,8 +124,8 @@ class IndyCredxHolder(IndyHolder):
             (
                 cred_req,
                 cred_req_metadata,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await executors.run_in_executor(
+                executors.ANONCREDS_HOLDER,
                 CredentialRequest.create,
                 holder_did,
                 credential_definition,
@@ -178,8 +178,8 @@ class IndyCredxHolder(IndyHolder):
         try:
             secret = await self.get_master_secret()
             cred = Credential.load(credential_data)
-            cred_recvd = await asyncio.get_event_loop().run_in_executor(
-                None,
+            cred_recvd = await executors.run_in_executor(
+                executors.ANONCREDS_HOLDER,
                 cred.process,
                 credential_request_metadata,
                 secret,
@@ -561,8 +561,8 @@ class IndyCredxHolder(IndyHolder):
             #print("holder.py | CREDENTIAL_DEFINITIONS = " + str(credential_definitions) + "\n")
             #print("holder.py | CREDENTIAL_DEFINITIONS_VALUES= " + str(credential_definitions.values()) + "\n")
 
-            presentation = await asyncio.get_event_loop().run_in_executor(
-                None,
+            presentation = await executors.run_in_executor(
+                executors.ANONCREDS_HOLDER,
                 Presentation.create,
                 presentation_request,
                 present_creds,
@@ -604,8 +604,8 @@ class IndyCredxHolder(IndyHolder):
         """
 
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
+            rev_state = await executors.run_in_executor(
+                executors.ANONCREDS_HOLDER,
                 CredentialRevocationState.create,
                 rev_reg_def,
                 rev_reg_delta,
@@ -1,6 +1,5 @@
 """Indy issuer implementation."""
 
-import asyncio
 import logging
 
 from typing import Sequence, Tuple
@@ -20,6 +19,7 @@ from indy_credx import (
 )
 
 from ...askar.profile import AskarProfile
+from ...utils import executors
 
 from ..issuer import (
     IndyIssuer,
@@ -42,6 +42,36 @@ CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
 
 
+def create_revocation_registry(
+    origin_did: str,
+    cred_def_json: str,
+    tag: str,
+    revoc_def_type: str,
+    max_cred_num: int,
+    tails_dir_path: str,
+) -> Tuple[str, str, str]:
+    """
+    Create a revocation registry and its tails file.
+
+    Runs in a worker thread or process, so the registry definition, private
+    key and initial entry are returned as JSON.
+    """
+    (
+        rev_reg_def,
+        rev_reg_def_private,
+        rev_reg,
+        _rev_reg_delta,
+    ) = RevocationRegistryDefinition.create(
+        origin_did,
+        cred_def_json,
+        tag,
+        revoc_def_type,
+        max_cred_num,
+        tails_dir_path=tails_dir_path,
+    )
+    return rev_reg_def.to_json(), rev_reg_def_private.to_json(), rev_reg.to_json()
+
+
 class IndyCredxIssuer(IndyIssuer):
     """Indy-Credx issuer class."""
 
@@ -140,8 +170,8 @@ class IndyCredxIssuer(IndyIssuer):
                 cred_def,
                 cred_def_private,
                 key_proof,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await executors.run_in_executor(
+                executors.ANONCREDS_ISSUE,
                 lambda: CredentialDefinition.create(
                     origin_did,
                     schema,
@@ -344,8 +374,8 @@ class IndyCredxIssuer(IndyIssuer):
                 credential,
                 _upd_rev_reg,
                 _delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await executors.run_in_executor(
+                executors.ANONCREDS_ISSUE,
                 Credential.create,
                 cred_def.raw_value,
                 cred_def_private.raw_value,
@@ -457,8 +487,8 @@ class IndyCredxIssuer(IndyIssuer):
                 raise IndyIssuerError("Error loading revocation registry") from err
 
             try:
-                delta = await asyncio.get_event_loop().run_in_executor(
-                    None,
+                delta = await executors.run_in_executor(
+                    executors.ANONCREDS_ISSUE,
                     lambda: rev_reg.update(
                         rev_reg_def,
                         None,  # issued
@@ -531,8 +561,8 @@ class IndyCredxIssuer(IndyIssuer):
                     "Error merging revocation registry deltas"
                 ) from err
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, update, fro_delta, to_delta
+        return await executors.run_in_executor(
+            executors.ANONCREDS_ISSUE, update, fro_delta, to_delta
         )
 
     async def create_and_store_revocation_registry(
@@ -572,28 +602,23 @@ class IndyCredxIssuer(IndyIssuer):
 
         try:
             (
-                rev_reg_def,
-                rev_reg_def_private,
-                rev_reg,
-                _rev_reg_delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: RevocationRegistryDefinition.create(
-                    origin_did,
-                    cred_def.raw_value,
-                    tag,
-                    revoc_def_type,
-                    max_cred_num,
-                    tails_dir_path=tails_base_path,
-                ),
+                rev_reg_def_json,
+                rev_reg_def_private_json,
+                rev_reg_json,
+            ) = await executors.run_in_executor(
+                executors.ANONCREDS_REGISTRY,
+                create_revocation_registry,
+                origin_did,
+                bytes(cred_def.raw_value),
+                tag,
+                revoc_def_type,
+                max_cred_num,
+                tails_base_path,
             )
+            rev_reg_def_id = RevocationRegistryDefinition.load(rev_reg_def_json).id
         except CredxError as err:
             raise IndyIssuerError("Error creating revocation registry") from err
 
-        rev_reg_def_id = rev_reg_def.id
-        rev_reg_def_json = rev_reg_def.to_json()
-        rev_reg_json = rev_reg.to_json()
-
         try:
             async with self._profile.transaction() as txn:
                 await txn.handle.insert(CATEGORY_REV_REG, rev_reg_def_id, rev_reg_json)
@@ -608,7 +633,7 @@ class IndyCredxIssuer(IndyIssuer):
                 await txn.handle.insert(
                     CATEGORY_REV_REG_DEF_PRIVATE,
                     rev_reg_def_id,
-                    rev_reg_def_private.to_json_buffer(),
+                    rev_reg_def_private_json.encode(),
                 )
                 await txn.commit()
         except AskarError as err:
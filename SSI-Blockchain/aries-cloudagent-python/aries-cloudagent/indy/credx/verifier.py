@@ -1,17 +1,31 @@
 """Indy-Credx verifier implementation."""
 
-import asyncio
 import logging
 
 from indy_credx import CredxError, Presentation
 
 from ...core.profile import Profile
+from ...utils import executors
 
 from ..verifier import IndyVerifier, PresVerifyMsg
 
 LOGGER = logging.getLogger(__name__)
 
 
+def verify_presentation(
+    pres: dict,
+    pres_req: dict,
+    schemas: list,
+    credential_definitions: list,
+    rev_reg_defs: list,
+    rev_reg_entries: dict,
+) -> bool:
+    """Verify a presentation, in a worker thread or process."""
+    return Presentation.load(pres).verify(
+        pres_req, schemas, credential_definitions, rev_reg_defs, rev_reg_entries
+    )
+
+
 class IndyCredxVerifier(IndyVerifier):
     """Indy-Credx verifier class."""
 
@@ -63,22 +77,18 @@ class IndyCredxVerifier(IndyVerifier):
             return (False, msgs)
 
         try:
-            presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
-                presentation.verify,
+            verified = await executors.run_in_executor(
+                executors.ANONCREDS_VERIFY,
+                verify_presentation,
+                pres,
                 pres_req,
-                schemas.values(),
-                credential_definitions.values(),
-                rev_reg_defs.values(),
+                list(schemas.values()),
+                list(credential_definitions.values()),
+                list(rev_reg_defs.values()),
                 rev_reg_entries,
             )
         except CredxError as err:
             s = str(err)
-            
-#            print("PRES_REQ = " + str(pres_req))
-#            print("PRES = " + str(pres))
-
             msgs.append(f"{PresVerifyMsg.PRES_VERIFY_ERROR.value}::{s}")
             LOGGER.exception(
                 f"Validation of presentation on nonce={pres_req['nonce']} "
@@ -8,7 +8,7 @@ from weakref import finalize, ref
 
 from ...config.injection_context import InjectionContext
 from ...config.provider import ClassProvider
-from ...core.profile import Profile, ProfileManager, ProfileSession
+from ...core.profile import Profile, ProfileManager, ProfileSession, SessionScope
 from ...core.error import ProfileError
 from ...ledger.base import BaseLedger
 from ...ledger.indy import IndySdkLedger, IndySdkLedgerPool
@@ -105,7 +105,9 @@ class IndySdkProfile(Profile):
 
     def session(self, context: InjectionContext = None) -> "ProfileSession":
         """Start a new interactive session with no transaction support requested."""
-        return IndySdkProfileSession(self, context=context)
+        return SessionScope.get_session(
+            self, context, lambda: IndySdkProfileSession(self, context=context)
+        )
 
     def transaction(self, context: InjectionContext = None) -> "ProfileSession":
         """
@@ -493,10 +493,35 @@ class IndySdkLedger(BaseLedger):
 
         """
         if self.pool.cache:
-            result = await self.pool.cache.get(f"schema::{schema_id}")
-            if result:
+            cache_key = f"schema::{schema_id}"
+            async with self.pool.cache.acquire(cache_key) as entry:
+                if entry.negative:
+                    result = None
+                elif entry.result:
+                    result = entry.result
+                    entry.refresh(
+                        lambda: self._fetch_schema(schema_id),
+                        self.pool.cache_duration,
+                        store=False,
+                    )
+                else:
+                    result = await self._fetch_schema(schema_id)
+                    if result:
+                        # already stored under its id and sequence number
+                        await entry.set_result(result, store=False)
+                    else:
+                        await entry.set_negative()
                 return result
 
+        return await self._fetch_schema(schema_id)
+
+    async def _fetch_schema(self, schema_id: str) -> dict:
+        """
+        Fetch a schema from the ledger by id or stringified sequence number.
+
+        The cache is bypassed, and the result is stored under both its id and
+        sequence number by `fetch_schema_by_id`.
+        """
         if schema_id.isdigit():
             return await self.fetch_schema_by_seq_no(int(schema_id))
         else:
@@ -535,7 +560,7 @@ class IndySdkLedger(BaseLedger):
 
         parsed_response = json.loads(parsed_schema_json)
         if parsed_response and self.pool.cache:
-            await self.pool.cache.set(
+            await self.pool.cache.set_refreshable(
                 [f"schema::{schema_id}", f"schema::{response['result']['seqNo']}"],
                 parsed_response,
                 self.pool.cache_duration,
@@ -569,7 +594,7 @@ class IndySdkLedger(BaseLedger):
                 data_txn["data"]["data"]["version"],
             )
             schema_id = f"{origin_did}:2:{name}:{version}"
-            return await self.get_schema(schema_id)
+            return await self.fetch_schema_by_id(schema_id)
 
         raise LedgerTransactionError(
             f"Could not get schema from ledger for seq no {seq_no}"
@@ -604,10 +629,28 @@ class IndySdkLedger(BaseLedger):
 
         """
         if self.pool.cache:
-            result = await self.pool.cache.get(
-                f"credential_definition::{credential_definition_id}"
-            )
-            if result:
+            cache_key = f"credential_definition::{credential_definition_id}"
+            async with self.pool.cache.acquire(cache_key) as entry:
+                if entry.negative:
+                    result = None
+                elif entry.result:
+                    result = entry.result
+                    entry.refresh(
+                        lambda: self.fetch_credential_definition(
+                            credential_definition_id
+                        ),
+                        self.pool.cache_duration,
+                        store=False,
+                    )
+                else:
+                    result = await self.fetch_credential_definition(
+                        credential_definition_id
+                    )
+                    if result:
+                        # already stored by fetch_credential_definition
+                        await entry.set_result(result, store=False)
+                    else:
+                        await entry.set_negative()
                 return result
 
         return await self.fetch_credential_definition(credential_definition_id)
@@ -645,7 +688,7 @@ class IndySdkLedger(BaseLedger):
                     raise
 
         if parsed_response and self.pool.cache:
-            await self.pool.cache.set(
+            await self.pool.cache.set_refreshable(
                 f"credential_definition::{credential_definition_id}",
                 parsed_response,
                 self.pool.cache_duration,
@@ -405,10 +405,35 @@ class IndyVdrLedger(BaseLedger):
 
         """
         if self.pool.cache:
-            result = await self.pool.cache.get(f"schema::{schema_id}")
-            if result:
+            cache_key = f"schema::{schema_id}"
+            async with self.pool.cache.acquire(cache_key) as entry:
+                if entry.negative:
+                    result = None
+                elif entry.result:
+                    result = entry.result
+                    entry.refresh(
+                        lambda: self._fetch_schema(schema_id),
+                        self.pool.cache_duration,
+                        store=False,
+                    )
+                else:
+                    result = await self._fetch_schema(schema_id)
+                    if result:
+                        # already stored under its id and sequence number
+                        await entry.set_result(result, store=False)
+                    else:
+                        await entry.set_negative()
                 return result
 
+        return await self._fetch_schema(schema_id)
+
+    async def _fetch_schema(self, schema_id: str) -> dict:
+        """
+        Fetch a schema from the ledger by id or stringified sequence number.
+
+        The cache is bypassed, and the result is stored under both its id and
+        sequence number by `fetch_schema_by_id`.
+        """
         if schema_id.isdigit():
             return await self.fetch_schema_by_seq_no(int(schema_id))
         else:
@@ -453,7 +478,7 @@ class IndyVdrLedger(BaseLedger):
         }
 
         if self.pool.cache:
-            await self.pool.cache.set(
+            await self.pool.cache.set_refreshable(
                 [f"schema::{schema_id}", f"schema::{schema_seqno}"],
                 schema_data,
                 self.pool.cache_duration,
@@ -489,7 +514,7 @@ class IndyVdrLedger(BaseLedger):
                 data_txn["data"]["data"]["version"],
             )
             schema_id = f"{origin_did}:2:{name}:{version}"
-            return await self.get_schema(schema_id)
+            return await self.fetch_schema_by_id(schema_id)
 
         raise LedgerTransactionError(
             f"Could not get schema from ledger for seq no {seq_no}"
@@ -526,14 +551,24 @@ class IndyVdrLedger(BaseLedger):
         if self.pool.cache:
             cache_key = f"credential_definition::{credential_definition_id}"
             async with self.pool.cache.acquire(cache_key) as entry:
-                if entry.result:
+                if entry.negative:
+                    result = None
+                elif entry.result:
                     result = entry.result
+                    entry.refresh(
+                        lambda: self.fetch_credential_definition(
+                            credential_definition_id
+                        ),
+                        self.pool.cache_duration,
+                    )
                 else:
                     result = await self.fetch_credential_definition(
                         credential_definition_id
                     )
                     if result:
                         await entry.set_result(result, self.pool.cache_duration)
+                    else:
+                        await entry.set_negative()
                 return result
 
         return await self.fetch_credential_definition(credential_definition_id)
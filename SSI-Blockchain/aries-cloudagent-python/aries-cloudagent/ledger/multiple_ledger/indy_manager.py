@@ -7,7 +7,7 @@ import json
 from collections import OrderedDict
 from typing import Optional, Tuple, Mapping
 
-from ...cache.base import BaseCache
+from ...cache.base import BaseCache, is_negative_entry
 from ...core.profile import Profile
 from ...ledger.error import LedgerError
 from ...wallet.crypto import did_is_self_certified
@@ -126,6 +126,13 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
             )
             return None
 
+    async def _lookup_ledger_id(self, did: str) -> str:
+        """Look up the id of the ledger for a DID, bypassing the cache."""
+        (ledger_id, _) = await self.lookup_did_in_configured_ledgers(
+            did, cache_did=False
+        )
+        return ledger_id
+
     async def lookup_did_in_configured_ledgers(
         self, did: str, cache_did: bool = True
     ) -> Tuple[str, IndySdkLedger]:
@@ -134,6 +141,16 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
         cache_key = f"did_ledger_id_resolver::{did}"
         if bool(cache_did and self.cache and await self.cache.get(cache_key)):
             cached_ledger_id = await self.cache.get(cache_key)
+            if is_negative_entry(cached_ledger_id):
+                raise MultipleLedgerManagerError(
+                    f"DID {did} not found in any of the ledgers (cached)"
+                )
+            if await self.cache.is_stale(cache_key):
+                self.cache.refresh(
+                    cache_key,
+                    lambda: self._lookup_ledger_id(did),
+                    self.cache_ttl,
+                )
             if cached_ledger_id in self.production_ledgers:
                 return (cached_ledger_id, self.production_ledgers.get(cached_ledger_id))
             elif cached_ledger_id in self.non_production_ledgers:
@@ -205,7 +222,7 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
                 applicable_prod_ledgers.get("self_certified").values()
             )[0]
             if cache_did and self.cache:
-                await self.cache.set(
+                await self.cache.set_refreshable(
                     cache_key, successful_ledger_inst[0], self.cache_ttl
                 )
             return successful_ledger_inst
@@ -214,7 +231,7 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
                 applicable_non_prod_ledgers.get("self_certified").values()
             )[0]
             if cache_did and self.cache:
-                await self.cache.set(
+                await self.cache.set_refreshable(
                     cache_key, successful_ledger_inst[0], self.cache_ttl
                 )
             return successful_ledger_inst
@@ -223,7 +240,7 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
                 applicable_prod_ledgers.get("non_self_certified").values()
             )[0]
             if cache_did and self.cache:
-                await self.cache.set(
+                await self.cache.set_refreshable(
                     cache_key, successful_ledger_inst[0], self.cache_ttl
                 )
             return successful_ledger_inst
@@ -232,11 +249,13 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
                 applicable_non_prod_ledgers.get("non_self_certified").values()
             )[0]
             if cache_did and self.cache:
-                await self.cache.set(
+                await self.cache.set_refreshable(
                     cache_key, successful_ledger_inst[0], self.cache_ttl
                 )
             return successful_ledger_inst
         else:
+            if cache_did and self.cache:
+                await self.cache.set_negative(cache_key)
             raise MultipleLedgerManagerError(
                 f"DID {did} not found in any of the ledgers total: "
                 f"(production: {len(self.production_ledgers)}, "
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from aries_cloudagent.messaging.valid import ENDPOINT_TYPE
 import pytest
@@ -6,6 +7,8 @@ from asynctest import mock as async_mock
 
 import indy_vdr
 
+from ...cache.base import REFRESH_AHEAD_PREFIX
+from ...cache.in_memory import InMemoryCache
 from ...core.in_memory import InMemoryProfile
 from ...indy.issuer import IndyIssuer
 from ...wallet.base import BaseWallet
@@ -377,6 +380,93 @@ class TestIndyVdrLedger:
             result = await ledger.get_schema("55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1")
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_schema_cached_once(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        schema_id = "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1"
+        cache = InMemoryCache()
+        ledger.pool.cache = cache
+        async with ledger:
+            ledger.pool_handle.submit_request.return_value = {
+                "seqNo": 99,
+                "dest": "55GkHamhTU1ZbTbV2ab9DE",
+                "data": {
+                    "name": "schema_name",
+                    "version": "9.1",
+                    "attr_names": ["a", "b"],
+                },
+            }
+            with async_mock.patch.object(
+                cache, "set", async_mock.CoroutineMock(wraps=cache.set)
+            ) as mock_set:
+                results = await asyncio.gather(
+                    ledger.get_schema(schema_id), ledger.get_schema(schema_id)
+                )
+            assert results[0] == results[1]
+            assert results[0]["attrNames"] == ["a", "b"]
+            # concurrent lookups share one fetch, stored once under both keys
+            ledger.pool_handle.submit_request.assert_awaited_once()
+            mock_set.assert_awaited_once()
+            assert mock_set.call_args[0][0] == [f"schema::{schema_id}", "schema::99"]
+
+            ledger.pool_handle.submit_request.return_value = {}
+            missing_id = "55GkHamhTU1ZbTbV2ab9DE:2:missing:1.0"
+            assert await ledger.get_schema(missing_id) is None
+            assert await ledger.get_schema(missing_id) is None
+            assert ledger.pool_handle.submit_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_schema_refresh_by_seq_no(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        schema_id = "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1"
+        cache = InMemoryCache()
+        cache.set_refresh_policy("schema::", 60)
+        ledger.pool.cache = cache
+        stale = {"id": schema_id, "attrNames": ["a"], "seqNo": 99}
+        await cache.set([f"schema::{schema_id}", "schema::99"], stale, 60)
+        async with ledger:
+            ledger.pool_handle.submit_request.side_effect = [
+                {
+                    "data": {
+                        "txn": {
+                            "type": "101",
+                            "metadata": {"from": "55GkHamhTU1ZbTbV2ab9DE"},
+                            "data": {"data": {"name": "schema_name", "version": "9.1"}},
+                        }
+                    }
+                },
+                {
+                    "seqNo": 99,
+                    "dest": "55GkHamhTU1ZbTbV2ab9DE",
+                    "data": {
+                        "name": "schema_name",
+                        "version": "9.1",
+                        "attr_names": ["a", "b"],
+                    },
+                },
+            ]
+            with async_mock.patch.object(
+                cache, "set", async_mock.CoroutineMock(wraps=cache.set)
+            ) as mock_set:
+                assert await ledger.get_schema("99") == stale
+                await cache._refresh_tasks["schema::99"]
+
+            assert (await cache.get("schema::99"))["attrNames"] == ["a", "b"]
+            assert (await cache.get(f"schema::{schema_id}"))["attrNames"] == [
+                "a",
+                "b",
+            ]
+            assert [call[0][0] for call in mock_set.call_args_list] == [
+                f"schema::{schema_id}",
+                f"{REFRESH_AHEAD_PREFIX}schema::{schema_id}",
+                "schema::99",
+                f"{REFRESH_AHEAD_PREFIX}schema::99",
+            ]
+
     @pytest.mark.asyncio
     async def test_send_credential_definition(
         self,
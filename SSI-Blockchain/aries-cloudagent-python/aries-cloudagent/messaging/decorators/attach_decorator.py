@@ -11,7 +11,7 @@ import copy
 
 from typing import Any, Mapping, Sequence, Tuple, Union
 
-from marshmallow import EXCLUDE, fields, pre_load
+from marshmallow import EXCLUDE, fields, post_load, pre_load
 
 from ...wallet.base import BaseWallet
 from ...wallet.util import (
@@ -215,12 +215,19 @@ def raw_key(verkey: str) -> str:
 
 
 class AttachDecoratorData(BaseModel):
-    """Attach decorator data."""
+    """
+    Attach decorator data.
+
+    JSON content passed in is copied, so later changes by the caller do not
+    affect the attachment. Instances loaded through the schema instead hold
+    the JSON content of the deserialized message itself, without a copy.
+    """
 
     class Meta:
         """AttachDecoratorData metadata."""
 
         schema_class = "AttachDecoratorDataSchema"
+        repr_exclude = ["_decoded"]
 
     def __init__(
         self,
@@ -230,6 +237,7 @@ class AttachDecoratorData(BaseModel):
         links_: Union[Sequence[str], str] = None,
         base64_: str = None,
         json_: Union[Sequence[dict], dict] = None,
+        _copy_json: bool = True,
     ):
         """
         Initialize decorator data.
@@ -246,6 +254,8 @@ class AttachDecoratorData(BaseModel):
             links_: URL or list of URLs
             base64_: base64 encoded content for inclusion
             json_: dict content for inclusion as json
+            _copy_json: whether to copy `json_` rather than hold the caller's
+                content, which is then shared with the caller
 
         """
         if jws_:
@@ -256,7 +266,7 @@ class AttachDecoratorData(BaseModel):
             self.base64_ = base64_
         elif json_:
             # prevent external manipulation of attachment data
-            self.json_ = copy.deepcopy(json_)
+            self.json_ = copy.deepcopy(json_) if _copy_json else json_
         else:
             assert isinstance(links_, (str, Sequence))
             self.links_ = [links_] if isinstance(links_, str) else list(links_)
@@ -269,6 +279,22 @@ class AttachDecoratorData(BaseModel):
 
         return getattr(self, "base64_", None)
 
+    def decode_base64(self) -> bytes:
+        """
+        Decode base64 decorator data, or return None.
+
+        The payload is only decoded on first access, and the result is retained
+        for as long as the base64 data is unchanged.
+        """
+        b64 = self.base64
+        if not b64:
+            return None
+        decoded = getattr(self, "_decoded", None)
+        if not decoded or decoded[0] is not b64:
+            decoded = (b64, b64_to_bytes(b64))
+            self._decoded = decoded
+        return decoded[1]
+
     @property
     def jws(self):
         """Accessor for JWS, or None."""
@@ -480,6 +506,18 @@ class AttachDecoratorDataSchema(BaseModelSchema):
 
         return data
 
+    @post_load
+    def make_model(self, data: dict, **kwargs):
+        """
+        Return model instance after loading.
+
+        Loaded json content belongs to the message being deserialized, so the
+        instance holds it without the defensive copy taken of caller data; the
+        `json` accessor still returns a copy.
+
+        """
+        return super().make_model({**data, "_copy_json": False}, **kwargs)
+
     base64_ = fields.Str(
         description="Base64-encoded data", required=False, data_key="base64", **BASE64
     )
@@ -564,7 +602,7 @@ class AttachDecorator(BaseModel):
 
         """
         if hasattr(self.data, "base64_"):
-            return json.loads(b64_to_bytes(self.data.base64))
+            return json.loads(self.data.decode_base64())
         elif hasattr(self.data, "json_"):
             return self.data.json
         elif hasattr(self.data, "links_"):
@@ -601,6 +639,9 @@ class AttachDecorator(BaseModel):
             byte_count: optional attachment byte count
 
         """
+        payload = json.dumps(mapping).encode()
+        data = AttachDecoratorData(base64_=bytes_to_b64(payload))
+        data._decoded = (data.base64, payload)
         return AttachDecorator(
             ident=ident or str(uuid.uuid4()),
             description=description,
@@ -608,9 +649,7 @@ class AttachDecorator(BaseModel):
             mime_type="application/json",
             lastmod_time=lastmod_time,
             byte_count=byte_count,
-            data=AttachDecoratorData(
-                base64_=bytes_to_b64(json.dumps(mapping).encode())
-            ),
+            data=data,
         )
 
     @classmethod
@@ -421,6 +421,48 @@ class TestAttachDecorator(TestCase):
         assert "key_one" in deco_aries.data.json
         assert "key_one" not in data
 
+    def test_decode_base64_memoized(self):
+        deco_b64 = AttachDecorator.data_base64(mapping=INDY_CRED)
+        serialized = deco_b64.serialize()
+
+        loaded = AttachDecorator.deserialize(serialized)
+        assert "_decoded" not in vars(loaded.data)
+        assert "_decoded" not in repr(loaded.data)
+
+        decoded = loaded.data.decode_base64()
+        assert decoded == b64_to_bytes(serialized["data"]["base64"])
+        assert loaded.data.decode_base64() is decoded
+        assert loaded.content == INDY_CRED
+        assert loaded.content is not loaded.content
+        assert loaded.serialize() == serialized
+
+        # replaced data is decoded afresh
+        loaded.data.base64_ = bytes_to_b64(json.dumps({"a": 1}).encode())
+        assert loaded.content == {"a": 1}
+
+        # encoded content is retained on construction
+        assert deco_b64.data.decode_base64() == json.dumps(INDY_CRED).encode()
+        assert AttachDecorator.data_json(INDY_CRED).data.decode_base64() is None
+
+    def test_deserialize_json_adopted(self):
+        serialized = AttachDecorator.data_json(mapping=INDY_CRED).serialize()
+
+        loaded = AttachDecorator.deserialize(serialized)
+        # the loaded model holds the deserialized content without a copy
+        assert loaded.data.json_ is serialized["data"]["json"]
+        assert loaded.data.json == INDY_CRED
+        assert loaded.data.json is not loaded.data.json_
+        assert loaded.serialize() == serialized
+
+    def test_json_copied(self):
+        mapping = {"a": [1]}
+        data = AttachDecoratorData(json_=mapping)
+        assert data.json_ == mapping
+        assert data.json_ is not mapping
+
+        data = AttachDecoratorData(json_=mapping, _copy_json=False)
+        assert data.json_ is mapping
+
 
 @pytest.mark.indy
 class TestAttachDecoratorSignature:
@@ -0,0 +1,575 @@
+"""
+Compiled fast-path codecs for high-volume message types.
+
+A codec is compiled once from the marshmallow schema of a model class: the
+field definitions are turned into specialised loader and dumper closures, and
+the schema hooks (decorator extraction, schema validators, model construction)
+are invoked directly on a pooled schema instance. Values of the common field
+types are converted inline, other fields use the field's own conversion.
+
+The marshmallow path remains the validating fallback: whenever the fast path
+meets anything it cannot handle, including any validation error, the codec
+declines and `BaseModel` repeats the operation through marshmallow, which
+produces the canonical result or error.
+"""
+
+import logging
+
+from typing import Callable, Dict, Iterable, Mapping, Sequence, Tuple, Type, Union
+
+from marshmallow import EXCLUDE, INCLUDE, RAISE, Schema, fields, missing
+from marshmallow.decorators import (
+    POST_DUMP,
+    POST_LOAD,
+    PRE_DUMP,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+
+from ..core.error import BaseError
+from ..utils.classloader import ClassLoader
+from .models.base import (
+    FAST_CODECS,
+    BaseModel,
+    BaseModelSchema,
+    acquire_schema,
+    release_schema,
+    resolve_meta_property,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+FAST_CODEC_MESSAGE_TYPES = (
+    "aries_cloudagent.protocols.routing.v1_0.messages.forward.Forward",
+    "aries_cloudagent.protocols.trustping.v1_0.messages.ping.Ping",
+    "aries_cloudagent.protocols.basicmessage.v1_0.messages.basicmessage.BasicMessage",
+    "aries_cloudagent.protocols.issue_credential.v2_0.messages.cred_issue.V20CredIssue",
+    "aries_cloudagent.protocols.present_proof.v2_0.messages.pres.V20Pres",
+    # decorators carried by most of the messages above
+    "aries_cloudagent.messaging.decorators.thread_decorator.ThreadDecorator",
+    "aries_cloudagent.messaging.decorators.timing_decorator.TimingDecorator",
+    "aries_cloudagent.messaging.decorators.transport_decorator.TransportDecorator",
+)
+
+
+class CodecError(BaseError):
+    """Error raised when a schema cannot be compiled into a fast-path codec."""
+
+
+class _Decline(Exception):
+    """Internal signal to hand the current operation over to marshmallow."""
+
+
+def _field_loader(field: fields.Field, data_key: str, codec_for) -> Callable:
+    """Compile the conversion of a raw value for a loaded field."""
+    field_type = type(field)
+
+    if field_type is fields.String:
+
+        def convert(value, data):
+            if value.__class__ is str:
+                return value
+            return field._deserialize(value, data_key, data)
+
+    elif field_type is fields.Integer:
+
+        def convert(value, data):
+            if value.__class__ is int:
+                return value
+            return field._deserialize(value, data_key, data)
+
+    elif field_type is fields.Boolean:
+
+        def convert(value, data):
+            if value is True or value is False:
+                return value
+            return field._deserialize(value, data_key, data)
+
+    elif field_type is fields.Dict and not (field.key_field or field.value_field):
+
+        def convert(value, data):
+            if isinstance(value, Mapping):
+                return value
+            return field._deserialize(value, data_key, data)
+
+    elif field_type is fields.Raw:
+
+        def convert(value, data):
+            return value
+
+    elif field_type is fields.List:
+        inner = _value_loader(field.inner, data_key, codec_for)
+
+        def convert(value, data):
+            if value.__class__ is list or value.__class__ is tuple:
+                return [inner(item, data) for item in value]
+            return field._deserialize(value, data_key, data)
+
+    elif field_type is fields.Nested and field.only is None and not field.exclude:
+        nested = codec_for(type(field.schema))
+        many = field.many or field.schema.many
+        unknown = field.unknown
+
+        def convert(value, data):
+            if many:
+                if value.__class__ is not list and value.__class__ is not tuple:
+                    raise _Decline()
+                return [nested().load_value(item, unknown) for item in value]
+            return nested().load_value(value, unknown)
+
+    else:
+        return None
+
+    return convert
+
+
+def _value_loader(field: fields.Field, data_key: str, codec_for) -> Callable:
+    """Compile the deserialization of a present value, as `Field.deserialize`."""
+    convert = _field_loader(field, data_key, codec_for)
+    if not convert:
+
+        def load(value, data):
+            return field.deserialize(value, data_key, data)
+
+        return load
+
+    allow_none = field.allow_none
+    validators = tuple(field.validators)
+
+    def load(value, data):
+        if value is None:
+            if allow_none:
+                return None
+            raise _Decline()
+        value = convert(value, data)
+        for validator in validators:
+            if validator(value) is False:
+                raise _Decline()
+        return value
+
+    return load
+
+
+def _field_dumper(field: fields.Field, attr: str, codec_for) -> Callable:
+    """Compile the serialization of an attribute value, as `Field._serialize`."""
+    field_type = type(field)
+
+    if field_type is fields.String:
+
+        def dump(value, obj):
+            if value.__class__ is str or value is None:
+                return value
+            return field._serialize(value, attr, obj)
+
+    elif field_type is fields.Integer and not field.as_string:
+
+        def dump(value, obj):
+            if value.__class__ is int or value is None:
+                return value
+            return field._serialize(value, attr, obj)
+
+    elif field_type is fields.Boolean:
+
+        def dump(value, obj):
+            if value is True or value is False or value is None:
+                return value
+            return field._serialize(value, attr, obj)
+
+    elif field_type is fields.Raw or (
+        field_type is fields.Dict and not (field.key_field or field.value_field)
+    ):
+
+        def dump(value, obj):
+            return value
+
+    elif field_type is fields.List:
+        inner = _field_dumper(field.inner, attr, codec_for)
+
+        def dump(value, obj):
+            if value is None:
+                return None
+            return [inner(item, obj) for item in value]
+
+    elif field_type is fields.Nested and field.only is None and not field.exclude:
+        nested = codec_for(type(field.schema))
+        many = field.many or field.schema.many
+
+        def dump(value, obj):
+            if value is None:
+                return None
+            if many:
+                return [nested().dump_value(item) for item in value]
+            return nested().dump_value(value)
+
+    else:
+
+        def dump(value, obj):
+            return field._serialize(value, attr, obj)
+
+    return dump
+
+
+def _native_hook(schema: BaseModelSchema, name: str) -> Callable:
+    """Return an inline implementation of a standard `BaseModelSchema` hook."""
+    if name == "skip_dump_only":
+        dump_only = tuple(
+            field.data_key or field_name
+            for field_name, field in schema.fields.items()
+            if field.dump_only
+        )
+
+        def skip_dump_only(data):
+            for key in dump_only:
+                data.pop(key, None)
+            return data
+
+        return skip_dump_only
+
+    if name == "make_model":
+        # only resolves the model class, so the compile-time instance will do
+        make_model = schema.make_model
+
+        def make_model_inline(data):
+            return make_model(data, many=False, partial=None)
+
+        return make_model_inline
+
+    if name == "remove_skipped_values":
+        skip_values = resolve_meta_property(schema, "skip_values", [])
+
+        def remove_skipped_values(data):
+            return {
+                key: value for key, value in data.items() if value not in skip_values
+            }
+
+        return remove_skipped_values
+
+    return None
+
+
+def _get_value(obj, attr: str):
+    """Fetch an attribute to serialize, as marshmallow's default accessor does."""
+    if hasattr(obj, "__getitem__"):
+        try:
+            return obj[attr]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            pass
+    return getattr(obj, attr, missing)
+
+
+class SchemaCodec:
+    """Specialised load and dump functions compiled from one schema class."""
+
+    def __init__(self, schema_cls: Type[Schema], codec_for: Callable = None):
+        """
+        Compile the codec for a schema class.
+
+        Args:
+            schema_cls: The marshmallow schema class to compile
+            codec_for: Callable returning a deferred codec for nested schemas
+
+        Raises:
+            CodecError: If the schema uses features the codec does not support
+
+        """
+        self.schema_cls = schema_cls
+        codec_for = codec_for or _deferred_codec
+        try:
+            schema = schema_cls()
+        except TypeError as err:
+            raise CodecError(
+                f"Cannot instantiate schema {schema_cls.__name__}"
+            ) from err
+
+        hooks = schema_cls._hooks
+        for tag in (PRE_LOAD, POST_LOAD, VALIDATES_SCHEMA, PRE_DUMP, POST_DUMP):
+            if hooks[(tag, True)]:
+                raise CodecError(
+                    f"Schema {schema_cls.__name__} uses a pass_many {tag} hook"
+                )
+        if schema.many:
+            raise CodecError(f"Schema {schema_cls.__name__} loads collections")
+
+        self.unknown = schema.unknown
+        self.pre_load = self._hooks(schema, PRE_LOAD)
+        self.post_load = self._hooks(schema, POST_LOAD)
+        self.validators = self._hooks(schema, VALIDATES_SCHEMA)
+        self.pre_dump = self._hooks(schema, PRE_DUMP)
+        self.post_dump = self._hooks(schema, POST_DUMP)
+        self.field_validators = []
+        for name in hooks[VALIDATES]:
+            field_name = getattr(schema, name).__marshmallow_hook__[VALIDATES][
+                "field_name"
+            ]
+            if field_name in schema.fields:
+                field = schema.fields[field_name]
+                self.field_validators.append(
+                    (name, field.attribute or field_name, field_name)
+                )
+        # a pooled schema instance is only needed to run custom hooks
+        self.needs_schema = bool(self.field_validators) or any(
+            not native
+            for hooks in (
+                self.pre_load,
+                self.post_load,
+                self.validators,
+                self.pre_dump,
+                self.post_dump,
+            )
+            for _name, _pass_original, native in hooks
+        )
+
+        self.loaders = []
+        self.load_keys = set()
+        for name, field in schema.load_fields.items():
+            if field.attribute and "." in field.attribute:
+                raise CodecError(f"Field {name} uses a nested attribute path")
+            data_key = field.data_key if field.data_key is not None else name
+            self.loaders.append(
+                (
+                    data_key,
+                    field.attribute or name,
+                    field.required,
+                    field.missing,
+                    _value_loader(field, data_key, codec_for),
+                )
+            )
+            self.load_keys.add(data_key)
+
+        self.dumpers = []
+        for name, field in schema.dump_fields.items():
+            attr = field.attribute or name
+            if "." in attr:
+                raise CodecError(f"Field {name} uses a nested attribute path")
+            if not field._CHECK_ATTRIBUTE:
+                raise CodecError(f"Field {name} does not serialize an attribute")
+            self.dumpers.append(
+                (
+                    field.data_key if field.data_key is not None else name,
+                    attr,
+                    field.default,
+                    _field_dumper(field, attr, codec_for),
+                )
+            )
+
+    @staticmethod
+    def _hooks(schema: Schema, tag: str) -> Tuple[Tuple[str, bool, Callable], ...]:
+        """
+        List the hooks of a schema for a tag, in the order marshmallow runs them.
+
+        Each hook is given with its pass_original flag and, for the standard
+        `BaseModelSchema` hooks, an inline implementation.
+        """
+        hooks = []
+        for name in schema._hooks[(tag, False)]:
+            options = getattr(schema, name).__marshmallow_hook__[(tag, False)]
+            native = None
+            if getattr(type(schema), name) is getattr(BaseModelSchema, name, None):
+                native = _native_hook(schema, name)
+            hooks.append((name, bool(options.get("pass_original")), native))
+        return tuple(hooks)
+
+    @staticmethod
+    def _run(schema: Schema, hooks: Sequence, data, original, **kwargs):
+        """Run a sequence of schema hooks as marshmallow does."""
+        for name, pass_original, native in hooks:
+            if native:
+                data = native(data)
+                continue
+            hook = getattr(schema, name)
+            if pass_original:
+                data = hook(data, original, many=False, **kwargs)
+            else:
+                data = hook(data, many=False, **kwargs)
+        return data
+
+    def load_value(self, value: Mapping, unknown: str = None):
+        """Load a single object, raising `_Decline` when marshmallow must decide."""
+        if not isinstance(value, Mapping):
+            raise _Decline()
+        if not self.needs_schema:
+            return self._load(None, value, unknown)
+        schema = acquire_schema(self.schema_cls)
+        try:
+            return self._load(schema, value, unknown)
+        finally:
+            release_schema(schema, self.schema_cls)
+
+    def _load(self, schema: Schema, original: Mapping, unknown: str = None):
+        # hooks may alter the input, which must remain intact for the fallback
+        data = dict(original)
+        if self.pre_load:
+            data = self._run(schema, self.pre_load, data, original, partial=None)
+            if not isinstance(data, Mapping):
+                raise _Decline()
+
+        result = {}
+        for data_key, attr, required, default, load in self.loaders:
+            value = data.get(data_key, missing)
+            if value is missing:
+                if required:
+                    raise _Decline()
+                if default is missing:
+                    continue
+                value = default() if callable(default) else default
+            else:
+                value = load(value, data)
+            if value is not missing:
+                result[attr] = value
+
+        unknown = unknown or self.unknown
+        if unknown != EXCLUDE:
+            for key, value in data.items():
+                if key not in self.load_keys:
+                    if unknown == RAISE:
+                        raise _Decline()
+                    if unknown == INCLUDE:
+                        result[key] = value
+
+        for name, attr, field_name in self.field_validators:
+            if attr in result and getattr(schema, name)(result[attr]) is missing:
+                result.pop(field_name, None)
+        if self.validators:
+            self._run(schema, self.validators, result, original, partial=None)
+        if self.post_load:
+            result = self._run(schema, self.post_load, result, original, partial=None)
+        return result
+
+    def dump_value(self, obj):
+        """Dump a single object, raising `_Decline` when marshmallow must decide."""
+        if not self.needs_schema:
+            return self._dump(None, obj)
+        schema = acquire_schema(self.schema_cls)
+        try:
+            return self._dump(schema, obj)
+        finally:
+            release_schema(schema, self.schema_cls)
+
+    def _dump(self, schema: Schema, original):
+        obj = original
+        if self.pre_dump:
+            obj = self._run(schema, self.pre_dump, obj, original)
+
+        result = {}
+        for key, attr, default, dump in self.dumpers:
+            value = _get_value(obj, attr)
+            if value is missing:
+                if default is missing:
+                    continue
+                value = default() if callable(default) else default
+            result[key] = dump(value, obj)
+
+        if self.post_dump:
+            result = self._run(schema, self.post_dump, result, original)
+        return result
+
+
+class ModelCodec:
+    """Fast-path codec registered for a model class."""
+
+    def __init__(self, model_cls: Type[BaseModel]):
+        """Compile the codec for a model class and its nested schemas."""
+        self.model_cls = model_cls
+        self.schema = compile_schema(model_cls._get_schema_class())
+
+    def load(self, obj: Mapping) -> Union[BaseModel, None]:
+        """
+        Load a model instance from its serialized form.
+
+        Returns:
+            The model instance, or None if the validating path must be used
+
+        """
+        try:
+            return self.schema.load_value(obj)
+        except Exception as err:
+            LOGGER.debug("Fast-path load declined for %s: %r", self.model_cls, err)
+            return None
+
+    def dump(self, obj: BaseModel) -> Union[dict, None]:
+        """
+        Dump a model instance to its serialized form.
+
+        Returns:
+            The serialized dict, or None if the validating path must be used
+
+        """
+        try:
+            return self.schema.dump_value(obj)
+        except Exception as err:
+            LOGGER.debug("Fast-path dump declined for %s: %r", self.model_cls, err)
+            return None
+
+
+_SCHEMA_CODECS: Dict[type, SchemaCodec] = {}
+
+
+def compile_schema(schema_cls: Type[Schema]) -> SchemaCodec:
+    """Fetch or compile the codec for a schema class."""
+    codec = _SCHEMA_CODECS.get(schema_cls)
+    if not codec:
+        codec = SchemaCodec(schema_cls, _deferred_codec)
+        _SCHEMA_CODECS[schema_cls] = codec
+    return codec
+
+
+def _deferred_codec(schema_cls: Type[Schema]) -> Callable[[], SchemaCodec]:
+    """Resolve nested codecs on first use, allowing self-referencing schemas."""
+    resolved = []
+
+    def get_codec() -> SchemaCodec:
+        if not resolved:
+            resolved.append(compile_schema(schema_cls))
+        return resolved[0]
+
+    return get_codec
+
+
+def enable_fast_codecs(
+    model_classes: Iterable[Union[str, Type[BaseModel]]] = None
+) -> Sequence[Type[BaseModel]]:
+    """
+    Compile and register fast-path codecs for a set of model classes.
+
+    Args:
+        model_classes: Model classes or their class paths, by default the
+            high-volume message types in `FAST_CODEC_MESSAGE_TYPES`
+
+    Returns:
+        The model classes with a registered codec
+
+    """
+    enabled = []
+    for model_cls in model_classes or FAST_CODEC_MESSAGE_TYPES:
+        if isinstance(model_cls, str):
+            model_cls = ClassLoader.load_class(model_cls)
+        try:
+            codec = ModelCodec(model_cls)
+            # compile nested schemas now rather than on the first message
+            _compile_nested(codec.schema)
+        except CodecError as err:
+            LOGGER.warning("No fast-path codec for %s: %s", model_cls.__name__, err)
+            continue
+        FAST_CODECS[model_cls] = codec
+        enabled.append(model_cls)
+    return enabled
+
+
+def _compile_nested(codec: SchemaCodec, seen: set = None):
+    """Compile the codecs of all schemas nested in a codec."""
+    seen = seen if seen is not None else set()
+    if codec.schema_cls in seen:
+        return
+    seen.add(codec.schema_cls)
+    schema = codec.schema_cls()
+    for field in schema.fields.values():
+        for inner in (field, getattr(field, "inner", None)):
+            if isinstance(inner, fields.Nested):
+                _compile_nested(compile_schema(type(inner.schema)), seen)
+
+
+def disable_fast_codecs(model_classes: Iterable[Type[BaseModel]] = None):
+    """Remove the fast-path codecs of some or all model classes."""
+    for model_cls in list(model_classes or FAST_CODECS):
+        FAST_CODECS.pop(model_cls, None)
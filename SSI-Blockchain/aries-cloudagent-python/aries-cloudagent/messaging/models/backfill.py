@@ -0,0 +1,221 @@
+"""Backfill of record tags introduced since records were stored."""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+from typing import Dict, Sequence
+
+from ...core.profile import Profile, ProfileSession
+from ...storage.base import BaseStorage
+from ...storage.error import StorageDuplicateError, StorageNotFoundError
+from ...storage.record import StorageRecord
+from ...utils.classloader import ClassLoader, ClassNotFoundError
+
+from .base import BaseModelError
+
+LOGGER = logging.getLogger(__name__)
+
+# Record types whose value fields are now mirrored as tags for query push-down
+TAG_BACKFILL_RECORD_PATHS = (
+    "aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange."
+    "V10CredentialExchange",
+    "aries_cloudagent.protocols.issue_credential.v2_0.models.cred_ex_record."
+    "V20CredExRecord",
+    "aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange."
+    "V10PresentationExchange",
+    "aries_cloudagent.protocols.present_proof.v2_0.models.pres_exchange."
+    "V20PresExRecord",
+)
+TAG_BACKFILL_PAGE_SIZE = 100
+TAG_BACKFILL_LEASE = 3600.0
+RECORD_TYPE_TAG_BACKFILL_LEASE = "acapy_tag_backfill_lease"
+
+
+async def backfill_record_tags(profile: Profile, record_type: type) -> int:
+    """
+    Rewrite the tags of all stored records of a type from their values.
+
+    The record values and timestamps are left untouched and no events are
+    emitted.
+
+    Args:
+        profile: Root profile
+        record_type: The `BaseRecord` subclass to update
+
+    Returns:
+        The number of records updated
+
+    """
+    return await record_type.backfill_tags(profile, TAG_BACKFILL_PAGE_SIZE)
+
+
+def load_tag_backfill_record_types() -> Sequence[type]:
+    """Load the record types whose tags may need to be backfilled."""
+    record_types = []
+    for record_path in TAG_BACKFILL_RECORD_PATHS:
+        try:
+            record_types.append(ClassLoader.load_class(record_path))
+        except ClassNotFoundError as err:
+            raise BaseModelError(f"Unknown Record type {record_path}") from err
+    return record_types
+
+
+async def mark_record_tags_backfilled(session: ProfileSession):
+    """
+    Record that no tags need to be backfilled in a newly provisioned wallet.
+
+    Args:
+        session: Session on the new wallet, before any records are stored
+
+    """
+    for record_type in load_tag_backfill_record_types():
+        await record_type.mark_tags_backfilled(session)
+
+
+async def claim_tag_backfill(
+    profile: Profile, record_type: type, owner: str, lease: float = None
+) -> bool:
+    """
+    Claim the lease on backfilling the tags of a record type.
+
+    The lease is stored in the wallet, so that agents sharing it do not run
+    the same backfill at the same time. A lease which has not been released
+    expires, in case its owner stopped before completing the backfill.
+
+    Args:
+        profile: Root profile
+        record_type: The `BaseRecord` subclass to update
+        owner: Identifier of the claiming agent
+        lease: Number of seconds after which the lease expires
+
+    Returns:
+        `True` if the lease was claimed
+
+    """
+    lease_id = f"lease::{record_type.RECORD_TYPE}"
+    now = time.time()
+    value = json.dumps({"owner": owner, "expires": now + (lease or TAG_BACKFILL_LEASE)})
+    try:
+        async with profile.transaction() as txn:
+            storage = txn.inject(BaseStorage)
+            try:
+                record = await storage.get_record(
+                    RECORD_TYPE_TAG_BACKFILL_LEASE, lease_id, {"forUpdate": True}
+                )
+            except StorageNotFoundError:
+                await storage.add_record(
+                    StorageRecord(RECORD_TYPE_TAG_BACKFILL_LEASE, value, None, lease_id)
+                )
+            else:
+                if json.loads(record.value)["expires"] > now:
+                    return False
+                await storage.update_record(record, value, {})
+            await txn.commit()
+    except StorageDuplicateError:
+        return False
+    return True
+
+
+async def release_tag_backfill(profile: Profile, record_type: type, owner: str):
+    """Release the lease on backfilling the tags of a record type, if held."""
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        try:
+            record = await storage.get_record(
+                RECORD_TYPE_TAG_BACKFILL_LEASE, f"lease::{record_type.RECORD_TYPE}"
+            )
+        except StorageNotFoundError:
+            return
+        if json.loads(record.value)["owner"] == owner:
+            await storage.delete_record(record)
+
+
+async def backfill_pending_record_tags(profile: Profile) -> int:
+    """
+    Backfill record tags which have not been backfilled yet.
+
+    Each record type is skipped once its backfill marker is stored, or while
+    another agent sharing the wallet holds the lease on its backfill.
+
+    Args:
+        profile: Root profile
+
+    Returns:
+        The number of records updated
+
+    """
+    owner = uuid.uuid4().hex
+    total = 0
+    for record_type in load_tag_backfill_record_types():
+        async with profile.session() as session:
+            if await record_type.tags_backfilled(session):
+                continue
+        if not await claim_tag_backfill(profile, record_type, owner):
+            LOGGER.info(
+                "Tags on records of %s are being backfilled elsewhere",
+                record_type.__name__,
+            )
+            continue
+        try:
+            LOGGER.info("Backfilling tags on records of %s", record_type.__name__)
+            count = await backfill_record_tags(profile, record_type)
+            LOGGER.info(
+                "Backfilled tags on %d records of %s", count, record_type.__name__
+            )
+            total += count
+        finally:
+            await release_tag_backfill(profile, record_type, owner)
+    return total
+
+
+class TagBackfillService:
+    """Backfill record tags in the background while the agent is running."""
+
+    def __init__(self):
+        """Initialize the service."""
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._completed = set()
+
+    @staticmethod
+    def _profile_key(profile: Profile) -> str:
+        """Identify the wallet of a profile; sub-wallets carry a wallet id."""
+        return profile.settings.get_str("wallet.id") or profile.name
+
+    async def _run(self, profile: Profile, key: str):
+        """Backfill any pending record tags."""
+        try:
+            await backfill_pending_record_tags(profile)
+            self._completed.add(key)
+        except Exception:
+            LOGGER.exception("Error backfilling record tags")
+
+    def start(self, profile: Profile):
+        """
+        Start backfilling the profile in the background.
+
+        This is called for the root profile on startup, and for each
+        sub-wallet profile when it is opened. Profiles whose backfill has
+        completed or is still running are skipped.
+        """
+        key = self._profile_key(profile)
+        if key in self._completed:
+            return
+        task = self._tasks.get(key)
+        if not task or task.done():
+            self._tasks[key] = asyncio.get_event_loop().create_task(
+                self._run(profile, key)
+            )
+
+    async def stop(self):
+        """Stop the background backfills."""
+        tasks, self._tasks = self._tasks, {}
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
@@ -5,7 +5,19 @@ import json
 
 from abc import ABC
 from collections import namedtuple
-from typing import Mapping, Optional, Type, TypeVar, Union, cast, overload
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from typing_extensions import Literal
 
 from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
@@ -17,6 +29,15 @@ LOGGER = logging.getLogger(__name__)
 
 SerDe = namedtuple("SerDe", "ser de")
 
+# idle schema instances kept for reuse, per schema class and unknown policy
+SCHEMA_POOL_SIZE = 8
+_SCHEMA_POOL: Dict[Tuple[type, Optional[str]], List["BaseModelSchema"]] = {}
+_SCHEMA_CLASSES: Dict[type, Type["BaseModelSchema"]] = {}
+_MODEL_CLASSES: Dict[type, type] = {}
+
+# compiled fast-path codecs by model class, see messaging.fast_codec
+FAST_CODECS: Dict[type, Any] = {}
+
 
 def resolve_class(the_cls, relative_cls: Optional[type] = None) -> type:
     """
@@ -74,6 +95,40 @@ def resolve_meta_property(obj, prop_name: str, defval=None):
     return found
 
 
+def acquire_schema(schema_cls: type, unknown: Optional[str] = None) -> "Schema":
+    """
+    Take an idle schema instance from the pool, or create a new one.
+
+    Constructing a marshmallow schema copies all of its declared fields, so
+    instances are reused between calls. An instance is only handed out to one
+    caller at a time; release it with `release_schema` when done.
+
+    Args:
+        schema_cls: The schema class to instantiate
+        unknown: Behaviour for unknown attributes, or None for the schema default
+
+    Returns:
+        A schema instance
+
+    """
+    idle = _SCHEMA_POOL.get((schema_cls, unknown))
+    if idle:
+        try:
+            return idle.pop()
+        except IndexError:
+            pass
+    return schema_cls(
+        unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
+    )
+
+
+def release_schema(schema: "Schema", schema_cls: type, unknown: Optional[str] = None):
+    """Return a schema instance obtained from `acquire_schema` to the pool."""
+    idle = _SCHEMA_POOL.setdefault((schema_cls, unknown), [])
+    if len(idle) < SCHEMA_POOL_SIZE:
+        idle.append(schema)
+
+
 class BaseModelError(BaseError):
     """Base exception class for base model errors."""
 
@@ -113,8 +168,13 @@ class BaseModel(ABC):
             The resolved schema class
 
         """
+        resolved = _SCHEMA_CLASSES.get(cls)
+        if resolved:
+            return resolved
+
         resolved = resolve_class(cls.Meta.schema_class, cls)
         if issubclass(resolved, BaseModelSchema):
+            _SCHEMA_CLASSES[cls] = resolved
             return resolved
 
         raise TypeError(
@@ -190,10 +250,14 @@ class BaseModel(ABC):
         if obj is None and none2none:
             return None
 
+        codec = FAST_CODECS.get(cls)
+        if codec and not unknown and isinstance(obj, dict):
+            loaded = codec.load(obj)
+            if loaded is not None:
+                return loaded
+
         schema_cls = cls._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
+        schema = acquire_schema(schema_cls, unknown)
 
         try:
             return cast(
@@ -203,6 +267,8 @@ class BaseModel(ABC):
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from err
+        finally:
+            release_schema(schema, schema_cls, unknown)
 
     @overload
     def serialize(
@@ -239,10 +305,16 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
+        codec = FAST_CODECS.get(self.__class__)
+        if codec and not unknown:
+            dumped = codec.dump(self)
+            if dumped is not None:
+                return (
+                    json.dumps(dumped, separators=(",", ":")) if as_string else dumped
+                )
+
         schema_cls = self._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
+        schema = acquire_schema(schema_cls, unknown)
         try:
             return (
                 schema.dumps(self, separators=(",", ":"))
@@ -254,6 +326,8 @@ class BaseModel(ABC):
             raise BaseModelError(
                 f"{self.__class__.__name__} schema validation failed"
             ) from err
+        finally:
+            release_schema(schema, schema_cls, unknown)
 
     @classmethod
     def serde(cls, obj: Union["BaseModel", Mapping]) -> Optional[SerDe]:
@@ -359,7 +433,11 @@ class BaseModelSchema(Schema):
             The model class
 
         """
-        return resolve_class(cls.Meta.model_class, cls)
+        resolved = _MODEL_CLASSES.get(cls)
+        if not resolved:
+            resolved = resolve_class(cls.Meta.model_class, cls)
+            _MODEL_CLASSES[cls] = resolved
+        return resolved
 
     @property
     def Model(self) -> type:
@@ -3,18 +3,38 @@
 import json
 import logging
 import sys
+import time
 import uuid
+import weakref
 
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
-from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...core.profile import Profile, ProfileSession
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
+from ...utils import json_codec
+from ...wallet.util import b64_to_str, str_to_b64
 
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME
@@ -26,6 +46,21 @@ LOGGER = logging.getLogger(__name__)
 
 RecordType = TypeVar("RecordType", bound="BaseRecord")
 
+RECORD_TYPE_TAG_BACKFILL = "acapy_tag_backfill"
+
+# seconds before a missing backfill marker is looked up again, in case the
+# backfill was completed by another agent sharing the wallet
+TAG_BACKFILL_RECHECK_INTERVAL = 60.0
+
+# backfill markers found for each record type, by profile
+_TAGS_BACKFILLED: "weakref.WeakKeyDictionary[Profile, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+# times at which backfill markers were found missing, by profile
+_TAGS_NOT_BACKFILLED: "weakref.WeakKeyDictionary[Profile, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def match_post_filter(
     record: dict,
@@ -68,6 +103,50 @@ def match_post_filter(
     return positive
 
 
+# number of preceding stored records searched for the last record of a page
+QUERY_CURSOR_LOOKBACK = DEFAULT_PAGE_SIZE
+
+
+def encode_query_cursor(record_type: str, offset: int, last_id: str = None) -> str:
+    """Encode the position of a paginated record query as an opaque cursor."""
+    position = {"type": record_type, "offset": offset}
+    if last_id:
+        position["last"] = last_id
+    return str_to_b64(json.dumps(position), urlsafe=True, pad=False)
+
+
+def decode_query_cursor(record_type: str, cursor: str) -> Tuple[int, Optional[str]]:
+    """
+    Decode the position of a paginated record query from an opaque cursor.
+
+    Args:
+        record_type: the record type being queried
+        cursor: the cursor returned with the previous page
+
+    Returns:
+        A tuple of the number of stored records preceding the next page and
+        the id of the last record returned, if known
+
+    Raises:
+        BaseModelError: if the cursor is malformed or issued for another type
+
+    """
+    try:
+        position = json.loads(b64_to_str(cursor, urlsafe=True))
+        offset = position["offset"]
+        last_id = position.get("last")
+        valid = (
+            position["type"] == record_type
+            and isinstance(offset, int)
+            and (last_id is None or isinstance(last_id, str))
+        )
+    except (ValueError, TypeError, KeyError, AttributeError):
+        valid = False
+    if not valid or offset < 0:
+        raise BaseModelError(f"Invalid query cursor for {record_type}: {cursor}")
+    return offset, last_id
+
+
 class BaseRecord(BaseModel):
     """Represents a single storage record."""
 
@@ -81,6 +160,8 @@ class BaseRecord(BaseModel):
     EVENT_NAMESPACE: str = "acapy::record"
     LOG_STATE_FLAG = None
     TAG_NAMES = {"state"}
+    # tags added after records of this type may already have been stored
+    BACKFILL_TAG_NAMES = set()
 
     def __init__(
         self,
@@ -127,12 +208,103 @@ class BaseRecord(BaseModel):
 
         return {tag.lstrip("~"): tag for tag in cls.TAG_NAMES or ()}
 
+    @classmethod
+    def _backfill_marker_value(cls) -> str:
+        """Value of the marker recording that tags have been backfilled."""
+        return ",".join(sorted(cls.BACKFILL_TAG_NAMES))
+
+    @classmethod
+    async def tags_backfilled(cls, session: ProfileSession) -> bool:
+        """
+        Check whether every stored record of this type carries all its tags.
+
+        Args:
+            session: The profile session to use
+
+        Returns:
+            `True` unless some of `BACKFILL_TAG_NAMES` may be missing from
+            records stored before the tags were introduced
+
+        """
+        if not cls.BACKFILL_TAG_NAMES:
+            return True
+        profile = session.profile
+        expected = cls._backfill_marker_value()
+        if _TAGS_BACKFILLED.get(profile, {}).get(cls.RECORD_TYPE) == expected:
+            return True
+        checked = _TAGS_NOT_BACKFILLED.get(profile, {}).get(cls.RECORD_TYPE)
+        if checked and time.monotonic() - checked < TAG_BACKFILL_RECHECK_INTERVAL:
+            return False
+        storage = session.inject(BaseStorage)
+        try:
+            marker = await storage.get_record(
+                RECORD_TYPE_TAG_BACKFILL, cls.RECORD_TYPE, {"retrieveTags": False}
+            )
+        except StorageNotFoundError:
+            marker = None
+        if not marker or marker.value != expected:
+            _TAGS_NOT_BACKFILLED.setdefault(profile, {})[
+                cls.RECORD_TYPE
+            ] = time.monotonic()
+            return False
+        _TAGS_BACKFILLED.setdefault(profile, {})[cls.RECORD_TYPE] = expected
+        _TAGS_NOT_BACKFILLED.get(profile, {}).pop(cls.RECORD_TYPE, None)
+        return True
+
+    @classmethod
+    async def mark_tags_backfilled(cls, session: ProfileSession):
+        """
+        Store the marker recording that every record of this type has its tags.
+
+        This is done once the tags have been backfilled, or when a wallet is
+        provisioned without any records.
+
+        Args:
+            session: The profile session to use
+
+        """
+        if not cls.BACKFILL_TAG_NAMES:
+            return
+        storage = session.inject(BaseStorage)
+        value = cls._backfill_marker_value()
+        try:
+            marker = await storage.get_record(RECORD_TYPE_TAG_BACKFILL, cls.RECORD_TYPE)
+            await storage.update_record(marker, value, {})
+        except StorageNotFoundError:
+            await storage.add_record(
+                StorageRecord(RECORD_TYPE_TAG_BACKFILL, value, None, cls.RECORD_TYPE)
+            )
+        profile = session.profile
+        _TAGS_BACKFILLED.setdefault(profile, {})[cls.RECORD_TYPE] = value
+        _TAGS_NOT_BACKFILLED.get(profile, {}).pop(cls.RECORD_TYPE, None)
+
+    @classmethod
+    async def get_query_tag_map(cls, session: ProfileSession) -> Mapping[str, str]:
+        """
+        Accessor for the tags which may be used to query stored records.
+
+        Tags in `BACKFILL_TAG_NAMES` are left out until they have been
+        backfilled on existing records.
+
+        Args:
+            session: The profile session to use
+
+        """
+        tag_map = cls.get_tag_map()
+        if not await cls.tags_backfilled(session):
+            tag_map = {
+                name: tag
+                for name, tag in tag_map.items()
+                if name not in cls.BACKFILL_TAG_NAMES
+            }
+        return tag_map
+
     @property
     def storage_record(self) -> StorageRecord:
         """Accessor for a `StorageRecord` representing this record."""
 
         return StorageRecord(
-            self.RECORD_TYPE, json.dumps(self.value), self.tags, self._id
+            self.RECORD_TYPE, json_codec.dumps(self.value), self.tags, self._id
         )
 
     @property
@@ -180,6 +352,9 @@ class BaseRecord(BaseModel):
             return
         cache = session.inject_or(BaseCache)
         if cache:
+            cache_key = await cache.scoped_key(
+                cache_key, session.settings.get("wallet.id")
+            )
             return await cache.get(cache_key)
 
     @classmethod
@@ -200,6 +375,9 @@ class BaseRecord(BaseModel):
             return
         cache = session.inject_or(BaseCache)
         if cache:
+            cache_key = await cache.scoped_key(
+                cache_key, session.settings.get("wallet.id")
+            )
             await cache.set(cache_key, value, ttl or cls.DEFAULT_CACHE_TTL)
 
     @classmethod
@@ -216,6 +394,9 @@ class BaseRecord(BaseModel):
             return
         cache = session.inject_or(BaseCache)
         if cache:
+            cache_key = await cache.scoped_key(
+                cache_key, session.settings.get("wallet.id")
+            )
             await cache.clear(cache_key)
 
     @classmethod
@@ -238,7 +419,7 @@ class BaseRecord(BaseModel):
         result = await storage.get_record(
             cls.RECORD_TYPE, record_id, {"forUpdate": for_update, "retrieveTags": False}
         )
-        vals = json.loads(result.value)
+        vals = json_codec.loads(result.value)
         return cls.from_storage(record_id, vals)
 
     @classmethod
@@ -261,15 +442,18 @@ class BaseRecord(BaseModel):
         """
 
         storage = session.inject(BaseStorage)
+        query_filter, value_filter = cls.push_down_post_filter(
+            tag_filter, post_filter, tag_map=await cls.get_query_tag_map(session)
+        )
         rows = await storage.find_all_records(
             cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
+            cls.prefix_tag_filter(query_filter),
             options={"forUpdate": for_update, "retrieveTags": False},
         )
         found = None
         for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(vals, post_filter, alt=False):
+            vals = json_codec.loads(record.value)
+            if match_post_filter(vals, value_filter, alt=False):
                 if found:
                     raise StorageDuplicateError(
                         "Multiple {} records located for {}{}".format(
@@ -296,10 +480,18 @@ class BaseRecord(BaseModel):
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
-    ) -> Sequence[RecordType]:
+        for_update: bool = False,
+        projection: Sequence[str] = None,
+    ) -> Sequence[Union[RecordType, dict]]:
         """
         Query stored records.
 
+        When a projection is given, each match is returned as a dict view
+        holding the record id and the projected fields instead of a record
+        instance. Fields which are record tags are read from the storage tags,
+        and the stored value is only decoded when another field or a
+        remaining post-filter requires it.
+
         Args:
             session: The profile session to use
             tag_filter: An optional dictionary of tag filter clauses
@@ -307,34 +499,380 @@ class BaseRecord(BaseModel):
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
                 values in post_filter
+            for_update: lock the matching records for update within a transaction
+            projection: the fields to return for each matching record
         """
 
         storage = session.inject(BaseStorage)
+        tag_map = await cls.get_query_tag_map(session)
+        tag_filter, post_filter_positive = cls.push_down_post_filter(
+            tag_filter, post_filter_positive, alt, tag_map=tag_map
+        )
+        decode = (
+            projection is None
+            or bool(post_filter_positive or post_filter_negative)
+            or any(
+                field not in tag_map and field != cls.RECORD_ID_NAME
+                for field in projection
+            )
+        )
+        options = {"retrieveTags": projection is not None}
+        if not decode:
+            options["retrieveValue"] = False
+        if for_update:
+            options["forUpdate"] = True
         rows = await storage.find_all_records(
             cls.RECORD_TYPE,
             cls.prefix_tag_filter(tag_filter),
-            options={"retrieveTags": False},
+            options=options,
         )
         result = []
         for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(
-                vals,
-                post_filter_positive,
-                positive=True,
-                alt=alt,
-            ) and match_post_filter(
-                vals,
-                post_filter_negative,
-                positive=False,
-                alt=alt,
+            vals = json_codec.loads(record.value) if decode else None
+            if decode and not (
+                match_post_filter(
+                    vals,
+                    post_filter_positive,
+                    positive=True,
+                    alt=alt,
+                )
+                and match_post_filter(
+                    vals,
+                    post_filter_negative,
+                    positive=False,
+                    alt=alt,
+                )
             ):
-                try:
-                    result.append(cls.from_storage(record.id, vals))
-                except BaseModelError as err:
-                    raise BaseModelError(f"{err}, for record id {record.id}")
+                continue
+            if projection is not None:
+                result.append(cls.project_storage_record(record, projection, vals))
+                continue
+            try:
+                result.append(cls.from_storage(record.id, vals))
+            except BaseModelError as err:
+                raise BaseModelError(f"{err}, for record id {record.id}")
         return result
 
+    @classmethod
+    def project_storage_record(
+        cls, record: StorageRecord, projection: Sequence[str], value: dict = None
+    ) -> dict:
+        """
+        Build a dict view of selected fields of a stored record.
+
+        Args:
+            record: The stored record
+            projection: The fields to include alongside the record id
+            value: The decoded record value, if available. Otherwise the
+                fields are read from the record tags
+
+        """
+        tag_map = cls.get_tag_map()
+        view = {cls.RECORD_ID_NAME: record.id}
+        for field in projection:
+            if field == cls.RECORD_ID_NAME:
+                continue
+            if value is not None:
+                view[field] = value.get(field)
+            else:
+                view[field] = (record.tags or {}).get(tag_map[field])
+        return view
+
+    @classmethod
+    async def count(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> int:
+        """
+        Count stored records.
+
+        Without a remaining post-filter the count is made by the storage
+        backend, without retrieving any record values.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+        """
+
+        tag_filter, post_filter_positive = cls.push_down_post_filter(
+            tag_filter,
+            post_filter_positive,
+            alt,
+            tag_map=await cls.get_query_tag_map(session),
+        )
+        if post_filter_positive or post_filter_negative:
+            views = await cls.query(
+                session,
+                tag_filter,
+                post_filter_positive=post_filter_positive,
+                post_filter_negative=post_filter_negative,
+                alt=alt,
+                projection=(),
+            )
+            return len(views)
+        storage = session.inject(BaseStorage)
+        return await storage.count_records(
+            cls.RECORD_TYPE, cls.prefix_tag_filter(tag_filter)
+        )
+
+    @classmethod
+    async def _scan(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        page_size: int = None,
+        offset: int = 0,
+        projection: Sequence[str] = None,
+    ) -> AsyncIterator[Tuple[Union[RecordType, dict], int]]:
+        """
+        Stream matching records along with their position in the storage search.
+
+        The position yielded with each record is the number of stored records
+        read so far, and may be used as the offset to resume the search. When
+        a projection is given, dict views are yielded instead of records.
+        """
+
+        tag_filter, post_filter_positive = cls.push_down_post_filter(
+            tag_filter,
+            post_filter_positive,
+            alt,
+            tag_map=await cls.get_query_tag_map(session),
+        )
+        search = session.inject(BaseStorageSearch).search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            page_size,
+            options={"retrieveTags": False, "offset": offset},
+        )
+        position = offset
+        try:
+            while True:
+                rows = await search.fetch()
+                if not rows:
+                    break
+                for record in rows:
+                    position += 1
+                    vals = json_codec.loads(record.value)
+                    if match_post_filter(
+                        vals,
+                        post_filter_positive,
+                        positive=True,
+                        alt=alt,
+                    ) and match_post_filter(
+                        vals,
+                        post_filter_negative,
+                        positive=False,
+                        alt=alt,
+                    ):
+                        if projection is not None:
+                            view = cls.project_storage_record(record, projection, vals)
+                            yield view, position
+                            continue
+                        try:
+                            found = cls.from_storage(record.id, vals)
+                        except BaseModelError as err:
+                            raise BaseModelError(f"{err}, for record id {record.id}")
+                        yield found, position
+        finally:
+            await search.close()
+
+    @classmethod
+    async def iter_query(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        page_size: int = None,
+        projection: Sequence[str] = None,
+    ) -> AsyncIterator[Union[RecordType, dict]]:
+        """
+        Query stored records, streaming the results one storage page at a time.
+
+        Post-filters are applied as each page is fetched, so only a single
+        page of records is held in memory at once.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            page_size: The number of stored records to fetch per page
+            projection: the fields to return for each matching record, as a dict
+                view holding the record id, instead of a record instance
+        """
+
+        scan = cls._scan(
+            session,
+            tag_filter,
+            post_filter_positive=post_filter_positive,
+            post_filter_negative=post_filter_negative,
+            alt=alt,
+            page_size=page_size,
+            projection=projection,
+        )
+        try:
+            async for record, _ in scan:
+                yield record
+        finally:
+            await scan.aclose()
+
+    @classmethod
+    async def query_page(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        limit: int = None,
+        cursor: str = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> Tuple[Sequence[RecordType], Optional[str]]:
+        """
+        Query stored records one page at a time.
+
+        Stored records are returned in storage order, which is kept as records
+        are added or updated. The cursor holds the number of stored records
+        read so far along with the id of the last record returned. The next
+        page resumes after that record if it is found among the preceding
+        `QUERY_CURSOR_LOOKBACK` records, so deleting records between pages
+        does not skip any others. Otherwise, as when the last record itself
+        was deleted or no longer matches, the page resumes at the stored
+        offset and records may be skipped.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return
+            cursor: The cursor returned with the previous page, if any
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+
+        Returns:
+            A tuple of the matching records and the cursor for the next page,
+            which is `None` once there are no more matching records
+
+        """
+
+        if limit is not None and limit < 1:
+            raise BaseModelError(f"Invalid query limit: {limit}")
+        offset, last_id = (
+            decode_query_cursor(cls.RECORD_TYPE, cursor) if cursor else (0, None)
+        )
+        start = max(offset - QUERY_CURSOR_LOOKBACK, 0) if last_id else offset
+        if limit and not (post_filter_positive or post_filter_negative):
+            # fetch one more than requested to detect the final page
+            page_size = min(limit + 1 + offset - start, DEFAULT_PAGE_SIZE)
+        else:
+            page_size = None
+
+        result = []
+        next_cursor = None
+        seeking = bool(last_id)
+        scan = cls._scan(
+            session,
+            tag_filter,
+            post_filter_positive=post_filter_positive,
+            post_filter_negative=post_filter_negative,
+            alt=alt,
+            page_size=page_size,
+            offset=start,
+        )
+        try:
+            async for record, position in scan:
+                if seeking:
+                    if record._id == last_id:
+                        seeking = False
+                        offset = position
+                        continue
+                    if position <= offset:
+                        continue
+                    seeking = False
+                if limit and len(result) == limit:
+                    next_cursor = encode_query_cursor(
+                        cls.RECORD_TYPE, offset, result[-1]._id
+                    )
+                    break
+                result.append(record)
+                offset = position
+        finally:
+            await scan.aclose()
+        return result, next_cursor
+
+    @classmethod
+    async def backfill_tags(cls, profile: Profile, page_size: int = None) -> int:
+        """
+        Rewrite the tags of all stored records of this type from their values.
+
+        The records are read in a single scan and written back a page at a
+        time. The record values and timestamps are left untouched and no
+        events are emitted. Once every record is updated, a marker is stored
+        so that queries may use the tags in `BACKFILL_TAG_NAMES`.
+
+        Args:
+            profile: The profile holding the records
+            page_size: The number of records to update in each transaction
+
+        Returns:
+            The number of records updated
+
+        """
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        count = 0
+        async with profile.session() as session:
+            page = []
+            scan = cls.iter_query(session, page_size=page_size)
+            try:
+                async for record in scan:
+                    page.append(record._id)
+                    if len(page) == page_size:
+                        count += await cls._backfill_page(profile, page)
+                        page = []
+            finally:
+                await scan.aclose()
+            if page:
+                count += await cls._backfill_page(profile, page)
+
+        async with profile.session() as session:
+            await cls.mark_tags_backfilled(session)
+        return count
+
+    @classmethod
+    async def _backfill_page(cls, profile: Profile, record_ids: Sequence[str]) -> int:
+        """Rewrite the tags of a page of records in a single transaction."""
+        async with profile.transaction() as txn:
+            stored = []
+            for record_id in record_ids:
+                # reload under lock, in case of concurrent updates
+                try:
+                    record = await cls.retrieve_by_id(txn, record_id, for_update=True)
+                except StorageNotFoundError:
+                    continue
+                stored.append(record.storage_record)
+            await txn.inject(BaseStorage).update_records(stored)
+            await txn.commit()
+        return len(stored)
+
     async def save(
         self,
         session: ProfileSession,
@@ -386,6 +924,133 @@ class BaseRecord(BaseModel):
 
         return self._id
 
+    @classmethod
+    async def save_all(
+        cls,
+        session: ProfileSession,
+        records: Sequence["BaseRecord"],
+        *,
+        reason: str = None,
+        log_params: Mapping[str, Any] = None,
+        log_override: bool = False,
+        event: bool = None,
+    ) -> Sequence[str]:
+        """
+        Persist several records to storage using batched writes.
+
+        New records are added in one batch and existing records are updated in
+        another, each in a single transaction where the backend supports it.
+
+        Batched writes bypass `save`, so records whose class overrides `save`
+        or `post_save` are instead saved one at a time.
+
+        Args:
+            session: The profile session to use
+            records: The records to persist
+            reason: A reason to add to the log
+            log_params: Additional parameters to log
+            override: Override configured logging regimen, print to stderr instead
+            event: Flag to override whether the events are sent
+
+        Returns:
+            The identifiers of the records, in order
+
+        """
+
+        if any(record._overrides("save", "post_save") for record in records):
+            return [
+                await record.save(
+                    session,
+                    reason=reason,
+                    log_params=log_params,
+                    log_override=log_override,
+                    event=event,
+                )
+                for record in records
+            ]
+
+        added = []
+        updated = []
+        timestamp = time_now()
+        for record in records:
+            record.updated_at = timestamp
+            if record._id and not record._new_with_id:
+                updated.append(record)
+            else:
+                if not record._id:
+                    record._id = str(uuid.uuid4())
+                record.created_at = timestamp
+                added.append(record)
+
+        new_ids = set(id(rec) for rec in added)
+        stored = set()
+        try:
+            storage = session.inject(BaseStorage)
+            if updated:
+                await storage.update_records([rec.storage_record for rec in updated])
+                stored.update(id(rec) for rec in updated)
+            if added:
+                await storage.add_records([rec.storage_record for rec in added])
+                stored.update(id(rec) for rec in added)
+                for record in added:
+                    record._new_with_id = False
+        finally:
+            for record in records:
+                log_reason = reason or (
+                    "Created record" if id(record) in new_ids else "Updated record"
+                )
+                if id(record) not in stored:
+                    log_reason = f"FAILED: {log_reason}"
+                params = {record.RECORD_TYPE: record.serialize()}
+                if log_params:
+                    params.update(log_params)
+                record.log_state(
+                    log_reason, params, override=log_override, settings=session.settings
+                )
+
+        for record in records:
+            await record.post_save(
+                session, id(record) in new_ids, record._last_state, event
+            )
+            record._last_state = record.state
+
+        return [record._id for record in records]
+
+    @classmethod
+    async def delete_all(cls, session: ProfileSession, records: Sequence["BaseRecord"]):
+        """
+        Remove several stored records using a batched delete.
+
+        Batched deletes bypass `delete_record`, so records whose class
+        overrides it are instead deleted one at a time.
+
+        Args:
+            session: The profile session to use
+            records: The records to remove
+        """
+
+        records = [record for record in records if record._id]
+        if not records:
+            return
+        if any(record._overrides("delete_record") for record in records):
+            for record in records:
+                await record.delete_record(session)
+            return
+        storage = session.inject(BaseStorage)
+        for record in records:
+            if record.state:
+                record._previous_state = record.state
+                record.state = "deleted"
+                await record.emit_event(session, record.serialize())
+        await storage.delete_records([record.storage_record for record in records])
+
+    @classmethod
+    def _overrides(cls, *names: str) -> bool:
+        """Check whether the class overrides any of the named `BaseRecord` methods."""
+        return any(
+            getattr(cls, name) is not getattr(BaseRecord, name) for name in names
+        )
+
     async def post_save(
         self,
         session: ProfileSession,
@@ -473,6 +1138,57 @@ class BaseRecord(BaseModel):
             {(k[1:] if "~" in k else k): v for (k, v) in tags.items()} if tags else {}
         )
 
+    @classmethod
+    def push_down_post_filter(
+        cls,
+        tag_filter: dict,
+        post_filter: dict,
+        alt: bool = False,
+        *,
+        tag_map: Mapping[str, str] = None,
+    ) -> Tuple[dict, dict]:
+        """
+        Move positive post-filter clauses on tagged fields into the tag filter.
+
+        Record values mirror every field named in `TAG_NAMES`, so a clause on
+        such a field can be evaluated by the storage backend instead of after
+        loading each record. Clauses which cannot be expressed as a tag query
+        are left in the post-filter.
+
+        Args:
+            tag_filter: The tag filter dictionary
+            post_filter: Value filters to apply matching positively
+            alt: set if post_filter values are sequences of alternatives to hit
+            tag_map: The tags which may be queried, as returned by
+                `get_query_tag_map`. Defaults to all tags
+
+        Returns:
+            A tuple of the resulting tag filter and remaining post-filter
+
+        """
+
+        if not post_filter:
+            return tag_filter, post_filter
+        if tag_map is None:
+            tag_map = cls.get_tag_map()
+        tag_filter = dict(tag_filter or {})
+        remaining = {}
+        for k, v in post_filter.items():
+            if k not in tag_map or k in tag_filter:
+                remaining[k] = v
+            elif not alt and isinstance(v, str):
+                tag_filter[k] = v
+            elif (
+                alt
+                and isinstance(v, (list, tuple))
+                and v
+                and all(isinstance(opt, str) and opt for opt in v)
+            ):
+                tag_filter[k] = {"$in": list(v)}
+            else:
+                remaining[k] = v
+        return tag_filter, remaining
+
     @classmethod
     def prefix_tag_filter(cls, tag_filter: dict):
         """Prefix unencrypted tags used in the tag filter."""
@@ -0,0 +1,104 @@
+"""Common parameters and helpers for paginated admin list queries."""
+
+from typing import Optional, Sequence, Tuple, Type
+
+from aiohttp import web
+from marshmallow import fields, validate
+
+from ...core.profile import ProfileSession
+
+from .base_record import BaseRecord
+from .openapi import OpenAPISchema
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated record list queries."""
+
+    limit = fields.Int(
+        description="Maximum number of records to return",
+        required=False,
+        validate=validate.Range(min=1),
+        example=100,
+    )
+    cursor = fields.Str(
+        description=(
+            "Cursor returned with the previous page of results. Pages are not a "
+            "snapshot: records added meanwhile may appear on later pages, and "
+            "records may be skipped if the last record of the previous page was "
+            "deleted or changed so that it no longer matches"
+        ),
+        required=False,
+    )
+
+
+class PaginatedResultSchema(OpenAPISchema):
+    """Result fields for paginated record list queries."""
+
+    next_cursor = fields.Str(
+        description="Cursor for the next page of results, absent on the last page",
+        required=False,
+    )
+
+
+def get_paginated_query_params(
+    request: web.BaseRequest,
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Read the pagination parameters from a request query string.
+
+    Returns:
+        A tuple of the page size limit and cursor, either of which may be `None`
+
+    """
+    limit = request.query.get("limit")
+    try:
+        limit = int(limit) if limit else None
+    except ValueError:
+        raise web.HTTPBadRequest(reason=f"Invalid limit: {limit}")
+    if limit is not None and limit < 1:
+        raise web.HTTPBadRequest(reason=f"Invalid limit: {limit}")
+    return limit, request.query.get("cursor") or None
+
+
+async def query_paginated(
+    record_cls: Type[BaseRecord],
+    session: ProfileSession,
+    tag_filter: dict = None,
+    *,
+    limit: int = None,
+    cursor: str = None,
+    **kwargs,
+) -> Tuple[Sequence[BaseRecord], Optional[str]]:
+    """
+    Query stored records, one page at a time if a limit or cursor is given.
+
+    Without either, all matching records are returned as by `BaseRecord.query`.
+
+    Args:
+        record_cls: The `BaseRecord` subclass to query
+        session: The profile session to use
+        tag_filter: An optional dictionary of tag filter clauses
+        limit: The maximum number of records to return
+        cursor: The cursor returned with the previous page, if any
+        kwargs: The post-filter arguments of the query
+
+    Returns:
+        A tuple of the matching records and the cursor for the next page,
+        which is `None` once there are no more matching records
+
+    """
+    if limit or cursor:
+        return await record_cls.query_page(
+            session, tag_filter, limit=limit, cursor=cursor, **kwargs
+        )
+    return await record_cls.query(session, tag_filter, **kwargs), None
+
+
+def paginated_response(
+    results: Sequence, next_cursor: Optional[str], key: str = "results"
+) -> dict:
+    """Assemble a list response, with the cursor for the next page if any."""
+    response = {key: results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return response
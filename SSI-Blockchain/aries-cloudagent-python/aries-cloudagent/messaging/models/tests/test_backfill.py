@@ -0,0 +1,160 @@
+import asyncio
+
+from asynctest import mock as async_mock, TestCase as AsyncTestCase
+
+from ....core.in_memory import InMemoryProfile
+from ....protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
+from ....storage.base import BaseStorage
+
+from .. import backfill as test_module
+from ..base import BaseModelError
+
+
+class TestTagBackfill(AsyncTestCase):
+    async def setUp(self):
+        self.session_storage = InMemoryProfile.test_session()
+        self.profile_storage = self.session_storage.profile
+        self.storage = self.session_storage.inject(BaseStorage)
+
+    async def test_backfill_pending_record_tags_updates_tags(self):
+        cred_ex = V20CredExRecord(
+            connection_id="dummy-conn-id",
+            thread_id="dummy-thid",
+            role=V20CredExRecord.ROLE_ISSUER,
+            state=V20CredExRecord.STATE_OFFER_SENT,
+        )
+        await cred_ex.save(self.session_storage)
+        stored = cred_ex.storage_record
+        await self.storage.update_record(
+            stored, stored.value, {"thread_id": "dummy-thid"}
+        )
+        # without the backfill marker, the state is matched after loading
+        assert not await V20CredExRecord.tags_backfilled(self.session_storage)
+        records = await V20CredExRecord.query(
+            self.session_storage,
+            post_filter_positive={"state": V20CredExRecord.STATE_OFFER_SENT},
+        )
+        assert [rec.cred_ex_id for rec in records] == [cred_ex.cred_ex_id]
+
+        with async_mock.patch.object(test_module, "TAG_BACKFILL_PAGE_SIZE", 1):
+            await test_module.backfill_pending_record_tags(self.profile_storage)
+        assert await V20CredExRecord.tags_backfilled(self.session_storage)
+
+        stored = await self.storage.get_record(
+            V20CredExRecord.RECORD_TYPE, cred_ex.cred_ex_id
+        )
+        assert stored.tags == {
+            "thread_id": "dummy-thid",
+            "connection_id": "dummy-conn-id",
+            "role": V20CredExRecord.ROLE_ISSUER,
+            "state": V20CredExRecord.STATE_OFFER_SENT,
+        }
+        records = await V20CredExRecord.query(
+            self.session_storage,
+            post_filter_positive={"state": V20CredExRecord.STATE_OFFER_SENT},
+        )
+        assert [rec.cred_ex_id for rec in records] == [cred_ex.cred_ex_id]
+
+    async def test_backfill_pending_record_tags(self):
+        with async_mock.patch.object(
+            V20CredExRecord, "backfill_tags", async_mock.CoroutineMock(return_value=0)
+        ) as mock_backfill:
+            await test_module.backfill_pending_record_tags(self.profile_storage)
+            mock_backfill.assert_called_once_with(
+                self.profile_storage, test_module.TAG_BACKFILL_PAGE_SIZE
+            )
+        await V20CredExRecord.backfill_tags(self.profile_storage)
+        with async_mock.patch.object(
+            V20CredExRecord, "backfill_tags", async_mock.CoroutineMock(return_value=0)
+        ) as mock_backfill:
+            await test_module.backfill_pending_record_tags(self.profile_storage)
+            mock_backfill.assert_not_called()
+
+    async def test_backfill_pending_record_tags_leased(self):
+        assert await test_module.claim_tag_backfill(
+            self.profile_storage, V20CredExRecord, "other"
+        )
+        with async_mock.patch.object(
+            V20CredExRecord, "backfill_tags", async_mock.CoroutineMock(return_value=0)
+        ) as mock_backfill:
+            await test_module.backfill_pending_record_tags(self.profile_storage)
+            mock_backfill.assert_not_called()
+
+        # the lease is only released by its owner
+        await test_module.release_tag_backfill(
+            self.profile_storage, V20CredExRecord, "mine"
+        )
+        assert not await test_module.claim_tag_backfill(
+            self.profile_storage, V20CredExRecord, "mine"
+        )
+        await test_module.release_tag_backfill(
+            self.profile_storage, V20CredExRecord, "other"
+        )
+        assert await test_module.claim_tag_backfill(
+            self.profile_storage, V20CredExRecord, "mine", lease=-1
+        )
+        # an expired lease may be claimed by another agent
+        assert await test_module.claim_tag_backfill(
+            self.profile_storage, V20CredExRecord, "other"
+        )
+
+    async def test_tag_backfill_service(self):
+        service = test_module.TagBackfillService()
+        with async_mock.patch.object(
+            test_module,
+            "backfill_pending_record_tags",
+            async_mock.CoroutineMock(side_effect=Exception("failed")),
+        ) as mock_backfill:
+            service.start(self.profile_storage)
+            await asyncio.sleep(0)
+            mock_backfill.assert_awaited_once_with(self.profile_storage)
+        await service.stop()
+
+        async def backfill(profile):
+            await asyncio.sleep(10)
+
+        with async_mock.patch.object(
+            test_module, "backfill_pending_record_tags", backfill
+        ):
+            service.start(self.profile_storage)
+            await asyncio.sleep(0)
+            await service.stop()
+
+    async def test_tag_backfill_service_sub_wallets(self):
+        service = test_module.TagBackfillService()
+        sub_wallet = InMemoryProfile.test_profile({"wallet.id": "sub-wallet-id"})
+        with async_mock.patch.object(
+            test_module,
+            "backfill_pending_record_tags",
+            async_mock.CoroutineMock(return_value=0),
+        ) as mock_backfill:
+            service.start(self.profile_storage)
+            service.start(sub_wallet)
+            await asyncio.sleep(0)
+            assert mock_backfill.await_count == 2
+
+            # completed backfills are not run again
+            service.start(self.profile_storage)
+            service.start(InMemoryProfile.test_profile({"wallet.id": "sub-wallet-id"}))
+            await asyncio.sleep(0)
+            assert mock_backfill.await_count == 2
+        await service.stop()
+
+    async def test_mark_record_tags_backfilled(self):
+        assert not await V20CredExRecord.tags_backfilled(self.session_storage)
+        await test_module.mark_record_tags_backfilled(self.session_storage)
+        assert await V20CredExRecord.tags_backfilled(self.session_storage)
+        with async_mock.patch.object(
+            test_module, "backfill_record_tags", async_mock.CoroutineMock()
+        ) as mock_backfill:
+            assert await test_module.backfill_pending_record_tags(
+                self.profile_storage
+            ) == 0
+            mock_backfill.assert_not_called()
+
+    async def test_backfill_pending_record_tags_x_class_not_found(self):
+        with async_mock.patch.object(
+            test_module, "TAG_BACKFILL_RECORD_PATHS", ("aries_cloudagent.NoSuchRecord",)
+        ):
+            with self.assertRaises(BaseModelError):
+                await test_module.backfill_pending_record_tags(self.profile_storage)
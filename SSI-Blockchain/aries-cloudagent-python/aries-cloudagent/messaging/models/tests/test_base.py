@@ -2,7 +2,13 @@ from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from marshmallow import EXCLUDE, INCLUDE, fields, validates_schema, ValidationError
 
-from ..base import BaseModel, BaseModelError, BaseModelSchema
+from ..base import (
+    BaseModel,
+    BaseModelError,
+    BaseModelSchema,
+    acquire_schema,
+    release_schema,
+)
 
 
 class ModelImpl(BaseModel):
@@ -117,3 +123,31 @@ class TestBase(AsyncTestCase):
         assert ModelImplWithoutUnknown.deserialize(
             {"attr": "succeeds", "another": "value"}
         )
+
+    def test_schema_pool(self):
+        ModelImpl(attr="succeeds").serialize()
+        schema = acquire_schema(SchemaImpl)
+        assert isinstance(schema, SchemaImpl)
+        # an instance in use is never handed to another caller
+        other = acquire_schema(SchemaImpl)
+        assert other is not schema
+        release_schema(other, SchemaImpl)
+        release_schema(schema, SchemaImpl)
+        assert acquire_schema(SchemaImpl) is schema
+        assert acquire_schema(SchemaImpl) is other
+
+        unknown = acquire_schema(SchemaImpl, INCLUDE)
+        assert unknown is not schema and unknown is not other
+        assert unknown.unknown == INCLUDE
+
+    def test_schema_reuse(self):
+        with async_mock.patch.object(
+            SchemaImpl, "load", autospec=True, side_effect=SchemaImpl.load
+        ) as mock_load:
+            for _ in range(3):
+                ModelImpl.deserialize({"attr": "succeeds"})
+            schemas = {call[0][0] for call in mock_load.call_args_list}
+        assert len(schemas) == 1
+        with self.assertRaises(BaseModelError):
+            ModelImpl.deserialize({"attr": "fails"})
+        assert ModelImpl.deserialize({"attr": "succeeds"}).attr == "succeeds"
@@ -6,6 +6,7 @@ from marshmallow import EXCLUDE, fields
 from ....cache.base import BaseCache
 from ....core.event_bus import EventBus, MockEventBus, Event
 from ....core.in_memory import InMemoryProfile
+from ....storage.in_memory import InMemoryStorage
 from ....storage.base import (
     BaseStorage,
     StorageDuplicateError,
@@ -16,7 +17,14 @@ from ....messaging.models.base import BaseModelError
 
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema, LOGGER
+from .. import base_record as test_module
+from ..base_record import (
+    RECORD_TYPE_TAG_BACKFILL,
+    BaseRecord,
+    BaseRecordSchema,
+    LOGGER,
+    encode_query_cursor,
+)
 
 
 class BaseRecordImpl(BaseRecord):
@@ -118,20 +126,22 @@ class TestBaseRecord(AsyncTestCase):
         await BaseRecordImpl.clear_cached_key(None, None)
         session = InMemoryProfile.test_session()
         mock_cache = async_mock.MagicMock(BaseCache, autospec=True)
+        mock_cache.scoped_key = async_mock.CoroutineMock(return_value="scoped_key")
         session.context.injector.bind_instance(BaseCache, mock_cache)
         record = BaseRecordImpl()
         cache_key = "cache_key"
         cache_result = await BaseRecordImpl.get_cached_key(session, cache_key)
-        mock_cache.get.assert_awaited_once_with(cache_key)
+        mock_cache.scoped_key.assert_awaited_with(cache_key, None)
+        mock_cache.get.assert_awaited_once_with("scoped_key")
         assert cache_result is mock_cache.get.return_value
 
         await record.set_cached_key(session, cache_key, record)
         mock_cache.set.assert_awaited_once_with(
-            cache_key, record, record.DEFAULT_CACHE_TTL
+            "scoped_key", record, record.DEFAULT_CACHE_TTL
         )
 
         await record.clear_cached_key(session, cache_key)
-        mock_cache.clear.assert_awaited_once_with(cache_key)
+        mock_cache.clear.assert_awaited_once_with("scoped_key")
 
     async def test_retrieve_by_tag_filter_multi_x_delete(self):
         session = InMemoryProfile.test_session()
@@ -260,6 +270,390 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    async def test_iter_query(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="1", b=str(i), code="even" if i % 2 else "odd").save(
+                session
+            )
+
+        results = [rec async for rec in ARecordImpl.iter_query(session, page_size=2)]
+        assert [rec.b for rec in results] == ["0", "1", "2", "3", "4"]
+
+        results = [
+            rec
+            async for rec in ARecordImpl.iter_query(
+                session,
+                {"code": "odd"},
+                post_filter_negative={"b": "2"},
+                page_size=1,
+            )
+        ]
+        assert [rec.b for rec in results] == ["0", "4"]
+
+        views = [
+            view
+            async for view in ARecordImpl.iter_query(
+                session, {"code": "even"}, page_size=1, projection=["b"]
+            )
+        ]
+        assert [sorted(view) for view in views] == [["b", "ident"], ["b", "ident"]]
+        assert [view["b"] for view in views] == ["1", "3"]
+
+    async def test_query_page(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="1", b=str(i), code="one").save(session)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page, cursor = await ARecordImpl.query_page(
+                session, {"code": "one"}, limit=2, cursor=cursor
+            )
+            pages += 1
+            seen.extend(rec.b for rec in page)
+            if not cursor:
+                break
+        assert seen == ["0", "1", "2", "3", "4"]
+        assert pages == 3
+
+        page, cursor = await ARecordImpl.query_page(session, limit=5)
+        assert len(page) == 5 and cursor is None
+
+        page, cursor = await ARecordImpl.query_page(session)
+        assert len(page) == 5 and cursor is None
+
+    async def test_query_page_post_filter(self):
+        session = InMemoryProfile.test_session()
+        for i in range(6):
+            await ARecordImpl(a=str(i % 2), b=str(i), code="one").save(session)
+
+        page, cursor = await ARecordImpl.query_page(
+            session, limit=2, post_filter_positive={"a": "1"}
+        )
+        assert [rec.b for rec in page] == ["1", "3"]
+        assert cursor
+        page, cursor = await ARecordImpl.query_page(
+            session, limit=2, cursor=cursor, post_filter_positive={"a": "1"}
+        )
+        assert [rec.b for rec in page] == ["5"]
+        assert cursor is None
+
+    async def test_query_page_deleted_between_pages(self):
+        session = InMemoryProfile.test_session()
+        records = []
+        for i in range(8):
+            record = ARecordImpl(a="1", b=str(i), code="one")
+            await record.save(session)
+            records.append(record)
+
+        page, cursor = await ARecordImpl.query_page(session, limit=3)
+        assert [rec.b for rec in page] == ["0", "1", "2"]
+        await records[0].delete_record(session)
+        await records[1].delete_record(session)
+        page, cursor = await ARecordImpl.query_page(session, limit=3, cursor=cursor)
+        assert [rec.b for rec in page] == ["3", "4", "5"]
+
+        # the last record returned is gone: resume at the stored offset, which
+        # skips the record that moved into its place
+        await records[5].delete_record(session)
+        page, cursor = await ARecordImpl.query_page(session, limit=3, cursor=cursor)
+        assert [rec.b for rec in page] == ["7"]
+        assert cursor is None
+
+        # cursors without the last record id are still accepted
+        page, cursor = await ARecordImpl.query_page(
+            session, limit=3, cursor=encode_query_cursor(ARecordImpl.RECORD_TYPE, 2)
+        )
+        assert [rec.b for rec in page] == ["4", "6", "7"]
+
+    async def test_query_page_x(self):
+        session = InMemoryProfile.test_session()
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, limit=0)
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, cursor="not a cursor")
+
+        _, cursor = await BaseRecordImpl.query_page(session, limit=1)
+        assert cursor is None
+        for _ in range(2):
+            await BaseRecordImpl().save(session)
+        _, cursor = await BaseRecordImpl.query_page(session, limit=1)
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, cursor=cursor)
+
+    async def test_push_down_post_filter(self):
+        assert ARecordImpl.push_down_post_filter(None, None) == (None, None)
+        assert ARecordImpl.push_down_post_filter(
+            {"other": "x"}, {"code": "red", "a": "one"}
+        ) == ({"other": "x", "code": "red"}, {"a": "one"})
+        assert ARecordImpl.push_down_post_filter({"code": "blue"}, {"code": "red"}) == (
+            {"code": "blue"},
+            {"code": "red"},
+        )
+        assert ARecordImpl.push_down_post_filter(
+            None, {"code": ["red", "blue"], "a": ["one"]}, alt=True
+        ) == ({"code": {"$in": ["red", "blue"]}}, {"a": ["one"]})
+        assert ARecordImpl.push_down_post_filter(None, {"code": "red"}, alt=True) == (
+            {},
+            {"code": "red"},
+        )
+        assert ARecordImpl.push_down_post_filter(
+            None, {"code": ["red", ""]}, alt=True
+        ) == (
+            {},
+            {"code": ["red", ""]},
+        )
+
+    async def test_query_post_filter_pushed_down(self):
+        session = InMemoryProfile.test_session()
+        for code in ("red", "blue", "red"):
+            await ARecordImpl(a="1", b=code, code=code).save(session)
+
+        mock_storage = async_mock.MagicMock(BaseStorage, autospec=True)
+        mock_storage.find_all_records.return_value = []
+        with async_mock.patch.object(session, "inject", return_value=mock_storage):
+            await ARecordImpl.query(
+                session, {"a": "1"}, post_filter_positive={"code": "red"}
+            )
+        mock_storage.find_all_records.assert_awaited_once_with(
+            ARecordImpl.RECORD_TYPE,
+            {"a": "1", "code": "red"},
+            options={"retrieveTags": False},
+        )
+
+        results = await ARecordImpl.query(session, post_filter_positive={"code": "red"})
+        assert [rec.b for rec in results] == ["red", "red"]
+        results = await ARecordImpl.query(
+            session, post_filter_positive={"code": ["blue"]}, alt=True
+        )
+        assert [rec.b for rec in results] == ["blue"]
+        result = await ARecordImpl.retrieve_by_tag_filter(session, {}, {"code": "blue"})
+        assert result.b == "blue"
+        page, _ = await ARecordImpl.query_page(
+            session, limit=1, post_filter_positive={"code": "red"}
+        )
+        assert [rec.b for rec in page] == ["red"]
+
+    async def test_query_backfill_tags(self):
+        session = InMemoryProfile.test_session()
+        storage = session.inject(BaseStorage)
+        records = [
+            ARecordImpl(a=str(i), b="b", code=code) for i, code in enumerate("xy")
+        ]
+        for record in records:
+            await record.save(session)
+        # the first record was stored before its tags were introduced
+        stored = records[0].storage_record
+        await storage.update_record(stored, stored.value, {})
+
+        with async_mock.patch.object(ARecordImpl, "BACKFILL_TAG_NAMES", {"code"}):
+            assert not await ARecordImpl.tags_backfilled(session)
+            results = await ARecordImpl.query(
+                session, post_filter_positive={"code": "x"}
+            )
+            assert [rec._id for rec in results] == [records[0]._id]
+            assert (
+                await ARecordImpl.count(session, post_filter_positive={"code": "x"})
+                == 1
+            )
+            views = await ARecordImpl.query(session, projection=["code"])
+            assert [view["code"] for view in views] == ["x", "y"]
+
+            assert await ARecordImpl.backfill_tags(session.profile, 1) == 2
+            assert await ARecordImpl.tags_backfilled(session)
+            stored = await storage.get_record(ARecordImpl.RECORD_TYPE, records[0]._id)
+            assert stored.tags == {"code": "x"}
+
+            mock_storage = async_mock.MagicMock(BaseStorage, autospec=True)
+            mock_storage.find_all_records.return_value = []
+            with async_mock.patch.object(session, "inject", return_value=mock_storage):
+                await ARecordImpl.query(session, post_filter_positive={"code": "x"})
+            mock_storage.find_all_records.assert_awaited_once_with(
+                ARecordImpl.RECORD_TYPE,
+                {"code": "x"},
+                options={"retrieveTags": False},
+            )
+
+        with async_mock.patch.object(ARecordImpl, "BACKFILL_TAG_NAMES", {"code", "a"}):
+            # the tags have changed since the marker was stored
+            assert not await ARecordImpl.tags_backfilled(session)
+            batches = []
+            update_records = InMemoryStorage.update_records
+
+            async def record_batch(storage, records):
+                batches.append([record.id for record in records])
+                await update_records(storage, records)
+
+            with async_mock.patch.object(
+                InMemoryStorage, "update_records", record_batch
+            ):
+                assert await ARecordImpl.backfill_tags(session.profile, 1) == 2
+            assert batches == [[records[0]._id], [records[1]._id]]
+            assert await ARecordImpl.tags_backfilled(session)
+
+    async def test_tags_backfilled_cached(self):
+        session = InMemoryProfile.test_session()
+        with async_mock.patch.object(ARecordImpl, "BACKFILL_TAG_NAMES", {"code"}):
+            assert not await ARecordImpl.tags_backfilled(session)
+
+            # the backfill was completed by another agent sharing the wallet
+            storage = session.inject(BaseStorage)
+            await storage.add_record(
+                StorageRecord(
+                    RECORD_TYPE_TAG_BACKFILL, "code", None, ARecordImpl.RECORD_TYPE
+                )
+            )
+            with async_mock.patch.object(
+                session, "inject", return_value=storage
+            ) as mock_inject:
+                assert not await ARecordImpl.tags_backfilled(session)
+                mock_inject.assert_not_called()
+
+            with async_mock.patch.object(
+                test_module, "TAG_BACKFILL_RECHECK_INTERVAL", 0
+            ):
+                assert await ARecordImpl.tags_backfilled(session)
+
+    async def test_mark_tags_backfilled(self):
+        session = InMemoryProfile.test_session()
+        with async_mock.patch.object(ARecordImpl, "BACKFILL_TAG_NAMES", {"code"}):
+            assert not await ARecordImpl.tags_backfilled(session)
+            await ARecordImpl.mark_tags_backfilled(session)
+            assert await ARecordImpl.tags_backfilled(session)
+            storage = session.inject(BaseStorage)
+            marker = await storage.get_record(
+                RECORD_TYPE_TAG_BACKFILL, ARecordImpl.RECORD_TYPE
+            )
+            assert marker.value == "code"
+
+    async def test_query_projection(self):
+        session = InMemoryProfile.test_session()
+        records = [
+            ARecordImpl(a=str(i), b="b", code=code) for i, code in enumerate("xyx")
+        ]
+        for record in records:
+            await record.save(session)
+
+        with async_mock.patch.object(json, "loads", async_mock.Mock()) as mock_loads:
+            views = await ARecordImpl.query(session, {"code": "x"}, projection=["code"])
+            mock_loads.assert_not_called()
+        assert views == [
+            {"ident": records[0]._id, "code": "x"},
+            {"ident": records[2]._id, "code": "x"},
+        ]
+
+        views = await ARecordImpl.query(
+            session,
+            post_filter_positive={"a": "1"},
+            projection=("ident", "a", "code"),
+        )
+        assert views == [{"ident": records[1]._id, "a": "1", "code": "y"}]
+
+        mock_storage = async_mock.MagicMock(BaseStorage, autospec=True)
+        mock_storage.find_all_records.return_value = []
+        with async_mock.patch.object(session, "inject", return_value=mock_storage):
+            await ARecordImpl.query(session, projection=["code"])
+        mock_storage.find_all_records.assert_awaited_once_with(
+            ARecordImpl.RECORD_TYPE,
+            None,
+            options={"retrieveTags": True, "retrieveValue": False},
+        )
+
+    async def test_count(self):
+        session = InMemoryProfile.test_session()
+        for i, code in enumerate("xyx"):
+            await ARecordImpl(a=str(i), b="b", code=code).save(session)
+
+        assert await ARecordImpl.count(session) == 3
+        assert await ARecordImpl.count(session, {"code": "x"}) == 2
+        assert await ARecordImpl.count(session, post_filter_positive={"code": "y"}) == 1
+        assert (
+            await ARecordImpl.count(
+                session, {"code": "x"}, post_filter_negative={"a": "0"}
+            )
+            == 1
+        )
+
+    async def test_save_all_delete_all(self):
+        session = InMemoryProfile.test_session()
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        existing.b = "updated"
+        records = [existing] + [
+            ARecordImpl(a="1", b=str(i), code="one") for i in range(1, 3)
+        ]
+
+        storage = session.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage, "add_record", async_mock.CoroutineMock()
+        ) as mock_add, async_mock.patch.object(
+            BaseRecord, "post_save", async_mock.CoroutineMock()
+        ) as mock_post_save:
+            ids = await ARecordImpl.save_all(session, records)
+            mock_add.assert_not_called()
+        assert ids == [rec._id for rec in records] and all(ids)
+        assert [call.args[1] for call in mock_post_save.call_args_list] == [
+            False,
+            True,
+            True,
+        ]
+
+        found = await ARecordImpl.query(session, {"code": "one"})
+        assert sorted(rec.b for rec in found) == ["1", "2", "updated"]
+
+        await ARecordImpl.delete_all(session, found[:2] + [ARecordImpl(a="1", b="x")])
+        assert len(await ARecordImpl.query(session, {"code": "one"})) == 1
+
+    async def test_save_all_delete_all_overridden(self):
+        calls = []
+
+        class HookedRecordImpl(ARecordImpl):
+            async def post_save(self, session, *args, **kwargs):
+                await super().post_save(session, *args, **kwargs)
+                calls.append(("save", self.b))
+
+            async def delete_record(self, session):
+                await super().delete_record(session)
+                calls.append(("delete", self.b))
+
+        session = InMemoryProfile.test_session()
+        records = [HookedRecordImpl(a="1", b=str(i), code="one") for i in range(2)]
+        storage = session.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage, "add_records", async_mock.CoroutineMock()
+        ) as mock_add_records:
+            ids = await HookedRecordImpl.save_all(session, records)
+            mock_add_records.assert_not_called()
+        assert ids == [rec._id for rec in records] and all(ids)
+
+        with async_mock.patch.object(
+            storage, "delete_records", async_mock.CoroutineMock()
+        ) as mock_delete_records:
+            await HookedRecordImpl.delete_all(session, records)
+            mock_delete_records.assert_not_called()
+        assert calls == [("save", "0"), ("save", "1"), ("delete", "0"), ("delete", "1")]
+        assert not await HookedRecordImpl.query(session)
+
+    async def test_save_all_x(self):
+        session = InMemoryProfile.test_session()
+        records = [ARecordImpl(a="1", b=str(i), code="one") for i in range(2)]
+        storage = session.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage,
+            "add_records",
+            async_mock.CoroutineMock(side_effect=StorageError()),
+        ), async_mock.patch.object(BaseRecord, "log_state") as mock_log_state:
+            with self.assertRaises(StorageError):
+                await ARecordImpl.save_all(session, records)
+            assert all(
+                call.args[0].startswith("FAILED")
+                for call in mock_log_state.call_args_list
+            )
+        assert not await ARecordImpl.query(session)
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
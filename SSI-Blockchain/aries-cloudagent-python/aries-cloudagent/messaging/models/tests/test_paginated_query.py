@@ -0,0 +1,48 @@
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from aiohttp import web
+
+from .. import paginated_query as test_module
+
+
+class TestPaginatedQuery(AsyncTestCase):
+    def test_get_paginated_query_params(self):
+        request = async_mock.MagicMock(query={"limit": "10", "cursor": "abc"})
+        assert test_module.get_paginated_query_params(request) == (10, "abc")
+
+        request = async_mock.MagicMock(query={})
+        assert test_module.get_paginated_query_params(request) == (None, None)
+
+        for limit in ("0", "ten"):
+            request = async_mock.MagicMock(query={"limit": limit})
+            with self.assertRaises(web.HTTPBadRequest):
+                test_module.get_paginated_query_params(request)
+
+    async def test_query_paginated(self):
+        record_cls = async_mock.MagicMock(
+            query=async_mock.CoroutineMock(return_value=["a", "b"]),
+            query_page=async_mock.CoroutineMock(return_value=(["a"], "next")),
+        )
+        session = async_mock.MagicMock()
+
+        assert await test_module.query_paginated(
+            record_cls, session, {"state": "done"}, post_filter_positive={"x": 1}
+        ) == (["a", "b"], None)
+        record_cls.query.assert_called_once_with(
+            session, {"state": "done"}, post_filter_positive={"x": 1}
+        )
+        record_cls.query_page.assert_not_called()
+
+        assert await test_module.query_paginated(
+            record_cls, session, None, limit=1, cursor=None, alt=True
+        ) == (["a"], "next")
+        record_cls.query_page.assert_called_once_with(
+            session, None, limit=1, cursor=None, alt=True
+        )
+
+    def test_paginated_response(self):
+        assert test_module.paginated_response(["a"], None) == {"results": ["a"]}
+        assert test_module.paginated_response(["a"], "next", key="ids") == {
+            "ids": ["a"],
+            "next_cursor": "next",
+        }
@@ -6,12 +6,12 @@ in response to the message being handled.
 """
 
 from abc import ABC, abstractmethod
-import json
 from typing import Sequence, Union
 
 from ..connections.models.connection_target import ConnectionTarget
 from ..core.error import BaseError
 from ..transport.outbound.message import OutboundMessage
+from ..utils import json_codec
 
 from .base_message import BaseMessage
 from ..transport.outbound.status import OutboundSendStatus
@@ -54,7 +54,7 @@ class BaseResponder(ABC):
             # TODO DIDComm version selection
             serialized = message.serialize()
             # TODO serialized format selection?
-            payload = json.dumps(serialized)
+            payload = json_codec.dumps(serialized)
             enc_payload = None
             if not reply_thread_id:
                 reply_thread_id = message._thread_id
@@ -4,6 +4,7 @@ from marshmallow import EXCLUDE, fields
 
 from ...core.in_memory import InMemoryProfile
 from ...protocols.didcomm_prefix import DIDCommPrefix
+from ...protocols.trustping.v1_0.messages.ping import Ping
 from ...wallet.key_type import ED25519
 
 from ..agent_message import AgentMessage, AgentMessageSchema
@@ -267,3 +268,22 @@ class TestAgentMessageSchema(AsyncTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_fresh_decorators(self):
+        traced = Ping.deserialize(
+            {
+                "@type": DIDCommPrefix.qualify_current(Ping.Meta.message_type),
+                "@id": "3a3b8e52-4b61-4dc5-ac5b-4bcae8e3fa21",
+                "~thread": {"thid": "thread-1"},
+            }
+        )
+        plain = Ping.deserialize(
+            {
+                "@type": DIDCommPrefix.qualify_current(Ping.Meta.message_type),
+                "@id": "c5d7e1d0-7a8c-4ac9-9d40-6ad0a4e1f1b2",
+            }
+        )
+        assert traced._decorators is not plain._decorators
+        assert traced._thread_id == "thread-1"
+        assert plain._thread_id == plain._id
+        assert "~thread" not in plain.serialize()
@@ -0,0 +1,262 @@
+from contextlib import contextmanager
+from copy import deepcopy
+from unittest import TestCase
+
+from marshmallow import EXCLUDE, INCLUDE, ValidationError, fields
+from marshmallow import post_dump, pre_load, validates, validates_schema
+
+from ...protocols.basicmessage.v1_0.messages.basicmessage import BasicMessage
+from ...protocols.issue_credential.v2_0.messages.cred_issue import V20CredIssue
+from ...protocols.issue_credential.v2_0.messages.tests import test_cred_issue
+from ...protocols.present_proof.v2_0.messages.pres import V20Pres
+from ...protocols.present_proof.v2_0.messages.tests import test_pres
+from ...protocols.routing.v1_0.messages.forward import Forward
+from ...protocols.trustping.v1_0.messages.ping import Ping
+
+from ..decorators.timing_decorator import TimingDecorator
+from ..models.base import FAST_CODECS, BaseModel, BaseModelError, BaseModelSchema
+from .. import fast_codec as test_module
+
+
+class Item(BaseModel):
+    class Meta:
+        schema_class = "ItemSchema"
+
+    def __init__(self, name: str = None, count: int = None, **kwargs):
+        super().__init__()
+        self.name = name
+        self.count = count
+
+
+class ItemSchema(BaseModelSchema):
+    class Meta:
+        model_class = Item
+        unknown = EXCLUDE
+
+    name = fields.Str(required=True)
+    count = fields.Int(required=False, missing=1)
+
+
+class Basket(BaseModel):
+    class Meta:
+        schema_class = "BasketSchema"
+
+    def __init__(
+        self,
+        owner: str = None,
+        items: list = None,
+        best: Item = None,
+        tags: dict = None,
+        **kwargs,
+    ):
+        super().__init__()
+        self.owner = owner
+        self.items = items
+        self.best = best
+        self.tags = tags
+        self.extra = kwargs
+
+
+class BasketSchema(BaseModelSchema):
+    class Meta:
+        model_class = Basket
+        unknown = INCLUDE
+
+    owner = fields.Str(required=True, data_key="@owner")
+    items = fields.List(fields.Nested(ItemSchema), required=False)
+    best = fields.Nested(ItemSchema, required=False, allow_none=True)
+    tags = fields.Dict(required=False)
+
+    @pre_load
+    def strip_owner(self, data, **kwargs):
+        if isinstance(data.get("@owner"), str):
+            data["@owner"] = data["@owner"].strip()
+        return data
+
+    @validates("owner")
+    def validate_owner(self, value):
+        if value == "nobody":
+            raise ValidationError("Basket must have an owner")
+
+    @validates_schema(pass_original=True)
+    def validate_items(self, data, original, **kwargs):
+        if len(data.get("items") or ()) > 3:
+            raise ValidationError("Too many items")
+
+    @post_dump
+    def add_count(self, data, **kwargs):
+        data["size"] = len(data.get("items") or ())
+        return data
+
+
+class Batch(BaseModel):
+    class Meta:
+        schema_class = "BatchSchema"
+
+
+class BatchSchema(BaseModelSchema):
+    class Meta:
+        model_class = Batch
+
+    @pre_load(pass_many=True)
+    def unwrap(self, data, many, **kwargs):
+        return data
+
+
+@contextmanager
+def validating_path():
+    """Run the enclosed code through marshmallow only."""
+    codecs = dict(FAST_CODECS)
+    FAST_CODECS.clear()
+    try:
+        yield
+    finally:
+        FAST_CODECS.update(codecs)
+
+
+class TestFastCodecConformance(TestCase):
+    """Check the fast path against the validating path for each message type."""
+
+    def setUp(self):
+        self.enabled = test_module.enable_fast_codecs()
+
+        ping = Ping(comment="hello", response_requested=False)
+        ping.assign_thread_id("thid-0", "pthid-0")
+        ping._decorators["timing"] = TimingDecorator(expires_time="2021-01-01T00:00Z")
+        forward = Forward(
+            to="did:sov:LjgpST2rjsoxYegQDRm7EL", msg='{"protected": "eyJlbmMi"}'
+        )
+        basic = BasicMessage(content="hi there", localization="en")
+
+        self.messages = [
+            ping,
+            forward,
+            basic,
+            test_cred_issue.TestV20CredIssue.CRED_ISSUE,
+            test_pres.PRES,
+            test_pres.PRES_DIF,
+        ]
+
+    def tearDown(self):
+        test_module.disable_fast_codecs()
+
+    def test_default_types_enabled(self):
+        for model_cls in (Forward, Ping, BasicMessage, V20CredIssue, V20Pres):
+            assert model_cls in self.enabled
+            assert model_cls in FAST_CODECS
+
+    def test_dump_conforms(self):
+        for message in self.messages:
+            codec = FAST_CODECS[type(message)]
+            fast = codec.dump(message)
+            with validating_path():
+                canonical = message.serialize()
+            assert fast == canonical, type(message).__name__
+            assert list(fast) == list(canonical)
+            assert message.serialize() == canonical
+            assert message.to_json() is not None
+
+    def test_load_conforms(self):
+        for message in self.messages:
+            message_cls = type(message)
+            with validating_path():
+                serialized = message.serialize()
+                canonical = message_cls.deserialize(deepcopy(serialized))
+
+            original = deepcopy(serialized)
+            loaded = FAST_CODECS[message_cls].load(serialized)
+            assert loaded is not None, message_cls.__name__
+            assert serialized == original
+            assert type(loaded) is message_cls
+            assert loaded.serialize() == canonical.serialize()
+            assert loaded._thread_id == canonical._thread_id
+            assert message_cls.deserialize(serialized).serialize() == original
+
+    def test_load_invalid_declines(self):
+        invalid = [
+            (Ping, {"@type": Ping.Meta.message_type, "response_requested": "maybe"}),
+            (Forward, {"@type": Forward.Meta.message_type, "msg": {"a": 1}}),
+            (BasicMessage, {"content": 42}),
+            (V20CredIssue, {"formats": [{"attach_id": "x"}]}),
+            (V20Pres, {"presentations~attach": "none"}),
+        ]
+        for message_cls, payload in invalid:
+            assert FAST_CODECS[message_cls].load(payload) is None
+            with self.assertRaises(BaseModelError):
+                message_cls.deserialize(payload)
+            with validating_path():
+                with self.assertRaises(BaseModelError):
+                    message_cls.deserialize(payload)
+
+    def test_unknown_override_bypasses(self):
+        ping = Ping()
+        with validating_path():
+            serialized = ping.serialize()
+        serialized["surprise"] = True
+        with self.assertRaises(BaseModelError):
+            Ping.deserialize(serialized, unknown="raise")
+
+    def test_disable(self):
+        test_module.disable_fast_codecs([Ping])
+        assert Ping not in FAST_CODECS
+        assert Forward in FAST_CODECS
+        test_module.disable_fast_codecs()
+        assert not FAST_CODECS
+
+
+class TestSchemaCodec(TestCase):
+    """Check the compiled codec of a schema using custom hooks."""
+
+    def setUp(self):
+        assert test_module.enable_fast_codecs([Basket]) == [Basket]
+        self.codec = FAST_CODECS[Basket]
+        self.data = {
+            "@owner": " alice ",
+            "items": [{"name": "apple", "count": 3}, {"name": "pear"}],
+            "best": None,
+            "tags": {"fruit": ["yes"]},
+            "colour": "green",
+        }
+
+    def tearDown(self):
+        test_module.disable_fast_codecs()
+
+    def test_load(self):
+        original = deepcopy(self.data)
+        basket = self.codec.load(self.data)
+        assert self.data == original
+        with validating_path():
+            canonical = Basket.deserialize(deepcopy(self.data))
+
+        assert basket.owner == canonical.owner == "alice"
+        assert [(i.name, i.count) for i in basket.items] == [("apple", 3), ("pear", 1)]
+        assert basket.best is None
+        assert basket.tags == canonical.tags
+        assert basket.extra == canonical.extra == {"colour": "green"}
+
+    def test_dump(self):
+        basket = Basket.deserialize(self.data)
+        dumped = self.codec.dump(basket)
+        with validating_path():
+            canonical = basket.serialize()
+        assert dumped == canonical
+        assert list(dumped) == list(canonical)
+        assert dumped["size"] == 2
+
+    def test_validators_decline(self):
+        for update in (
+            {"@owner": "nobody"},
+            {"items": [{"name": "apple"}] * 4},
+            {"items": [{"count": 1}]},
+            {"best": {"name": 7}},
+        ):
+            data = {**self.data, **update}
+            assert self.codec.load(data) is None
+            with self.assertRaises(BaseModelError):
+                Basket.deserialize(data)
+
+    def test_pass_many_not_compiled(self):
+        with self.assertRaises(test_module.CodecError):
+            test_module.SchemaCodec(BatchSchema)
+        assert test_module.enable_fast_codecs([Batch, Basket]) == [Basket]
+        assert Batch not in FAST_CODECS
@@ -8,6 +8,7 @@ from ..config.wallet import wallet_config
 from ..config.injection_context import InjectionContext
 from ..wallet.models.wallet_record import WalletRecord
 from ..askar.profile import AskarProfile
+from ..messaging.models.backfill import mark_record_tags_backfilled
 from ..multitenant.base import BaseMultitenantManager
 
 
@@ -101,11 +102,18 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
 
         assert self._multitenant_profile.opened
 
-        return AskarProfile(
+        profile = AskarProfile(
             self._multitenant_profile.opened,
             profile_context,
             profile_id=wallet_record.wallet_id,
         )
+        if provision:
+            async with profile.session() as session:
+                await mark_record_tags_backfilled(session)
+        else:
+            self.start_tag_backfill(profile)
+
+        return profile
 
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -7,9 +7,11 @@ from typing import Iterable, List, Optional, cast
 
 import jwt
 
+from ..cache.base import BaseCache, wallet_namespace
 from ..config.injection_context import InjectionContext
 from ..core.error import BaseError
 from ..core.profile import Profile, ProfileSession
+from ..messaging.models.backfill import TagBackfillService
 from ..protocols.coordinate_mediation.v1_0.manager import (
     MediationManager,
     MediationRecord,
@@ -122,6 +124,12 @@ class BaseMultitenantManager(ABC):
 
         return webhook_urls
 
+    def start_tag_backfill(self, profile: Profile):
+        """Backfill record tags of an existing sub-wallet in the background."""
+        tag_backfill = self._profile.inject_or(TagBackfillService)
+        if tag_backfill:
+            tag_backfill.start(profile)
+
     @abstractmethod
     async def get_wallet_profile(
         self,
@@ -271,6 +279,11 @@ class BaseMultitenantManager(ABC):
 
             await wallet.delete_record(session)
 
+        # Drop any cached values belonging to the removed wallet
+        cache = self._profile.inject_or(BaseCache)
+        if cache:
+            await cache.invalidate_namespace(wallet_namespace(wallet.wallet_id))
+
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
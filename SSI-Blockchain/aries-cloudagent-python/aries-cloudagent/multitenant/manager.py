@@ -82,6 +82,8 @@ class MultitenantManager(BaseMultitenantManager):
             # MTODO: add ledger config
             profile, _ = await wallet_config(context, provision=provision)
             self._profiles.put(wallet_id, profile)
+            if not profile.created:
+                self.start_tag_backfill(profile)
 
         return profile
 
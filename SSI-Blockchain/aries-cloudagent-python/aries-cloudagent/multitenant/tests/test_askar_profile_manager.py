@@ -106,7 +106,11 @@ class TestAskarProfileMultitenantManager(AsyncTestCase):
 
         with async_mock.patch(
             "aries_cloudagent.multitenant.askar_profile_manager.AskarProfile"
-        ) as AskarProfile:
+        ) as AskarProfile, async_mock.patch(
+            "aries_cloudagent.multitenant.askar_profile_manager."
+            "mark_record_tags_backfilled",
+            async_mock.CoroutineMock(),
+        ) as mock_mark_backfilled:
             sub_wallet_profile = AskarProfile(None, None)
             sub_wallet_profile.context.copy.return_value = InjectionContext()
             sub_wallet_profile.store.create_profile.return_value = create_profile_stub
@@ -119,6 +123,8 @@ class TestAskarProfileMultitenantManager(AsyncTestCase):
             sub_wallet_profile.store.create_profile.assert_called_once_with(
                 wallet_record.wallet_id
             )
+            # a new sub-wallet holds no records to backfill
+            mock_mark_backfilled.assert_awaited_once()
 
     async def test_get_wallet_profile_should_use_custom_subwallet_name(self):
         wallet_record = WalletRecord(wallet_id="test", settings={})
@@ -5,6 +5,8 @@ from asynctest import mock as async_mock
 import jwt
 
 from .. import base as test_module
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.base import InjectionError
 from ...core.in_memory import InMemoryProfile
 from ...messaging.responder import BaseResponder
@@ -355,6 +357,30 @@ class TestBaseMultitenantManager(AsyncTestCase):
                 RouteRecord.RECORD_TYPE, {"wallet_id": "test"}
             )
 
+    async def test_remove_wallet_invalidates_cache_namespace(self):
+        cache = InMemoryCache()
+        self.context.injector.bind_instance(BaseCache, cache)
+        cache_key = await cache.scoped_key("connection_target::abc", "test")
+        await cache.set(cache_key, "value")
+        with async_mock.patch.object(
+            WalletRecord, "retrieve_by_id"
+        ) as retrieve_by_id, async_mock.patch.object(
+            self.manager, "get_wallet_profile"
+        ), async_mock.patch.object(
+            WalletRecord, "delete_record"
+        ):
+            retrieve_by_id.return_value = WalletRecord(
+                wallet_id="test",
+                key_management_mode=WalletRecord.MODE_UNMANAGED,
+                settings={"wallet.type": "indy", "wallet.key": "test_key"},
+            )
+
+            await self.manager.remove_wallet("test")
+
+        new_key = await cache.scoped_key("connection_target::abc", "test")
+        assert new_key != cache_key
+        assert await cache.get(new_key) is None
+
     async def test_create_auth_token_fails_no_wallet_key_but_required(self):
         self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
         wallet_record = WalletRecord(
@@ -2,6 +2,7 @@ from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
 from ...core.in_memory import InMemoryProfile
+from ...messaging.models.backfill import TagBackfillService
 from ...messaging.responder import BaseResponder
 from ...wallet.models.wallet_record import WalletRecord
 from ..manager import MultitenantManager
@@ -46,6 +47,32 @@ class TestMultitenantManager(AsyncTestCase):
             assert profile is self.manager._profiles.get("test")
             wallet_config.assert_not_called()
 
+    async def test_get_wallet_profile_starts_tag_backfill(self):
+        tag_backfill = async_mock.MagicMock(TagBackfillService, autospec=True)
+        self.profile.context.injector.bind_instance(TagBackfillService, tag_backfill)
+
+        def side_effect(context, provision):
+            profile = InMemoryProfile(context=context)
+            profile._created = provision
+            return (profile, None)
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config:
+            wallet_config.side_effect = side_effect
+            profile = await self.manager.get_wallet_profile(
+                self.profile.context, WalletRecord(wallet_id="test", settings={})
+            )
+            tag_backfill.start.assert_called_once_with(profile)
+
+            # a newly provisioned sub-wallet has nothing to backfill
+            await self.manager.get_wallet_profile(
+                self.profile.context,
+                WalletRecord(wallet_id="new", settings={}),
+                provision=True,
+            )
+            tag_backfill.start.assert_called_once_with(profile)
+
     async def test_get_wallet_profile_settings(self):
         extra_settings = {"extra_settings": "extra_settings"}
         all_wallet_record_settings = [
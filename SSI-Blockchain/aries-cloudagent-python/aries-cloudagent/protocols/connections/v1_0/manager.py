@@ -974,16 +974,18 @@ class ConnectionManager(BaseConnectionManager):
             )
             cache = self.profile.inject_or(BaseCache)
             if cache:
+                cache_key = await cache.scoped_key(
+                    cache_key, self.profile.settings.get("wallet.id")
+                )
                 async with cache.acquire(cache_key) as entry:
                     if entry.result:
                         cached = entry.result
                         receipt.sender_did = cached["sender_did"]
                         receipt.recipient_did_public = cached["recipient_did_public"]
                         receipt.recipient_did = cached["recipient_did"]
-                        async with self.profile.session() as session:
-                            connection = await ConnRecord.retrieve_by_id(
-                                session, cached["id"]
-                            )
+                        connection = await ConnRecord.retrieve_by_id_cached(
+                            self.profile, cached["id"]
+                        )
                     else:
                         connection = await self.resolve_inbound_connection(receipt)
                         if connection:
@@ -1059,8 +1061,11 @@ class ConnectionManager(BaseConnectionManager):
         if not connection_id:
             connection_id = connection.connection_id
         cache = self.profile.inject_or(BaseCache)
-        cache_key = f"connection_target::{connection_id}"
         if cache:
+            cache_key = await cache.scoped_key(
+                f"connection_target::{connection_id}",
+                self.profile.settings.get("wallet.id"),
+            )
             async with cache.acquire(cache_key) as entry:
                 if entry.result:
                     targets = [
@@ -17,6 +17,13 @@ from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
@@ -38,7 +45,7 @@ class ConnectionModuleResponseSchema(OpenAPISchema):
     """Response schema for connection module."""
 
 
-class ConnectionListSchema(OpenAPISchema):
+class ConnectionListSchema(PaginatedResultSchema):
     """Result schema for connection list."""
 
     results = fields.List(
@@ -166,7 +173,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -360,18 +367,28 @@ async def connections_list(request: web.BaseRequest):
     if request.query.get("connection_protocol"):
         post_filter["connection_protocol"] = request.query["connection_protocol"]
 
+    limit, cursor = get_paginated_query_params(request)
+
     profile = context.profile
     try:
         async with profile.session() as session:
-            records = await ConnRecord.query(
-                session, tag_filter, post_filter_positive=post_filter, alt=True
+            records, next_cursor = await query_paginated(
+                ConnRecord,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
+                post_filter_positive=post_filter,
+                alt=True,
             )
         results = [record.serialize() for record in records]
-        results.sort(key=connection_sort_key)
+        if not (limit or cursor):
+            # pages are returned in storage order, which is stable across pages
+            results.sort(key=connection_sort_key)
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(tags=["connection"], summary="Fetch a single connection record")
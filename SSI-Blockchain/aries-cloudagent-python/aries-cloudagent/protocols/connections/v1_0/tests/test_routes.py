@@ -139,6 +139,48 @@ class TestConnectionRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.connections_list(self.request)
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "2", "cursor": "some-cursor"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            conn = async_mock.MagicMock(
+                serialize=async_mock.MagicMock(
+                    return_value={
+                        "state": ConnRecord.State.COMPLETED.rfc23,
+                        "created_at": "1234567890",
+                    }
+                )
+            )
+            mock_conn_rec.State = ConnRecord.State
+            mock_conn_rec.query_page = async_mock.CoroutineMock(
+                return_value=([conn], "next-cursor")
+            )
+
+            await test_module.connections_list(self.request)
+            mock_conn_rec.query_page.assert_called_once_with(
+                ANY,
+                {},
+                limit=2,
+                cursor="some-cursor",
+                post_filter_positive={},
+                alt=True,
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [conn.serialize.return_value],
+                    "next_cursor": "next-cursor",
+                }
+            )
+
+    async def test_connections_list_paginated_x(self):
+        self.request.query = {"limit": "none"}
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.connections_list(self.request)
+
     async def test_connections_retrieve(self):
         self.request.match_info = {"conn_id": "dummy"}
         mock_conn_rec = async_mock.MagicMock()
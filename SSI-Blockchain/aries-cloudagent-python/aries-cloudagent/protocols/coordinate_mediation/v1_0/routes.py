@@ -14,6 +14,13 @@ from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import UUIDFour
 from ....storage.error import StorageError, StorageNotFoundError
 from ...connections.v1_0.routes import ConnectionsConnIdMatchInfoSchema
@@ -119,7 +126,7 @@ class MediationIdMatchInfoSchema(OpenAPISchema):
     mediation_id = MEDIATION_ID_SCHEMA
 
 
-class GetKeylistQuerySchema(OpenAPISchema):
+class GetKeylistQuerySchema(PaginatedQuerySchema):
     """Get keylist query string paramaters."""
 
     conn_id = CONNECTION_ID_SCHEMA
@@ -135,7 +142,7 @@ class GetKeylistQuerySchema(OpenAPISchema):
     )
 
 
-class KeylistSchema(OpenAPISchema):
+class KeylistSchema(PaginatedResultSchema):
     """Result schema for mediation list query."""
 
     results = fields.List(
@@ -372,13 +379,17 @@ async def get_keylist(request: web.BaseRequest):
     if role:
         tag_filter["role"] = role
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         async with context.profile.session() as session:
-            keylists = await RouteRecord.query(session, tag_filter)
+            keylists, next_cursor = await query_paginated(
+                RouteRecord, session, tag_filter, limit=limit, cursor=cursor
+            )
         results = [record.serialize() for record in keylists]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
-    return web.json_response({"results": results}, status=200)
+    return web.json_response(paginated_response(results, next_cursor), status=200)
 
 
 @docs(
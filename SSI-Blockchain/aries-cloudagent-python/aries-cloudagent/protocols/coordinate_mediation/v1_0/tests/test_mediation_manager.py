@@ -421,6 +421,8 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
         with async_mock.patch.object(
             RouteRecord, "query", async_mock.CoroutineMock()
         ) as mock_route_rec_query, async_mock.patch.object(
+            RouteRecord, "delete_all", async_mock.CoroutineMock()
+        ) as mock_route_rec_delete_all, async_mock.patch.object(
             test_module.LOGGER, "error", async_mock.MagicMock()
         ) as mock_logger_error:
             mock_route_rec_query.return_value = [
@@ -429,6 +431,9 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
 
             await manager.store_update_results(TEST_CONN_ID, results)
             mock_logger_error.assert_called_once()
+            mock_route_rec_delete_all.assert_awaited_once_with(
+                async_mock.ANY, [mock_route_rec_query.return_value[0]]
+            )
 
     async def test_store_update_results_exists_relay(self, session, manager):
         """test_store_update_results_record_exists_relay."""
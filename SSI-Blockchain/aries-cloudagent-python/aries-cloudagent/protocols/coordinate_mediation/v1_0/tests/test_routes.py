@@ -421,6 +421,41 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
                 {"connection_id": "test-id", "role": MediationRecord.ROLE_SERVER},
             )
 
+    async def test_get_keylist_paginated(self):
+        session = await self.profile.session()
+        self.request.query["limit"] = "1"
+
+        query_results = [
+            async_mock.MagicMock(
+                serialize=async_mock.MagicMock(
+                    return_value={"serialized": "route record"}
+                )
+            )
+        ]
+
+        with async_mock.patch.object(
+            test_module.RouteRecord,
+            "query_page",
+            async_mock.CoroutineMock(return_value=(query_results, "next-cursor")),
+        ) as mock_query_page, async_mock.patch.object(
+            self.profile,
+            "session",
+            async_mock.MagicMock(return_value=session),
+        ) as mock_session, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            await test_module.get_keylist(self.request)
+            mock_query_page.assert_called_once_with(
+                mock_session.return_value, {}, limit=1, cursor=None
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [{"serialized": "route record"}],
+                    "next_cursor": "next-cursor",
+                },
+                status=200,
+            )
+
     async def test_get_keylist_no_matching_records(self):
         session = await self.profile.session()
         with async_mock.patch.object(
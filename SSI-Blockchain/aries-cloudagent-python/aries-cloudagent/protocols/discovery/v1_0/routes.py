@@ -7,6 +7,13 @@ from marshmallow import fields
 from ....admin.request_context import AdminRequestContext
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import UUIDFour
 from ....storage.error import StorageNotFoundError, StorageError
 
@@ -18,7 +25,7 @@ from .models.discovery_record import (
 )
 
 
-class V10DiscoveryExchangeListResultSchema(OpenAPISchema):
+class V10DiscoveryExchangeListResultSchema(PaginatedResultSchema):
     """Result schema for Discover Features v1.0 exchange records."""
 
     results = fields.List(
@@ -46,7 +53,7 @@ class QueryFeaturesQueryStringSchema(OpenAPISchema):
     )
 
 
-class QueryDiscoveryExchRecordsSchema(OpenAPISchema):
+class QueryDiscoveryExchRecordsSchema(PaginatedQuerySchema):
     """Query string parameter for Discover Features v1.0 exchange record."""
 
     connection_id = fields.Str(
@@ -106,10 +113,14 @@ async def query_records(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     connection_id = request.query.get("connection_id")
+    next_cursor = None
     if not connection_id:
+        limit, cursor = get_paginated_query_params(request)
         try:
             async with context.profile.session() as session:
-                records = await V10DiscoveryExchangeRecord.query(session=session)
+                records, next_cursor = await query_paginated(
+                    V10DiscoveryExchangeRecord, session, limit=limit, cursor=cursor
+                )
             results = [record.serialize() for record in records]
         except (StorageError, BaseModelError) as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
@@ -123,7 +134,7 @@ async def query_records(request: web.BaseRequest):
             results = [record.serialize()]
         except (StorageError, BaseModelError, StorageNotFoundError) as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 async def register(app: web.Application):
@@ -152,6 +152,28 @@ class TestDiscoveryRoutes(AsyncTestCase):
                 {"results": [k.serialize() for k in test_recs]}
             )
 
+    async def test_query_records_paginated(self):
+        self.request.json = async_mock.CoroutineMock()
+        self.request.query = {"limit": "1", "cursor": "some-cursor"}
+
+        test_rec = async_mock.MagicMock(
+            serialize=async_mock.MagicMock(return_value={"serialized": "record"})
+        )
+
+        with async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response, async_mock.patch.object(
+            test_module, "V20DiscoveryExchangeRecord", autospec=True
+        ) as mock_ex_rec:
+            mock_ex_rec.query_page.return_value = ([test_rec], "next-cursor")
+            await test_module.query_records(self.request)
+            mock_ex_rec.query_page.assert_called_once_with(
+                async_mock.ANY, None, limit=1, cursor="some-cursor"
+            )
+            mock_response.assert_called_once_with(
+                {"results": [{"serialized": "record"}], "next_cursor": "next-cursor"}
+            )
+
     async def test_query_records_connection_x(self):
         self.request.json = async_mock.CoroutineMock()
 
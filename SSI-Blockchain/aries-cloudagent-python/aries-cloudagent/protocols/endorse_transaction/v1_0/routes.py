@@ -22,6 +22,13 @@ from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import UUIDFour
 from ....protocols.connections.v1_0.manager import ConnectionManager
 from ....protocols.connections.v1_0.messages.connection_invitation import (
@@ -39,7 +46,7 @@ from .util import is_author_role, get_endorser_connection_id
 LOGGER = logging.getLogger(__name__)
 
 
-class TransactionListSchema(OpenAPISchema):
+class TransactionListSchema(PaginatedResultSchema):
     """Result schema for transaction list."""
 
     results = fields.List(
@@ -48,7 +55,7 @@ class TransactionListSchema(OpenAPISchema):
     )
 
 
-class TransactionsListQueryStringSchema(OpenAPISchema):
+class TransactionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for transactions list request query string."""
 
 
@@ -159,17 +166,24 @@ async def transactions_list(request: web.BaseRequest):
 
     tag_filter = {}
     post_filter = {}
+    limit, cursor = get_paginated_query_params(request)
 
     try:
         async with context.profile.session() as session:
-            records = await TransactionRecord.query(
-                session, tag_filter, post_filter_positive=post_filter, alt=True
+            records, next_cursor = await query_paginated(
+                TransactionRecord,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
+                post_filter_positive=post_filter,
+                alt=True,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(tags=["endorse-transaction"], summary="Fetch a single transaction record")
@@ -90,6 +90,35 @@ class TestEndorseTransactionRoutes(AsyncTestCase):
 
             mock_response.assert_called_once_with({"results": [{"...": "..."}]})
 
+    async def test_transactions_list_paginated(self):
+        self.request.query = {"limit": "1", "cursor": "some-cursor"}
+        with async_mock.patch.object(
+            TransactionRecord, "query_page", async_mock.CoroutineMock()
+        ) as mock_query_page, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_query_page.return_value = (
+                [
+                    async_mock.MagicMock(
+                        serialize=async_mock.MagicMock(return_value={"...": "..."})
+                    )
+                ],
+                "next-cursor",
+            )
+            await test_module.transactions_list(self.request)
+
+            mock_query_page.assert_called_once_with(
+                async_mock.ANY,
+                {},
+                limit=1,
+                cursor="some-cursor",
+                post_filter_positive={},
+                alt=True,
+            )
+            mock_response.assert_called_once_with(
+                {"results": [{"...": "..."}], "next_cursor": "next-cursor"}
+            )
+
     async def test_transactions_list_x(self):
         with async_mock.patch.object(
             TransactionRecord, "query", async_mock.CoroutineMock()
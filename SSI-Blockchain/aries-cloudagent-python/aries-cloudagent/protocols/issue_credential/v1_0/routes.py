@@ -22,6 +22,13 @@ from ....ledger.error import LedgerError
 from ....messaging.credential_definitions.util import CRED_DEF_TAGS
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_DID,
@@ -52,7 +59,7 @@ class IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for Issue Credential Module."""
 
 
-class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
+class V10CredentialExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange list query."""
 
     connection_id = fields.UUID(
@@ -89,7 +96,7 @@ class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
     )
 
 
-class V10CredentialExchangeListResultSchema(OpenAPISchema):
+class V10CredentialExchangeListResultSchema(PaginatedResultSchema):
     """Result schema for Aries#0036 v1.0 credential exchange query."""
 
     results = fields.List(
@@ -321,19 +328,23 @@ async def credential_exchange_list(request: web.BaseRequest):
         for k in ("connection_id", "role", "state")
         if request.query.get(k, "") != ""
     }
+    limit, cursor = get_paginated_query_params(request)
 
     try:
         async with context.profile.session() as session:
-            records = await V10CredentialExchange.query(
-                session=session,
-                tag_filter=tag_filter,
+            records, next_cursor = await query_paginated(
+                V10CredentialExchange,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(
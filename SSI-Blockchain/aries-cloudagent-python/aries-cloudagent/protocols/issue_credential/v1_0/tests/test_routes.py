@@ -47,6 +47,40 @@ class TestCredentialRoutes(AsyncTestCase):
                     {"results": [mock_cred_ex.serialize.return_value]}
                 )
 
+    async def test_credential_exchange_list_paginated(self):
+        self.request.query = {"state": "dummy", "limit": "2", "cursor": "some-cursor"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex:
+            mock_cred_ex.query_page = async_mock.CoroutineMock(
+                return_value=([mock_cred_ex], "next-cursor")
+            )
+            mock_cred_ex.serialize = async_mock.MagicMock()
+            mock_cred_ex.serialize.return_value = {"hello": "world"}
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.credential_exchange_list(self.request)
+                mock_cred_ex.query_page.assert_called_once_with(
+                    async_mock.ANY,
+                    {},
+                    limit=2,
+                    cursor="some-cursor",
+                    post_filter_positive={"state": "dummy"},
+                )
+                mock_response.assert_called_once_with(
+                    {
+                        "results": [mock_cred_ex.serialize.return_value],
+                        "next_cursor": "next-cursor",
+                    }
+                )
+
+        self.request.query = {"limit": "0"}
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.credential_exchange_list(self.request)
+
     async def test_credential_exchange_list_x(self):
         self.request.query = {
             "thread_id": "dummy",
@@ -7,7 +7,7 @@ from typing import Mapping, Optional, Tuple
 from ....connections.models.conn_record import ConnRecord
 from ....core.oob_processor import OobRecord
 from ....core.error import BaseError
-from ....core.profile import Profile
+from ....core.profile import Profile, ProfileSession
 from ....messaging.responder import BaseResponder
 from ....storage.error import StorageError, StorageNotFoundError
 
@@ -714,10 +714,19 @@ class V20CredManager:
 
         return cred_ex_record
 
-    async def delete_cred_ex_record(self, cred_ex_id: str) -> None:
-        """Delete credential exchange record and associated detail records."""
+    async def delete_cred_ex_record(
+        self, cred_ex_id: str, session: ProfileSession = None
+    ) -> None:
+        """
+        Delete credential exchange record and associated detail records.
 
-        async with self._profile.session() as session:
+        Args:
+            cred_ex_id: The credential exchange record identifier
+            session: The session or transaction to use, if any
+
+        """
+
+        async with (session or self._profile.session()) as session:
             for fmt in V20CredFormat.Format:  # details first: do not strand any orphans
                 for record in await fmt.detail.query_by_cred_ex_id(
                     session,
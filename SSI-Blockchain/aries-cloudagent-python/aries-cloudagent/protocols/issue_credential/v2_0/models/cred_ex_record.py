@@ -34,7 +34,13 @@ class V20CredExRecord(BaseExchangeRecord):
     RECORD_TYPE = "cred_ex_v20"
     RECORD_ID_NAME = "cred_ex_id"
     RECORD_TOPIC = "issue_credential_v2_0"
-    TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    TAG_NAMES = {
+        "~thread_id" if UNENCRYPTED_TAGS else "thread_id",
+        "connection_id",
+        "role",
+        "state",
+    }
+    BACKFILL_TAG_NAMES = {"connection_id", "role", "state"}
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
@@ -26,6 +26,13 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_DID,
@@ -58,7 +65,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.UUID(
@@ -114,7 +121,7 @@ class V20CredExRecordDetailSchema(OpenAPISchema):
     )
 
 
-class V20CredExRecordListResultSchema(OpenAPISchema):
+class V20CredExRecordListResultSchema(PaginatedResultSchema):
     """Result schema for credential exchange record list query."""
 
     results = fields.List(
@@ -453,12 +460,16 @@ async def credential_exchange_list(request: web.BaseRequest):
         for k in ("connection_id", "role", "state")
         if request.query.get(k, "") != ""
     }
+    limit, cursor = get_paginated_query_params(request)
 
     try:
         async with profile.session() as session:
-            cred_ex_records = await V20CredExRecord.query(
-                session=session,
-                tag_filter=tag_filter,
+            cred_ex_records, next_cursor = await query_paginated(
+                V20CredExRecord,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
                 post_filter_positive=post_filter,
             )
 
@@ -471,7 +482,7 @@ async def credential_exchange_list(request: web.BaseRequest):
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(
@@ -9,6 +9,7 @@ from marshmallow import fields, validate
 from marshmallow.exceptions import ValidationError
 
 from ....admin.request_context import AdminRequestContext
+from ....core.oob_processor import OobMessageProcessorError
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
 from ....messaging.valid import UUID4
@@ -243,7 +244,12 @@ async def invitation_receive(request: web.BaseRequest):
             use_existing_connection=use_existing_conn,
             mediation_id=mediation_id,
         )
-    except (DIDXManagerError, StorageError, BaseModelError) as err:
+    except (
+        DIDXManagerError,
+        OobMessageProcessorError,
+        StorageError,
+        BaseModelError,
+    ) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     return web.json_response(result.serialize())
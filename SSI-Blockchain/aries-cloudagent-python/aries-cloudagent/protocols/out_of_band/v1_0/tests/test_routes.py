@@ -168,6 +168,13 @@ class TestOutOfBandRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.invitation_receive(self.request)
 
+            mock_oob_mgr.return_value.receive_invitation = async_mock.CoroutineMock(
+                side_effect=test_module.OobMessageProcessorError("queue full")
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.invitation_receive(self.request)
+
     async def test_register(self):
         mock_app = async_mock.MagicMock()
         mock_app.add_routes = async_mock.MagicMock()
@@ -25,6 +25,13 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL,
     NUM_STR_NATURAL,
@@ -52,7 +59,7 @@ class V10PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
+class V10PresentationExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -89,7 +96,7 @@ class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
     )
 
 
-class V10PresentationExchangeListSchema(OpenAPISchema):
+class V10PresentationExchangeListSchema(PaginatedResultSchema):
     """Result schema for an Aries RFC 37 v1.0 presentation exchange query."""
 
     results = fields.List(
@@ -231,19 +238,23 @@ async def presentation_exchange_list(request: web.BaseRequest):
         for k in ("connection_id", "role", "state")
         if request.query.get(k, "") != ""
     }
+    limit, cursor = get_paginated_query_params(request)
 
     try:
         async with context.profile.session() as session:
-            records = await V10PresentationExchange.query(
-                session=session,
-                tag_filter=tag_filter,
+            records, next_cursor = await query_paginated(
+                V10PresentationExchange,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(
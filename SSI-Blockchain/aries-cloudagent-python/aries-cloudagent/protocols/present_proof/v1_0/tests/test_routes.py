@@ -86,6 +86,46 @@ class TestProofRoutes(AsyncTestCase):
                     {"results": [mock_presentation_exchange.serialize.return_value]}
                 )
 
+    async def test_presentation_exchange_list_paginated(self):
+        self.request.query = {"state": "dummy", "limit": "2", "cursor": "some-cursor"}
+
+        with async_mock.patch(
+            (
+                "aries_cloudagent.protocols.present_proof.v1_0."
+                "models.presentation_exchange.V10PresentationExchange"
+            ),
+            autospec=True,
+        ) as mock_presentation_exchange:
+
+            # Since we are mocking import
+            importlib.reload(test_module)
+
+            mock_presentation_exchange.query_page = async_mock.CoroutineMock(
+                return_value=([mock_presentation_exchange], "next-cursor")
+            )
+            mock_presentation_exchange.serialize = async_mock.MagicMock()
+            mock_presentation_exchange.serialize.return_value = {
+                "thread_id": "sample-thread-id"
+            }
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.presentation_exchange_list(self.request)
+                mock_presentation_exchange.query_page.assert_called_once_with(
+                    async_mock.ANY,
+                    {},
+                    limit=2,
+                    cursor="some-cursor",
+                    post_filter_positive={"state": "dummy"},
+                )
+                mock_response.assert_called_once_with(
+                    {
+                        "results": [mock_presentation_exchange.serialize.return_value],
+                        "next_cursor": "next-cursor",
+                    }
+                )
+
     async def test_presentation_exchange_list_x(self):
         self.request.query = {
             "thread_id": "thread_id_0",
@@ -27,6 +27,13 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL,
     NUM_STR_NATURAL,
@@ -69,7 +76,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -106,7 +113,7 @@ class V20PresExRecordListQueryStringSchema(OpenAPISchema):
     )
 
 
-class V20PresExRecordListSchema(OpenAPISchema):
+class V20PresExRecordListSchema(PaginatedResultSchema):
     """Result schema for a presentation exchange query."""
 
     results = fields.List(
@@ -381,19 +388,23 @@ async def present_proof_list(request: web.BaseRequest):
         for k in ("connection_id", "role", "state")
         if request.query.get(k, "") != ""
     }
+    limit, cursor = get_paginated_query_params(request)
 
     try:
         async with profile.session() as session:
-            records = await V20PresExRecord.query(
-                session=session,
-                tag_filter=tag_filter,
+            records, next_cursor = await query_paginated(
+                V20PresExRecord,
+                session,
+                tag_filter,
+                limit=limit,
+                cursor=cursor,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return web.json_response(paginated_response(results, next_cursor))
 
 
 @docs(
@@ -164,6 +164,37 @@ class RoutingManager:
         LOGGER.info(">>> CREATED routing record for verkey: " + recipient_key)
         return route
 
+    async def create_route_records(
+        self, client_connection_id: str, recipient_keys: Sequence[str]
+    ) -> Sequence[RouteRecord]:
+        """
+        Create and store several new route records for a client connection.
+
+        Args:
+            client_connection_id: The ID of the connection record
+            recipient_keys: The recipient verkeys of the routes
+
+        Returns:
+            The new routing records
+
+        """
+        if not client_connection_id:
+            raise RoutingManagerError("Missing client_connection_id")
+        if not all(recipient_keys):
+            raise RoutingManagerError("Missing recipient_key")
+        routes = [
+            RouteRecord(connection_id=client_connection_id, recipient_key=recip_key)
+            for recip_key in recipient_keys
+        ]
+        async with self._profile.session() as session:
+            await RouteRecord.save_all(session, routes, reason="Created new route")
+        return routes
+
+    async def delete_route_records(self, routes: Sequence[RouteRecord]):
+        """Remove several existing route records."""
+        async with self._profile.session() as session:
+            await RouteRecord.delete_all(session, routes)
+
     async def update_routes(
         self, client_connection_id: str, updates: Sequence[RouteUpdate]
     ) -> Sequence[RouteUpdated]:
@@ -180,7 +211,10 @@ class RoutingManager:
         for route in exist_routes:
             exist[route.recipient_key] = route
 
+        # collect the changes first so that each kind is written in one batch
         updated = []
+        to_create = {}
+        to_delete = {}
         for update in updates:
             result = RouteUpdated(
                 recipient_key=update.recipient_key, action=update.action
@@ -189,31 +223,39 @@ class RoutingManager:
             if not recip_key:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             elif update.action == RouteUpdate.ACTION_CREATE:
-                if recip_key in exist:
+                if recip_key in exist or recip_key in to_create:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
                 else:
-                    try:
-                        await self.create_route_record(
-                            client_connection_id=client_connection_id,
-                            recipient_key=recip_key,
-                        )
-                    except RoutingManagerError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                    to_create[recip_key] = result
             elif update.action == RouteUpdate.ACTION_DELETE:
-                if recip_key in exist:
-                    try:
-                        await self.delete_route_record(exist[recip_key])
-                    except StorageError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                if recip_key in exist and recip_key not in to_delete:
+                    to_delete[recip_key] = result
                 else:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
             else:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             updated.append(result)
+
+        if to_create:
+            try:
+                await self.create_route_records(client_connection_id, list(to_create))
+            except (RoutingManagerError, StorageError):
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            else:
+                outcome = RouteUpdated.RESULT_SUCCESS
+            for result in to_create.values():
+                result.result = outcome
+        if to_delete:
+            try:
+                await self.delete_route_records(
+                    [exist[recip_key] for recip_key in to_delete]
+                )
+            except StorageError:
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            else:
+                outcome = RouteUpdated.RESULT_SUCCESS
+            for result in to_delete.values():
+                result.result = outcome
         return updated
 
     async def send_create_route(
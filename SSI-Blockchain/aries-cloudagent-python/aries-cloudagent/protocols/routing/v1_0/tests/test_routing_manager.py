@@ -3,6 +3,7 @@ from asynctest import mock as async_mock
 
 from marshmallow import ValidationError
 
+from .....messaging.models.base_record import BaseRecord
 from .....messaging.request_context import RequestContext
 from .....storage.error import (
     StorageDuplicateError,
@@ -248,9 +249,9 @@ class TestRoutingManager(AsyncTestCase):
 
     async def test_update_routes_create_server_error(self):
         with async_mock.patch.object(
-            self.manager, "create_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_create_route_record:
-            mock_mgr_create_route_record.side_effect = RoutingManagerError()
+            self.manager, "create_route_records", async_mock.CoroutineMock()
+        ) as mock_mgr_create_route_records:
+            mock_mgr_create_route_records.side_effect = RoutingManagerError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
@@ -282,9 +283,9 @@ class TestRoutingManager(AsyncTestCase):
     async def test_update_routes_delete_server_error(self):
         await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         with async_mock.patch.object(
-            self.manager, "delete_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_delete_route_record:
-            mock_mgr_delete_route_record.side_effect = StorageError()
+            self.manager, "delete_route_records", async_mock.CoroutineMock()
+        ) as mock_mgr_delete_route_records:
+            mock_mgr_delete_route_records.side_effect = StorageError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
@@ -299,6 +300,53 @@ class TestRoutingManager(AsyncTestCase):
             assert results[0].action == RouteUpdate.ACTION_DELETE
             assert results[0].result == RouteUpdated.RESULT_SERVER_ERROR
 
+    async def test_update_routes_batched(self):
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        with async_mock.patch.object(
+            BaseRecord, "save", async_mock.CoroutineMock()
+        ) as mock_save, async_mock.patch.object(
+            BaseRecord, "delete_record", async_mock.CoroutineMock()
+        ) as mock_delete:
+            results = await self.manager.update_routes(
+                client_connection_id=TEST_CONN_ID,
+                updates=[
+                    RouteUpdate(
+                        recipient_key=f"{TEST_ROUTE_VERKEY}-{i}",
+                        action=RouteUpdate.ACTION_CREATE,
+                    )
+                    for i in range(3)
+                ]
+                + [
+                    RouteUpdate(
+                        recipient_key=f"{TEST_ROUTE_VERKEY}-0",
+                        action=RouteUpdate.ACTION_CREATE,
+                    ),
+                    RouteUpdate(
+                        recipient_key=TEST_ROUTE_VERKEY,
+                        action=RouteUpdate.ACTION_DELETE,
+                    ),
+                ],
+            )
+            mock_save.assert_not_called()
+            mock_delete.assert_not_called()
+        assert [result.result for result in results] == [
+            RouteUpdated.RESULT_SUCCESS,
+            RouteUpdated.RESULT_SUCCESS,
+            RouteUpdated.RESULT_SUCCESS,
+            RouteUpdated.RESULT_NO_CHANGE,
+            RouteUpdated.RESULT_SUCCESS,
+        ]
+        routes = await self.manager.get_routes(TEST_CONN_ID)
+        assert sorted(route.recipient_key for route in routes) == [
+            f"{TEST_ROUTE_VERKEY}-{i}" for i in range(3)
+        ]
+
+    async def test_create_route_records_x(self):
+        with self.assertRaises(RoutingManagerError):
+            await self.manager.create_route_records(None, [TEST_ROUTE_VERKEY])
+        with self.assertRaises(RoutingManagerError):
+            await self.manager.create_route_records(TEST_CONN_ID, [None])
+
     async def test_send_create_route(self):
         mock_outbound_handler = async_mock.CoroutineMock()
         await self.manager.send_create_route(
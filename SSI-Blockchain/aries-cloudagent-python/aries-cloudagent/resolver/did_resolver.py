@@ -13,6 +13,7 @@ from typing import Optional, List, Sequence, Tuple, Text, Type, TypeVar, Union
 from pydid import DID, DIDError, DIDUrl, Resource, NonconformantDocument
 from pydid.doc.doc import IDNotFoundError
 
+from ..cache.base import BaseCache, is_negative_entry
 from ..core.profile import Profile
 from .base import (
     BaseDIDResolver,
@@ -47,11 +48,18 @@ class DIDResolver:
         service_accept: Optional[Sequence[Text]] = None,
     ) -> Tuple[BaseDIDResolver, dict]:
         """Retrieve doc and return with resolver."""
-        # TODO Cache results
         if isinstance(did, DID):
             did = str(did)
         else:
             DID.validate(did)
+        cache = profile.inject_or(BaseCache)
+        if cache:
+            # resolvers may depend on the wallet, as the ledgers of a tenant do
+            cache_key = await cache.scoped_key(
+                f"did_resolver_not_found::{did}", profile.settings.get("wallet.id")
+            )
+            if is_negative_entry(await cache.get(cache_key)):
+                raise DIDNotFound(f"DID {did} could not be resolved (cached)")
         for resolver in await self._match_did_to_resolver(profile, did):
             try:
                 LOGGER.debug("Resolving DID %s with %s", did, resolver)
@@ -64,6 +72,8 @@ class DIDResolver:
             except DIDNotFound:
                 LOGGER.debug("DID %s not found by resolver %s", did, resolver)
 
+        if cache:
+            await cache.set_negative(cache_key)
         raise DIDNotFound(f"DID {did} could not be resolved")
 
     async def resolve(
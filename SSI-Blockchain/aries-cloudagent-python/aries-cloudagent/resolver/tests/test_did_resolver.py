@@ -9,6 +9,9 @@ import pytest
 from asynctest import mock as async_mock
 from pydid import DID, DIDDocument, VerificationMethod
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
 from ..base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -96,7 +99,7 @@ def resolver():
 
 @pytest.fixture
 def profile():
-    yield async_mock.MagicMock()
+    yield InMemoryProfile.test_profile()
 
 
 def test_create_resolver(resolver):
@@ -196,3 +199,28 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver([cowsay_resolver_not_found])
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+@pytest.mark.asyncio
+async def test_resolve_did_x_not_found_cached(profile):
+    cache = InMemoryCache()
+    cache.negative_ttl = 10
+    profile.context.injector.bind_instance(BaseCache, cache)
+    py_did = DID("did:cowsay:EiDahaOGH-liLLdDtTxEAdc8i-cfCz-WUcQdRJheMVNn3A")
+    cowsay_resolver_not_found = MockResolver(["cowsay"], resolved=DIDNotFound())
+    resolver = DIDResolver([cowsay_resolver_not_found])
+    with pytest.raises(DIDNotFound):
+        await resolver.resolve(profile, py_did)
+    with async_mock.patch.object(
+        cowsay_resolver_not_found, "resolve", async_mock.CoroutineMock()
+    ) as mock_resolve:
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(profile, py_did)
+        mock_resolve.assert_not_called()
+
+        # the result is not shared with other wallets
+        sub_wallet = InMemoryProfile.test_profile(
+            {"wallet.id": "sub-wallet-id"}, bind={BaseCache: cache}
+        )
+        await resolver.resolve(sub_wallet, py_did)
+        mock_resolve.assert_awaited_once()
@@ -0,0 +1 @@
+"""Retention of completed exchange records."""
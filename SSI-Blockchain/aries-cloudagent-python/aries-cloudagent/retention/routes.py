@@ -0,0 +1,81 @@
+"""Record retention admin routes."""
+
+from aiohttp import web
+from aiohttp_apispec import docs, response_schema
+from marshmallow import fields
+
+from ..admin.request_context import AdminRequestContext
+from ..messaging.models.openapi import OpenAPISchema
+from ..storage.error import StorageError
+from .service import RetentionService
+
+
+class RetentionReportSchema(OpenAPISchema):
+    """Result schema for a retention dry-run report."""
+
+    results = fields.Dict(
+        description=(
+            "Records scanned and expired under each retention policy, by record type"
+        ),
+        required=True,
+    )
+    stats = fields.Dict(
+        description="Retention policies and metrics of the background sweep",
+        required=True,
+    )
+
+
+@docs(
+    tags=["retention"],
+    summary="Report the records which the retention policies would remove",
+)
+@response_schema(RetentionReportSchema(), 200, description="")
+async def retention_report(request: web.BaseRequest):
+    """
+    Request handler for a retention dry-run report.
+
+    The report covers the base wallet, which is the only one swept by the
+    retention service.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The dry-run results and the retention metrics
+
+    """
+    context: AdminRequestContext = request["context"]
+    service = context.inject_or(RetentionService)
+    if not service:
+        raise web.HTTPNotFound(reason="No retention policies are configured")
+    if context.profile.settings.get("wallet.id"):
+        raise web.HTTPForbidden(
+            reason="Retention policies only apply to the base wallet"
+        )
+
+    try:
+        results = await service.sweep(context.profile, dry_run=True)
+    except StorageError as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+    return web.json_response({"results": results, "stats": service.stats})
+
+
+async def register(app: web.Application):
+    """Register routes."""
+
+    app.add_routes([web.get("/retention/report", retention_report, allow_head=False)])
+
+
+def post_process_routes(app: web.Application):
+    """Amend swagger API."""
+
+    # Add top-level tags description
+    if "tags" not in app._state["swagger_dict"]:
+        app._state["swagger_dict"]["tags"] = []
+    app._state["swagger_dict"]["tags"].append(
+        {
+            "name": "retention",
+            "description": "Retention of completed exchange records",
+        }
+    )
@@ -0,0 +1,413 @@
+"""Background service removing completed exchange records from storage."""
+
+import asyncio
+import logging
+import time
+from typing import Mapping, Optional, Sequence
+
+from ..core.error import BaseError
+from ..core.profile import Profile, ProfileSession
+from ..messaging.util import str_to_epoch
+from ..protocols.endorse_transaction.v1_0.models.transaction_record import (
+    TransactionRecord,
+)
+from ..protocols.issue_credential.v1_0.models.credential_exchange import (
+    V10CredentialExchange,
+)
+from ..protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
+from ..protocols.out_of_band.v1_0.models.oob_record import OobRecord
+from ..protocols.present_proof.v1_0.models.presentation_exchange import (
+    V10PresentationExchange,
+)
+from ..protocols.present_proof.v2_0.models.pres_exchange import V20PresExRecord
+from ..storage.error import StorageNotFoundError
+from ..utils.classloader import ClassLoader
+from ..utils.task_queue import TaskPriority, TaskQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Supported record types, with their record class and terminal states
+RETENTION_RECORD_TYPES = {
+    V10CredentialExchange.RECORD_TYPE: (
+        V10CredentialExchange,
+        (
+            V10CredentialExchange.STATE_ACKED,
+            V10CredentialExchange.STATE_CREDENTIAL_REVOKED,
+            V10CredentialExchange.STATE_ABANDONED,
+        ),
+    ),
+    V20CredExRecord.RECORD_TYPE: (
+        V20CredExRecord,
+        (
+            V20CredExRecord.STATE_DONE,
+            V20CredExRecord.STATE_CREDENTIAL_REVOKED,
+            V20CredExRecord.STATE_ABANDONED,
+        ),
+    ),
+    V10PresentationExchange.RECORD_TYPE: (
+        V10PresentationExchange,
+        (
+            V10PresentationExchange.STATE_VERIFIED,
+            V10PresentationExchange.STATE_PRESENTATION_ACKED,
+            V10PresentationExchange.STATE_ABANDONED,
+        ),
+    ),
+    V20PresExRecord.RECORD_TYPE: (
+        V20PresExRecord,
+        (V20PresExRecord.STATE_DONE, V20PresExRecord.STATE_ABANDONED),
+    ),
+    OobRecord.RECORD_TYPE: (
+        OobRecord,
+        (OobRecord.STATE_DONE, OobRecord.STATE_ACCEPTED, OobRecord.STATE_NOT_ACCEPTED),
+    ),
+    TransactionRecord.RECORD_TYPE: (
+        TransactionRecord,
+        (
+            TransactionRecord.STATE_TRANSACTION_ACKED,
+            TransactionRecord.STATE_TRANSACTION_REFUSED,
+            TransactionRecord.STATE_TRANSACTION_CANCELLED,
+        ),
+    ),
+}
+
+# Record types removed through their protocol manager, with the delete method
+RETENTION_MANAGERS = {
+    "cred_ex_v20": (
+        "aries_cloudagent.protocols.issue_credential.v2_0.manager.V20CredManager",
+        "delete_cred_ex_record",
+    ),
+}
+
+
+class RetentionError(BaseError):
+    """Retention configuration or processing error."""
+
+
+class RetentionPolicy:
+    """Retention limits applied to one record type."""
+
+    def __init__(
+        self,
+        record_type: str,
+        max_age: Optional[float] = None,
+        max_count: Optional[int] = None,
+        terminal_only: bool = True,
+    ):
+        """
+        Initialize a `RetentionPolicy` instance.
+
+        Args:
+            record_type: the record type the policy applies to
+            max_age: number of seconds after its last update that a record
+                is removed
+            max_count: the number of most recently updated records to keep
+            terminal_only: only consider records in a terminal state
+
+        """
+        if record_type not in RETENTION_RECORD_TYPES:
+            raise RetentionError(f"Unsupported retention record type: {record_type}")
+        if max_age is None and max_count is None:
+            raise RetentionError(
+                f"Retention policy for {record_type} needs max_age or max_count"
+            )
+        self.record_type = record_type
+        self.max_age = max_age
+        self.max_count = max_count
+        self.terminal_only = terminal_only
+
+    @classmethod
+    def from_settings(cls, record_type: str, settings: Mapping) -> "RetentionPolicy":
+        """Create a policy from its `retention.policies` settings entry."""
+        return cls(
+            record_type,
+            max_age=settings.get("max_age"),
+            max_count=settings.get("max_count"),
+            terminal_only=settings.get("terminal_only", True),
+        )
+
+    @property
+    def terminal_states(self) -> Sequence[str]:
+        """Accessor for the terminal states of the record type."""
+        return RETENTION_RECORD_TYPES[self.record_type][1]
+
+    def load_record_class(self):
+        """Accessor for the record class of the record type."""
+        return RETENTION_RECORD_TYPES[self.record_type][0]
+
+    async def delete_record(self, session: ProfileSession, record_id: str):
+        """
+        Remove a stored record through its usual delete path.
+
+        Related records are removed along with it, and deletion events are
+        emitted.
+
+        Args:
+            session: the session or transaction to use
+            record_id: the identifier of the record to remove
+
+        Raises:
+            StorageNotFoundError: if the record no longer exists
+
+        """
+        if self.record_type in RETENTION_MANAGERS:
+            manager_path, method = RETENTION_MANAGERS[self.record_type]
+            manager = ClassLoader.load_class(manager_path)(session.profile)
+            await getattr(manager, method)(record_id, session=session)
+        else:
+            record = await self.load_record_class().retrieve_by_id(
+                session, record_id, for_update=True
+            )
+            await record.delete_record(session)
+
+    def serialize(self) -> dict:
+        """Return a dict representation of the policy."""
+        return {
+            "max_age": self.max_age,
+            "max_count": self.max_count,
+            "terminal_only": self.terminal_only,
+        }
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(record_type={}, max_age={}, max_count={})>".format(
+            self.__class__.__name__, self.record_type, self.max_age, self.max_count
+        )
+
+
+class RetentionService:
+    """
+    Periodically remove completed exchange records according to policies.
+
+    Candidate records are streamed from storage a page at a time and only
+    their ids and update times are retained while the expired set is
+    determined. Expired records are then deleted in batches, with a bounded
+    number of batches in flight. Each batch is one transaction, in which
+    every record is removed through its usual delete path.
+
+    Only the profile passed in is swept: the sub-wallets of a multitenant
+    agent are not.
+    """
+
+    def __init__(
+        self,
+        policies: Sequence[RetentionPolicy],
+        interval: float = 3600.0,
+        batch_size: int = 100,
+        concurrency: int = 2,
+    ):
+        """
+        Initialize a `RetentionService` instance.
+
+        Args:
+            policies: the retention policies to apply
+            interval: number of seconds between sweeps
+            batch_size: the number of records deleted per transaction
+            concurrency: the maximum number of delete batches in flight
+
+        """
+        self.policies = {policy.record_type: policy for policy in policies}
+        self.interval = interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.metrics = {
+            record_type: {"scanned": 0, "deleted": 0, "failed": 0}
+            for record_type in self.policies
+        }
+        self.sweeps = 0
+        self.last_sweep = None
+        self.last_duration = None
+        self.task_queue: TaskQueue = None
+        self._task: asyncio.Task = None
+
+    @classmethod
+    def from_settings(cls, settings: Mapping) -> Optional["RetentionService"]:
+        """Create the service from settings, if any policies are configured."""
+        policies = settings.get("retention.policies")
+        if not policies:
+            return None
+        return cls(
+            [
+                RetentionPolicy.from_settings(record_type, policy)
+                for record_type, policy in policies.items()
+            ],
+            interval=settings.get("retention.interval", 3600.0),
+            batch_size=settings.get("retention.batch_size", 100),
+            concurrency=settings.get("retention.concurrency", 2),
+        )
+
+    async def select_expired(
+        self, profile: Profile, policy: RetentionPolicy, now: float = None
+    ) -> (int, Sequence[str]):
+        """
+        Find the records which have exceeded the limits of a policy.
+
+        Returns:
+            A tuple of the number of records scanned and the ids of the
+            records to remove, oldest first
+
+        """
+        record_cls = policy.load_record_class()
+        post_filter = (
+            {"state": list(policy.terminal_states)} if policy.terminal_only else None
+        )
+        candidates = []
+        async with profile.session() as session:
+            async for view in record_cls.iter_query(
+                session,
+                post_filter_positive=post_filter,
+                alt=True,
+                page_size=self.batch_size,
+                projection=("created_at", "updated_at"),
+            ):
+                updated = view["updated_at"] or view["created_at"]
+                candidates.append(
+                    (
+                        str_to_epoch(updated) if updated else 0,
+                        view[record_cls.RECORD_ID_NAME],
+                    )
+                )
+        candidates.sort(reverse=True)
+
+        cutoff = None
+        if policy.max_age is not None:
+            cutoff = (time.time() if now is None else now) - policy.max_age
+        expired = [
+            record_id
+            for (rank, (updated, record_id)) in enumerate(candidates)
+            if (policy.max_count is not None and rank >= policy.max_count)
+            or (cutoff is not None and updated < cutoff)
+        ]
+        expired.reverse()
+        return len(candidates), expired
+
+    async def _delete_batch(
+        self, profile: Profile, policy: RetentionPolicy, record_ids: Sequence[str]
+    ) -> int:
+        """Delete one batch of records, returning the number removed."""
+        deleted = 0
+        async with profile.transaction() as txn:
+            for record_id in record_ids:
+                try:
+                    await policy.delete_record(txn, record_id)
+                    deleted += 1
+                except StorageNotFoundError:
+                    pass  # removed concurrently
+            await txn.commit()
+        return deleted
+
+    async def apply_policy(
+        self, profile: Profile, policy: RetentionPolicy, dry_run: bool = False
+    ) -> dict:
+        """
+        Apply a single retention policy to a profile.
+
+        Args:
+            profile: the profile to sweep
+            policy: the retention policy to apply
+            dry_run: only report the records which would be removed
+
+        Returns:
+            A dict reporting the records scanned, expired and deleted
+
+        """
+        scanned, expired = await self.select_expired(profile, policy)
+        result = {"scanned": scanned, "expired": len(expired), "deleted": 0}
+        if dry_run or not expired:
+            return result
+
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def delete_batch(record_ids: Sequence[str]) -> int:
+            async with limit:
+                delete = self._delete_batch(profile, policy, record_ids)
+                if self.task_queue:
+                    # run behind message handling in the shared task queue
+                    task = await self.task_queue.put(delete, priority=TaskPriority.LOW)
+                    return await task
+                return await delete
+
+        batches = []
+        for start in range(0, len(expired), self.batch_size):
+            end = start + self.batch_size
+            batches.append(delete_batch(expired[start:end]))
+        outcomes = await asyncio.gather(*batches, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                LOGGER.error(
+                    "Error removing expired %s records: %s",
+                    policy.record_type,
+                    outcome,
+                )
+            else:
+                result["deleted"] += outcome
+        result["failed"] = result["expired"] - result["deleted"]
+        metrics = self.metrics[policy.record_type]
+        metrics["scanned"] += scanned
+        metrics["deleted"] += result["deleted"]
+        metrics["failed"] += result["failed"]
+        return result
+
+    async def sweep(self, profile: Profile, dry_run: bool = False) -> dict:
+        """
+        Apply all retention policies to a profile.
+
+        Args:
+            profile: the profile to sweep
+            dry_run: only report the records which would be removed
+
+        Returns:
+            A dict of per record type results
+
+        """
+        started = time.perf_counter()
+        results = {}
+        for record_type, policy in self.policies.items():
+            results[record_type] = await self.apply_policy(profile, policy, dry_run)
+        if not dry_run:
+            self.sweeps += 1
+            self.last_sweep = time.time()
+            self.last_duration = time.perf_counter() - started
+            LOGGER.info(
+                "Retention sweep completed in %.3fs: %s", self.last_duration, results
+            )
+        return results
+
+    async def _run(self, profile: Profile):
+        """Sweep the profile until cancelled."""
+        while True:
+            try:
+                await self.sweep(profile)
+            except Exception:
+                LOGGER.exception("Error running retention sweep")
+            await asyncio.sleep(self.interval)
+
+    def start(self, profile: Profile):
+        """Start sweeping the profile in the background."""
+        if not self._task or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run(profile))
+
+    async def stop(self):
+        """Stop the background sweep."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the retention policies and metrics."""
+        return {
+            "sweeps": self.sweeps,
+            "last_sweep": self.last_sweep,
+            "last_duration": self.last_duration,
+            "record_types": {
+                record_type: {
+                    "policy": policy.serialize(),
+                    **self.metrics[record_type],
+                }
+                for record_type, policy in self.policies.items()
+            },
+        }
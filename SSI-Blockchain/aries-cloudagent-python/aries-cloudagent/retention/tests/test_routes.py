@@ -0,0 +1,79 @@
+from asynctest import mock as async_mock, TestCase as AsyncTestCase
+
+from ...core.in_memory import InMemoryProfile
+from ...storage.error import StorageError
+
+from .. import routes as test_module
+from ..service import RetentionPolicy, RetentionService
+
+
+class TestRetentionRoutes(AsyncTestCase):
+    def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.context = self.profile.context
+        setattr(self.context, "profile", self.profile)
+
+        self.request_dict = {"context": self.context}
+        self.request = async_mock.MagicMock(
+            app={},
+            match_info={},
+            query={},
+            __getitem__=lambda _, k: self.request_dict[k],
+        )
+
+    async def test_retention_report(self):
+        service = RetentionService([RetentionPolicy("oob_record", max_age=60)])
+        self.context.injector.bind_instance(RetentionService, service)
+
+        with async_mock.patch.object(
+            test_module.web, "json_response", async_mock.Mock()
+        ) as json_response:
+            result = await test_module.retention_report(self.request)
+            json_response.assert_called_once_with(
+                {
+                    "results": {
+                        "oob_record": {"scanned": 0, "expired": 0, "deleted": 0}
+                    },
+                    "stats": service.stats,
+                }
+            )
+            assert result is json_response.return_value
+        assert service.sweeps == 0
+
+    async def test_retention_report_not_configured(self):
+        with self.assertRaises(test_module.web.HTTPNotFound):
+            await test_module.retention_report(self.request)
+
+    async def test_retention_report_sub_wallet(self):
+        service = RetentionService([RetentionPolicy("oob_record", max_age=60)])
+        self.context.injector.bind_instance(RetentionService, service)
+        self.context.update_settings({"wallet.id": "sub-wallet-id"})
+
+        with async_mock.patch.object(
+            service, "sweep", async_mock.CoroutineMock()
+        ) as mock_sweep:
+            with self.assertRaises(test_module.web.HTTPForbidden):
+                await test_module.retention_report(self.request)
+            mock_sweep.assert_not_called()
+
+    async def test_retention_report_storage_error(self):
+        service = RetentionService([RetentionPolicy("oob_record", max_age=60)])
+        self.context.injector.bind_instance(RetentionService, service)
+
+        with async_mock.patch.object(
+            service, "sweep", async_mock.CoroutineMock(side_effect=StorageError())
+        ):
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.retention_report(self.request)
+
+    async def test_register(self):
+        mock_app = async_mock.MagicMock()
+        mock_app.add_routes = async_mock.MagicMock()
+
+        await test_module.register(mock_app)
+        mock_app.add_routes.assert_called_once()
+
+    async def test_post_process_routes(self):
+        mock_app = async_mock.MagicMock(_state={"swagger_dict": {}})
+        test_module.post_process_routes(mock_app)
+        assert "tags" in mock_app._state["swagger_dict"]
@@ -0,0 +1,208 @@
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...messaging.models import base_record
+from ...protocols.didcomm_prefix import DIDCommPrefix
+from ...protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
+from ...protocols.issue_credential.v2_0.models.detail.indy import V20CredExRecordIndy
+from ...protocols.out_of_band.v1_0.messages.invitation import (
+    HSProto,
+    InvitationMessage,
+)
+from ...protocols.out_of_band.v1_0.models.oob_record import OobRecord
+from ...storage.error import StorageNotFoundError
+from ...utils.task_queue import TaskQueue
+
+from .. import service as test_module
+from ..service import RetentionError, RetentionPolicy, RetentionService
+
+
+class TestRetentionService(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.records = []
+        async with self.profile.session() as session:
+            for index in range(6):
+                record = V20CredExRecord(
+                    state=(
+                        V20CredExRecord.STATE_DONE
+                        if index % 3
+                        else V20CredExRecord.STATE_OFFER_SENT
+                    ),
+                    thread_id=f"thread-{index}",
+                )
+                with async_mock.patch.object(
+                    base_record, "time_now", lambda: f"2022-01-0{index + 1}T00:00:00Z"
+                ):
+                    await record.save(session)
+                self.records.append(record)
+
+    async def stored_ids(self):
+        async with self.profile.session() as session:
+            return {record._id for record in await V20CredExRecord.query(session)}
+
+    def test_policy(self):
+        policy = RetentionPolicy.from_settings("cred_ex_v20", {"max_count": 5})
+        assert policy.serialize() == {
+            "max_age": None,
+            "max_count": 5,
+            "terminal_only": True,
+        }
+        assert "done" in policy.terminal_states
+        assert policy.load_record_class() is V20CredExRecord
+        assert "cred_ex_v20" in repr(policy)
+
+        with self.assertRaises(RetentionError):
+            RetentionPolicy("unknown", max_age=10)
+        with self.assertRaises(RetentionError):
+            RetentionPolicy("cred_ex_v20")
+
+    def test_from_settings(self):
+        assert RetentionService.from_settings({}) is None
+        service = RetentionService.from_settings(
+            {
+                "retention.policies": {"cred_ex_v20": {"max_age": 60}},
+                "retention.batch_size": 10,
+            }
+        )
+        assert service.policies["cred_ex_v20"].max_age == 60
+        assert service.batch_size == 10
+        assert service.concurrency == 2
+
+    async def test_select_expired_max_age(self):
+        service = RetentionService([])
+        policy = RetentionPolicy("cred_ex_v20", max_age=86400)
+        scanned, expired = await service.select_expired(
+            self.profile,
+            policy,
+            now=test_module.str_to_epoch("2022-01-05T12:00:00Z"),
+        )
+        # only terminal records updated more than a day before are expired
+        assert scanned == 4
+        assert expired == [self.records[1]._id, self.records[2]._id]
+
+    async def test_select_expired_max_count(self):
+        service = RetentionService([], batch_size=2)
+        policy = RetentionPolicy("cred_ex_v20", max_count=1, terminal_only=False)
+        scanned, expired = await service.select_expired(self.profile, policy)
+        assert scanned == 6
+        assert expired == [record._id for record in self.records[:5]]
+
+    async def test_sweep(self):
+        service = RetentionService(
+            [RetentionPolicy("cred_ex_v20", max_count=1)],
+            batch_size=1,
+            concurrency=2,
+        )
+
+        results = await service.sweep(self.profile, dry_run=True)
+        assert results == {"cred_ex_v20": {"scanned": 4, "expired": 3, "deleted": 0}}
+        assert len(await self.stored_ids()) == 6
+        assert service.sweeps == 0
+
+        results = await service.sweep(self.profile)
+        assert results == {
+            "cred_ex_v20": {"scanned": 4, "expired": 3, "deleted": 3, "failed": 0}
+        }
+        assert await self.stored_ids() == {
+            self.records[index]._id for index in (0, 3, 5)
+        }
+        assert service.sweeps == 1
+        stats = service.stats
+        assert stats["record_types"]["cred_ex_v20"]["deleted"] == 3
+        assert stats["record_types"]["cred_ex_v20"]["policy"]["max_count"] == 1
+
+    async def test_sweep_task_queue(self):
+        service = RetentionService(
+            [RetentionPolicy("cred_ex_v20", max_count=1)], batch_size=2
+        )
+        service.task_queue = TaskQueue()
+
+        results = await service.sweep(self.profile)
+        assert results["cred_ex_v20"]["deleted"] == 3
+        assert service.task_queue.priority_stats["low"]["done"] == 2
+
+    async def test_sweep_concurrent_delete(self):
+        service = RetentionService(
+            [RetentionPolicy("cred_ex_v20", max_count=1)], batch_size=5
+        )
+        select_expired = service.select_expired
+
+        async def select_then_delete(profile, policy):
+            # simulate another flow removing a record after it was selected
+            scanned, expired = await select_expired(profile, policy)
+            async with profile.session() as session:
+                record = await V20CredExRecord.retrieve_by_id(session, expired[0])
+                await record.delete_record(session)
+            return scanned, expired
+
+        with async_mock.patch.object(service, "select_expired", select_then_delete):
+            results = await service.sweep(self.profile)
+
+        assert results["cred_ex_v20"]["deleted"] == 2
+        assert await self.stored_ids() == {
+            self.records[index]._id for index in (0, 3, 5)
+        }
+
+    async def test_sweep_delete_path(self):
+        service = RetentionService(
+            [
+                RetentionPolicy("cred_ex_v20", max_count=1),
+                RetentionPolicy("oob_record", max_age=0, terminal_only=False),
+            ]
+        )
+        async with self.profile.session() as session:
+            for record in self.records:
+                await V20CredExRecordIndy(cred_ex_id=record._id).save(session)
+            oob_record = OobRecord(
+                state=OobRecord.STATE_DONE,
+                invi_msg_id="test-invi-msg-id",
+                invitation=InvitationMessage(
+                    handshake_protocols=[
+                        DIDCommPrefix.qualify_current(HSProto.RFC23.name)
+                    ]
+                ),
+                role=OobRecord.ROLE_SENDER,
+            )
+            await oob_record.save(session)
+
+        with async_mock.patch.object(
+            OobRecord,
+            "delete_record",
+            autospec=True,
+            side_effect=OobRecord.delete_record,
+        ) as mock_oob_delete, async_mock.patch.object(
+            self.profile, "notify", async_mock.CoroutineMock()
+        ) as mock_notify:
+            results = await service.sweep(self.profile)
+
+        assert results["cred_ex_v20"]["deleted"] == 3
+        assert results["oob_record"]["deleted"] == 1
+        mock_oob_delete.assert_called_once()
+        # a deletion event for each exchange and the oob record
+        assert mock_notify.call_count == 4
+        # detail records of removed exchanges are removed along with them
+        async with self.profile.session() as session:
+            details = await V20CredExRecordIndy.query(session)
+        assert {detail.cred_ex_id for detail in details} == await self.stored_ids()
+
+    async def test_sweep_batch_error(self):
+        service = RetentionService([RetentionPolicy("cred_ex_v20", max_count=1)])
+        with async_mock.patch.object(
+            service, "_delete_batch", async_mock.CoroutineMock()
+        ) as mock_delete:
+            mock_delete.side_effect = StorageNotFoundError()
+            results = await service.sweep(self.profile)
+        assert results["cred_ex_v20"]["failed"] == 3
+        assert service.metrics["cred_ex_v20"]["failed"] == 3
+
+    async def test_start_stop(self):
+        service = RetentionService([RetentionPolicy("cred_ex_v20", max_count=1)])
+        with async_mock.patch.object(
+            service, "sweep", async_mock.CoroutineMock()
+        ) as mock_sweep:
+            service.start(self.profile)
+            await test_module.asyncio.sleep(0)
+            mock_sweep.assert_awaited_once_with(self.profile)
+            await service.stop()
+        assert service._task is None
@@ -10,6 +10,7 @@ from ..protocols.revocation_notification.v1_0.models.rev_notification_record imp
 from ..core.error import BaseError
 from ..core.profile import Profile
 from ..indy.issuer import IndyIssuer
+from ..messaging.models.base_record import BaseRecord
 from ..storage.error import StorageNotFoundError
 from .indy import IndyRevocation
 from .models.issuer_cred_rev_record import IssuerCredRevRecord
@@ -303,6 +304,9 @@ class RevocationManager:
         """
         Update credentials state to credential_revoked.
 
+        All the credentials are updated in a single transaction, holding locks
+        on their records until it commits; if any update fails, none is saved.
+
         Args:
             rev_reg_id: revocation registry ID
             cred_rev_ids: list of credential revocation IDs
@@ -311,36 +315,36 @@ class RevocationManager:
             None
 
         """
-        for cred_rev_id in cred_rev_ids:
-            cred_ex_id = None
+        if not cred_rev_ids:
+            return
 
-            try:
-                async with self._profile.transaction() as txn:
-                    rev_rec = await IssuerCredRevRecord.retrieve_by_ids(
-                        txn, rev_reg_id, cred_rev_id, for_update=True
-                    )
-                    cred_ex_id = rev_rec.cred_ex_id
-                    cred_ex_version = rev_rec.cred_ex_version
-                    rev_rec.state = IssuerCredRevRecord.STATE_REVOKED
-                    await rev_rec.save(txn, reason="revoke credential")
-                    await txn.commit()
-            except StorageNotFoundError:
-                continue
+        async with self._profile.transaction() as txn:
+            rev_recs = await IssuerCredRevRecord.query(
+                txn,
+                {
+                    "rev_reg_id": rev_reg_id,
+                    "cred_rev_id": {"$in": [str(crid) for crid in cred_rev_ids]},
+                },
+                for_update=True,
+            )
+            for rev_rec in rev_recs:
+                rev_rec.state = IssuerCredRevRecord.STATE_REVOKED
 
-            async with self._profile.transaction() as txn:
+            cred_ex_records = []
+            for rev_rec in rev_recs:
+                cred_ex_version = rev_rec.cred_ex_version
                 if (
                     not cred_ex_version
                     or cred_ex_version == IssuerCredRevRecord.VERSION_1
                 ):
                     try:
                         cred_ex_record = await V10CredentialExchange.retrieve_by_id(
-                            txn, cred_ex_id, for_update=True
+                            txn, rev_rec.cred_ex_id, for_update=True
                         )
                         cred_ex_record.state = (
                             V10CredentialExchange.STATE_CREDENTIAL_REVOKED
                         )
-                        await cred_ex_record.save(txn, reason="revoke credential")
-                        await txn.commit()
+                        cred_ex_records.append(cred_ex_record)
                         continue  # skip 2.0 record check
                     except StorageNotFoundError:
                         pass
@@ -351,10 +355,15 @@ class RevocationManager:
                 ):
                     try:
                         cred_ex_record = await V20CredExRecord.retrieve_by_id(
-                            txn, cred_ex_id, for_update=True
+                            txn, rev_rec.cred_ex_id, for_update=True
                         )
                         cred_ex_record.state = V20CredExRecord.STATE_CREDENTIAL_REVOKED
-                        await cred_ex_record.save(txn, reason="revoke credential")
-                        await txn.commit()
+                        cred_ex_records.append(cred_ex_record)
                     except StorageNotFoundError:
                         pass
+
+            # the batch mixes record types, so save through the base class
+            await BaseRecord.save_all(
+                txn, rev_recs + cred_ex_records, reason="revoke credential"
+            )
+            await txn.commit()
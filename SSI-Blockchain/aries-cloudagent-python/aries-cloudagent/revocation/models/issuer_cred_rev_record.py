@@ -1,6 +1,6 @@
 """Issuer credential revocation information."""
 
-from typing import Any, Sequence
+from typing import Any, Sequence, Union
 
 from marshmallow import fields
 
@@ -73,7 +73,8 @@ class IssuerCredRevRecord(BaseRecord):
         cred_def_id: str = None,
         rev_reg_id: str = None,
         state: str = None,
-    ) -> Sequence["IssuerCredRevRecord"]:
+        projection: Sequence[str] = None,
+    ) -> Sequence[Union["IssuerCredRevRecord", dict]]:
         """Retrieve issuer cred rev records by cred def id and/or rev reg id.
 
         Args:
@@ -81,6 +82,7 @@ class IssuerCredRevRecord(BaseRecord):
             cred_def_id: the cred def id by which to filter
             rev_reg_id: the rev reg id by which to filter
             state: a state value by which to filter
+            projection: the fields to return as dict views instead of records
         """
         tag_filter = {
             **{"cred_def_id": cred_def_id for _ in [""] if cred_def_id},
@@ -88,7 +90,7 @@ class IssuerCredRevRecord(BaseRecord):
             **{"state": state for _ in [""] if state},
         }
 
-        return await cls.query(session, tag_filter)
+        return await cls.query(session, tag_filter, projection=projection)
 
     @classmethod
     async def retrieve_by_ids(
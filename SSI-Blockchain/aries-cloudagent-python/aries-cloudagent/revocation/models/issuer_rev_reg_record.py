@@ -362,14 +362,16 @@ class IssuerRevRegRecord(BaseRecord):
         applied_txn = {}
         async with profile.session() as session:
             recs = await IssuerCredRevRecord.query_by_ids(
-                session, rev_reg_id=self.revoc_reg_id
+                session,
+                rev_reg_id=self.revoc_reg_id,
+                projection=("state", "cred_rev_id"),
             )
 
             revoked_ids = []
             for rec in recs:
-                if rec.state == IssuerCredRevRecord.STATE_REVOKED:
-                    revoked_ids.append(int(rec.cred_rev_id))
-                    if int(rec.cred_rev_id) not in rev_reg_delta["value"]["revoked"]:
+                if rec["state"] == IssuerCredRevRecord.STATE_REVOKED:
+                    revoked_ids.append(int(rec["cred_rev_id"]))
+                    if int(rec["cred_rev_id"]) not in rev_reg_delta["value"]["revoked"]:
                         # await rec.set_state(session, IssuerCredRevRecord.STATE_ISSUED)
                         rec_count += 1
 
@@ -27,6 +27,13 @@ from ..ledger.error import LedgerError
 from ..messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from ..messaging.models.base import BaseModelError
 from ..messaging.models.openapi import OpenAPISchema
+from ..messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+    paginated_response,
+    query_paginated,
+)
 from ..messaging.responder import BaseResponder
 from ..messaging.valid import (
     INDY_CRED_DEF_ID,
@@ -50,6 +57,7 @@ from ..protocols.endorse_transaction.v1_0.util import (
 )
 from ..storage.base import BaseStorage
 from ..storage.error import StorageError, StorageNotFoundError
+from ..utils.task_queue import TaskPriority, task_priority
 
 from .error import RevocationError, RevocationNotSupportedError
 from .indy import IndyRevocation
@@ -305,7 +313,7 @@ class RevRegWalletUpdatedResultSchema(OpenAPISchema):
     )
 
 
-class RevRegsCreatedSchema(OpenAPISchema):
+class RevRegsCreatedSchema(PaginatedResultSchema):
     """Result schema for request for revocation registries created."""
 
     rev_reg_ids = fields.List(
@@ -326,7 +334,7 @@ class RevRegUpdateTailsFileUriSchema(OpenAPISchema):
     )
 
 
-class RevRegsCreatedQueryStringSchema(OpenAPISchema):
+class RevRegsCreatedQueryStringSchema(PaginatedQuerySchema):
     """Query string parameters and validators for rev regs created request."""
 
     cred_def_id = fields.Str(
@@ -457,6 +465,7 @@ async def revoke(request: web.BaseRequest):
 @docs(tags=["revocation"], summary="Publish pending revocations to ledger")
 @request_schema(PublishRevocationsSchema())
 @response_schema(TxnOrPublishRevocationsResultSchema(), 200, description="")
+@task_priority(TaskPriority.LOW)
 async def publish_revocations(request: web.BaseRequest):
     """
     Request handler for publishing pending revocations to the ledger.
@@ -514,6 +523,7 @@ async def clear_pending_revocations(request: web.BaseRequest):
 @docs(tags=["revocation"], summary="Creates a new revocation registry")
 @request_schema(RevRegCreateRequestSchema())
 @response_schema(RevRegResultSchema(), 200, description="")
+@task_priority(TaskPriority.LOW)
 async def create_rev_reg(request: web.BaseRequest):
     """
     Request handler to create a new revocation registry.
@@ -579,24 +589,30 @@ async def rev_regs_created(request: web.BaseRequest):
     context: AdminRequestContext = request["context"]
 
     search_tags = [
-        tag for tag in vars(RevRegsCreatedQueryStringSchema)["_declared_fields"]
+        tag
+        for tag in vars(RevRegsCreatedQueryStringSchema)["_declared_fields"]
+        if tag not in vars(PaginatedQuerySchema)["_declared_fields"]
     ]
     tag_filter = {
         tag: request.query[tag] for tag in search_tags if tag in request.query
     }
+    limit, cursor = get_paginated_query_params(request)
     async with context.profile.session() as session:
-        found = await IssuerRevRegRecord.query(
+        found, next_cursor = await query_paginated(
+            IssuerRevRegRecord,
             session,
             tag_filter,
+            limit=limit,
+            cursor=cursor,
             post_filter_negative={"state": IssuerRevRegRecord.STATE_INIT},
         )
 
     return web.json_response(
-        {
-            "rev_reg_ids": [
-                record.revoc_reg_id for record in found if record.revoc_reg_id
-            ]
-        }
+        paginated_response(
+            [record.revoc_reg_id for record in found if record.revoc_reg_id],
+            next_cursor,
+            key="rev_reg_ids",
+        )
     )
 
 
@@ -656,9 +672,7 @@ async def get_rev_reg_issued_count(request: web.BaseRequest):
             await IssuerRevRegRecord.retrieve_by_revoc_reg_id(session, rev_reg_id)
         except StorageNotFoundError as err:
             raise web.HTTPNotFound(reason=err.roll_up) from err
-        count = len(
-            await IssuerCredRevRecord.query_by_ids(session, rev_reg_id=rev_reg_id)
-        )
+        count = await IssuerCredRevRecord.count(session, {"rev_reg_id": rev_reg_id})
 
     return web.json_response({"result": count})
 
@@ -923,6 +937,7 @@ async def get_tails_file(request: web.BaseRequest) -> web.FileResponse:
 )
 @match_info_schema(RevRegIdMatchInfoSchema())
 @response_schema(RevocationModuleResponseSchema(), description="")
+@task_priority(TaskPriority.LOW)
 async def upload_tails_file(request: web.BaseRequest):
     """
     Request handler to upload local tails file for revocation registry.
@@ -959,6 +974,7 @@ async def upload_tails_file(request: web.BaseRequest):
 @querystring_schema(CreateRevRegTxnForEndorserOptionSchema())
 @querystring_schema(RevRegConnIdMatchInfoSchema())
 @response_schema(TxnOrRevRegResultSchema(), 200, description="")
+@task_priority(TaskPriority.LOW)
 async def send_rev_reg_def(request: web.BaseRequest):
     """
     Request handler to send revocation registry definition by rev reg id to ledger.
@@ -1074,6 +1090,7 @@ async def send_rev_reg_def(request: web.BaseRequest):
 @querystring_schema(CreateRevRegTxnForEndorserOptionSchema())
 @querystring_schema(RevRegConnIdMatchInfoSchema())
 @response_schema(RevRegResultSchema(), 200, description="")
+@task_priority(TaskPriority.LOW)
 async def send_rev_reg_entry(request: web.BaseRequest):
     """
     Request handler to send rev reg entry by registry id to ledger.
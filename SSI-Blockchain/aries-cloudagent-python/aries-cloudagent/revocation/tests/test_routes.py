@@ -298,6 +298,39 @@ class TestRevocationRoutes(AsyncTestCase):
             mock_json_response.assert_called_once_with({"rev_reg_ids": ["dummy"]})
             assert result is mock_json_response.return_value
 
+    async def test_rev_regs_created_paginated(self):
+        CRED_DEF_ID = f"{self.test_did}:3:CL:1234:default"
+        self.request.query = {
+            "cred_def_id": CRED_DEF_ID,
+            "limit": "1",
+            "cursor": "some-cursor",
+        }
+
+        with async_mock.patch.object(
+            test_module.IssuerRevRegRecord, "query_page", async_mock.CoroutineMock()
+        ) as mock_query_page, async_mock.patch.object(
+            test_module.web, "json_response", async_mock.Mock()
+        ) as mock_json_response:
+            mock_query_page.return_value = (
+                [async_mock.MagicMock(revoc_reg_id="dummy")],
+                "next-cursor",
+            )
+
+            result = await test_module.rev_regs_created(self.request)
+            mock_query_page.assert_called_once_with(
+                async_mock.ANY,
+                {"cred_def_id": CRED_DEF_ID},
+                limit=1,
+                cursor="some-cursor",
+                post_filter_negative={
+                    "state": test_module.IssuerRevRegRecord.STATE_INIT
+                },
+            )
+            mock_json_response.assert_called_once_with(
+                {"rev_reg_ids": ["dummy"], "next_cursor": "next-cursor"}
+            )
+            assert result is mock_json_response.return_value
+
     async def test_get_rev_reg(self):
         REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
             self.test_did, self.test_did
@@ -354,14 +387,16 @@ class TestRevocationRoutes(AsyncTestCase):
             async_mock.CoroutineMock(),
         ) as mock_retrieve, async_mock.patch.object(
             test_module.IssuerCredRevRecord,
-            "query_by_ids",
-            async_mock.CoroutineMock(),
-        ) as mock_query, async_mock.patch.object(
+            "count",
+            async_mock.CoroutineMock(return_value=2),
+        ) as mock_count, async_mock.patch.object(
             test_module.web, "json_response", async_mock.Mock()
         ) as mock_json_response:
-            mock_query.return_value = return_value = [{"...": "..."}, {"...": "..."}]
             result = await test_module.get_rev_reg_issued_count(self.request)
 
+            mock_count.assert_awaited_once_with(
+                async_mock.ANY, {"rev_reg_id": REV_REG_ID}
+            )
             mock_json_response.assert_called_once_with({"result": 2})
             assert result is mock_json_response.return_value
 
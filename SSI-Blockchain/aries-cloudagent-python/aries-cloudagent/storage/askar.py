@@ -1,6 +1,7 @@
 """Aries-Askar implementation of BaseStorage interface."""
 
-from typing import Mapping, Sequence
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Sequence
 
 from aries_askar import AskarError, AskarErrorCode, Session
 
@@ -48,10 +49,12 @@ class AskarStorage(BaseStorage):
 
         """
         validate_record(record)
+        await self._insert(self._session.handle, record)
+
+    async def _insert(self, handle: Session, record: StorageRecord):
+        """Insert a validated record using a session handle."""
         try:
-            await self._session.handle.insert(
-                record.type, record.id, record.value, record.tags
-            )
+            await handle.insert(record.type, record.id, record.value, record.tags)
         except AskarError as err:
             if err.code == AskarErrorCode.DUPLICATE:
                 raise StorageDuplicateError(
@@ -115,8 +118,14 @@ class AskarStorage(BaseStorage):
 
         """
         validate_record(record)
+        await self._replace(self._session.handle, record, value, tags)
+
+    async def _replace(
+        self, handle: Session, record: StorageRecord, value: str, tags: Mapping
+    ):
+        """Replace the value and tags of a validated record using a session handle."""
         try:
-            await self._session.handle.replace(record.type, record.id, value, tags)
+            await handle.replace(record.type, record.id, value, tags)
         except AskarError as err:
             if err.code == AskarErrorCode.NOT_FOUND:
                 raise StorageNotFoundError("Record not found") from None
@@ -135,8 +144,12 @@ class AskarStorage(BaseStorage):
 
         """
         validate_record(record, delete=True)
+        await self._remove(self._session.handle, record)
+
+    async def _remove(self, handle: Session, record: StorageRecord):
+        """Remove a validated record using a session handle."""
         try:
-            await self._session.handle.remove(record.type, record.id)
+            await handle.remove(record.type, record.id)
         except AskarError as err:
             if err.code == AskarErrorCode.NOT_FOUND:
                 raise StorageNotFoundError(
@@ -145,6 +158,80 @@ class AskarStorage(BaseStorage):
             else:
                 raise StorageError("Error when removing storage record") from err
 
+    @asynccontextmanager
+    async def _batch(self) -> AsyncIterator[Session]:
+        """
+        Provide a transaction handle for a batch of writes.
+
+        The current session is used when it is already a transaction, in which
+        case committing is left to its owner. Otherwise a new transaction is
+        opened, committed if the batch succeeds and rolled back otherwise.
+        """
+        if self._session.is_transaction:
+            yield self._session.handle
+            return
+        profile = self._session.profile
+        try:
+            txn = await profile.store.transaction(profile.profile_id)
+        except AskarError as err:
+            raise StorageError("Error opening storage transaction") from err
+        try:
+            yield txn
+            try:
+                await txn.commit()
+            except AskarError as err:
+                raise StorageError("Error committing storage transaction") from err
+        finally:
+            await txn.close()
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            validate_record(record)
+        if not records:
+            return
+        async with self._batch() as txn:
+            for record in records:
+                await self._insert(txn, record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            validate_record(record)
+        if not records:
+            return
+        async with self._batch() as txn:
+            for record in records:
+                await self._replace(txn, record, record.value, record.tags)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+        if not records:
+            return
+        async with self._batch() as txn:
+            for record in records:
+                await self._remove(txn, record)
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping, options: Mapping = None
     ) -> StorageRecord:
@@ -183,6 +270,7 @@ class AskarStorage(BaseStorage):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
         for_update = bool(options and options.get("forUpdate"))
+        retrieve_value = not options or options.get("retrieveValue", True)
         results = []
         for row in await self._session.handle.fetch_all(
             type_filter, tag_query, for_update=for_update
@@ -191,12 +279,23 @@ class AskarStorage(BaseStorage):
                 StorageRecord(
                     type=row.category,
                     id=row.name,
-                    value=None if row.value is None else row.value.decode("utf-8"),
+                    value=(
+                        row.value.decode("utf-8")
+                        if retrieve_value and row.value is not None
+                        else None
+                    ),
                     tags=row.tags,
                 )
             )
         return results
 
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """Count the records matching a particular type filter and tag query."""
+        try:
+            return await self._session.handle.count(type_filter, tag_query)
+        except AskarError as err:
+            raise StorageError("Error when counting storage records") from err
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -262,11 +361,16 @@ class AskarStorageSearchSession(BaseStorageSearchSession):
             type_filter: Filter string
             tag_query: Tags to search
             page_size: Size of page to return
+            options: Dictionary of backend-specific options, supporting
+                `offset` to skip a number of leading results and
+                `retrieveValue` to leave out record values
 
         """
         self.tag_query = tag_query
         self.type_filter = type_filter
         self.page_size = page_size or DEFAULT_PAGE_SIZE
+        self.offset = (options or {}).get("offset") or None
+        self.retrieve_value = (options or {}).get("retrieveValue", True)
         self._done = False
         self._profile = profile
         self._scan = None
@@ -314,7 +418,11 @@ class AskarStorageSearchSession(BaseStorageSearchSession):
         return StorageRecord(
             type=row.category,
             id=row.name,
-            value=None if row.value is None else row.value.decode("utf-8"),
+            value=(
+                row.value.decode("utf-8")
+                if self.retrieve_value and row.value is not None
+                else None
+            ),
             tags=row.tags,
         )
 
@@ -352,7 +460,11 @@ class AskarStorageSearchSession(BaseStorageSearchSession):
                 StorageRecord(
                     type=row.category,
                     id=row.name,
-                    value=None if row.value is None else row.value.decode("utf-8"),
+                    value=(
+                        row.value.decode("utf-8")
+                        if self.retrieve_value and row.value is not None
+                        else None
+                    ),
                     tags=row.tags,
                 )
             )
@@ -368,11 +480,13 @@ class AskarStorageSearchSession(BaseStorageSearchSession):
         """Start the search query."""
         if self._scan:
             return
+        scan_args = {"offset": self.offset} if self.offset else {}
         try:
             self._scan = self._profile.store.scan(
                 self.type_filter,
                 self.tag_query,
                 profile=self._profile.settings.get("wallet.askar_profile"),
+                **scan_args,
             )
         except AskarError as err:
             raise StorageSearchError("Error opening search query") from err
@@ -74,6 +74,45 @@ class BaseStorage(ABC):
 
         """
 
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        Backends which support it add the records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            await self.add_record(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records with the value and tags they carry.
+
+        Backends which support it update the records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        Backends which support it delete the records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            await self.delete_record(record)
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping = None, options: Mapping = None
     ) -> StorageRecord:
@@ -101,7 +140,37 @@ class BaseStorage(ABC):
         tag_query: Mapping = None,
         options: Mapping = None,
     ):
-        """Retrieve all records matching a particular type filter and tag query."""
+        """
+        Retrieve all records matching a particular type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            options: Dictionary of backend-specific options, supporting
+                `retrieveValue` and `retrieveTags` to leave out record values
+                or tags which the caller does not need
+
+        """
+
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """
+        Count the records matching a particular type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+
+        Returns:
+            The number of matching records
+
+        """
+        return len(
+            await self.find_all_records(
+                type_filter,
+                tag_query,
+                options={"retrieveValue": False, "retrieveTags": False},
+            )
+        )
 
     @abstractmethod
     async def delete_all_records(
@@ -1,6 +1,8 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+import re
+from itertools import count
+from typing import Dict, Mapping, Sequence, Set, Tuple
 
 from ..core.in_memory import InMemoryProfile
 
@@ -31,6 +33,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
 
         """
         self.profile = profile
+        self.index = get_record_index(profile)
 
     async def add_record(self, record: StorageRecord):
         """
@@ -48,6 +51,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         if record.id in self.profile.records:
             raise StorageDuplicateError("Duplicate record")
         self.profile.records[record.id] = record
+        self.index.add(record)
 
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
@@ -89,7 +93,10 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         oldrec = self.profile.records.get(record.id)
         if not oldrec:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        self.profile.records[record.id] = oldrec._replace(value=value, tags=tags)
+        newrec = oldrec._replace(value=value, tags=tags)
+        self.profile.records[record.id] = newrec
+        self.index.remove(oldrec, keep_order=True)
+        self.index.add(newrec)
 
     async def delete_record(self, record: StorageRecord):
         """
@@ -105,7 +112,60 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         validate_record(record, delete=True)
         if record.id not in self.profile.records:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        del self.profile.records[record.id]
+        self.index.remove(self.profile.records.pop(record.id))
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        The records are checked before any is added, so that either all or
+        none of them are stored.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record)
+            if record.id in self.profile.records or record.id in ids:
+                raise StorageDuplicateError("Duplicate record")
+            ids.add(record.id)
+        for record in records:
+            self.profile.records[record.id] = record
+            self.index.add(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records with the value and tags they carry.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            validate_record(record)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record, delete=True)
+            if record.id not in self.profile.records or record.id in ids:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+            ids.add(record.id)
+        for record in records:
+            self.index.remove(self.profile.records.pop(record.id))
 
     async def find_all_records(
         self,
@@ -114,11 +174,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         options: Mapping = None,
     ):
         """Retrieve all records matching a particular type filter and tag query."""
-        results = []
-        for record in self.profile.records.values():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                results.append(record)
-        return results
+        return self.index.search(type_filter, tag_query)
 
     async def delete_all_records(
         self,
@@ -126,12 +182,8 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
-        ids = []
-        for record_id, record in self.profile.records.items():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                ids.append(record_id)
-        for record_id in ids:
-            del self.profile.records[record_id]
+        for record in self.index.search(type_filter, tag_query):
+            self.index.remove(self.profile.records.pop(record.id))
 
     def search_records(
         self,
@@ -158,6 +210,127 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         )
 
 
+class InMemoryRecordIndex:
+    """
+    Inverted tag index over the records of an in-memory profile.
+
+    Record ids are indexed by type and by (type, tag name, tag value), so
+    that equality, `$in`, `$and` and `$or` clauses are resolved with set
+    operations. Other clauses only narrow the search to the records having
+    the tag, and the candidates are then checked with `tag_query_match`.
+    """
+
+    def __init__(self, records: Mapping[str, StorageRecord] = None):
+        """Initialize the index, adding any existing records."""
+        self._seq = count()
+        self._order: Dict[str, int] = {}
+        self._records: Dict[str, StorageRecord] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_name: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_value: Dict[Tuple[str, str, str], Set[str]] = {}
+        for record in (records or {}).values():
+            self.add(record)
+
+    def add(self, record: StorageRecord):
+        """Index a stored record."""
+        record_id = record.id
+        if record_id not in self._order:
+            self._order[record_id] = next(self._seq)
+        self._records[record_id] = record
+        self._by_type.setdefault(record.type, set()).add(record_id)
+        for name, value in (record.tags or {}).items():
+            self._by_name.setdefault((record.type, name), set()).add(record_id)
+            if isinstance(value, str):
+                self._by_value.setdefault((record.type, name, value), set()).add(
+                    record_id
+                )
+
+    def remove(self, record: StorageRecord, keep_order: bool = False):
+        """Remove a stored record from the index."""
+        record_id = record.id
+        if not keep_order:
+            self._order.pop(record_id, None)
+        self._records.pop(record_id, None)
+        self._discard(self._by_type, record.type, record_id)
+        for name, value in (record.tags or {}).items():
+            self._discard(self._by_name, (record.type, name), record_id)
+            if isinstance(value, str):
+                self._discard(self._by_value, (record.type, name, value), record_id)
+
+    @staticmethod
+    def _discard(index: dict, key, record_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(record_id)
+            if not ids:
+                del index[key]
+
+    def _candidates(self, type_filter: str, tag_query: Mapping) -> Tuple[Set, bool]:
+        """
+        Find the ids of the records which may match a tag query.
+
+        Returns:
+            A tuple of the candidate ids and whether the candidates are known
+            to match exactly, without checking each record
+
+        """
+        type_ids = self._by_type.get(type_filter, set())
+        if not tag_query:
+            return type_ids, True
+        if not isinstance(tag_query, dict):
+            return type_ids, False
+        clauses = []
+        for k, v in tag_query.items():
+            if k in ("$and", "$or") and isinstance(v, list):
+                subs = [self._candidates(type_filter, sub) for sub in v]
+                if not subs:
+                    clauses.append((type_ids if k == "$and" else set(), True))
+                elif k == "$and":
+                    ids = set.intersection(*sorted((sub for sub, _ in subs), key=len))
+                    clauses.append((ids, all(exact for _, exact in subs)))
+                else:
+                    ids = set().union(*(sub for sub, _ in subs))
+                    clauses.append((ids, all(exact for _, exact in subs)))
+            elif k[:1] == "$":
+                clauses.append((type_ids, False))
+            elif isinstance(v, str):
+                clauses.append((self._by_value.get((type_filter, k, v), set()), True))
+            elif (
+                isinstance(v, dict)
+                and len(v) == 1
+                and isinstance(v.get("$in"), list)
+                and all(isinstance(opt, str) for opt in v["$in"])
+            ):
+                ids = set().union(
+                    *(self._by_value.get((type_filter, k, opt), ()) for opt in v["$in"])
+                )
+                clauses.append((ids, True))
+            else:
+                clauses.append((self._by_name.get((type_filter, k), set()), False))
+        clauses.sort(key=lambda clause: len(clause[0]))
+        ids = set.intersection(*(ids for ids, _ in clauses))
+        return ids, all(exact for _, exact in clauses)
+
+    def search(self, type_filter: str, tag_query: Mapping = None) -> list:
+        """Find the records matching a type and tag query, in insertion order."""
+        ids, exact = self._candidates(type_filter, tag_query)
+        records = [self._records[record_id] for record_id in ids]
+        if not exact:
+            records = [
+                record for record in records if tag_query_match(record.tags, tag_query)
+            ]
+        records.sort(key=lambda record: self._order[record.id])
+        return records
+
+
+def get_record_index(profile: InMemoryProfile) -> InMemoryRecordIndex:
+    """Get the tag index shared by all sessions of an in-memory profile."""
+    index = getattr(profile, "record_index", None)
+    if index is None:
+        index = profile.record_index = InMemoryRecordIndex(profile.records)
+    return index
+
+
 def tag_value_match(value: str, match: dict) -> bool:
     """Match a single tag against a tag subquery.
 
@@ -186,12 +359,24 @@ def tag_value_match(value: str, match: dict) -> bool:
             chk = float(value) < float(cmp_val)
         elif op == "$lte":
             chk = float(value) <= float(cmp_val)
-        # elif op == "$like":  NYI
+        elif op == "$like":
+            chk = like_pattern(cmp_val).match(value) is not None
         else:
             raise StorageSearchError(f"Unsupported match operator: {op}")
     return chk
 
 
+def like_pattern(pattern: str) -> "re.Pattern":
+    """Compile a SQL `LIKE` pattern, as used by the `$like` operator."""
+    return re.compile(
+        "".join(
+            ".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern
+        )
+        + r"\Z",
+        re.DOTALL,
+    )
+
+
 def tag_query_match(tags: dict, tag_query: dict) -> bool:
     """Match simple tag filters (string values)."""
     result = True
@@ -254,14 +439,17 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             type_filter: Filter string
             tag_query: Tags to search
             page_size: Size of page to return
-            options: Dictionary of backend-specific options
+            options: Dictionary of backend-specific options, supporting
+                `offset` to skip a number of leading results
 
         """
-        self._cache = profile.records.copy()
-        self._iter = iter(self._cache)
+        self._profile = profile
+        self._cache = None
+        self._done = False
         self.page_size = page_size or DEFAULT_PAGE_SIZE
         self.tag_query = tag_query
         self.type_filter = type_filter
+        self._skip = (options or {}).get("offset") or 0
 
     async def fetch(self, max_count: int = None) -> Sequence[StorageRecord]:
         """
@@ -278,30 +466,25 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             StorageSearchError: If the search query has not been opened
 
         """
-        if self._cache is None:
+        if self._done:
             raise StorageSearchError("Search query is complete")
+        if self._cache is None:
+            # the matching records are resolved when the first page is fetched
+            self._cache = get_record_index(self._profile).search(
+                self.type_filter, self.tag_query
+            )
+            del self._cache[: self._skip]
 
-        ret = []
-        check_type = self.type_filter
-        i = max_count or self.page_size
-
-        while i > 0:
-            try:
-                id = next(self._iter)
-            except StopIteration:
-                break
-            record = self._cache[id]
-            if record.type == check_type and tag_query_match(
-                record.tags, self.tag_query
-            ):
-                ret.append(record)
-                i -= 1
+        limit = max_count or self.page_size
+        ret = self._cache[:limit]
+        del self._cache[:limit]
 
         if not ret:
-            self._cache = None
+            await self.close()
 
         return ret
 
     async def close(self):
         """Dispose of the search query."""
+        self._done = True
         self._cache = None
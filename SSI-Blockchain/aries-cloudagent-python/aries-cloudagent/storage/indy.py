@@ -168,6 +168,54 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
                 raise StorageNotFoundError(f"Record not found: {record.id}")
             raise StorageError(str(x_indy))
 
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        The indy-sdk wallet has no transactions, so the records are submitted
+        concurrently and any failure is raised once all requests complete.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            validate_record(record)
+        await self._gather(self.add_record(record) for record in records)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records with the value and tags they carry.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            validate_record(record)
+        await self._gather(
+            self.update_record(record, record.value, record.tags) for record in records
+        )
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+        await self._gather(self.delete_record(record) for record in records)
+
+    async def _gather(self, requests):
+        """Await wallet requests together, raising the first failure if any."""
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
     async def find_all_records(
         self,
         type_filter: str,
@@ -185,6 +233,34 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
                 break
         return results
 
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """Count the records matching a particular type filter and tag query."""
+        options_json = json.dumps(
+            {
+                "retrieveRecords": False,
+                "retrieveTotalCount": True,
+                "retrieveType": False,
+                "retrieveValue": False,
+                "retrieveTags": False,
+            }
+        )
+        try:
+            handle = await non_secrets.open_wallet_search(
+                self._wallet.handle,
+                type_filter,
+                json.dumps(tag_query or {}),
+                options_json,
+            )
+            try:
+                result_json = await non_secrets.fetch_wallet_search_next_records(
+                    self._wallet.handle, handle, 1
+                )
+            finally:
+                await non_secrets.close_wallet_search(handle)
+        except IndyError as x_indy:
+            raise StorageSearchError(str(x_indy)) from x_indy
+        return json.loads(result_json)["totalCount"]
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -238,6 +314,10 @@ class IndySdkStorageSearch(BaseStorageSearchSession):
             type_filter: Filter string
             tag_query: Tags to search
             page_size: Size of page to return
+            options: Dictionary of backend-specific options, supporting
+                `offset` to skip a number of leading results, and
+                `retrieveValue` and `retrieveTags` to leave out record values
+                or tags
 
         """
         self._handle = None
@@ -303,7 +383,7 @@ class IndySdkStorageSearch(BaseStorageSearchSession):
                 "retrieveRecords": True,
                 "retrieveTotalCount": False,
                 "retrieveType": False,
-                "retrieveValue": True,
+                "retrieveValue": self.options.get("retrieveValue", True),
                 "retrieveTags": self.options.get("retrieveTags", True),
             }
         )
@@ -314,6 +394,22 @@ class IndySdkStorageSearch(BaseStorageSearchSession):
         except IndyError as x_indy:
             raise StorageSearchError(str(x_indy)) from x_indy
 
+        # the indy-sdk search has no native offset: discard the leading results
+        remaining = self.options.get("offset") or 0
+        while remaining > 0:
+            try:
+                result_json = await non_secrets.fetch_wallet_search_next_records(
+                    self.store.wallet.handle,
+                    self._handle,
+                    min(remaining, self.page_size),
+                )
+            except IndyError as x_indy:
+                raise StorageSearchError(str(x_indy)) from x_indy
+            skipped = len(json.loads(result_json)["records"] or ())
+            if not skipped:
+                break
+            remaining -= skipped
+
     async def close(self):
         """Dispose of the search query."""
         try:
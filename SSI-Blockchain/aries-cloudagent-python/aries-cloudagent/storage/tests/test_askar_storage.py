@@ -205,6 +205,18 @@ class TestAskarStorage(test_in_memory_storage.TestInMemoryStorage):
                 with pytest.raises(test_module.StorageError):
                     await storage.delete_record(rec)
 
+    @pytest.mark.asyncio
+    async def test_find_all_without_value(self, store):
+        record = test_in_memory_storage.test_record({"tag": "one"})
+        await store.add_record(record)
+
+        rows = await store.find_all_records(
+            record.type, {}, options={"retrieveValue": False}
+        )
+        assert [(row.id, row.value, row.tags) for row in rows] == [
+            (record.id, None, record.tags)
+        ]
+
     @pytest.mark.skip
     @pytest.mark.asyncio
     async def test_storage_search_x(self):
@@ -107,6 +107,43 @@ class TestInMemoryStorage:
         with pytest.raises(StorageNotFoundError):
             await store.update_record(missing, missing.value, {})
 
+    @pytest.mark.asyncio
+    async def test_batch_add_update_delete(self, store):
+        records = [test_record({"a": str(i)}) for i in range(3)]
+        await store.add_records(records)
+        for record in records:
+            found = await store.get_record(record.type, record.id)
+            assert found.tags == record.tags
+
+        updated = [record._replace(value="NEW", tags={"b": "1"}) for record in records]
+        await store.update_records(updated)
+        rows = await store.find_all_records("TYPE", {"b": "1"})
+        assert sorted(row.id for row in rows) == sorted(rec.id for rec in records)
+        assert all(row.value == "NEW" for row in rows)
+
+        await store.delete_records(records[:2])
+        rows = await store.find_all_records("TYPE")
+        assert [row.id for row in rows] == [records[2].id]
+
+        await store.add_records([])
+        await store.update_records([])
+        await store.delete_records([])
+
+    @pytest.mark.asyncio
+    async def test_batch_x(self, store):
+        record = test_record()
+        await store.add_record(record)
+        with pytest.raises(StorageError):
+            await store.add_records([test_record(), StorageRecord(None, None)])
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records([test_record(), record])
+        with pytest.raises(StorageNotFoundError):
+            await store.update_records([record, test_missing_record()])
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records([record, test_missing_record()])
+        rows = await store.find_all_records("TYPE")
+        assert [row.id for row in rows] == [record.id]
+
     @pytest.mark.asyncio
     async def test_find_record(self, store):
         record = test_record()
@@ -144,6 +181,16 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_count(self, store):
+        for tag in ("one", "two", "one"):
+            await store.add_record(test_record({"tag": tag}))
+
+        assert await store.count_records("TYPE") == 3
+        assert await store.count_records("TYPE", {"tag": "one"}) == 2
+        assert await store.count_records("TYPE", {"tag": "three"}) == 0
+        assert await store.count_records("OTHER") == 0
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store):
         record = test_record({"tag": "one"})
@@ -275,3 +322,80 @@ class TestInMemoryTagQuery:
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"a": -1})
         assert "Expected string or dict for filter value" in str(excinfo.value)
+
+
+class TestInMemoryRecordIndex:
+    @pytest.mark.asyncio
+    async def test_indexed_queries(self, store):
+        records = [
+            StorageRecord(type="TYPE", value=str(i), tags=tags)
+            for i, tags in enumerate(
+                [
+                    {"a": "aardvark", "b": "bear", "z": "0"},
+                    {"a": "aardvark", "b": "badger", "z": "1"},
+                    {"a": "alligator", "b": "bear", "z": "2"},
+                    {"a": "alligator"},
+                ]
+            )
+        ]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(
+            StorageRecord(type="OTHER", value="x", tags={"a": "aardvark"})
+        )
+
+        async def values(tag_query):
+            return [
+                rec.value for rec in await store.find_all_records("TYPE", tag_query)
+            ]
+
+        assert await values(None) == ["0", "1", "2", "3"]
+        assert await values({"a": "aardvark"}) == ["0", "1"]
+        assert await values({"a": "aardvark", "b": "bear"}) == ["0"]
+        assert await values({"a": {"$in": ["alligator", "crocodile"]}}) == ["2", "3"]
+        assert await values({"$or": [{"b": "badger"}, {"a": "alligator"}]}) == [
+            "1",
+            "2",
+            "3",
+        ]
+        assert await values({"$and": [{"b": "bear"}, {"z": {"$gte": "1"}}]}) == ["2"]
+        assert await values({"$not": {"a": "aardvark"}}) == ["2", "3"]
+        assert await values({"b": {"$neq": "bear"}}) == ["1"]
+        assert await values({"a": {"$like": "a%ar%"}}) == ["0", "1"]
+        assert await values({"a": {"$like": "alligato_"}}) == ["2", "3"]
+        assert await values({"$or": []}) == []
+        assert await values({"$and": []}) == ["0", "1", "2", "3"]
+        assert await values({"c": "missing"}) == []
+
+        with pytest.raises(StorageSearchError):
+            await store.find_all_records("TYPE", {"$or": "-1"})
+
+    @pytest.mark.asyncio
+    async def test_index_maintained(self, store):
+        record = test_record({"a": "aardvark"})
+        await store.add_record(record)
+        other = test_record({"a": "aardvark"})
+        await store.add_record(other)
+
+        await store.update_record(record, "NEW", {"a": "alligator"})
+        rows = await store.find_all_records("TYPE", {"a": "aardvark"})
+        assert [row.id for row in rows] == [other.id]
+        rows = await store.find_all_records("TYPE", {"a": "alligator"})
+        assert [(row.id, row.value) for row in rows] == [(record.id, "NEW")]
+        # updates keep the insertion order
+        rows = await store.find_all_records("TYPE")
+        assert [row.id for row in rows] == [record.id, other.id]
+
+        await store.delete_record(record)
+        assert not await store.find_all_records("TYPE", {"a": "alligator"})
+
+        await store.delete_all_records("TYPE", {"a": "aardvark"})
+        assert not await store.find_all_records("TYPE")
+        assert not store.profile.records
+
+        # the index is shared with other storage instances of the profile
+        await store.add_record(record)
+        other_store = InMemoryStorage(store.profile)
+        assert other_store.index is store.index
+        search = other_store.search_records("TYPE", {"a": "aardvark"}, None)
+        assert [row.id for row in await search.fetch()] == [record.id]
@@ -0,0 +1,174 @@
+"""Admission control for inbound transports."""
+
+import asyncio
+import logging
+from typing import Callable, Mapping, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    Decide whether inbound transports accept new messages.
+
+    Messages are refused while the agent is over any configured budget: the
+    number of tasks waiting in the dispatcher, the number of outbound messages
+    waiting to be encoded or delivered, and the event loop lag. Once over
+    budget, messages are only accepted again when the load has fallen below
+    `resume_ratio` of each limit, so that the agent does not flap between
+    states under a sustained load.
+    """
+
+    STATE_OK = "ok"
+    STATE_OVERLOADED = "overloaded"
+
+    def __init__(
+        self,
+        *,
+        max_pending: int = 0,
+        max_outbound: int = 0,
+        max_loop_lag: float = 0.0,
+        retry_after: int = 5,
+        pending: Callable[[], int] = None,
+        outbound: Callable[[], int] = None,
+        lag_interval: float = 0.5,
+        resume_ratio: float = 0.8,
+    ):
+        """
+        Initialize an `AdmissionController` instance.
+
+        Args:
+            max_pending: the maximum number of tasks waiting in the dispatcher
+            max_outbound: the maximum number of queued outbound messages
+            max_loop_lag: the maximum event loop lag in seconds
+            retry_after: the number of seconds clients are asked to wait
+            pending: callable returning the number of tasks waiting in the
+                dispatcher
+            outbound: callable returning the number of queued outbound messages
+            lag_interval: number of seconds between event loop lag samples
+            resume_ratio: the share of each limit below which messages are
+                accepted again
+
+        """
+        self.max_pending = max_pending
+        self.max_outbound = max_outbound
+        self.max_loop_lag = max_loop_lag
+        self.retry_after = retry_after
+        self.pending = pending
+        self.outbound = outbound
+        self.lag_interval = lag_interval
+        self.resume_ratio = resume_ratio
+        self.loop_lag = 0.0
+        self.reason: Optional[str] = None
+        self.rejected = {"pending": 0, "outbound": 0, "loop_lag": 0, "queue_full": 0}
+        self._task: asyncio.Task = None
+
+    @classmethod
+    def from_settings(
+        cls, settings: Mapping, **kwargs
+    ) -> Optional["AdmissionController"]:
+        """Create the controller from settings, if any limits are configured."""
+        limits = {
+            "max_pending": settings.get("transport.admission.max_pending", 0),
+            "max_outbound": settings.get("transport.admission.max_outbound", 0),
+            "max_loop_lag": settings.get("transport.admission.max_loop_lag", 0.0),
+        }
+        if not any(limits.values()):
+            return None
+        return cls(
+            **limits,
+            retry_after=settings.get("transport.admission.retry_after", 5),
+            **kwargs,
+        )
+
+    @property
+    def state(self) -> str:
+        """Accessor for the current load state."""
+        return self.STATE_OVERLOADED if self.reason else self.STATE_OK
+
+    def load(self) -> dict:
+        """Sample the current load."""
+        return {
+            "pending": self.pending() if self.pending else 0,
+            "outbound": self.outbound() if self.outbound else 0,
+            "loop_lag": self.loop_lag,
+        }
+
+    def check(self) -> Optional[str]:
+        """
+        Update the load state.
+
+        Returns:
+            The budget which is exceeded, if any
+
+        """
+        ratio = self.resume_ratio if self.reason else 1.0
+        load = self.load()
+        reason = None
+        for name, limit in (
+            ("pending", self.max_pending),
+            ("outbound", self.max_outbound),
+            ("loop_lag", self.max_loop_lag),
+        ):
+            if limit and load[name] >= limit * ratio:
+                reason = name
+                break
+        if reason != self.reason:
+            if reason:
+                LOGGER.warning(
+                    "Refusing inbound messages, %s over budget: %s", reason, load
+                )
+            else:
+                LOGGER.info("Accepting inbound messages again: %s", load)
+            self.reason = reason
+        return reason
+
+    def admit(self) -> bool:
+        """Check whether a new inbound message may be accepted."""
+        reason = self.check()
+        if reason:
+            self.rejected[reason] += 1
+            return False
+        return True
+
+    def reject(self):
+        """Record a message refused by the dispatcher for a full queue."""
+        self.rejected["queue_full"] += 1
+
+    @property
+    def status(self) -> dict:
+        """Accessor for the current load state and limits."""
+        return {
+            "state": self.state,
+            "reason": self.reason,
+            "load": self.load(),
+            "limits": {
+                "pending": self.max_pending,
+                "outbound": self.max_outbound,
+                "loop_lag": self.max_loop_lag,
+            },
+            "rejected": dict(self.rejected),
+        }
+
+    async def _monitor(self):
+        """Sample the event loop lag until cancelled."""
+        loop = asyncio.get_event_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.loop_lag = max(0.0, loop.time() - started - self.lag_interval)
+
+    def start(self):
+        """Start monitoring the event loop lag."""
+        if not self._task or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._monitor())
+
+    async def stop(self):
+        """Stop monitoring the event loop lag."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
@@ -2,11 +2,12 @@
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 
 from ...core.profile import Profile
 from ..error import TransportError
 from ..wire_format import BaseWireFormat
+from .admission import AdmissionController
 from .session import InboundSession
 
 
@@ -53,6 +54,19 @@ class BaseInboundTransport(ABC):
         """Accessor for this transport's is_external."""
         return self._is_external
 
+    @property
+    def reuse_port(self) -> bool:
+        """Check whether the listening port is shared with other workers."""
+        return bool(
+            self.root_profile
+            and (self.root_profile.settings.get("workers.count") or 1) > 1
+        )
+
+    @property
+    def admission(self) -> Optional[AdmissionController]:
+        """Accessor for the admission controller, if one is configured."""
+        return self.root_profile and self.root_profile.inject_or(AdmissionController)
+
     def create_session(
         self,
         *,
@@ -5,8 +5,10 @@ import logging
 from aiohttp import web
 
 from ...messaging.error import MessageParseError
+from ...utils.task_queue import TaskQueueFullError
 from ..error import WireFormatParseError
 from ..wire_format import DIDCOMM_V0_MIME_TYPE, DIDCOMM_V1_MIME_TYPE
+from .admission import AdmissionController
 from .base import BaseInboundTransport, InboundTransportSetupError
 
 LOGGER = logging.getLogger(__name__)
@@ -51,7 +53,9 @@ class HttpTransport(BaseInboundTransport):
         app = await self.make_application()
         runner = web.AppRunner(app)
         await runner.setup()
-        self.site = web.TCPSite(runner, host=self.host, port=self.port)
+        self.site = web.TCPSite(
+            runner, host=self.host, port=self.port, reuse_port=self.reuse_port
+        )
         try:
             await self.site.start()
         except OSError:
@@ -77,6 +81,10 @@ class HttpTransport(BaseInboundTransport):
             The web response
 
         """
+        admission = self.admission
+        if admission and not admission.admit():
+            raise self.service_unavailable(admission)
+
         ctype = request.headers.get("content-type", "")
         if ctype.split(";", 1)[0].lower() == "application/json":
             body = await request.text()
@@ -94,6 +102,10 @@ class HttpTransport(BaseInboundTransport):
                 inbound = await session.receive(body)
             except (MessageParseError, WireFormatParseError):
                 raise web.HTTPBadRequest()
+            except TaskQueueFullError:
+                if admission:
+                    admission.reject()
+                raise self.service_unavailable(admission)
 
             if inbound.receipt.direct_response_requested:
                 # Wait for the message to be processed. Only send a response if a response
@@ -128,6 +140,14 @@ class HttpTransport(BaseInboundTransport):
                         )
         return web.Response(status=200)
 
+    @staticmethod
+    def service_unavailable(
+        admission: AdmissionController = None,
+    ) -> web.HTTPServiceUnavailable:
+        """Build the response refusing a message while the agent is too busy."""
+        retry_after = admission.retry_after if admission else 5
+        return web.HTTPServiceUnavailable(headers={"Retry-After": str(retry_after)})
+
     async def invite_message_handler(self, request: web.BaseRequest):
         """
         Message handler for invites.
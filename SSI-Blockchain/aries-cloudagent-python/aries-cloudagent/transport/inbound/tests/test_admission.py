@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from asynctest import TestCase as AsyncTestCase
+
+from ..admission import AdmissionController
+
+
+class TestAdmissionController(AsyncTestCase):
+    def setUp(self):
+        self.pending = 0
+        self.outbound = 0
+        self.admission = AdmissionController(
+            max_pending=10,
+            max_outbound=100,
+            max_loop_lag=0.5,
+            pending=lambda: self.pending,
+            outbound=lambda: self.outbound,
+        )
+
+    def test_from_settings(self):
+        assert AdmissionController.from_settings({}) is None
+        admission = AdmissionController.from_settings(
+            {
+                "transport.admission.max_loop_lag": 0.25,
+                "transport.admission.retry_after": 2,
+            },
+            pending=len,
+        )
+        assert admission.max_pending == 0
+        assert admission.max_loop_lag == 0.25
+        assert admission.retry_after == 2
+        assert admission.pending is len
+
+    def test_admit(self):
+        assert self.admission.admit()
+        assert self.admission.state == AdmissionController.STATE_OK
+
+        self.outbound = 100
+        assert not self.admission.admit()
+        assert self.admission.reason == "outbound"
+
+        # resume only once the load has fallen well below the limit
+        self.outbound = 90
+        assert not self.admission.admit()
+        self.outbound = 79
+        assert self.admission.admit()
+
+        self.pending = 12
+        self.admission.loop_lag = 1.0
+        assert not self.admission.admit()
+        assert self.admission.reason == "pending"
+        self.pending = 0
+        assert not self.admission.admit()
+        assert self.admission.reason == "loop_lag"
+        self.admission.loop_lag = 0.0
+        assert self.admission.admit()
+
+        self.admission.reject()
+        assert self.admission.rejected == {
+            "pending": 1,
+            "outbound": 2,
+            "loop_lag": 1,
+            "queue_full": 1,
+        }
+
+    def test_status(self):
+        self.pending = 11
+        self.admission.check()
+        status = self.admission.status
+        assert status["state"] == AdmissionController.STATE_OVERLOADED
+        assert status["reason"] == "pending"
+        assert status["load"] == {"pending": 11, "outbound": 0, "loop_lag": 0.0}
+        assert status["limits"] == {"pending": 10, "outbound": 100, "loop_lag": 0.5}
+
+    async def test_monitor_loop_lag(self):
+        self.admission.lag_interval = 0.01
+        self.admission.start()
+        await asyncio.sleep(0.02)
+        # block the event loop past the next sample
+        asyncio.get_event_loop().call_soon(time.sleep, 0.05)
+        await asyncio.sleep(0.05)
+        assert self.admission.loop_lag > 0.01
+        await self.admission.stop()
+        await self.admission.stop()
@@ -11,7 +11,9 @@ from ....core.profile import Profile
 from ...error import WireFormatParseError
 from ...outbound.message import OutboundMessage
 from ...wire_format import JsonWireFormat
+from ....utils.task_queue import TaskQueueFullError
 
+from ..admission import AdmissionController
 from ..http import HttpTransport
 from ..message import InboundMessage
 from ..session import InboundSession
@@ -148,6 +150,64 @@ class TestHttpTransport(AioHTTPTestCase):
 
         await self.transport.stop()
 
+    async def test_send_message_overloaded(self):
+        await self.transport.start()
+
+        pending = [0]
+        admission = AdmissionController(
+            max_pending=10, retry_after=3, pending=lambda: pending[0]
+        )
+        self.transport.root_profile = InMemoryProfile.test_profile(
+            bind={AdmissionController: admission}
+        )
+
+        test_message = {"test": "message"}
+        pending[0] = 10
+        async with self.client.post("/", json=test_message) as resp:
+            assert resp.status == 503
+            assert resp.headers["Retry-After"] == "3"
+        assert not self.message_results
+        assert admission.status["state"] == "overloaded"
+
+        pending[0] = 5
+        async with self.client.post("/", json=test_message) as resp:
+            assert resp.status == 200
+        assert len(self.message_results) == 1
+
+        with async_mock.patch.object(
+            test_module.HttpTransport, "create_session", async_mock.CoroutineMock()
+        ) as mock_session:
+            mock_session.return_value = async_mock.MagicMock(
+                receive=async_mock.CoroutineMock(side_effect=TaskQueueFullError()),
+                profile=InMemoryProfile.test_profile(),
+            )
+            async with self.client.post("/", json=test_message) as resp:
+                assert resp.status == 503
+                assert resp.headers["Retry-After"] == "3"
+        assert admission.rejected == {
+            "pending": 1,
+            "outbound": 0,
+            "loop_lag": 0,
+            "queue_full": 1,
+        }
+
+        await self.transport.stop()
+
+    async def test_start_reuse_port(self):
+        profile = InMemoryProfile.test_profile(settings={"workers.count": 2})
+        transports = [
+            HttpTransport(
+                "127.0.0.1", self.port, self.create_session, root_profile=profile
+            )
+            for _ in range(2)
+        ]
+        assert all(transport.reuse_port for transport in transports)
+        assert not self.transport.reuse_port
+        for transport in transports:
+            await transport.start()
+        for transport in transports:
+            await transport.stop()
+
     async def test_invite_message_handler(self):
         await self.transport.start()
 
@@ -2,6 +2,7 @@ import asyncio
 import json
 import pytest
 
+from aiohttp import WSServerHandshakeError
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop, unused_port
 from asynctest import mock as async_mock
 
@@ -11,6 +12,7 @@ from ...outbound.message import OutboundMessage
 from ...wire_format import JsonWireFormat
 from ....config.injection_context import InjectionContext
 
+from ..admission import AdmissionController
 from ..message import InboundMessage
 from ..session import InboundSession
 from ..ws import WsTransport
@@ -103,3 +105,26 @@ class TestWsTransport(AioHTTPTestCase):
             assert result == {"response": "ok"}
 
         await self.transport.stop()
+
+    async def test_message_overloaded(self):
+        await self.transport.start()
+
+        pending = [0]
+        admission = AdmissionController(max_pending=10, pending=lambda: pending[0])
+        self.profile.context.injector.bind_instance(AdmissionController, admission)
+
+        async with self.client.ws_connect("/") as ws:
+            pending[0] = 10
+            await ws.send_json({"test": "message"})
+            result = await asyncio.wait_for(ws.receive(), 1.0)
+            assert result.type == test_module.WSMsgType.CLOSE
+            assert ws.close_code == 1013
+        assert not self.message_results
+
+        with pytest.raises(WSServerHandshakeError) as excinfo:
+            async with self.client.ws_connect("/"):
+                pass
+        assert excinfo.value.status == 503
+        assert admission.rejected["pending"] == 2
+
+        await self.transport.stop()
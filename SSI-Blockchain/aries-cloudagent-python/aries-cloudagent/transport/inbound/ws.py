@@ -7,6 +7,7 @@ from typing import Optional
 from aiohttp import WSMessage, WSMsgType, web
 
 from ...messaging.error import MessageParseError
+from ...utils.task_queue import TaskQueueFullError
 from ..error import WireFormatParseError
 from .base import BaseInboundTransport, InboundTransportSetupError
 
@@ -62,7 +63,9 @@ class WsTransport(BaseInboundTransport):
         app = await self.make_application()
         runner = web.AppRunner(app)
         await runner.setup()
-        self.site = web.TCPSite(runner, host=self.host, port=self.port)
+        self.site = web.TCPSite(
+            runner, host=self.host, port=self.port, reuse_port=self.reuse_port
+        )
         try:
             await self.site.start()
         except OSError:
@@ -88,6 +91,11 @@ class WsTransport(BaseInboundTransport):
             The web response
 
         """
+        admission = self.admission
+        if admission and not admission.admit():
+            raise web.HTTPServiceUnavailable(
+                headers={"Retry-After": str(admission.retry_after)}
+            )
 
         ws = web.WebSocketResponse(
             autoping=True,
@@ -116,10 +124,18 @@ class WsTransport(BaseInboundTransport):
                     msg: WSMessage = inbound.result()
                     LOGGER.info("Websocket received message: %s", msg.data)
                     if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                        if admission and not admission.admit():
+                            await ws.close(code=1013)  # try again later
+                            break
                         try:
                             await session.receive(msg.data)
                         except (MessageParseError, WireFormatParseError):
                             await ws.close(1003)  # unsupported data error
+                        except TaskQueueFullError:
+                            if admission:
+                                admission.reject()
+                            await ws.close(code=1013)  # try again later
+                            break
                     elif msg.type == WSMsgType.ERROR:
                         LOGGER.error(
                             "Websocket connection closed with exception: %s",
@@ -1,18 +1,27 @@
 """Outbound transport manager."""
 
 import asyncio
-import json
+import heapq
 import logging
 import time
 
-from typing import Callable, Type, Union
+from collections import deque
+from itertools import count
+from typing import Callable, Deque, List, Tuple, Type, Union
 from urllib.parse import urlparse
 
 from ...connections.models.connection_target import ConnectionTarget
 from ...core.profile import Profile
+from ...utils import json_codec
 from ...utils.classloader import ClassLoader, ModuleLoadError, ClassNotFoundError
 from ...utils.stats import Collector
-from ...utils.task_queue import CompletedTask, TaskQueue, task_exc_info
+from ...utils.task_queue import (
+    CompletedTask,
+    PendingTask,
+    TaskPriority,
+    TaskQueue,
+    task_exc_info,
+)
 
 from ...utils.tracing import trace_event, get_timer
 
@@ -38,6 +47,14 @@ class QueuedOutboundMessage:
     STATE_DELIVER = "deliver"
     STATE_RETRY = "retry"
     STATE_DONE = "done"
+    STATES = (
+        STATE_NEW,
+        STATE_PENDING,
+        STATE_ENCODE,
+        STATE_DELIVER,
+        STATE_RETRY,
+        STATE_DONE,
+    )
 
     def __init__(
         self,
@@ -56,7 +73,7 @@ class QueuedOutboundMessage:
         self.retry_at: float = None
         self.state = self.STATE_NEW
         self.target = target
-        self.task: asyncio.Task = None
+        self.task: PendingTask = None
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
@@ -66,6 +83,7 @@ class OutboundTransportManager:
     """Outbound transport manager class."""
 
     MAX_RETRY_COUNT = 4
+    RETRY_DELAY = 10.0
 
     def __init__(self, profile: Profile, handle_not_delivered: Callable = None):
         """
@@ -79,9 +97,17 @@ class OutboundTransportManager:
         self.root_profile = profile
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
         self.outbound_event = asyncio.Event()
-        self.outbound_new = []
+        # messages added since the last pass of the processing loop
+        self.outbound_new: List[QueuedOutboundMessage] = []
+        # encoded messages ready for delivery
+        self.outbound_pending: Deque[QueuedOutboundMessage] = deque()
+        # messages waiting for a retry, ordered by retry time
+        self.outbound_retry: List[Tuple[float, int, QueuedOutboundMessage]] = []
+        # finished messages, to be reported by the processing loop
+        self.outbound_done: List[QueuedOutboundMessage] = []
+        self._retry_seq = count()
+        self._state_counts = dict.fromkeys(QueuedOutboundMessage.STATES, 0)
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
@@ -92,6 +118,30 @@ class OutboundTransportManager:
                 "transport.max_outbound_retry"
             ]
 
+    @property
+    def outbound_size(self) -> int:
+        """Accessor for the number of outbound messages not yet finished."""
+        return sum(self._state_counts.values())
+
+    @property
+    def outbound_stats(self) -> dict:
+        """Accessor for the number of outbound messages in each state."""
+        return dict(self._state_counts)
+
+    def _set_state(self, queued: QueuedOutboundMessage, state: str):
+        """Update the state of a queued message and the state counts."""
+        if self._state_counts.get(queued.state):
+            self._state_counts[queued.state] -= 1
+        queued.state = state
+        if state in self._state_counts:
+            self._state_counts[state] += 1
+
+    def _add_new(self, queued: QueuedOutboundMessage):
+        """Add a message for the processing loop to encode or deliver."""
+        self._state_counts[queued.state] += 1
+        self.outbound_new.append(queued)
+        self.process_queued()
+
     async def setup(self):
         """Perform setup operations."""
         outbound_transports = (
@@ -285,8 +335,7 @@ class OutboundTransportManager:
         else:
             queued = QueuedOutboundMessage(profile, outbound, target, transport_id)
             queued.retries = self.MAX_RETRY_COUNT
-            self.outbound_new.append(queued)
-            self.process_queued()
+            self._add_new(queued)
 
     async def encode_outbound_message(
         self, profile: Profile, outbound: OutboundMessage, target: ConnectionTarget
@@ -340,11 +389,10 @@ class OutboundTransportManager:
             queued.api_key = api_key
         queued.endpoint = f"{endpoint}/topic/{topic}/"
         queued.metadata = metadata
-        queued.payload = json.dumps(payload)
+        queued.payload = json_codec.dumps(payload)
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
-        self.outbound_new.append(queued)
-        self.process_queued()
+        self._add_new(queued)
 
     def process_queued(self) -> asyncio.Task:
         """
@@ -355,7 +403,7 @@ class OutboundTransportManager:
         """
         if self._process_task and not self._process_task.done():
             self.outbound_event.set()
-        elif self.outbound_new or self.outbound_buffer:
+        elif self.outbound_new or self.outbound_size:
             self._process_task = self.loop.create_task(self._process_loop())
             self._process_task.add_done_callback(lambda task: self._process_done(task))
         return self._process_task
@@ -378,63 +426,36 @@ class OutboundTransportManager:
         while True:
             self.outbound_event.clear()
             loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
-
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
+
+            done_messages = self.outbound_done
+            self.outbound_done = []
+            for queued in done_messages:
+                if queued.error:
+                    LOGGER.exception(
+                        "Outbound message could not be delivered to %s",
+                        queued.endpoint,
+                        exc_info=queued.error,
                     )
+                    if self.handle_not_delivered and queued.message:
+                        self.handle_not_delivered(queued.profile, queued.message)
+                self._set_state(queued, None)
 
-                upd_buffer.append(queued)
+            while self.outbound_retry and self.outbound_retry[0][0] <= loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                queued.retry_at = None
+                self._set_state(queued, QueuedOutboundMessage.STATE_PENDING)
+                self.outbound_pending.append(queued)
 
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
-
             for queued in new_messages:
                 if queued.state == QueuedOutboundMessage.STATE_NEW:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
-                        queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self._set_state(queued, QueuedOutboundMessage.STATE_PENDING)
+                        self.outbound_pending.append(queued)
                     else:
-                        queued.state = QueuedOutboundMessage.STATE_ENCODE
+                        self._set_state(queued, QueuedOutboundMessage.STATE_ENCODE)
                         p_time = trace_event(
                             self.root_profile.settings,
                             queued.message if queued.message else queued.payload,
@@ -447,29 +468,52 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
-                else:
-                    new_pending += 1
-
-                upd_buffer.append(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    self.outbound_pending.append(queued)
+
+            while self.outbound_pending:
+                queued = self.outbound_pending.popleft()
+                self._set_state(queued, QueuedOutboundMessage.STATE_DELIVER)
+                p_time = trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+                )
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            if not self.outbound_size:
                 break
+            if self.outbound_new or self.outbound_done:
+                continue
+
+            # wait for an encoding or delivery to finish, or the next retry
+            wake = None
+            if self.outbound_retry:
+                wake = self.loop.call_later(
+                    max(0.0, self.outbound_retry[0][0] - get_timer()),
+                    self.outbound_event.set,
+                )
+            try:
+                await self.outbound_event.wait()
+            finally:
+                if wake:
+                    wake.cancel()
 
-    def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
-        """Kick off encoding of a queued message."""
+    def encode_queued_message(self, queued: QueuedOutboundMessage) -> PendingTask:
+        """Queue encoding of a queued message."""
 
         transport = self.get_transport_instance(queued.transport_id)
 
-        queued.task = self.task_queue.run(
+        queued.task = self.task_queue.put(
             self.perform_encode(queued, transport.wire_format),
             lambda completed: self.finished_encode(queued, completed),
+            priority=TaskPriority.NORMAL,
         )
         return queued.task
 
@@ -492,16 +536,18 @@ class OutboundTransportManager:
         """Handle completion of queued message encoding."""
         if completed.exc_info:
             queued.error = completed.exc_info
-            queued.state = QueuedOutboundMessage.STATE_DONE
+            self._set_state(queued, QueuedOutboundMessage.STATE_DONE)
+            self.outbound_done.append(queued)
         else:
-            queued.state = QueuedOutboundMessage.STATE_PENDING
+            self._set_state(queued, QueuedOutboundMessage.STATE_PENDING)
+            self.outbound_pending.append(queued)
         queued.task = None
         self.process_queued()
 
-    def deliver_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
-        """Kick off delivery of a queued message."""
+    def deliver_queued_message(self, queued: QueuedOutboundMessage) -> PendingTask:
+        """Queue delivery of a queued message."""
         transport = self.get_transport_instance(queued.transport_id)
-        queued.task = self.task_queue.run(
+        queued.task = self.task_queue.put(
             transport.handle_message(
                 queued.profile,
                 queued.payload,
@@ -510,6 +556,9 @@ class OutboundTransportManager:
                 queued.api_key,
             ),
             lambda completed: self.finished_deliver(queued, completed),
+            # webhooks are queued without a message and yield to agent messages
+            # once the queue is busy
+            priority=TaskPriority.NORMAL if queued.message else TaskPriority.LOW,
         )
         return queued.task
 
@@ -540,17 +589,23 @@ class OutboundTransportManager:
                         queued.error,
                     )
                 queued.retries -= 1
-                queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                self._set_state(queued, QueuedOutboundMessage.STATE_RETRY)
+                queued.retry_at = time.perf_counter() + self.RETRY_DELAY
+                heapq.heappush(
+                    self.outbound_retry,
+                    (queued.retry_at, next(self._retry_seq), queued),
+                )
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
-                queued.state = QueuedOutboundMessage.STATE_DONE
+                self._set_state(queued, QueuedOutboundMessage.STATE_DONE)
+                self.outbound_done.append(queued)
         else:
             queued.error = None
-            queued.state = QueuedOutboundMessage.STATE_DONE
+            self._set_state(queued, QueuedOutboundMessage.STATE_DONE)
+            self.outbound_done.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -1,4 +1,7 @@
+import asyncio
+import heapq
 import json
+import time
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
@@ -166,6 +169,75 @@ class TestOutboundTransportManager(AsyncTestCase):
             assert queued.retries == test_attempts - 1
             assert queued.state == QueuedOutboundMessage.STATE_PENDING
 
+    async def test_deliver_queued_priority(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        transport = async_mock.MagicMock(handle_message=async_mock.CoroutineMock())
+        message = QueuedOutboundMessage(
+            profile, OutboundMessage(payload="{}"), None, None
+        )
+        webhook = QueuedOutboundMessage(profile, None, None, None)
+
+        with async_mock.patch.object(
+            mgr, "get_transport_instance", return_value=transport
+        ), async_mock.patch.object(mgr.task_queue, "put") as mock_put:
+            # deliveries are queued, so webhooks yield to messages when busy
+            mgr.deliver_queued_message(message)
+            mgr.deliver_queued_message(webhook)
+            mgr.encode_queued_message(message)
+            assert [call[1]["priority"] for call in mock_put.call_args_list] == [
+                test_module.TaskPriority.NORMAL,
+                test_module.TaskPriority.LOW,
+                test_module.TaskPriority.NORMAL,
+            ]
+            for call in mock_put.call_args_list:
+                call[0][0].close()
+
+    def add_retry(self, mgr: OutboundTransportManager, queued):
+        mgr._state_counts[queued.state] += 1
+        heapq.heappush(mgr.outbound_retry, (queued.retry_at, id(queued), queued))
+
+    async def test_retry_schedule(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        mgr.RETRY_DELAY = 0.05
+        attempts = []
+
+        async def handle_message(profile, payload, endpoint, metadata, api_key):
+            attempts.append((endpoint, time.perf_counter()))
+            if len([a for a in attempts if a[0] == endpoint]) < 3:
+                raise KeyError()
+
+        transport = async_mock.MagicMock(
+            schemes=["http"],
+            is_external=False,
+            handle_message=handle_message,
+            start=async_mock.CoroutineMock(),
+        )
+        transport_cls = async_mock.MagicMock(schemes=["http"], return_value=transport)
+        tid = mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start_transport(tid)
+
+        with async_mock.patch.object(test_module.LOGGER, "error"):
+            started = time.perf_counter()
+            mgr.enqueue_webhook("topic", {}, "http://one", max_attempts=3)
+            mgr.enqueue_webhook("topic", {}, "http://two", max_attempts=3)
+            assert mgr.outbound_size == 2
+            assert mgr.outbound_stats[QueuedOutboundMessage.STATE_PENDING] == 2
+            await asyncio.sleep(0.01)
+            assert mgr.outbound_stats[QueuedOutboundMessage.STATE_RETRY] == 2
+            await mgr.flush()
+
+        assert len(attempts) == 6
+        # each retry waits for the retry delay, without polling in between
+        for endpoint in ("http://one/topic/topic/", "http://two/topic/topic/"):
+            times = [at for (ep, at) in attempts if ep == endpoint]
+            assert times[1] - times[0] >= 0.05
+            assert times[2] - times[1] >= 0.05
+        assert time.perf_counter() - started < 1.0
+        assert mgr.outbound_size == 0
+        assert not mgr.outbound_retry
+
     async def test_process_done_x(self):
         mock_task = async_mock.MagicMock(
             done=async_mock.MagicMock(return_value=True),
@@ -204,7 +276,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        self.add_retry(mgr, mock_queued)
 
         with async_mock.patch.object(
             test_module, "trace_event", async_mock.MagicMock()
@@ -213,6 +285,7 @@ class TestOutboundTransportManager(AsyncTestCase):
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is None
+            assert not mgr.outbound_retry
 
     async def test_process_loop_retry_later(self):
         mock_queued = async_mock.MagicMock(
@@ -223,15 +296,16 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        self.add_retry(mgr, mock_queued)
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            mgr.outbound_event, "wait", async_mock.CoroutineMock()
+        ) as mock_wait_x:
+            mock_wait_x.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            assert mgr.outbound_stats[QueuedOutboundMessage.STATE_RETRY] == 1
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
@@ -267,6 +341,7 @@ class TestOutboundTransportManager(AsyncTestCase):
                 message=async_mock.MagicMock(enc_payload=b"encr"),
             )
         ]
+        mgr._state_counts[QueuedOutboundMessage.STATE_DELIVER] = 1
         with async_mock.patch.object(
             mgr, "deliver_queued_message", async_mock.MagicMock()
         ) as mock_deliver, async_mock.patch.object(
@@ -290,9 +365,14 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr._state_counts[QueuedOutboundMessage.STATE_DONE] = 1
+        mgr.outbound_done.append(mock_queued)
 
         await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
+        assert not mgr.outbound_size
 
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = async_mock.MagicMock(
@@ -303,7 +383,6 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
         with async_mock.patch.object(
             test_module.LOGGER, "exception", async_mock.MagicMock()
         ) as mock_logger_exception, async_mock.patch.object(
@@ -1,6 +1,5 @@
 """Standard packed message format classes."""
 
-import json
 import logging
 from typing import List, Sequence, Tuple, Union
 
@@ -9,7 +8,8 @@ from ..core.profile import ProfileSession
 from ..protocols.routing.v1_0.messages.forward import Forward
 
 from ..messaging.util import time_now
-from ..utils.task_queue import TaskQueue
+from ..utils import json_codec
+from ..utils.task_queue import TaskPriority, TaskQueue
 from ..wallet.base import BaseWallet
 from ..wallet.error import WalletError
 from ..wallet.util import b64_to_str
@@ -27,6 +27,8 @@ class PackWireFormat(BaseWireFormat):
     def __init__(self):
         """Initialize the pack wire format instance."""
         super().__init__()
+        # Queue for packing and unpacking, which must not be awaited from
+        # tasks running on the same queue
         self.task_queue: TaskQueue = None
 
     async def parse_message(
@@ -61,7 +63,7 @@ class PackWireFormat(BaseWireFormat):
             raise WireFormatParseError("Message body is empty")
 
         try:
-            message_dict = json.loads(message_json)
+            message_dict = json_codec.loads(message_json)
         except ValueError:
             raise WireFormatParseError("Message JSON parsing failed")
         if not isinstance(message_dict, dict):
@@ -72,15 +74,17 @@ class PackWireFormat(BaseWireFormat):
 
             try:
                 unpack = self.unpack(session, message_body, receipt)
-                message_json = await (
-                    self.task_queue and self.task_queue.run(unpack) or unpack
-                )
+                if self.task_queue:
+                    task = await self.task_queue.put(unpack, priority=TaskPriority.HIGH)
+                    message_json = await task
+                else:
+                    message_json = await unpack
             except WireFormatParseError:
                 LOGGER.debug("Message unpack failed, falling back to JSON")
             else:
                 receipt.raw_message = message_json
                 try:
-                    message_dict = json.loads(message_json)
+                    message_dict = json_codec.loads(message_json)
                 except ValueError:
                     raise WireFormatParseError("Message JSON parsing failed")
                 if not isinstance(message_dict, dict):
@@ -154,7 +158,11 @@ class PackWireFormat(BaseWireFormat):
             pack = self.pack(
                 session, message_json, recipient_keys, routing_keys, sender_key
             )
-            message = await (self.task_queue and self.task_queue.run(pack) or pack)
+            if self.task_queue:
+                task = await self.task_queue.put(pack, priority=TaskPriority.NORMAL)
+                message = await task
+            else:
+                message = await pack
         else:
             message = message_json
         return message
@@ -185,7 +193,7 @@ class PackWireFormat(BaseWireFormat):
         if routing_keys:
             recip_keys = recipient_keys
             for router_key in routing_keys:
-                message = json.loads(message.decode("utf-8"))
+                message = json_codec.loads(message.decode("utf-8"))
                 fwd_msg = Forward(to=recip_keys[0], msg=message)
                 # Forwards are anon packed
                 recip_keys = [router_key]
@@ -211,8 +219,10 @@ class PackWireFormat(BaseWireFormat):
         """
 
         try:
-            message_dict = json.loads(message_body)
-            protected = json.loads(b64_to_str(message_dict["protected"], urlsafe=True))
+            message_dict = json_codec.loads(message_body)
+            protected = json_codec.loads(
+                b64_to_str(message_dict["protected"], urlsafe=True)
+            )
             recipients = protected["recipients"]
 
             recipient_keys = [recipient["header"]["kid"] for recipient in recipients]
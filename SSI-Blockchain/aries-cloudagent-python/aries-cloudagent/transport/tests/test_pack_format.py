@@ -14,6 +14,7 @@ from ...wallet.key_type import ED25519
 from .. import pack_format as test_module
 from ..error import RecipientKeysError, WireFormatEncodeError, WireFormatParseError
 from ..pack_format import PackWireFormat
+from ...utils.task_queue import TaskPriority, TaskQueue
 
 
 class TestPackWireFormat(AsyncTestCase):
@@ -171,6 +172,33 @@ class TestPackWireFormat(AsyncTestCase):
             == plain_json
         )
 
+    async def test_encode_decode_queued(self):
+        local_did = await self.wallet.create_local_did(
+            method=SOV, key_type=ED25519, seed=self.test_seed
+        )
+        serializer = PackWireFormat()
+        serializer.task_queue = TaskQueue(max_active=1)
+        message_json = json.dumps(self.test_message)
+
+        with async_mock.patch.object(
+            serializer.task_queue, "put", wraps=serializer.task_queue.put
+        ) as mock_put:
+            packed_json = await serializer.encode_message(
+                self.session,
+                message_json,
+                (local_did.verkey,),
+                (),
+                local_did.verkey,
+            )
+            message_dict, _ = await serializer.parse_message(
+                self.session, packed_json
+            )
+        assert message_dict == self.test_message
+        assert [call[1]["priority"] for call in mock_put.call_args_list] == [
+            TaskPriority.NORMAL,
+            TaskPriority.HIGH,
+        ]
+
     async def test_forward(self):
         local_did = await self.wallet.create_local_did(
             method=SOV, key_type=ED25519, seed=self.test_seed
@@ -0,0 +1,272 @@
+"""
+Named executors for blocking cryptographic operations.
+
+Each class of operation runs on its own sized executor instead of the default
+loop executor, so that message packing, credential issuance, proof
+verification and revocation registry generation do not compete with each
+other or with unrelated blocking I/O. Executors may limit the number of
+queued operations and report the time operations wait before running.
+
+Executors listed in `PROCESS_EXECUTORS` may use a process pool: their call
+sites only submit module-level functions with plain data arguments.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping
+
+from ..core.error import BaseError
+
+LOGGER = logging.getLogger(__name__)
+
+PACK = "pack"
+ANONCREDS_ISSUE = "anoncreds-issue"
+ANONCREDS_HOLDER = "anoncreds-holder"
+ANONCREDS_VERIFY = "anoncreds-verify"
+ANONCREDS_REGISTRY = "anoncreds-registry"
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+# Executors whose operations may run in a process pool
+PROCESS_EXECUTORS = (ANONCREDS_VERIFY, ANONCREDS_REGISTRY)
+
+
+def _default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+EXECUTOR_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    PACK: {"workers": _default_workers},
+    ANONCREDS_ISSUE: {"workers": _default_workers},
+    ANONCREDS_HOLDER: {"workers": _default_workers},
+    ANONCREDS_VERIFY: {"workers": _default_workers},
+    # tails file generation is heavy on CPU and disk: one registry at a time
+    ANONCREDS_REGISTRY: {"workers": 1},
+}
+
+
+class ExecutorError(BaseError):
+    """Executor configuration error."""
+
+
+class ExecutorFullError(ExecutorError):
+    """Error raised when too many operations are queued for an executor."""
+
+
+class _RaisedError:
+    """An exception raised in a worker process, rebuilt in the caller."""
+
+    def __init__(self, err: Exception):
+        # exceptions with custom constructors cannot always be pickled as-is
+        self.cls = type(err)
+        self.args = err.args
+        self.attrs = dict(err.__dict__)
+
+    def rebuild(self) -> Exception:
+        err = self.cls.__new__(self.cls)
+        err.args = self.args
+        err.__dict__.update(self.attrs)
+        return err
+
+
+def _timed_call(fn: Callable, *args):
+    """Run an operation, reporting when it started and ended and any error."""
+    started = time.monotonic()
+    try:
+        result, error = fn(*args), None
+    except Exception as err:
+        result, error = None, err
+    return started, time.monotonic(), result, error
+
+
+def _timed_process_call(fn: Callable, *args):
+    """Run an operation in a worker process, capturing any error for the caller."""
+    started, ended, result, error = _timed_call(fn, *args)
+    return started, ended, result, error and _RaisedError(error)
+
+
+class NamedExecutor:
+    """A sized executor for one class of blocking operations."""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int = None,
+        max_queued: int = 0,
+        backend: str = BACKEND_THREAD,
+    ):
+        """
+        Initialize a `NamedExecutor` instance.
+
+        Args:
+            name: the executor name
+            workers: the number of worker threads or processes
+            max_queued: the maximum number of operations waiting for a worker,
+                or 0 for no limit
+            backend: "thread" or "process"
+
+        """
+        if backend not in (BACKEND_THREAD, BACKEND_PROCESS):
+            raise ExecutorError(f"Unknown executor backend: {backend}")
+        if backend == BACKEND_PROCESS and name not in PROCESS_EXECUTORS:
+            raise ExecutorError(f"Executor {name} does not support processes")
+        self.name = name
+        self.workers = workers or _default_workers()
+        self.max_queued = max_queued
+        self.backend = backend
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+        self._executor: Executor = None
+
+    @property
+    def executor(self) -> Executor:
+        """Accessor for the underlying executor, created on first use."""
+        if not self._executor:
+            if self.backend == BACKEND_PROCESS:
+                # worker processes are spawned, as forking a threaded process
+                # may deadlock
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix=f"acapy-{self.name}"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """
+        Run a blocking operation on the executor.
+
+        Raises:
+            ExecutorFullError: If the queue limit of the executor is reached
+
+        """
+        if self.max_queued and self.pending >= self.workers + self.max_queued:
+            self.rejected += 1
+            raise ExecutorFullError(f"Too many operations queued for {self.name}")
+        call = _timed_process_call if self.backend == BACKEND_PROCESS else _timed_call
+        submitted = time.monotonic()
+        self.pending += 1
+        try:
+            (
+                started,
+                ended,
+                result,
+                error,
+            ) = await asyncio.get_event_loop().run_in_executor(
+                self.executor, call, fn, *args
+            )
+        except Exception:
+            # the operation could not be submitted or its result returned
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        wait = max(0.0, started - submitted)
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.run_total += ended - started
+        if error:
+            self.failed += 1
+            raise error.rebuild() if isinstance(error, _RaisedError) else error
+        self.completed += 1
+        return result
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the executor metrics."""
+        count = self.completed + self.failed
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "max_queued": self.max_queued,
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "wait_avg": self.wait_total / count if count else 0.0,
+            "wait_max": self.wait_max,
+            "run_avg": self.run_total / count if count else 0.0,
+        }
+
+    def shutdown(self, wait: bool = False):
+        """Shut down the underlying executor."""
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+_EXECUTORS: Dict[str, NamedExecutor] = {}
+
+
+def get_executor(name: str) -> NamedExecutor:
+    """Return the executor with a name, creating it with defaults if needed."""
+    executor = _EXECUTORS.get(name)
+    if not executor:
+        if name not in EXECUTOR_DEFAULTS:
+            raise ExecutorError(f"Unknown executor: {name}")
+        options = {
+            option: get_executor_default(name, option)
+            for option in EXECUTOR_DEFAULTS[name]
+        }
+        executor = _EXECUTORS[name] = NamedExecutor(name, **options)
+    return executor
+
+
+async def run_in_executor(name: str, fn: Callable, *args) -> Any:
+    """Run a blocking operation on the named executor."""
+    return await get_executor(name).run(fn, *args)
+
+
+def configure_executors(config: Mapping[str, Mapping[str, Any]] = None):
+    """
+    Configure the named executors, replacing any already created.
+
+    Args:
+        config: options per executor name: "workers", "max_queued" and "backend"
+
+    Raises:
+        ExecutorError: If an executor name or backend is unknown
+
+    """
+    shutdown_executors()
+    for name, options in (config or {}).items():
+        if name not in EXECUTOR_DEFAULTS:
+            raise ExecutorError(f"Unknown executor: {name}")
+        _EXECUTORS[name] = NamedExecutor(
+            name,
+            workers=options.get("workers") or get_executor_default(name, "workers"),
+            max_queued=options.get("max_queued", 0),
+            backend=options.get("backend", BACKEND_THREAD),
+        )
+        LOGGER.debug("Configured executor %s: %s", name, _EXECUTORS[name].stats)
+
+
+def get_executor_default(name: str, option: str) -> Any:
+    """Return the default value of an executor option."""
+    value = EXECUTOR_DEFAULTS[name].get(option)
+    return value() if callable(value) else value
+
+
+def executor_stats() -> dict:
+    """Return the metrics of each executor in use."""
+    return {name: executor.stats for name, executor in sorted(_EXECUTORS.items())}
+
+
+def shutdown_executors(wait: bool = False):
+    """Shut down all the named executors."""
+    for executor in _EXECUTORS.values():
+        executor.shutdown(wait)
+    _EXECUTORS.clear()
@@ -0,0 +1,169 @@
+"""
+Pluggable JSON codec for high-volume encoding and decoding.
+
+The codec is used where JSON is produced and consumed in bulk: wire message
+parsing, storage record values and webhook payloads. Admin responses are
+encoded by aiohttp. It defaults to the standard library and may be switched at
+startup to a faster library, if installed.
+
+Values which are not JSON types are rejected as they are by the standard
+library, so that code does not come to depend on a faster codec. The one
+exception is `orjson`, which always encodes `uuid.UUID` values.
+
+Output which is signed, hashed or otherwise compared byte for byte must not be
+produced through this codec: other libraries do not reproduce the formatting
+of `json.dumps`. Such call sites use the `json` module directly.
+"""
+
+import json
+import logging
+
+from typing import Any, Callable, Dict, Sequence, Union
+
+from ..core.error import BaseError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class JsonCodecError(BaseError):
+    """Error raised when a JSON codec cannot be selected."""
+
+
+class JsonCodec:
+    """JSON codec based on the standard library `json` module."""
+
+    name = "stdlib"
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(value)
+
+    def dumps(self, value: Any) -> str:
+        """Encode a JSON document."""
+        return json.dumps(value)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if orjson is not installed."""
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        # datetime and dataclass values are rejected, as by the standard library
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._loads(value)
+        except ValueError:
+            # orjson rejects some valid input, such as integers beyond 64 bits
+            return json.loads(value)
+
+    def dumps(self, value: Any) -> str:
+        """Encode a JSON document."""
+        try:
+            return self._dumps(value, option=self._options).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values, such as integers beyond 64 bits
+            return json.dumps(value)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec based on `ujson`."""
+
+    name = "ujson"
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if ujson is not installed."""
+        import ujson
+
+        self._loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._loads(value)
+        except ValueError:
+            return json.loads(value)
+
+    def dumps(self, value: Any) -> str:
+        """Encode a JSON document."""
+        try:
+            return self._dumps(value, ensure_ascii=True, escape_forward_slashes=False)
+        except (OverflowError, TypeError):
+            return json.dumps(value)
+
+
+JSON_CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+AUTO_CODEC_ORDER: Sequence[str] = (OrjsonCodec.name, UjsonCodec.name)
+
+_CODEC = JsonCodec()
+
+
+def loads(value: Union[str, bytes]) -> Any:
+    """Decode a JSON document with the selected codec."""
+    return _CODEC.loads(value)
+
+
+def dumps(value: Any) -> str:
+    """Encode a JSON document with the selected codec."""
+    return _CODEC.dumps(value)
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the selected JSON codec."""
+    return _CODEC
+
+
+def set_json_codec(name: str = None) -> JsonCodec:
+    """
+    Select the JSON codec.
+
+    Args:
+        name: The codec name, "auto" for the fastest one installed, or None
+            for the standard library
+
+    Returns:
+        The selected codec
+
+    Raises:
+        JsonCodecError: If the codec is unknown or its library is not installed
+
+    """
+    global _CODEC
+
+    if name == "auto":
+        for candidate in AUTO_CODEC_ORDER:
+            try:
+                _CODEC = JSON_CODECS[candidate]()
+                break
+            except ImportError:
+                continue
+        else:
+            _CODEC = JsonCodec()
+    else:
+        name = name or JsonCodec.name
+        if name not in JSON_CODECS:
+            raise JsonCodecError(f"Unknown JSON codec: {name}")
+        try:
+            _CODEC = JSON_CODECS[name]()
+        except ImportError as err:
+            raise JsonCodecError(f"JSON codec {name} is not installed") from err
+
+    LOGGER.debug("Using %s JSON codec", _CODEC.name)
+    return _CODEC
@@ -3,11 +3,38 @@
 import asyncio
 import logging
 import time
-from typing import Callable, Coroutine, Tuple
+from collections import deque
+from enum import IntEnum
+from itertools import chain, cycle
+from typing import Callable, Coroutine, Deque, Dict, Hashable, Sequence, Tuple
+
+from ..core.error import BaseError
 
 LOGGER = logging.getLogger(__name__)
 
 
+class TaskPriority(IntEnum):
+    """Priority classes for queued tasks, in decreasing order of precedence."""
+
+    HIGH = 0  # inbound message handling
+    NORMAL = 1  # admin requests, outbound message encoding and delivery
+    LOW = 2  # webhooks and background jobs
+
+
+# Share of the pending tasks started from each priority while all are waiting
+PRIORITY_WEIGHTS = {TaskPriority.HIGH: 8, TaskPriority.NORMAL: 4, TaskPriority.LOW: 1}
+
+
+def task_priority(priority: TaskPriority) -> Callable:
+    """Mark a request handler to be queued at a given priority."""
+
+    def wrap(handler: Callable) -> Callable:
+        handler.task_priority = TaskPriority(priority)
+        return handler
+
+    return wrap
+
+
 def coro_ident(coro: Coroutine):
     """Extract an identifier for a coroutine."""
     return coro and (hasattr(coro, "__qualname__") and coro.__qualname__ or repr(coro))
@@ -43,10 +70,12 @@ class CompletedTask:
         exc_info: Tuple,
         ident: str = None,
         timing: dict = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ):
         """Initialize the completed task."""
         self.exc_info = exc_info
         self.ident = ident
+        self.priority = priority
         self.task = task
         self.timing = timing
 
@@ -65,6 +94,7 @@ class PendingTask:
         ident: str = None,
         task_future: asyncio.Future = None,
         queued_time: float = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ):
         """
         Initialize the pending task.
@@ -75,6 +105,7 @@ class PendingTask:
             ident: A string identifier for the task
             task_future: A future to be resolved to the asyncio Task
             queued_time: When the pending task was added to the queue
+            priority: The priority class of the task
         """
         if not asyncio.iscoroutine(coro):
             raise ValueError(f"Expected coroutine, got {coro}")
@@ -84,6 +115,7 @@ class PendingTask:
         self.queued_time: float = queued_time
         self.unqueued_time: float = None
         self.ident = ident or coro_ident(coro)
+        self.priority = TaskPriority(priority)
         self.task_future = task_future or asyncio.get_event_loop().create_future()
 
     def cancel(self):
@@ -137,7 +169,6 @@ class TaskQueue:
         """
         self.loop = asyncio.get_event_loop()
         self.active_tasks = []
-        self.pending_tasks = []
         self.timed = timed
         self.total_done = 0
         self.total_failed = 0
@@ -147,6 +178,14 @@ class TaskQueue:
         self._drain_evt = asyncio.Event()
         self._drain_task: asyncio.Task = None
         self._max_active = max_active
+        self._pending: Dict[TaskPriority, Deque[PendingTask]] = {
+            priority: deque() for priority in TaskPriority
+        }
+        self._credits = dict(PRIORITY_WEIGHTS)
+        self._priority_counts = {
+            priority: {"active": 0, "started": 0, "done": 0, "failed": 0}
+            for priority in TaskPriority
+        }
 
     @property
     def cancelled(self) -> bool:
@@ -167,6 +206,22 @@ class TaskQueue:
             or self.current_size < self._max_active
         )
 
+    @property
+    def pending_tasks(self) -> Sequence[PendingTask]:
+        """Accessor for the pending tasks, in order of priority."""
+        return list(chain(*self._pending.values()))
+
+    @property
+    def priority_stats(self) -> dict:
+        """Accessor for the task counts of each priority class."""
+        return {
+            priority.name.lower(): {
+                **self._priority_counts[priority],
+                "pending": len(self._pending[priority]),
+            }
+            for priority in TaskPriority
+        }
+
     @property
     def current_active(self) -> int:
         """Accessor for the current number of active tasks in the queue."""
@@ -175,12 +230,12 @@ class TaskQueue:
     @property
     def current_pending(self) -> int:
         """Accessor for the current number of pending tasks in the queue."""
-        return len(self.pending_tasks)
+        return sum(len(pending) for pending in self._pending.values())
 
     @property
     def current_size(self) -> int:
         """Accessor for the total number of tasks in the queue."""
-        return len(self.active_tasks) + len(self.pending_tasks)
+        return len(self.active_tasks) + self.current_pending
 
     def __bool__(self) -> bool:
         """
@@ -199,7 +254,7 @@ class TaskQueue:
         """Start the process to run queued tasks."""
         if self._drain_task and not self._drain_task.done():
             self._drain_evt.set()
-        elif self.pending_tasks:
+        elif self.current_pending:
             self._drain_task = self.loop.create_task(self._drain_loop())
             self._drain_task.add_done_callback(lambda task: self._drain_done(task))
         return self._drain_task
@@ -218,10 +273,13 @@ class TaskQueue:
         # waiting for the drain event, to avoid yielding to other queue methods
         while True:
             self._drain_evt.clear()
-            while self.pending_tasks and (
+            while self.current_pending and (
                 not self._max_active or len(self.active_tasks) < self._max_active
             ):
-                pending: PendingTask = self.pending_tasks.pop(0)
+                pending = self._next_pending()
+                if pending.cancelled:
+                    # the coroutine was closed when the task was cancelled
+                    continue
                 if pending.queued_time:
                     pending.unqueued_time = time.perf_counter()
                     timing = {
@@ -231,17 +289,35 @@ class TaskQueue:
                 else:
                     timing = None
                 task = self.run(
-                    pending.coro, pending.complete_hook, pending.ident, timing
+                    pending.coro,
+                    pending.complete_hook,
+                    pending.ident,
+                    timing,
+                    pending.priority,
                 )
                 try:
                     pending.task = task
                 except ValueError:
                     LOGGER.warning("Pending task future already fulfilled")
-            if self.pending_tasks:
+            if self.current_pending:
                 await self._drain_evt.wait()
             else:
                 break
 
+    def _next_pending(self) -> PendingTask:
+        """
+        Take the next pending task to run.
+
+        Priorities are served in proportion to their weights while several have
+        tasks waiting, so that lower priorities are slowed down but not starved.
+        """
+        for _ in range(2):
+            for priority, pending in self._pending.items():
+                if pending and self._credits[priority]:
+                    self._credits[priority] -= 1
+                    return pending.popleft()
+            self._credits = dict(PRIORITY_WEIGHTS)
+
     def add_pending(self, pending: PendingTask):
         """
         Add a task to the pending queue.
@@ -251,7 +327,7 @@ class TaskQueue:
         """
         if self.timed and not pending.queued_time:
             pending.queued_time = time.perf_counter()
-        self.pending_tasks.append(pending)
+        self._pending[pending.priority].append(pending)
         self.drain()
 
     def add_active(
@@ -260,6 +336,7 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ) -> asyncio.Task:
         """
         Register an active async task with an optional completion callback.
@@ -269,12 +346,19 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifer for the task
             timing: An optional dictionary of timing information
+            priority: The priority class of the task
         """
+        priority = TaskPriority(priority)
         self.active_tasks.append(task)
         task.add_done_callback(
-            lambda fut: self.completed_task(task, task_complete, ident, timing)
+            lambda fut: self.completed_task(
+                task, task_complete, ident, timing, priority
+            )
         )
         self.total_started += 1
+        counts = self._priority_counts[priority]
+        counts["started"] += 1
+        counts["active"] += 1
         return task
 
     def run(
@@ -283,6 +367,7 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ) -> asyncio.Task:
         """
         Start executing a coroutine as an async task, bypassing the pending queue.
@@ -292,6 +377,7 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifier for the task
             timing: An optional dictionary of timing information
+            priority: The priority class of the task, for reporting
 
         Returns: the new asyncio task instance
 
@@ -307,10 +393,14 @@ class TaskQueue:
                 timing = dict()
             coro = coro_timed(coro, timing)
         task = self.loop.create_task(coro)
-        return self.add_active(task, task_complete, ident, timing)
+        return self.add_active(task, task_complete, ident, timing, priority)
 
     def put(
-        self, coro: Coroutine, task_complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ) -> PendingTask:
         """
         Add a new task to the queue, delaying execution if busy.
@@ -319,15 +409,34 @@ class TaskQueue:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            priority: The priority class of the task
 
         Returns: a future resolving to the asyncio task instance once queued
 
         """
-        pending = PendingTask(coro, task_complete, ident)
+        return self.put_pending(
+            PendingTask(coro, task_complete, ident, priority=priority)
+        )
+
+    def put_pending(self, pending: PendingTask) -> PendingTask:
+        """
+        Add a pending task to the queue, delaying execution if busy.
+
+        Args:
+            pending: The `PendingTask` to run
+
+        Returns: the pending task
+
+        """
         if self._cancelled:
             pending.cancel()
         elif self.ready:
-            pending.task = self.run(coro, task_complete, pending.ident)
+            pending.task = self.run(
+                pending.coro,
+                pending.complete_hook,
+                pending.ident,
+                priority=pending.priority,
+            )
         else:
             self.add_pending(pending)
         return pending
@@ -338,9 +447,13 @@ class TaskQueue:
         task_complete: Callable,
         ident: str,
         timing: dict = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
     ):
         """Clean up after a task has completed and run callbacks."""
         exc_info = task_exc_info(task)
+        counts = self._priority_counts[priority]
+        counts["active"] -= 1
+        counts["failed" if exc_info else "done"] += 1
         if exc_info:
             self.total_failed += 1
             if not task_complete and not self._trace_fn:
@@ -350,7 +463,7 @@ class TaskQueue:
         else:
             self.total_done += 1
         if task_complete or self._trace_fn:
-            completed = CompletedTask(task, exc_info, ident, timing)
+            completed = CompletedTask(task, exc_info, ident, timing, priority)
             try:
                 if task_complete:
                     task_complete(completed)
@@ -371,7 +484,8 @@ class TaskQueue:
             self._drain_task = None
         for pending in self.pending_tasks:
             pending.cancel()
-        self.pending_tasks = []
+        for pending in self._pending.values():
+            pending.clear()
 
     def cancel(self):
         """Cancel any pending or active tasks in the queue."""
@@ -416,3 +530,208 @@ class TaskQueue:
     async def wait_for(self, timeout: float):
         """Wait for all queued tasks to complete with a timeout."""
         return await asyncio.wait_for(self.flush(), timeout)
+
+
+class TaskQueueFullError(BaseError):
+    """Error raised when a task cannot be queued for lack of room."""
+
+
+class ShardedTaskQueue:
+    """
+    A set of task queues running tasks in order per key.
+
+    Tasks sharing a key run one at a time in the order they were added, while
+    tasks for different keys run in parallel. Keys are distributed among the
+    shards, each a `TaskQueue` with its own share of the active task limit,
+    so that a busy key only competes for the slots of its own shard.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        max_active: int = 0,
+        max_pending_per_key: int = 0,
+        timed: bool = False,
+        trace_fn: Callable = None,
+    ):
+        """
+        Initialize the sharded task queue.
+
+        Args:
+            shards: The number of shards
+            max_active: The maximum number of tasks to run, divided among shards
+            max_pending_per_key: The maximum number of tasks waiting on an active
+                task with the same key, or zero for no limit
+            timed: A flag indicating that timing should be collected for tasks
+            trace_fn: A callback for all completed tasks
+        """
+        if shards < 1:
+            raise ValueError("Sharded task queue requires at least one shard")
+        per_shard = max(1, max_active // shards) if max_active else 0
+        self.shards: Sequence[TaskQueue] = tuple(
+            TaskQueue(max_active=per_shard, timed=timed, trace_fn=trace_fn)
+            for _ in range(shards)
+        )
+        self.max_pending_per_key = max_pending_per_key
+        self.total_rejected = 0
+        # key -> tasks waiting on the active task for the key
+        self._waiting: Dict[Hashable, Deque[PendingTask]] = {}
+        # key -> task queued or running in its shard
+        self._heads: Dict[Hashable, PendingTask] = {}
+        self._unkeyed = cycle(self.shards)
+
+    @property
+    def cancelled(self) -> bool:
+        """Accessor for the cancelled property of the queue."""
+        return self.shards[0].cancelled
+
+    @property
+    def current_active(self) -> int:
+        """Accessor for the current number of active tasks."""
+        return sum(shard.current_active for shard in self.shards)
+
+    @property
+    def current_pending(self) -> int:
+        """Accessor for the current number of pending tasks, including waiting ones."""
+        return sum(shard.current_pending for shard in self.shards) + sum(
+            len(waiting) for waiting in self._waiting.values()
+        )
+
+    @property
+    def current_keys(self) -> int:
+        """Accessor for the current number of keys with an active or pending task."""
+        return len(self._waiting)
+
+    @property
+    def priority_stats(self) -> dict:
+        """Accessor for the task counts of each priority class."""
+        stats = {}
+        for shard in self.shards:
+            for priority, counts in shard.priority_stats.items():
+                totals = stats.setdefault(priority, dict.fromkeys(counts, 0))
+                for name, count in counts.items():
+                    totals[name] += count
+        return stats
+
+    @property
+    def total_done(self) -> int:
+        """Accessor for the number of tasks completed successfully."""
+        return sum(shard.total_done for shard in self.shards)
+
+    @property
+    def total_failed(self) -> int:
+        """Accessor for the number of failed tasks."""
+        return sum(shard.total_failed for shard in self.shards)
+
+    def shard_for(self, key: Hashable) -> TaskQueue:
+        """Return the shard running the tasks for a key."""
+        return self.shards[hash(key) % len(self.shards)]
+
+    def put(
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        key: Hashable = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+    ) -> PendingTask:
+        """
+        Add a new task to the queue, after any other task for the same key.
+
+        Args:
+            coro: The coroutine to run
+            task_complete: A callback to run on completion
+            ident: A string identifier for the task
+            key: The ordering key, or None to run the task without ordering
+            priority: The priority class of the task
+
+        Returns: a future resolving to the asyncio task instance once queued
+
+        Raises:
+            TaskQueueFullError: If too many tasks are waiting for the key
+
+        """
+        if key is None:
+            return next(self._unkeyed).put(coro, task_complete, ident, priority)
+
+        waiting = self._waiting.get(key)
+        if waiting is not None and (
+            self.max_pending_per_key and len(waiting) >= self.max_pending_per_key
+        ):
+            coro.close()
+            self.total_rejected += 1
+            raise TaskQueueFullError(f"Too many tasks queued for key: {key}")
+
+        def complete(completed: CompletedTask):
+            try:
+                if task_complete:
+                    task_complete(completed)
+            finally:
+                self._advance(key)
+
+        pending = PendingTask(coro, complete, ident, priority=priority)
+        pending.task_future.add_done_callback(
+            lambda fut: fut.cancelled() and self._handle_cancelled(key, pending)
+        )
+        if waiting is None:
+            self._waiting[key] = deque()
+            self._heads[key] = pending
+            self.shard_for(key).put_pending(pending)
+            if pending.cancelled:
+                del self._waiting[key]
+                del self._heads[key]
+        else:
+            waiting.append(pending)
+        return pending
+
+    def _advance(self, key: Hashable):
+        """Start the next task for a key once the previous one has completed."""
+        waiting = self._waiting.get(key)
+        while waiting:
+            pending = waiting.popleft()
+            if not pending.cancelled:
+                self._heads[key] = pending
+                self.shard_for(key).put_pending(pending)
+                if not pending.cancelled:
+                    return
+        self._waiting.pop(key, None)
+        self._heads.pop(key, None)
+
+    def _handle_cancelled(self, key: Hashable, pending: PendingTask):
+        """Release the place of a task cancelled before it was started."""
+        if self._heads.get(key) is pending:
+            # the task will not complete, so start the next one for the key
+            self._advance(key)
+        else:
+            waiting = self._waiting.get(key)
+            if waiting and pending in waiting:
+                waiting.remove(pending)
+
+    def cancel(self):
+        """Cancel any waiting, pending or active tasks in the queue."""
+        for waiting in self._waiting.values():
+            for pending in waiting:
+                pending.cancel()
+        self._waiting.clear()
+        self._heads.clear()
+        for shard in self.shards:
+            shard.cancel()
+
+    async def complete(self, timeout: float = None, cleanup: bool = True):
+        """Cancel any waiting tasks and wait for, or cancel active tasks."""
+        for waiting in self._waiting.values():
+            for pending in waiting:
+                pending.cancel()
+        self._waiting.clear()
+        self._heads.clear()
+        await asyncio.gather(
+            *(shard.complete(timeout, cleanup) for shard in self.shards)
+        )
+
+    async def flush(self):
+        """Wait for any active, pending or waiting tasks to be completed."""
+        while self._waiting or any(
+            shard.active_tasks or shard.current_pending for shard in self.shards
+        ):
+            await asyncio.gather(*(shard.flush() for shard in self.shards))
+            await asyncio.sleep(0)
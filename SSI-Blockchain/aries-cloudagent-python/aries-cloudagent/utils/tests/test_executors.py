@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+from asynctest import TestCase as AsyncTestCase
+
+from .. import executors as test_module
+from ..executors import ExecutorError, ExecutorFullError, NamedExecutor
+
+
+class CustomError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def raise_custom(code: int):
+    raise CustomError(code, "failed")
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class TestNamedExecutor(AsyncTestCase):
+    def tearDown(self):
+        test_module.shutdown_executors(wait=True)
+
+    async def test_run(self):
+        executor = NamedExecutor(test_module.PACK, workers=2)
+        names = set()
+
+        def work(value):
+            names.add(threading.current_thread().name)
+            return value * 2
+
+        assert await executor.run(work, 2) == 4
+        with self.assertRaises(ValueError):
+            await executor.run(int, "x")
+        assert names == {"acapy-pack_0"}
+        stats = executor.stats
+        assert stats["workers"] == 2
+        assert stats["completed"] == 1
+        assert stats["failed"] == 1
+        assert stats["pending"] == 0
+        assert stats["wait_avg"] >= 0.0
+        executor.shutdown(wait=True)
+
+    async def test_max_queued(self):
+        executor = NamedExecutor(test_module.PACK, workers=1, max_queued=1)
+        release = threading.Event()
+        running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert executor.pending == 2
+        with self.assertRaises(ExecutorFullError):
+            await executor.run(release.wait)
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert executor.stats["rejected"] == 1
+        assert executor.stats["wait_max"] > 0.0
+        executor.shutdown(wait=True)
+
+    async def test_process(self):
+        executor = NamedExecutor(
+            test_module.ANONCREDS_VERIFY,
+            workers=1,
+            backend=test_module.BACKEND_PROCESS,
+        )
+        assert await executor.run(add, 1, 2) == 3
+        with self.assertRaises(CustomError) as context:
+            await executor.run(raise_custom, 5)
+        assert context.exception.code == 5
+        assert str(context.exception) == "failed"
+        executor.shutdown(wait=True)
+
+    def test_backend_errors(self):
+        with self.assertRaises(ExecutorError):
+            NamedExecutor(test_module.PACK, backend="fiber")
+        with self.assertRaises(ExecutorError):
+            NamedExecutor(test_module.PACK, backend=test_module.BACKEND_PROCESS)
+
+
+class TestExecutors(AsyncTestCase):
+    def tearDown(self):
+        test_module.shutdown_executors(wait=True)
+
+    async def test_run_in_executor(self):
+        assert await test_module.run_in_executor(test_module.PACK, add, 1, 2) == 3
+        assert test_module.get_executor(test_module.ANONCREDS_REGISTRY).workers == 1
+        stats = test_module.executor_stats()
+        assert list(stats) == [test_module.ANONCREDS_REGISTRY, test_module.PACK]
+        assert stats[test_module.PACK]["completed"] == 1
+        with self.assertRaises(ExecutorError):
+            test_module.get_executor("unknown")
+
+    def test_configure(self):
+        test_module.configure_executors(
+            {
+                test_module.ANONCREDS_VERIFY: {
+                    "workers": 3,
+                    "max_queued": 10,
+                    "backend": test_module.BACKEND_PROCESS,
+                },
+                test_module.ANONCREDS_REGISTRY: {"max_queued": 2},
+            }
+        )
+        verify = test_module.get_executor(test_module.ANONCREDS_VERIFY)
+        assert (verify.workers, verify.max_queued, verify.backend) == (
+            3,
+            10,
+            test_module.BACKEND_PROCESS,
+        )
+        assert test_module.get_executor(test_module.ANONCREDS_REGISTRY).workers == 1
+
+        test_module.configure_executors()
+        assert not test_module.executor_stats()
+        with self.assertRaises(ExecutorError):
+            test_module.configure_executors({"unknown": {}})
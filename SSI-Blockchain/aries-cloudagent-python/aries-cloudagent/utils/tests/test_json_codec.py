@@ -0,0 +1,104 @@
+import json
+import sys
+
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import TestCase, mock, skipUnless
+from uuid import uuid4
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .. import json_codec as test_module
+
+BIG = 2**70
+DOC = {"@type": "https://didcomm.org/trust_ping/1.0/ping", "count": 3, "ok": True}
+
+
+def fake_dumps(value, option=None):
+    if any(isinstance(v, int) and v > 2**63 for v in value.values()):
+        raise TypeError("Integer exceeds 64-bit range")
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def fake_loads(value):
+    if str(BIG) in str(value):
+        raise ValueError("Integer exceeds 64-bit range")
+    return json.loads(value)
+
+
+FAKE_ORJSON = SimpleNamespace(
+    loads=fake_loads,
+    dumps=fake_dumps,
+    OPT_NON_STR_KEYS=4,
+    OPT_PASSTHROUGH_DATETIME=512,
+    OPT_PASSTHROUGH_DATACLASS=2048,
+)
+
+
+@dataclass
+class Point:
+    x: int
+
+
+class TestJsonCodec(TestCase):
+    def tearDown(self):
+        test_module.set_json_codec()
+
+    def test_default(self):
+        codec = test_module.get_json_codec()
+        assert codec.name == "stdlib"
+        assert test_module.dumps(DOC) == json.dumps(DOC)
+        assert test_module.loads(json.dumps(DOC)) == DOC
+        assert test_module.loads(json.dumps(DOC).encode()) == DOC
+
+    def test_set_codec(self):
+        with mock.patch.dict(sys.modules, {"orjson": FAKE_ORJSON}):
+            codec = test_module.set_json_codec("orjson")
+        assert test_module.get_json_codec() is codec
+        assert codec.name == "orjson"
+        assert test_module.dumps(DOC) == json.dumps(DOC, separators=(",", ":"))
+        assert test_module.loads(test_module.dumps(DOC)) == DOC
+
+        # values rejected by the library are handled by the standard library
+        assert test_module.dumps({"n": BIG}) == json.dumps({"n": BIG})
+        assert test_module.loads(json.dumps({"n": BIG})) == {"n": BIG}
+        with self.assertRaises(ValueError):
+            test_module.loads("{")
+
+        assert test_module.set_json_codec().name == "stdlib"
+
+    def test_set_codec_auto(self):
+        with mock.patch.dict(sys.modules, {"orjson": None, "ujson": None}):
+            assert test_module.set_json_codec("auto").name == "stdlib"
+        with mock.patch.dict(sys.modules, {"orjson": FAKE_ORJSON, "ujson": None}):
+            assert test_module.set_json_codec("auto").name == "orjson"
+
+    def test_set_codec_x(self):
+        with self.assertRaises(test_module.JsonCodecError):
+            test_module.set_json_codec("bogus")
+        with mock.patch.dict(sys.modules, {"ujson": None}):
+            with self.assertRaises(test_module.JsonCodecError):
+                test_module.set_json_codec("ujson")
+        assert test_module.get_json_codec().name == "stdlib"
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_orjson_non_json_types(self):
+        codec = test_module.set_json_codec("orjson")
+        assert codec.name == "orjson"
+        # rejected as they are by the standard library
+        for value in (datetime.now(), datetime.now().date(), Point(1)):
+            with self.assertRaises(TypeError):
+                json.dumps({"value": value})
+            with self.assertRaises(TypeError):
+                test_module.dumps({"value": value})
+        # accepted by orjson only
+        value = uuid4()
+        with self.assertRaises(TypeError):
+            json.dumps({"value": value})
+        assert test_module.loads(test_module.dumps({"value": value})) == {
+            "value": str(value)
+        }
@@ -2,7 +2,16 @@ import asyncio
 
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
-from ..task_queue import CompletedTask, PendingTask, TaskQueue, task_exc_info
+from ..task_queue import (
+    CompletedTask,
+    PendingTask,
+    ShardedTaskQueue,
+    TaskPriority,
+    TaskQueue,
+    TaskQueueFullError,
+    task_exc_info,
+    task_priority,
+)
 
 
 async def retval(val, *, delay=0):
@@ -226,3 +235,187 @@ class TestTaskQueue(AsyncTestCase):
         assert len(completed) == 2
         assert "queued" not in completed[0][1]
         assert "queued" in completed[1][1]
+
+    async def test_priority_order(self):
+        queue = TaskQueue(max_active=1)
+        started = []
+
+        async def record(val):
+            started.append(val)
+
+        queue.run(retval(0, delay=0.01))
+        for index in range(10):
+            queue.put(record(f"low-{index}"), priority=TaskPriority.LOW)
+        for index in range(20):
+            queue.put(record(f"high-{index}"), priority=TaskPriority.HIGH)
+        for index in range(10):
+            queue.put(record(f"normal-{index}"))
+        assert queue.pending_tasks[0].priority == TaskPriority.HIGH
+        assert queue.pending_tasks[-1].priority == TaskPriority.LOW
+        await queue.flush()
+
+        # weighted between priorities, in order of arrival within each priority
+        assert started[:13] == [
+            *(f"high-{index}" for index in range(8)),
+            *(f"normal-{index}" for index in range(4)),
+            "low-0",
+        ]
+        assert [val for val in started if val.startswith("low")] == [
+            f"low-{index}" for index in range(10)
+        ]
+        assert len(started) == 40
+
+    def test_task_priority(self):
+        @task_priority(TaskPriority.LOW)
+        async def handler():
+            pass
+
+        assert handler.task_priority == TaskPriority.LOW
+
+    async def test_priority_stats(self):
+        queue = TaskQueue(max_active=1)
+
+        async def fail():
+            raise ValueError()
+
+        completed = []
+        queue.run(retval(1, delay=0.01), completed.append, priority=TaskPriority.HIGH)
+        queue.put(fail(), completed.append, priority=TaskPriority.LOW)
+        stats = queue.priority_stats
+        assert stats["high"] == {
+            "active": 1,
+            "started": 1,
+            "done": 0,
+            "failed": 0,
+            "pending": 0,
+        }
+        assert stats["low"]["pending"] == 1
+        await queue.flush()
+
+        stats = queue.priority_stats
+        assert stats["high"]["done"] == 1
+        assert stats["low"]["failed"] == 1
+        assert stats["normal"]["started"] == 0
+        assert not any(counts["active"] for counts in stats.values())
+        assert [task.priority for task in completed] == [
+            TaskPriority.HIGH,
+            TaskPriority.LOW,
+        ]
+
+
+class TestShardedTaskQueue(AsyncTestCase):
+    async def test_order_per_key(self):
+        queue = ShardedTaskQueue(2, max_active=4)
+        events = []
+
+        async def record(name, delay):
+            events.append(("start", name))
+            await asyncio.sleep(delay)
+            events.append(("end", name))
+            return name
+
+        completed = []
+        pendings = [
+            queue.put(record("a1", 0.02), lambda c: completed.append(c), key="a"),
+            queue.put(record("a2", 0), lambda c: completed.append(c), key="a"),
+            queue.put(record("b1", 0.01), key="b"),
+        ]
+        assert queue.current_keys == 2
+        assert queue.current_active == 2
+        assert queue.current_pending == 1
+
+        await queue.flush()
+        assert events.index(("end", "a1")) < events.index(("start", "a2"))
+        # other keys are not held up by the first one
+        assert events.index(("start", "b1")) < events.index(("end", "a1"))
+        assert [c.task.result() for c in completed] == ["a1", "a2"]
+        assert [(await p).result() for p in pendings] == ["a1", "a2", "b1"]
+        assert queue.total_done == 3
+        assert not queue.current_keys
+
+    async def test_key_failure_advances(self):
+        queue = ShardedTaskQueue(1)
+
+        async def fail():
+            raise ValueError("failed")
+
+        def bad_hook(completed: CompletedTask):
+            raise RuntimeError("hook failed")
+
+        queue.put(fail(), bad_hook, key="a")
+        second = queue.put(retval(2), key="a")
+        await queue.flush()
+        assert (await second).result() == 2
+        assert queue.total_failed == 1
+        assert queue.total_done == 1
+
+    async def test_unkeyed(self):
+        queue = ShardedTaskQueue(3)
+        pendings = [queue.put(retval(n)) for n in range(3)]
+        assert all(shard.current_active == 1 for shard in queue.shards)
+        await queue.flush()
+        assert [(await p).result() for p in pendings] == [0, 1, 2]
+        assert queue.shard_for("key") is queue.shard_for("key")
+
+        with self.assertRaises(ValueError):
+            ShardedTaskQueue(0)
+
+    async def test_max_pending_per_key(self):
+        queue = ShardedTaskQueue(2, max_pending_per_key=1)
+        queue.put(retval(1, delay=0.01), key="a")
+        queue.put(retval(2), key="a")
+        coro = retval(3)
+        with self.assertRaises(TaskQueueFullError):
+            queue.put(coro, key="a")
+        assert coro.cr_frame is None  # closed
+        assert queue.total_rejected == 1
+        queue.put(retval(4), key="b")
+        await queue.flush()
+        assert queue.total_done == 3
+
+    async def test_complete(self):
+        queue = ShardedTaskQueue(2, max_active=2)
+        first = queue.put(retval(1, delay=5), key="a")
+        waiting = queue.put(retval(2), key="a")
+        await queue.complete(0.01)
+        assert queue.cancelled
+        assert (await first).cancelled()
+        assert waiting.cancelled
+        assert not queue.current_keys
+
+        assert queue.put(retval(3), key="b").cancelled
+        assert not queue.current_keys
+
+    async def test_cancel(self):
+        queue = ShardedTaskQueue(2)
+        first = queue.put(retval(1, delay=5), key="a")
+        waiting = queue.put(retval(2), key="a")
+        queue.cancel()
+        assert waiting.cancelled
+        assert queue.cancelled
+        await asyncio.sleep(0)
+        assert (await first).cancelled()
+
+    async def test_cancel_pending_releases_key(self):
+        queue = ShardedTaskQueue(1, max_active=1, max_pending_per_key=1)
+        queue.put(retval(1, delay=0.01), key="a")
+        head = queue.put(retval(2), key="b")
+        waiting = queue.put(retval(3), key="b")
+        assert queue.shards[0].current_pending == 1
+        # cancelled while queued in its shard, the task never completes
+        head.cancel()
+        await asyncio.sleep(0)
+        next_waiting = queue.put(retval(4), key="b")
+        await queue.flush()
+        assert (await waiting).result() == 3
+        assert (await next_waiting).result() == 4
+        assert not queue.current_keys
+        assert not queue.total_failed
+
+        queue.put(retval(5, delay=0.01), key="c")
+        waiting = queue.put(retval(6), key="c")
+        waiting.cancel()
+        await asyncio.sleep(0)
+        assert not queue._waiting["c"]
+        await queue.flush()
+        assert not queue.current_keys
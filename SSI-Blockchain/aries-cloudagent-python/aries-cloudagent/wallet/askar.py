@@ -1,6 +1,5 @@
 """Aries-Askar implementation of BaseWallet interface."""
 
-import asyncio
 import json
 import logging
 
@@ -23,6 +22,7 @@ from ..ledger.endpoint_type import EndpointType
 from ..ledger.error import LedgerConfigError
 from ..storage.askar import AskarStorage
 from ..storage.base import StorageRecord, StorageDuplicateError, StorageNotFoundError
+from ..utils import executors
 
 from .base import BaseWallet, KeyInfo, DIDInfo
 from .crypto import (
@@ -694,8 +694,8 @@ class AskarWallet(BaseWallet):
                 from_key = from_key_entry.key
             else:
                 from_key = None
-            return await asyncio.get_event_loop().run_in_executor(
-                None, pack_message, to_verkeys, from_key, message
+            return await executors.run_in_executor(
+                executors.PACK, pack_message, to_verkeys, from_key, message
             )
         except AskarError as err:
             raise WalletError("Exception when packing message") from err
@@ -1,10 +1,10 @@
 """In-memory implementation of BaseWallet interface."""
 
-import asyncio
 from typing import List, Sequence, Tuple, Union
 
 from ..core.in_memory import InMemoryProfile
 from ..did.did_key import DIDKey
+from ..utils import executors
 
 from .base import BaseWallet
 from .crypto import (
@@ -503,8 +503,8 @@ class InMemoryWallet(BaseWallet):
 
         keys_bin = [b58_to_bytes(key) for key in to_verkeys]
         secret = self._get_private_key(from_verkey) if from_verkey else None
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, encode_pack_message, message, keys_bin, secret
+        result = await executors.run_in_executor(
+            executors.PACK, encode_pack_message, message, keys_bin, secret
         )
         return result
 
@@ -530,8 +530,8 @@ class InMemoryWallet(BaseWallet):
                 message,
                 from_verkey,
                 to_verkey,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: decode_pack_message(enc_message, self._get_private_key)
+            ) = await executors.run_in_executor(
+                executors.PACK, decode_pack_message, enc_message, self._get_private_key
             )
         except ValueError as e:
             raise WalletError("Message could not be unpacked: {}".format(str(e)))
@@ -9,6 +9,7 @@ from aiohttp_apispec import docs, querystring_schema, request_schema, response_s
 from marshmallow import fields, validate
 
 from ..admin.request_context import AdminRequestContext
+from ..cache.base import BaseCache, wallet_namespace
 from ..connections.models.conn_record import ConnRecord
 from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile
@@ -809,6 +810,13 @@ async def wallet_rotate_did_keypair(request: web.BaseRequest):
         except WalletError as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
 
+    # Connection targets and inbound lookups cached for this wallet use the old key
+    cache = context.profile.inject_or(BaseCache)
+    if cache:
+        wallet_id = context.settings.get("wallet.id")
+        for family in ("connection_target", "connection_by_verkey"):
+            await cache.invalidate_namespace(wallet_namespace(wallet_id, family))
+
     return web.json_response({})
 
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for the available JSON codecs.
+
+Times decoding and encoding of representative payloads with each codec which
+is installed: a packed wire message, a credential exchange record value as
+kept in storage, and an issue-credential webhook payload.
+
+Usage: python scripts/bench_json_codec.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+
+from aries_cloudagent.messaging.decorators.attach_decorator import AttachDecorator
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.tests import (
+    test_cred_issue,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.models.cred_ex_record import (
+    V20CredExRecord,
+)
+from aries_cloudagent.utils.json_codec import JSON_CODECS
+from aries_cloudagent.wallet.util import bytes_to_b64
+
+CRED_ISSUE = test_cred_issue.TestV20CredIssue.CRED_ISSUE.serialize()
+RECORD = V20CredExRecord(
+    connection_id="9b2d8f5b-3a4b-4c3c-a5de-3e7e8c8b1f1a",
+    thread_id="4f6d2b8e-bb4d-4a8e-9f0c-3c9f5f1e9a11",
+    role=V20CredExRecord.ROLE_HOLDER,
+    state=V20CredExRecord.STATE_CREDENTIAL_RECEIVED,
+    cred_issue=CRED_ISSUE,
+    auto_offer=False,
+    auto_issue=False,
+).value
+PACKED = {
+    "protected": bytes_to_b64(
+        json.dumps(
+            {
+                "enc": "xchacha20poly1305_ietf",
+                "typ": "JWM/1.0",
+                "alg": "Authcrypt",
+                "recipients": [
+                    {
+                        "encrypted_key": "x" * 64,
+                        "header": {
+                            "kid": "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx",
+                            "sender": "s" * 128,
+                            "iv": "i" * 32,
+                        },
+                    }
+                ],
+            }
+        ).encode(),
+        urlsafe=True,
+    ),
+    "iv": "UA5B5s3Ev5sbpwpQ",
+    "ciphertext": AttachDecorator.data_base64(CRED_ISSUE).data.base64,
+    "tag": "TFB5mzFIYHs45-8eNHlfEg==",
+}
+PAYLOADS = {"packed": PACKED, "record": RECORD, "webhook": {**RECORD, "state": "done"}}
+
+
+def run(codec, payload, iterations: int):
+    """Time decoding and encoding of a payload, in microseconds per call."""
+    encoded = json.dumps(payload)
+    decode = min(
+        timeit.repeat(lambda: codec.loads(encoded), number=iterations, repeat=5)
+    )
+    encode = min(
+        timeit.repeat(lambda: codec.dumps(payload), number=iterations, repeat=5)
+    )
+    return decode / iterations * 1e6, encode / iterations * 1e6
+
+
+def main():
+    """Run the benchmark for each installed codec."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for name, codec_cls in JSON_CODECS.items():
+        try:
+            codec = codec_cls()
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+        for label, payload in PAYLOADS.items():
+            decode, encode = run(codec, payload, iterations)
+            print(
+                f"{name:>8} {label:>8} ({len(json.dumps(payload)):>6} bytes): "
+                f"loads {decode:7.1f} us, dumps {encode:7.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for BaseModel serialization with pooled schema instances.
+
+Compares a message round trip (deserialize, then serialize) using the pooled
+schema instances against constructing a new schema for every call, as was
+done before schemas were pooled, and a ping round trip through marshmallow
+against the compiled fast-path codec.
+
+Usage: python scripts/bench_model_serde.py [iterations]
+"""
+
+import sys
+import timeit
+
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.messaging.fast_codec import (
+    disable_fast_codecs,
+    enable_fast_codecs,
+)
+from aries_cloudagent.messaging.models import base
+from aries_cloudagent.protocols.connections.v1_0.messages.connection_request import (
+    ConnectionRequest,
+)
+from aries_cloudagent.protocols.didcomm_prefix import DIDCommPrefix
+from aries_cloudagent.protocols.trustping.v1_0.messages.ping import Ping
+
+REQUEST = {
+    "@type": DIDCommPrefix.qualify_current(ConnectionRequest.Meta.message_type),
+    "@id": "4f6d2b8e-bb4d-4a8e-9f0c-3c9f5f1e9a11",
+    "~thread": {"thid": "4f6d2b8e-bb4d-4a8e-9f0c-3c9f5f1e9a11"},
+    "label": "Alice",
+    "connection": {
+        "DID": "LjgpST2rjsoxYegQDRm7EL",
+        "DIDDoc": {
+            "@context": "https://w3id.org/did/v1",
+            "id": "did:sov:LjgpST2rjsoxYegQDRm7EL",
+            "publicKey": [
+                {
+                    "id": "did:sov:LjgpST2rjsoxYegQDRm7EL#1",
+                    "type": "Ed25519VerificationKey2018",
+                    "controller": "did:sov:LjgpST2rjsoxYegQDRm7EL",
+                    "publicKeyBase58": "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx",
+                }
+            ],
+            "service": [
+                {
+                    "id": "did:sov:LjgpST2rjsoxYegQDRm7EL;indy",
+                    "type": "IndyAgent",
+                    "priority": 0,
+                    "recipientKeys": ["3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"],
+                    "serviceEndpoint": "http://localhost:8020",
+                }
+            ],
+        },
+    },
+}
+RECORD = ConnRecord(
+    my_did="LjgpST2rjsoxYegQDRm7EL",
+    their_label="Bob",
+    state=ConnRecord.State.COMPLETED,
+).serialize()
+
+PING = {
+    "@type": DIDCommPrefix.qualify_current(Ping.Meta.message_type),
+    "@id": "4f6d2b8e-bb4d-4a8e-9f0c-3c9f5f1e9a12",
+    "~thread": {"thid": "4f6d2b8e-bb4d-4a8e-9f0c-3c9f5f1e9a11"},
+    "~timing": {"out_time": "2021-01-01T00:00:00Z"},
+    "comment": "ping",
+    "response_requested": True,
+}
+
+
+def round_trip():
+    """Deserialize and serialize a message and a record."""
+    ConnectionRequest.deserialize(REQUEST).serialize()
+    ConnRecord.deserialize(RECORD).serialize()
+
+
+def unpooled_schema(schema_cls, unknown=None):
+    """Construct a new schema instance, bypassing the pool."""
+    return schema_cls(
+        unknown=unknown or base.resolve_meta_property(schema_cls, "unknown", "exclude")
+    )
+
+
+def ping_round_trip():
+    """Deserialize and serialize a trust ping."""
+    Ping.deserialize(PING).serialize()
+
+
+def run(label: str, iterations: int, func=round_trip) -> float:
+    """Time the round trip and print the best per-call duration."""
+    best = min(timeit.repeat(func, number=iterations, repeat=5))
+    per_call = best / iterations * 1e6
+    print(f"{label:>10}: {per_call:8.1f} us per round trip")
+    return per_call
+
+
+def main():
+    """Run the benchmark with and without schema pooling and fast codecs."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    round_trip()
+
+    pooled = run("pooled", iterations)
+    acquire = base.acquire_schema
+    base.acquire_schema = unpooled_schema
+    try:
+        unpooled = run("unpooled", iterations)
+    finally:
+        base.acquire_schema = acquire
+    print(f"{'saving':>10}: {unpooled - pooled:8.1f} us ({unpooled / pooled:.1f}x)")
+
+    schema = run("schema", iterations, ping_round_trip)
+    enable_fast_codecs()
+    try:
+        fast = run("codec", iterations, ping_round_trip)
+    finally:
+        disable_fast_codecs()
+    print(f"{'saving':>10}: {schema - fast:8.1f} us ({schema / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()